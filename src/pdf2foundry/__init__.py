@@ -1,12 +1,22 @@
 """PDF2Foundry - Convert born-digital PDFs into Foundry VTT v13 module compendia."""
 
-try:
-    from importlib.metadata import version
-
-    __version__ = version("pdf2foundry")
-except ImportError:  # pragma: no cover - environment-specific fallback
-    # Fallback for Python < 3.8 or if package not installed
-    __version__ = "0.1.0"
+from typing import Any
 
 __author__ = "Martin Papy"
 __email__ = "martin.papy@gmail.com"
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access: importlib.metadata is one of the slowest
+    # imports on the CLI's startup path.
+    if name == "__version__":
+        try:
+            from importlib.metadata import version
+
+            value = version("pdf2foundry")
+        except ImportError:  # pragma: no cover - environment-specific fallback
+            # Fallback if the package is not installed
+            value = "0.1.0"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,8 +12,9 @@ import multiprocessing
 import os
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 
-from pdf2foundry.docling_env import probe_docling
+from pdf2foundry.docling_env import probe_docling, probe_docling_cached
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,9 @@ def detect_backend_capabilities(
     docling_version: str | None = None,
     platform: str | None = None,
     safe_fork: bool | None = None,
+    *,
+    refresh_probe: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> BackendCapabilities:
     """Detect backend capabilities for parallel processing.
 
@@ -41,6 +45,8 @@ def detect_backend_capabilities(
         docling_version: Docling version string (auto-detected if None)
         platform: Platform string (sys.platform if None)
         safe_fork: Whether fork is safe (auto-detected if None)
+        refresh_probe: Probe Docling again instead of using the capability cache
+        cache_dir: Persistent cache root holding the capability cache
 
     Returns:
         BackendCapabilities with parallel processing support information
@@ -53,7 +59,8 @@ def detect_backend_capabilities(
 
     # Auto-detect docling version if not provided
     if docling_version is None:
-        probe_result = probe_docling()
+        # The Docling probe is slow; reuse the result cached for this environment
+        probe_result = probe_docling_cached(refresh=refresh_probe, cache_dir=cache_dir, probe=probe_docling)
         docling_version = probe_result.docling_version
         if not probe_result.has_docling or not probe_result.can_construct_converter:
             notes.append("Docling not available or cannot construct converter")
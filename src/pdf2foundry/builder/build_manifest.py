@@ -0,0 +1,191 @@
+"""Build manifest for incremental rebuilds of a module's journal sources.
+
+Every run records, in ``sources/build-manifest.json`` next to the module, one
+record per written source file: the file name, a hash of the inputs the entry
+was generated from and, for chapters, the TocEntryRef the table of contents
+needs. A chapter's input hash covers its section titles, page ranges and HTML,
+its position in the book, and a build fingerprint of the tool version, module
+identity and output-affecting pipeline options.
+
+A later run with the same fingerprint can then skip mapping and rewriting a
+chapter whose hash and file name are unchanged, and skip compiling the pack
+when no source file changed. Deterministic entry and page IDs (make_entry_id /
+make_page_id) are what make a kept file identical to a regenerated one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pdf2foundry import __version__
+from pdf2foundry.builder.toc import TocEntryRef, TocPageRef
+from pdf2foundry.model.ir import ChapterIR
+
+logger = logging.getLogger(__name__)
+
+BUILD_MANIFEST_FILENAME = "build-manifest.json"
+
+# Bump when the manifest layout or the hashed material changes
+MANIFEST_VERSION = 1
+
+# Pipeline options that do not change the generated sources (page selection
+# changes the page HTML, which is hashed per chapter anyway)
+_RUNTIME_OPTIONS = frozenset(
+    {
+        "pages",
+        "workers",
+        "workers_effective",
+        "page_batch_size",
+        "worker_pool",
+        "disk_cache",
+        "cache_dir",
+        "image_cache_mb",
+        "streaming",
+    }
+)
+
+
+def _digest(material: object) -> str:
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def build_fingerprint(mod_id: str, mod_title: str, options: Mapping[str, Any] | None = None) -> str:
+    """Compute the fingerprint that every input hash of a build is salted with.
+
+    Args:
+        mod_id: Module ID (seeds the deterministic entry and page IDs)
+        mod_title: Module title (used in compendium folder flags)
+        options: Pipeline options, e.g. PdfPipelineOptions.to_dict(); options
+            that only affect how the run is executed are ignored
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    material = {
+        "manifest": MANIFEST_VERSION,
+        "tool": __version__,
+        "mod_id": mod_id,
+        "mod_title": mod_title,
+        "options": {k: v for k, v in (options or {}).items() if k not in _RUNTIME_OPTIONS},
+    }
+    return _digest(material)
+
+
+def chapter_input_hash(chapter: ChapterIR, chapter_index: int, fingerprint: str) -> str:
+    """Hash everything a chapter's journal entry is generated from."""
+    return _digest({"fingerprint": fingerprint, "index": chapter_index, "chapter": asdict(chapter)})
+
+
+def toc_input_hash(toc_meta: list[TocEntryRef], title: str, fingerprint: str) -> str:
+    """Hash everything the table of contents entry is generated from."""
+    return _digest({"fingerprint": fingerprint, "title": title, "toc": [asdict(ref) for ref in toc_meta]})
+
+
+@dataclass
+class SourceRecord:
+    """One journal source file written by a build.
+
+    Attributes:
+        file: File name inside ``sources/journals``
+        input_hash: Hash of the inputs the entry was generated from
+        toc: TOC metadata of a chapter entry (None for the TOC itself)
+    """
+
+    file: str
+    input_hash: str
+    toc: TocEntryRef | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"file": self.file, "input_hash": self.input_hash, "toc": asdict(self.toc) if self.toc else None}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SourceRecord:
+        toc_data = data.get("toc")
+        toc = None
+        if toc_data:
+            toc = TocEntryRef(
+                entry_id=toc_data["entry_id"],
+                entry_name=toc_data["entry_name"],
+                pages=[TocPageRef(**page) for page in toc_data["pages"]],
+            )
+        return cls(file=data["file"], input_hash=data["input_hash"], toc=toc)
+
+
+@dataclass
+class BuildManifest:
+    """Inputs and outputs of the last build of a module.
+
+    Attributes:
+        fingerprint: Build fingerprint (see build_fingerprint)
+        records: Source files in write order
+        packed: Whether the compiled pack reflects exactly these sources
+    """
+
+    fingerprint: str
+    records: list[SourceRecord] = field(default_factory=list)
+    packed: bool = False
+
+    def get(self, file: str) -> SourceRecord | None:
+        """Return the record of a source file, if the build wrote it."""
+        for record in self.records:
+            if record.file == file:
+                return record
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "tool_version": __version__,
+            "fingerprint": self.fingerprint,
+            "packed": self.packed,
+            "records": [record.to_dict() for record in self.records],
+        }
+
+
+def load_build_manifest(path: Path, fingerprint: str) -> BuildManifest | None:
+    """Load the manifest of the previous build if it can be reused.
+
+    Returns:
+        The manifest, or None if it is missing, unreadable, from another
+        manifest version or built with a different fingerprint
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION or data.get("fingerprint") != fingerprint:
+            logger.info("Build inputs changed since the last build; regenerating all journal sources")
+            return None
+        records = [SourceRecord.from_dict(record) for record in data.get("records", [])]
+        return BuildManifest(fingerprint=fingerprint, records=records, packed=bool(data.get("packed")))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable build manifest %s: %s", path, e)
+        return None
+
+
+def save_build_manifest(path: Path, manifest: BuildManifest) -> None:
+    """Write the manifest atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+__all__ = [
+    "BUILD_MANIFEST_FILENAME",
+    "BuildManifest",
+    "SourceRecord",
+    "build_fingerprint",
+    "chapter_input_hash",
+    "load_build_manifest",
+    "save_build_manifest",
+    "toc_input_hash",
+]
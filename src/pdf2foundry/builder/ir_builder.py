@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 
 from pdf2foundry.model.content import HtmlPage, ParsedContent
 from pdf2foundry.model.document import OutlineNode, ParsedDocument
@@ -58,6 +58,78 @@ def _merge_html(pages: list[HtmlPage], start: int, end: int | None) -> str:
     return "\n\n".join(parts)
 
 
+def _sections_for(chapter_node: OutlineNode) -> list[OutlineNode]:
+    """Gather all sections under a chapter node in document order."""
+    result: list[OutlineNode] = []
+    stack: list[OutlineNode] = chapter_node.children[:]
+    while stack:
+        n = stack.pop(0)
+        if n.level >= 2:
+            result.append(n)
+        stack[0:0] = n.children
+    return result
+
+
+def _chapter_ir(
+    node: OutlineNode,
+    pages: list[HtmlPage],
+    last_page_no: int | None,
+    seen_at_level: dict[int, dict[str, int]],
+    on_progress: ProgressCallback,
+) -> ChapterIR:
+    """Assemble one chapter from its outline node and the pages it spans.
+
+    ``last_page_no`` is the last page of the document, used to end a chapter
+    with an open page range.
+    """
+    chap_seg = [_slugify(seg) for seg in (node.path[:1] or [_slugify(node.title)])]
+    chap_id_path = _unique_path(chap_seg, seen_at_level, level=1)
+
+    chapter_ir = ChapterIR(id_path=chap_id_path, title=node.title, sections=[])
+    _safe_emit(on_progress, "chapter:assembled", {"chapter": node.title})
+
+    secs = _sections_for(node)
+    # Fallback: if no section nodes were found under this chapter, create
+    # synthetic sections per page across the chapter span so content is not lost.
+    if not secs:
+        start = node.page_start
+        end = node.page_end if node.page_end is not None else (last_page_no if last_page_no is not None else node.page_start)
+        for pno in range(start, end + 1):
+            segs = [*chap_id_path, _slugify(f"page-{pno:03d}")]
+            sec_id_path = _unique_path(segs, seen_at_level, level=2)
+            html = _merge_html(pages, pno, pno)
+            section_ir = SectionIR(
+                id_path=sec_id_path,
+                level=2,
+                title=f"Page {pno}",
+                page_start=pno,
+                page_end=pno,
+                html=html,
+            )
+            chapter_ir.sections.append(section_ir)
+
+    for sec in secs:
+        sec_segs = [*chap_id_path, _slugify(sec.title)]
+        sec_id_path = _unique_path(sec_segs, seen_at_level, level=sec.level)
+        html = _merge_html(pages, sec.page_start, sec.page_end)
+        section_ir = SectionIR(
+            id_path=sec_id_path,
+            level=sec.level,
+            title=sec.title,
+            page_start=sec.page_start,
+            page_end=sec.page_end,
+            html=html,
+        )
+        chapter_ir.sections.append(section_ir)
+        _safe_emit(
+            on_progress,
+            "section:assembled",
+            {"chapter": node.title, "section": sec.title},
+        )
+
+    return chapter_ir
+
+
 def build_document_ir(
     parsed_doc: ParsedDocument,
     parsed_content: ParsedContent,
@@ -67,74 +139,15 @@ def build_document_ir(
 ) -> DocumentIR:
     _safe_emit(on_progress, "ir:start", {"doc_title": doc_title})
 
-    # Helper to gather all sections under a chapter node
-    def sections_for(chapter_node: OutlineNode) -> list[OutlineNode]:
-        result: list[OutlineNode] = []
-        stack: list[OutlineNode] = chapter_node.children[:]
-        while stack:
-            n = stack.pop(0)
-            if n.level >= 2:
-                result.append(n)
-            stack[0:0] = n.children
-        return result
-
     chapters: list[ChapterIR] = []
     seen_at_level: dict[int, dict[str, int]] = {}
+    last_page_no = parsed_content.pages[-1].page_no if parsed_content.pages else None
 
     # Root outline nodes are top-level candidates; we treat only level==1 as chapters.
     for node in parsed_doc.outline:
         if node.level != 1:
             continue
-        chap_seg = [_slugify(seg) for seg in (node.path[:1] or [_slugify(node.title)])]
-        chap_id_path = _unique_path(chap_seg, seen_at_level, level=1)
-
-        chapter_ir = ChapterIR(id_path=chap_id_path, title=node.title, sections=[])
-        _safe_emit(on_progress, "chapter:assembled", {"chapter": node.title})
-
-        secs = sections_for(node)
-        # Fallback: if no section nodes were found under this chapter, create
-        # synthetic sections per page across the chapter span so content is not lost.
-        if not secs:
-            start = node.page_start
-            end = (
-                node.page_end
-                if node.page_end is not None
-                else (parsed_content.pages[-1].page_no if parsed_content.pages else node.page_start)
-            )
-            for pno in range(start, end + 1):
-                segs = [*chap_id_path, _slugify(f"page-{pno:03d}")]
-                sec_id_path = _unique_path(segs, seen_at_level, level=2)
-                html = _merge_html(parsed_content.pages, pno, pno)
-                section_ir = SectionIR(
-                    id_path=sec_id_path,
-                    level=2,
-                    title=f"Page {pno}",
-                    page_start=pno,
-                    page_end=pno,
-                    html=html,
-                )
-                chapter_ir.sections.append(section_ir)
-
-        for sec in secs:
-            sec_segs = [*chap_id_path, _slugify(sec.title)]
-            sec_id_path = _unique_path(sec_segs, seen_at_level, level=sec.level)
-            html = _merge_html(parsed_content.pages, sec.page_start, sec.page_end)
-            section_ir = SectionIR(
-                id_path=sec_id_path,
-                level=sec.level,
-                title=sec.title,
-                page_start=sec.page_start,
-                page_end=sec.page_end,
-                html=html,
-            )
-            chapter_ir.sections.append(section_ir)
-            _safe_emit(
-                on_progress,
-                "section:assembled",
-                {"chapter": node.title, "section": sec.title},
-            )
-
-        chapters.append(chapter_ir)
+        chapters.append(_chapter_ir(node, parsed_content.pages, last_page_no, seen_at_level, on_progress))
 
     total_sections = sum(len(c.sections) for c in chapters)
     _safe_emit(on_progress, "ir:finalized", {"chapters": len(chapters), "sections": total_sections})
@@ -142,6 +155,54 @@ def build_document_ir(
     return DocumentIR(mod_id=mod_id, title=doc_title, chapters=chapters, assets_dir=parsed_content.assets_dir)
 
 
+def iter_chapter_ir(
+    parsed_doc: ParsedDocument,
+    pages: Iterable[HtmlPage],
+    doc_title: str,
+    on_progress: ProgressCallback = None,
+) -> Iterator[ChapterIR]:
+    """Assemble chapters from a stream of pages, yielding each once it closes.
+
+    Pages must arrive in ascending page order. A chapter closes as soon as a
+    page past its last page arrives (or the stream ends), and pages no longer
+    needed by any open chapter are released, so only the pages of the current
+    chapter are held. Yields the same chapters as build_document_ir().
+    """
+    nodes = [node for node in parsed_doc.outline if node.level == 1]
+    seen_at_level: dict[int, dict[str, int]] = {}
+    held: list[HtmlPage] = []
+    last_page_no: int | None = None
+    index = 0
+    chapters = sections = 0
+
+    def first_needed_page(remaining: list[OutlineNode]) -> int | None:
+        starts = [n.page_start for node in remaining for n in (node, *_sections_for(node))]
+        return min(starts) if starts else None
+
+    def close_chapter() -> ChapterIR:
+        nonlocal index, held, chapters, sections
+        chapter = _chapter_ir(nodes[index], held, last_page_no, seen_at_level, on_progress)
+        index += 1
+        chapters += 1
+        sections += len(chapter.sections)
+        keep_from = first_needed_page(nodes[index:])
+        held = [] if keep_from is None else [page for page in held if page.page_no >= keep_from]
+        return chapter
+
+    def closes(node: OutlineNode, page_no: int) -> bool:
+        return node.page_end is not None and page_no > node.page_end
+
+    _safe_emit(on_progress, "ir:start", {"doc_title": doc_title})
+    for page in pages:
+        while index < len(nodes) and closes(nodes[index], page.page_no):
+            yield close_chapter()
+        held.append(page)
+        last_page_no = page.page_no
+    while index < len(nodes):
+        yield close_chapter()
+    _safe_emit(on_progress, "ir:finalized", {"chapters": chapters, "sections": sections})
+
+
 # --- Foundry mapping (Task 4.2): Map IR to Foundry Journal models ---
 
 
@@ -160,83 +221,103 @@ def map_ir_to_foundry_entries(
       on hierarchy mapping (Entry -> Pages) and page sorting.
     """
 
-    entries: list[JournalEntry] = []
-
-    for chapter_index, chapter in enumerate(ir.chapters, start=1):
-        entry_canonical: list[str] = [*chapter.id_path]
-        entry_id = make_entry_id(ir.mod_id, entry_canonical) if deterministic_ids else "-".join(chapter.id_path)
-        pages: list[JournalPageText] = []
-
-        # Derive deterministic display name for chapter
-        ch_name_raw = (chapter.title or "").strip()
-        ch_name = ch_name_raw or f"Untitled Chapter {chapter_index}"
-
-        # Assign sort in large gaps to allow later inserts
-        sort_base = 1000
-        seen_page_names: dict[str, int] = {}
-        temp_pages: list[tuple[str, str, int, str]] = []  # (page_name, page_id, index, html)
-        for i, sec in enumerate(chapter.sections):
-            sort = sort_base * (i + 1)
-            # Deterministic page display name with sibling de-duplication
-            raw_name = (sec.title or "").strip() or f"Untitled Section {i + 1}"
-            page_id = make_page_id(ir.mod_id, entry_canonical, raw_name) if deterministic_ids else "-".join(sec.id_path)
-            count = seen_page_names.get(raw_name, 0)
-            seen_page_names[raw_name] = count + 1
-            page_name = raw_name if count == 0 else f"{raw_name} ({count + 1})"
-
-            cleaned = clean_html_fragment(sec.html)
-            html_scoped = wrap_html(cleaned)
-            html_with_imgs = rewrite_img_srcs(html_scoped, ir.mod_id)
-            page = make_text_page(
-                _id=page_id,
-                name=page_name,
-                level=min(3, max(1, sec.level - 1)),  # clamp to 1..3
-                text_html=html_with_imgs,
-                sort=sort,
-            )
-            # Add canonical path flags for deterministic ID assignment
-            canonical_path = [*entry_canonical, page_name]
-            page.flags.setdefault(ir.mod_id, {})
-            mod_ns = page.flags[ir.mod_id]
-            if isinstance(mod_ns, dict):
-                mod_ns["canonicalPath"] = canonical_path
-                mod_ns["canonicalPathStr"] = "/".join(canonical_path)
-                mod_ns["sectionOrder"] = i
-            pages.append(page)
-            temp_pages.append((page_name, page_id, i, html_with_imgs))
-
-        # Rewrite internal anchor links to @UUID after page IDs are known
-        try:
-            from pdf2foundry.transform.links import (
-                build_anchor_lookup,
-                rewrite_internal_anchors_to_uuid,
-            )
+    return [
+        map_chapter_to_entry(
+            chapter, chapter_index, mod_id=ir.mod_id, doc_title=ir.title, deterministic_ids=deterministic_ids
+        )
+        for chapter_index, chapter in enumerate(ir.chapters, start=1)
+    ]
+
+
+def chapter_entry_name(chapter: ChapterIR, chapter_index: int) -> str:
+    """Return the display name of the JournalEntry a chapter maps to."""
+    return (chapter.title or "").strip() or f"Untitled Chapter {chapter_index}"
 
-            token_to_pageid = build_anchor_lookup([(n, pid) for (n, pid, _, _) in temp_pages])
-            for _n, _pid, idx, html_in in temp_pages:
-                pages[idx].text["content"] = rewrite_internal_anchors_to_uuid(html_in, entry_id, token_to_pageid)
-        except Exception:
-            # If link rewriting fails for any reason, keep original HTML
-            pass
-
-        # Encode folder path for Compendium Folders: [Book Title, Chapter Title]
-        entry_flags = build_compendium_folder_flags([ir.title, ch_name])
-        # Extend with module namespace for canonical paths
-        entry_flags.setdefault(ir.mod_id, {})
-        mod_flags = entry_flags[ir.mod_id]
-        if isinstance(mod_flags, dict):
-            mod_flags["canonicalPath"] = entry_canonical
-            mod_flags["canonicalPathStr"] = "/".join(entry_canonical)
-            mod_flags["nameSlug"] = entry_canonical[-1] if entry_canonical else ""
-
-        entry = make_journal_entry(
-            _id=entry_id,
-            name=ch_name,
-            pages=pages,
-            folder=None,
-            flags=entry_flags,
-            ownership={"default": 0},
+
+def map_chapter_to_entry(
+    chapter: ChapterIR,
+    chapter_index: int,
+    *,
+    mod_id: str,
+    doc_title: str,
+    deterministic_ids: bool = True,
+) -> JournalEntry:
+    """Map one chapter to a JournalEntry (see map_ir_to_foundry_entries).
+
+    ``chapter_index`` is the 1-based position of the chapter in the document,
+    used to name untitled chapters.
+    """
+    entry_canonical: list[str] = [*chapter.id_path]
+    entry_id = make_entry_id(mod_id, entry_canonical) if deterministic_ids else "-".join(chapter.id_path)
+    pages: list[JournalPageText] = []
+
+    # Derive deterministic display name for chapter
+    ch_name = chapter_entry_name(chapter, chapter_index)
+
+    # Assign sort in large gaps to allow later inserts
+    sort_base = 1000
+    seen_page_names: dict[str, int] = {}
+    temp_pages: list[tuple[str, str, int, str]] = []  # (page_name, page_id, index, html)
+    for i, sec in enumerate(chapter.sections):
+        sort = sort_base * (i + 1)
+        # Deterministic page display name with sibling de-duplication
+        raw_name = (sec.title or "").strip() or f"Untitled Section {i + 1}"
+        page_id = make_page_id(mod_id, entry_canonical, raw_name) if deterministic_ids else "-".join(sec.id_path)
+        count = seen_page_names.get(raw_name, 0)
+        seen_page_names[raw_name] = count + 1
+        page_name = raw_name if count == 0 else f"{raw_name} ({count + 1})"
+
+        cleaned = clean_html_fragment(sec.html)
+        html_scoped = wrap_html(cleaned)
+        html_with_imgs = rewrite_img_srcs(html_scoped, mod_id)
+        page = make_text_page(
+            _id=page_id,
+            name=page_name,
+            level=min(3, max(1, sec.level - 1)),  # clamp to 1..3
+            text_html=html_with_imgs,
+            sort=sort,
+        )
+        # Add canonical path flags for deterministic ID assignment
+        canonical_path = [*entry_canonical, page_name]
+        page.flags.setdefault(mod_id, {})
+        mod_ns = page.flags[mod_id]
+        if isinstance(mod_ns, dict):
+            mod_ns["canonicalPath"] = canonical_path
+            mod_ns["canonicalPathStr"] = "/".join(canonical_path)
+            mod_ns["sectionOrder"] = i
+        pages.append(page)
+        temp_pages.append((page_name, page_id, i, html_with_imgs))
+
+    # Rewrite internal anchor links to @UUID after page IDs are known
+    try:
+        from pdf2foundry.transform.links import (
+            build_anchor_lookup,
+            rewrite_internal_anchors_to_uuid,
         )
-        entries.append(entry)
 
-    return entries
+        token_to_pageid = build_anchor_lookup([(n, pid) for (n, pid, _, _) in temp_pages])
+        for _n, _pid, idx, html_in in temp_pages:
+            pages[idx].text["content"] = rewrite_internal_anchors_to_uuid(html_in, entry_id, token_to_pageid)
+    except Exception:
+        # If link rewriting fails for any reason, keep original HTML
+        pass
+
+    # Encode folder path for Compendium Folders: [Book Title, Chapter Title]
+    entry_flags = build_compendium_folder_flags([doc_title, ch_name])
+    # Extend with module namespace for canonical paths
+    entry_flags.setdefault(mod_id, {})
+    mod_flags = entry_flags[mod_id]
+    if isinstance(mod_flags, dict):
+        mod_flags["canonicalPath"] = entry_canonical
+        mod_flags["canonicalPathStr"] = "/".join(entry_canonical)
+        mod_flags["nameSlug"] = entry_canonical[-1] if entry_canonical else ""
+
+    entry = make_journal_entry(
+        _id=entry_id,
+        name=ch_name,
+        pages=pages,
+        folder=None,
+        flags=entry_flags,
+        ownership={"default": 0},
+    )
+    return entry
@@ -0,0 +1,151 @@
+"""Journal entry source files: one ``NNN-<slug>.json`` per entry.
+
+The Foundry CLI packs these files into the compendium. Entries can be written
+as they are produced, so a streaming conversion never holds more than one
+chapter's entry in memory. Given the manifest of the previous build (see
+build_manifest.py), the writer also keeps files whose inputs are unchanged and
+removes files the new build no longer produces.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from pdf2foundry.builder.build_manifest import BuildManifest, SourceRecord
+from pdf2foundry.builder.toc import TocEntryRef
+from pdf2foundry.model.foundry import JournalEntry
+
+
+def _slugify(text: str) -> str:
+    """Convert text to a filename-safe slug."""
+    s = re.sub(r"[^A-Za-z0-9]+", "-", (text or "").lower()).strip("-")
+    s = re.sub(r"-+", "-", s)
+    return s or "untitled"
+
+
+def entry_source_data(entry: JournalEntry) -> dict[str, Any]:
+    """Return the JSON data for an entry, with the Classic Level keys the Foundry CLI packs by."""
+    data = asdict(entry)
+    data["_key"] = f"!journal!{entry._id}"
+    if isinstance(data.get("pages"), list):
+        for p in data["pages"]:
+            pid = p.get("_id")
+            if isinstance(pid, str) and pid:
+                p["_key"] = f"!journal.pages!{entry._id}.{pid}"
+    return data
+
+
+class JournalSourceWriter:
+    """Write journal entries to numbered, uniquely named source files in order."""
+
+    def __init__(self, journals_src_dir: Path, fingerprint: str = "", previous: BuildManifest | None = None) -> None:
+        """Initialize the writer.
+
+        Args:
+            journals_src_dir: Directory receiving the source files (must exist)
+            fingerprint: Build fingerprint recorded in the manifest
+            previous: Manifest of the previous build with the same fingerprint,
+                whose unchanged files may be kept
+        """
+        self.journals_src_dir = journals_src_dir
+        self.fingerprint = fingerprint
+        self.previous = previous
+        self.records: list[SourceRecord] = []
+        self.written = 0
+        self.reused = 0
+        self.removed = 0
+        self._used_names: set[str] = set()
+        self._next_index = 1
+
+    def reserve(self, entry_name: str) -> tuple[int, str]:
+        """Claim the next file number and a unique name for an entry written later.
+
+        Used for entries that must sort first but can only be built at the
+        end, like the table of contents.
+        """
+        base = _slugify(entry_name)
+        name = base
+        n = 1
+        while name in self._used_names:
+            n += 1
+            name = f"{base}-{n}"
+        self._used_names.add(name)
+        index = self._next_index
+        self._next_index += 1
+        return index, name
+
+    @staticmethod
+    def file_name(slot: tuple[int, str]) -> str:
+        """Return the source file name of a slot."""
+        index, name = slot
+        return f"{index:03d}-{name}.json"
+
+    def write(
+        self,
+        entry: JournalEntry,
+        slot: tuple[int, str] | None = None,
+        *,
+        input_hash: str = "",
+        toc: TocEntryRef | None = None,
+    ) -> Path:
+        """Write an entry to its file, in the next slot unless a reserved one is given.
+
+        ``input_hash`` and ``toc`` are recorded in the build manifest.
+        """
+        if slot is None:
+            slot = self.reserve(entry.name)
+        out_file = self.journals_src_dir / self.file_name(slot)
+        with out_file.open("w", encoding="utf-8") as f:
+            json.dump(entry_source_data(entry), f, ensure_ascii=False, indent=2)
+        self.records.append(SourceRecord(file=out_file.name, input_hash=input_hash, toc=toc))
+        self.written += 1
+        return out_file
+
+    def reuse(self, slot: tuple[int, str], input_hash: str, *, with_toc: bool = False) -> SourceRecord | None:
+        """Keep the previous build's file for a slot if it was built from the same inputs.
+
+        With ``with_toc``, only a record carrying TOC metadata is reused.
+
+        Returns:
+            The previous record (now part of this build), or None if the entry
+            must be generated and written
+        """
+        if self.previous is None or not input_hash:
+            return None
+        record = self.previous.get(self.file_name(slot))
+        if record is None or record.input_hash != input_hash or (with_toc and record.toc is None):
+            return None
+        if not (self.journals_src_dir / record.file).is_file():
+            return None
+        self.records.append(record)
+        self.reused += 1
+        return record
+
+    def remove_stale(self) -> int:
+        """Delete files of the previous build that this build did not produce.
+
+        Returns:
+            Number of files removed
+        """
+        if self.previous is None:
+            return 0
+        current = {record.file for record in self.records}
+        for record in self.previous.records:
+            path = self.journals_src_dir / record.file
+            if record.file not in current and path.is_file():
+                path.unlink()
+                self.removed += 1
+        return self.removed
+
+    @property
+    def changed(self) -> bool:
+        """Whether the source files differ from the previous build's."""
+        return self.previous is None or self.written > 0 or self.removed > 0
+
+    def manifest(self, *, packed: bool = False) -> BuildManifest:
+        """Return the manifest describing the files written or kept so far."""
+        return BuildManifest(fingerprint=self.fingerprint, records=list(self.records), packed=packed)
@@ -68,7 +68,22 @@ def build_toc_entry_from_entries(
     - Renders HTML with @UUID links using collected metadata
     """
 
-    toc_meta = collect_toc_metadata(entries)
+    return build_toc_entry(mod_id, collect_toc_metadata(entries), title=title, folder_path=folder_path)
+
+
+def build_toc_entry(
+    mod_id: str,
+    toc_meta: list[TocEntryRef],
+    *,
+    title: str = "Table of Contents",
+    folder_path: list[str] | None = None,
+) -> JournalEntry:
+    """Build a TOC JournalEntry from collected metadata.
+
+    Lets a streaming writer keep only the small TocEntryRef of each chapter
+    instead of the chapter entries themselves.
+    """
+
     html = render_toc_html(toc_meta, title=title)
 
     entry_canonical = ["toc"]
@@ -0,0 +1,338 @@
+"""Batch conversion command: many PDFs in one process with warm resources.
+
+``pdf2foundry batch`` converts every PDF of a directory or manifest with the
+same pipeline as ``convert``, but inside warm_resources(): the Docling
+DocumentConverter, the caption model and the backend capabilities (read from
+the on-disk capability cache) are created once, and page workers run in one
+persistent pool. A failing document is reported and skipped; the others still
+convert.
+
+A manifest is either a JSON list, whose items are a PDF path or an object with
+``pdf`` and optional ``mod_id``, ``mod_title``, ``author``, ``license`` and
+``pages`` (a page spec like ``"1-10"``), or a text file with one PDF path per
+line (``#`` starts a comment). Relative paths resolve against the manifest's
+directory. Module IDs and titles default to the PDF's file name.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+
+@dataclass
+class BatchJob:
+    """One PDF of a batch and the module it becomes."""
+
+    pdf: Path
+    mod_id: str
+    mod_title: str
+    author: str = ""
+    license: str = ""
+    pages: list[int] | None = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of converting one batch job."""
+
+    job: BatchJob
+    ok: bool
+    seconds: float
+    error: str | None = None
+
+
+def _default_mod_id(pdf: Path) -> str:
+    s = re.sub(r"[^a-z0-9]+", "-", pdf.stem.lower()).strip("-")
+    return s or "module"
+
+
+def _job_from_item(item: Any, base_dir: Path) -> BatchJob:
+    from pdf2foundry.cli.parse import parse_page_spec
+
+    if isinstance(item, str):
+        item = {"pdf": item}
+    if not isinstance(item, dict) or not isinstance(item.get("pdf"), str):
+        raise ValueError(f"Manifest item needs a 'pdf' path: {item!r}")
+    pdf = Path(item["pdf"]).expanduser()
+    if not pdf.is_absolute():
+        pdf = base_dir / pdf
+    pages = item.get("pages")
+    return BatchJob(
+        pdf=pdf,
+        mod_id=item.get("mod_id") or _default_mod_id(pdf),
+        mod_title=item.get("mod_title") or pdf.stem,
+        author=item.get("author", ""),
+        license=item.get("license", ""),
+        pages=parse_page_spec(pages) if pages else None,
+    )
+
+
+def load_batch_jobs(source: Path) -> list[BatchJob]:
+    """Read the jobs of a batch from a directory of PDFs or a manifest file.
+
+    Args:
+        source: Directory (its ``*.pdf`` files, sorted by name) or manifest
+
+    Returns:
+        Jobs in manifest or name order
+
+    Raises:
+        ValueError: If the manifest is malformed, a PDF is missing or two
+            jobs share a module ID
+    """
+    if source.is_dir():
+        jobs = [_job_from_item(str(pdf), source) for pdf in sorted(source.glob("*.pdf"))]
+    elif source.suffix.lower() == ".json":
+        items = json.loads(source.read_text(encoding="utf-8"))
+        if not isinstance(items, list):
+            raise ValueError(f"Manifest {source} must contain a JSON list")
+        jobs = [_job_from_item(item, source.parent) for item in items]
+    else:
+        lines = (line.split("#", 1)[0].strip() for line in source.read_text(encoding="utf-8").splitlines())
+        jobs = [_job_from_item(line, source.parent) for line in lines if line]
+
+    seen: set[str] = set()
+    for job in jobs:
+        if not job.pdf.is_file():
+            raise ValueError(f"PDF not found: {job.pdf}")
+        if job.mod_id in seen:
+            raise ValueError(f"Duplicate module ID '{job.mod_id}' ({job.pdf}); set mod_id in the manifest")
+        seen.add(job.mod_id)
+    return jobs
+
+
+def run_batch(jobs: list[BatchJob], *, out_dir: Path, options: dict[str, Any], **pipeline_kwargs: Any) -> list[BatchResult]:
+    """Convert every job in this process, sharing warm resources between them.
+
+    Args:
+        jobs: Documents to convert, in order
+        out_dir: Output directory receiving one module directory per job
+        options: Keyword arguments for PdfPipelineOptions.from_cli shared by
+            every job (``pages`` comes from the job)
+        **pipeline_kwargs: Further arguments for run_conversion_pipeline
+
+    Returns:
+        One result per job; failures are recorded instead of raised
+    """
+    from pdf2foundry.cli.conversion import run_conversion_pipeline
+    from pdf2foundry.core.warm_resources import warm_resources
+    from pdf2foundry.ingest import docling_adapter
+    from pdf2foundry.ingest.page_scheduler import shutdown_page_pools
+    from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+    results: list[BatchResult] = []
+    with warm_resources():
+        try:
+            for number, job in enumerate(jobs, start=1):
+                typer.echo(f"\n📚 [{number}/{len(jobs)}] {job.pdf.name} → {job.mod_id}")
+                start = time.perf_counter()
+                try:
+                    job_options = {**options, "pages": job.pages, "worker_pool": "process"}
+                    pipeline_options = PdfPipelineOptions.from_cli(**job_options)
+                    run_conversion_pipeline(
+                        pdf=job.pdf,
+                        mod_id=job.mod_id,
+                        mod_title=job.mod_title,
+                        out_dir=out_dir,
+                        pack_name=f"{job.mod_id}-journals",
+                        author=job.author,
+                        license=job.license,
+                        pages=job.pages,
+                        workers=pipeline_options.workers,
+                        pipeline_options=pipeline_options,
+                        **pipeline_kwargs,
+                    )
+                    results.append(BatchResult(job, ok=True, seconds=time.perf_counter() - start))
+                except Exception as exc:
+                    # typer.Exit from the pipeline carries the actual error as its cause
+                    error = exc.__cause__ or exc
+                    message = f"{type(error).__name__}: {error}"
+                    results.append(BatchResult(job, ok=False, seconds=time.perf_counter() - start, error=message))
+                finally:
+                    # Release the converted document; the converter itself stays warm
+                    docling_adapter._cached_convert.cache_clear()
+        finally:
+            shutdown_page_pools()
+    return results
+
+
+def summarize_batch(results: list[BatchResult]) -> dict[str, Any]:
+    """Aggregate per-document timings of a batch.
+
+    ``first_seconds`` is the first document, which pays for loading models;
+    ``warm_mean_seconds`` averages the documents after it.
+    """
+    times = [r.seconds for r in results]
+    return {
+        "documents": len(results),
+        "succeeded": sum(r.ok for r in results),
+        "failed": sum(not r.ok for r in results),
+        "total_seconds": sum(times),
+        "mean_seconds": statistics.fmean(times) if times else 0.0,
+        "median_seconds": statistics.median(times) if times else 0.0,
+        "max_seconds": max(times, default=0.0),
+        "first_seconds": times[0] if times else 0.0,
+        "warm_mean_seconds": statistics.fmean(times[1:]) if len(times) > 1 else None,
+    }
+
+
+def write_batch_report(path: Path, results: list[BatchResult]) -> None:
+    """Write per-document results and the summary as JSON."""
+    report = {
+        "summary": summarize_batch(results),
+        "documents": [
+            {
+                "pdf": str(r.job.pdf),
+                "mod_id": r.job.mod_id,
+                "ok": r.ok,
+                "seconds": round(r.seconds, 3),
+                "error": r.error,
+            }
+            for r in results
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _echo_report(results: list[BatchResult]) -> None:
+    summary = summarize_batch(results)
+    typer.echo("\n📊 Batch report")
+    width = max((len(r.job.pdf.name) for r in results), default=0)
+    for r in results:
+        status = "✅" if r.ok else "❌"
+        typer.echo(f"  {status} {r.job.pdf.name:<{width}}  {r.seconds:8.1f}s" + (f"  {r.error}" if r.error else ""))
+    typer.echo(
+        f"  {summary['succeeded']} succeeded, {summary['failed']} failed in {summary['total_seconds']:.1f}s "
+        f"(mean {summary['mean_seconds']:.1f}s, median {summary['median_seconds']:.1f}s, max {summary['max_seconds']:.1f}s)"
+    )
+    if summary["warm_mean_seconds"] is not None:
+        typer.echo(
+            f"  First document {summary['first_seconds']:.1f}s, "
+            f"later documents {summary['warm_mean_seconds']:.1f}s on average"
+        )
+
+
+def batch(
+    source: Annotated[
+        Path,
+        typer.Argument(help="Directory of PDFs, or a manifest (.json list or one PDF path per line)", exists=True),
+    ],
+    out_dir: Annotated[Path, typer.Option("--out-dir", help="Output directory for generated modules")] = Path("dist"),
+    toc: Annotated[bool, typer.Option("--toc/--no-toc", help="Generate a Table of Contents entry")] = True,
+    tables: Annotated[
+        str, typer.Option("--tables", help="Table handling: 'structured', 'auto' (default), or 'image-only'")
+    ] = "auto",
+    ocr: Annotated[str, typer.Option("--ocr", help="OCR mode: 'auto' (default), 'on', or 'off'")] = "auto",
+    picture_descriptions: Annotated[
+        str, typer.Option("--picture-descriptions", help="Generate image captions: 'on' or 'off' (default)")
+    ] = "off",
+    vlm_repo_id: Annotated[
+        str | None, typer.Option("--vlm-repo-id", help="Hugging Face VLM repository ID for picture descriptions")
+    ] = None,
+    workers: Annotated[int, typer.Option("--workers", help="Worker processes shared by every document")] = 1,
+    compile_pack_now: Annotated[
+        bool, typer.Option("--compile-pack/--no-compile-pack", help="Compile each module's pack with the Foundry CLI")
+    ] = False,
+    disk_cache: Annotated[
+        bool, typer.Option("--disk-cache/--no-disk-cache", help="Reuse results of earlier runs via the persistent cache")
+    ] = True,
+    cache_dir: Annotated[
+        Path | None, typer.Option("--cache-dir", help="Directory for persistent caches (default: per-user cache directory)")
+    ] = None,
+    streaming: Annotated[
+        bool, typer.Option("--streaming", help="Write each chapter as soon as its pages are processed")
+    ] = False,
+    report: Annotated[
+        Path | None, typer.Option("--report", help="Write per-document timings and errors to this JSON file")
+    ] = None,
+    refresh_probe: Annotated[
+        bool, typer.Option("--refresh-probe", help="Probe the Docling environment again instead of using the cached result")
+    ] = False,
+    no_ml: Annotated[bool, typer.Option("--no-ml", help="Disable ML features (VLM, advanced OCR)")] = False,
+) -> None:
+    """Convert many PDFs in one process, sharing loaded models and workers.
+
+    Each PDF becomes its own module under --out-dir. A document that fails is
+    reported and skipped; the exit code is 1 if any document failed.
+    """
+    try:
+        jobs = load_batch_jobs(source)
+    except (OSError, ValueError) as exc:
+        typer.echo(f"Error: {exc}")
+        raise typer.Exit(1) from exc
+    if not jobs:
+        typer.echo(f"Error: no PDFs found in {source}")
+        raise typer.Exit(1)
+    if workers < 1:
+        typer.echo("Error: --workers must be >= 1")
+        raise typer.Exit(1)
+
+    if no_ml:
+        import os
+
+        picture_descriptions = "off"
+        vlm_repo_id = None
+        os.environ["PDF2FOUNDRY_NO_ML"] = "1"
+
+    options: dict[str, Any] = {
+        "tables": tables,
+        "ocr": ocr,
+        "picture_descriptions": picture_descriptions,
+        "vlm_repo_id": vlm_repo_id,
+        "workers": workers,
+        "disk_cache": disk_cache,
+        "cache_dir": str(cache_dir) if cache_dir is not None else None,
+        "streaming": streaming,
+    }
+    try:
+        from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+        PdfPipelineOptions.from_cli(**options)
+    except ValueError as exc:
+        typer.echo(f"Error: {exc}")
+        raise typer.Exit(1) from exc
+
+    from pdf2foundry.cli.validation import (
+        validate_foundry_cli_availability,
+        validate_ocr_availability,
+        validate_output_directory_permissions,
+    )
+
+    validate_ocr_availability(ocr)
+    validate_foundry_cli_availability(compile_pack_now)
+    validate_output_directory_permissions(out_dir)
+
+    typer.echo(f"📦 Converting {len(jobs)} PDFs into {out_dir}")
+    results = run_batch(
+        jobs,
+        out_dir=out_dir,
+        options=options,
+        toc=toc,
+        tables=tables,
+        deterministic_ids=True,
+        compile_pack_now=compile_pack_now,
+        docling_json=None,
+        write_docling_json=False,
+        fallback_on_json_failure=False,
+        ocr=ocr,
+        picture_descriptions=picture_descriptions,
+        vlm_repo_id=vlm_repo_id,
+        no_ml=no_ml,
+        refresh_probe=refresh_probe,
+    )
+
+    _echo_report(results)
+    if report is not None:
+        write_batch_report(report, results)
+        typer.echo(f"  Report written to {report}")
+    if not all(r.ok for r in results):
+        raise typer.Exit(1)
@@ -0,0 +1,134 @@
+"""``pdf2foundry cache`` commands for inspecting and pruning persistent caches."""
+
+import time
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+cache_app = typer.Typer(
+    help="Inspect and prune the persistent caches (Docling conversions, OCR results, captions).",
+    no_args_is_help=True,
+)
+
+CacheDirOption = Annotated[
+    Path | None,
+    typer.Option("--cache-dir", help="Directory for persistent caches (default: per-user cache directory)"),
+]
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"  # pragma: no cover - loop always returns
+
+
+def _disk_caches(cache_dir: Path | None) -> dict[str, Any]:
+    """Open the SQLite-backed caches with their configured budgets."""
+    from pdf2foundry.ingest.caption_cache import DEFAULT_CAPTION_DISK_CACHE_BYTES
+    from pdf2foundry.ingest.disk_cache import open_disk_cache
+    from pdf2foundry.ingest.ocr_engine import DEFAULT_OCR_DISK_CACHE_BYTES
+
+    return {
+        "OCR results": open_disk_cache("ocr", DEFAULT_OCR_DISK_CACHE_BYTES, cache_dir),
+        "Captions": open_disk_cache("captions", DEFAULT_CAPTION_DISK_CACHE_BYTES, cache_dir),
+    }
+
+
+@cache_app.command("info")
+def info(cache_dir: CacheDirOption = None) -> None:
+    """Show location, size and budget of each persistent cache."""
+    from pdf2foundry.core.cache_paths import get_cache_root
+    from pdf2foundry.ingest.conversion_cache import docling_versions, open_conversion_cache
+
+    typer.echo(f"📁 Cache root: {get_cache_root(cache_dir)}")
+    stats = open_conversion_cache(cache_dir).stats()
+    typer.echo(
+        f"🗃️  Conversions: {stats['entries']} entries, {_format_size(stats['bytes'])} "
+        f"of {_format_size(stats['max_bytes'])}"
+    )
+    versions = ", ".join(f"{name} {version}" for name, version in docling_versions().items())
+    typer.echo(f"   Keyed by PDF content, conversion options and {versions}")
+    for name, disk_cache in _disk_caches(cache_dir).items():
+        if not disk_cache.path.exists():
+            typer.echo(f"🗃️  {name}: empty")
+            continue
+        disk_stats = disk_cache.stats()
+        disk_cache.close()
+        typer.echo(
+            f"🗃️  {name}: {disk_stats['entries']} entries, {_format_size(disk_stats['bytes'])} "
+            f"of {_format_size(disk_stats['max_bytes'])}"
+        )
+
+
+@cache_app.command("list")
+def list_entries(cache_dir: CacheDirOption = None) -> None:
+    """List cached conversions, least recently used first."""
+    from pdf2foundry.ingest.conversion_cache import open_conversion_cache
+
+    entries = open_conversion_cache(cache_dir).entries()
+    if not entries:
+        typer.echo("No cached conversions.")
+        return
+    for entry in entries:
+        last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_used))
+        source = entry.source_sha256[:12] if entry.source_sha256 else "unknown"
+        typer.echo(f"{entry.key[:12]}  {_format_size(entry.size):>9}  last used {last_used}  pdf sha256 {source}")
+
+
+@cache_app.command("prune")
+def prune(
+    max_mb: Annotated[
+        int | None,
+        typer.Option(
+            "--max-mb", help="Shrink cached conversions to this many MB (default: the cache budget; 0 removes all)"
+        ),
+    ] = None,
+    older_than_days: Annotated[
+        float | None,
+        typer.Option("--older-than-days", help="Also remove conversions not used for this many days"),
+    ] = None,
+    cache_dir: CacheDirOption = None,
+) -> None:
+    """Remove least recently used conversions until the cache fits its budget."""
+    from pdf2foundry.ingest.conversion_cache import open_conversion_cache
+
+    if max_mb is not None and max_mb < 0:
+        typer.echo("Error: --max-mb must be >= 0", err=True)
+        raise typer.Exit(1)
+    conversion_cache = open_conversion_cache(cache_dir)
+    before = conversion_cache.stats()["bytes"]
+    removed = conversion_cache.prune(
+        max_mb * 1024 * 1024 if max_mb is not None else None,
+        older_than=older_than_days * 86400 if older_than_days is not None else None,
+    )
+    freed = before - conversion_cache.stats()["bytes"]
+    typer.echo(f"🧹 Removed {removed} cached conversions ({_format_size(freed)} freed)")
+
+
+@cache_app.command("clear")
+def clear(
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Do not ask for confirmation")] = False,
+    cache_dir: CacheDirOption = None,
+) -> None:
+    """Delete every cached conversion, OCR result and caption."""
+    from pdf2foundry.ingest.conversion_cache import open_conversion_cache
+
+    if not yes and not typer.confirm("Delete all cached conversions, OCR results and captions?"):
+        raise typer.Exit(1)
+    removed = open_conversion_cache(cache_dir).clear()
+    for disk_cache in _disk_caches(cache_dir).values():
+        if disk_cache.path.exists():
+            disk_cache.clear()
+            disk_cache.close()
+    # Drop cached Docling probe results too; the next run probes again
+    from pdf2foundry.core.cache_paths import get_cache_root
+    from pdf2foundry.docling_env import CAPABILITY_CACHE_FILENAME
+
+    (get_cache_root(cache_dir) / CAPABILITY_CACHE_FILENAME).unlink(missing_ok=True)
+    typer.echo(f"🧹 Cleared {removed} cached conversions and the OCR, caption and capability caches")
+
+
+__all__ = ["cache_app"]
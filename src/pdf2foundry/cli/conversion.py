@@ -1,20 +1,39 @@
 """Conversion pipeline utilities for CLI."""
 
 import json
-from dataclasses import asdict
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
 import typer
 
 from pdf2foundry import __version__
-from pdf2foundry.builder.ir_builder import build_document_ir, map_ir_to_foundry_entries
+from pdf2foundry.builder.build_manifest import (
+    BUILD_MANIFEST_FILENAME,
+    build_fingerprint,
+    chapter_input_hash,
+    load_build_manifest,
+    save_build_manifest,
+    toc_input_hash,
+)
+from pdf2foundry.builder.ir_builder import (
+    build_document_ir,
+    chapter_entry_name,
+    iter_chapter_ir,
+    map_chapter_to_entry,
+)
 from pdf2foundry.builder.manifest import build_module_manifest, validate_module_manifest
 from pdf2foundry.builder.packaging import PackCompileError, compile_pack
-from pdf2foundry.builder.toc import build_toc_entry_from_entries, validate_toc_links
+from pdf2foundry.builder.sources import JournalSourceWriter
+from pdf2foundry.builder.toc import TocEntryRef, build_toc_entry, collect_toc_metadata
+from pdf2foundry.core.warm_resources import get_or_create
 from pdf2foundry.ingest.content_extractor import extract_semantic_content
+from pdf2foundry.ingest.doc_cache import DocCacheFormat
 from pdf2foundry.ingest.docling_parser import parse_structure_from_doc
 from pdf2foundry.ingest.ingestion import JsonOpts, ingest_docling
-from pdf2foundry.model.foundry import JournalEntry
+from pdf2foundry.ingest.page_stream import ProgressCallback, iter_semantic_pages
+from pdf2foundry.model.document import ParsedDocument
+from pdf2foundry.model.ir import ChapterIR
 from pdf2foundry.model.pipeline_options import PdfPipelineOptions
 from pdf2foundry.ui.progress import ProgressReporter
 
@@ -34,6 +53,7 @@ def run_conversion_pipeline(
     docling_json: Path | None,
     write_docling_json: bool,
     fallback_on_json_failure: bool,
+    docling_cache_format: DocCacheFormat = DocCacheFormat.JSON,
     ocr: str = "auto",
     picture_descriptions: str = "off",
     vlm_repo_id: str | None = None,
@@ -42,8 +62,19 @@ def run_conversion_pipeline(
     reflow_columns: bool = False,
     verbose: int = 0,
     no_ml: bool = False,
+    pipeline_options: PdfPipelineOptions | None = None,
+    rebuild: bool = False,
+    refresh_probe: bool = False,
 ) -> None:
-    """Run the main conversion pipeline."""
+    """Run the main conversion pipeline.
+
+    ``pipeline_options`` carries the options already validated by the CLI; when
+    omitted they are rebuilt from the individual arguments. Unless ``rebuild``
+    is set, journal sources whose inputs match the previous build's manifest
+    are kept as they are, and the pack is only compiled again when a source
+    file changed. ``refresh_probe`` re-probes Docling instead of using the
+    cached capability report.
+    """
     # Keep placeholder path for minimal PDFs used in unit tests
     if str(pdf).endswith(".pdf") and pdf.stat().st_size < 1024:
         typer.echo("\n⚠️  Conversion not yet implemented - this is a placeholder!")
@@ -60,10 +91,14 @@ def run_conversion_pipeline(
         # Use rich progress UI for end-user feedback
         with ProgressReporter() as pr:
             startup_task = pr.add_step("Starting…", total=None)
+            loaded_json_path: str | None = None
 
             def _emit(event: str, payload: dict[str, int | str]) -> None:
+                nonlocal loaded_json_path
                 if startup_task in pr.progress.task_ids:
                     pr.finish_task(startup_task)
+                if event == "ingest:loaded_from_cache":
+                    loaded_json_path = str(payload.get("path"))
                 pr.emit(event, payload)
 
             json_opts = JsonOpts(
@@ -71,12 +106,25 @@ def run_conversion_pipeline(
                 write=write_docling_json,
                 fallback_on_json_failure=fallback_on_json_failure,
                 default_path=(
-                    out_dir / mod_id / "sources" / "docling.json" if write_docling_json and docling_json is None else None
+                    out_dir / mod_id / "sources" / docling_cache_format.default_filename
+                    if write_docling_json and docling_json is None
+                    else None
+                ),
+                cache_format=docling_cache_format,
+                conversion_cache=pipeline_options.disk_cache if pipeline_options is not None else True,
+                cache_dir=(
+                    Path(pipeline_options.cache_dir) if pipeline_options is not None and pipeline_options.cache_dir else None
                 ),
             )
 
             # First, validate the PDF and perform ingestion - this can fail early
-            dl_doc = ingest_docling(pdf, json_opts=json_opts, on_progress=_emit)
+            dl_doc = ingest_docling(
+                pdf,
+                json_opts=json_opts,
+                on_progress=_emit,
+                workers=pipeline_options.workers if pipeline_options is not None else workers,
+                pages=pipeline_options.pages if pipeline_options is not None else pages,
+            )
 
             # Only create output directories after successful PDF ingestion
             journals_src_dir.mkdir(parents=True, exist_ok=True)
@@ -89,15 +137,16 @@ def run_conversion_pipeline(
                 parsed_doc = parse_structure_from_doc(dl_doc, on_progress=_emit)
 
                 # Create pipeline options from CLI arguments
-                pipeline_options = PdfPipelineOptions.from_cli(
-                    tables=tables,
-                    ocr=ocr,
-                    picture_descriptions=picture_descriptions,
-                    vlm_repo_id=vlm_repo_id,
-                    pages=pages,
-                    workers=workers,
-                    reflow_columns=reflow_columns,
-                )
+                if pipeline_options is None:
+                    pipeline_options = PdfPipelineOptions.from_cli(
+                        tables=tables,
+                        ocr=ocr,
+                        picture_descriptions=picture_descriptions,
+                        vlm_repo_id=vlm_repo_id,
+                        pages=pages,
+                        workers=workers,
+                        reflow_columns=reflow_columns,
+                    )
 
                 # Detect backend capabilities and resolve effective workers
                 from pdf2foundry.backend.caps import (
@@ -106,7 +155,13 @@ def run_conversion_pipeline(
                     resolve_effective_workers,
                 )
 
-                capabilities = detect_backend_capabilities()
+                # Probe results are cached on disk, and held once per batch when resources are kept warm
+                capabilities = get_or_create(
+                    ("backend_capabilities",),
+                    lambda: detect_backend_capabilities(
+                        refresh_probe=refresh_probe, cache_dir=pipeline_options.cache_dir if pipeline_options else None
+                    ),
+                )
                 total_pages = getattr(dl_doc, "page_count", None) if hasattr(dl_doc, "page_count") else None
                 pages_to_process = len(pages) if pages else total_pages
 
@@ -118,6 +173,8 @@ def run_conversion_pipeline(
 
                 # Update pipeline options with effective workers
                 pipeline_options.workers_effective = effective_workers
+                # Page workers can reload a cache-loaded document themselves
+                pipeline_options.docling_json_path = loaded_json_path
 
                 # Log worker resolution
                 log_worker_resolution(
@@ -128,13 +185,35 @@ def run_conversion_pipeline(
                     pages_to_process=pages_to_process,
                 )
 
-                # Extract semantic content (HTML + images/tables/links)
-                content = extract_semantic_content(
-                    dl_doc,
-                    out_assets=assets_dir,
-                    options=pipeline_options,
-                    on_progress=_emit,
-                )
+                # Reuse unchanged sources of the previous build with the same fingerprint
+                fingerprint = build_fingerprint(mod_id, mod_title, pipeline_options.to_dict())
+                manifest_path = module_dir / "sources" / BUILD_MANIFEST_FILENAME
+                previous = None if rebuild else load_build_manifest(manifest_path, fingerprint)
+                writer = JournalSourceWriter(journals_src_dir, fingerprint=fingerprint, previous=previous)
+
+                if pipeline_options.streaming:
+                    # Extract, map and write chapter by chapter; sources are complete afterwards
+                    written = write_sources_streaming(
+                        dl_doc,
+                        parsed_doc,
+                        assets_dir=assets_dir,
+                        journals_src_dir=journals_src_dir,
+                        options=pipeline_options,
+                        mod_id=mod_id,
+                        mod_title=mod_title,
+                        toc=toc,
+                        on_progress=_emit,
+                        writer=writer,
+                    )
+                    typer.echo(f"\n📝 Streamed {written} journal entries to {journals_src_dir}")
+                else:
+                    # Extract semantic content (HTML + images/tables/links)
+                    content = extract_semantic_content(
+                        dl_doc,
+                        out_assets=assets_dir,
+                        options=pipeline_options,
+                        on_progress=_emit,
+                    )
             except Exception:
                 # If any processing step fails after directories are created, clean them up
                 import shutil
@@ -143,32 +222,28 @@ def run_conversion_pipeline(
                     shutil.rmtree(module_dir, ignore_errors=True)
                 raise
 
-            # Build IR
-            ir = build_document_ir(
-                parsed_doc,
-                content,
-                mod_id=mod_id,
-                doc_title=mod_title,
-                on_progress=_emit,
-            )
-
-            # 4) Map IR to Foundry Journal models
-            entries: list[JournalEntry] = map_ir_to_foundry_entries(ir)
+            if not pipeline_options.streaming:
+                # Build IR
+                ir = build_document_ir(
+                    parsed_doc,
+                    content,
+                    mod_id=mod_id,
+                    doc_title=mod_title,
+                    on_progress=_emit,
+                )
 
-        # 5) Optionally add TOC entry at the beginning
-        if toc:
-            try:
-                toc_entry = build_toc_entry_from_entries(mod_id, entries, title="Table of Contents")
-                entries = [toc_entry, *entries]
-                issues = validate_toc_links(toc_entry, entries[1:])
-                for msg in issues:
-                    typer.echo(f"⚠️  TOC link warning: {msg}")
-            except Exception:
-                # On failure, follow error policy: omit TOC, continue
-                pass
+                # 4-6) Map IR to Foundry Journal models (plus optional TOC) and write sources JSON
+                write_chapter_sources(ir.chapters, writer, mod_id=mod_id, mod_title=mod_title, toc=toc)
 
-        # 6) Write sources JSON, one file per entry
-        _write_journal_sources(entries, journals_src_dir)
+        writer.remove_stale()
+        if previous is not None:
+            typer.echo(
+                f"\n♻️  Kept {writer.reused} unchanged journal entries, "
+                f"wrote {writer.written}, removed {writer.removed} stale"
+            )
+        # The compiled pack stays valid as long as no source file changed
+        pack_current = previous is not None and previous.packed and not writer.changed and any(packs_dir.iterdir())
+        save_build_manifest(manifest_path, writer.manifest(packed=pack_current))
 
         # 7) Write module.json
         _write_module_manifest(module_dir, mod_id, mod_title, pack_name, author, license)
@@ -176,9 +251,12 @@ def run_conversion_pipeline(
         # 8) Write minimal CSS
         _write_css(styles_dir)
 
-        if compile_pack_now:
+        if compile_pack_now and pack_current:
+            typer.echo(f"\n✅ Pack at {packs_dir} is up to date (no journal sources changed)")
+        elif compile_pack_now:
             try:
                 compile_pack(module_dir, pack_name)
+                save_build_manifest(manifest_path, writer.manifest(packed=True))
                 typer.echo(f"\n✅ Compiled pack to {module_dir / 'packs' / pack_name}")
             except PackCompileError as exc:
                 typer.echo(f"\n❌ ERROR: Pack compilation failed: {exc}")
@@ -201,38 +279,79 @@ def run_conversion_pipeline(
             raise typer.Exit(1) from exc
 
 
-def _slugify(text: str) -> str:
-    """Convert text to a filename-safe slug."""
-    import re as _re
-
-    s = _re.sub(r"[^A-Za-z0-9]+", "-", (text or "").lower()).strip("-")
-    s = _re.sub(r"-+", "-", s)
-    return s or "untitled"
-
-
-def _write_journal_sources(entries: list[JournalEntry], journals_src_dir: Path) -> None:
-    """Write journal source files."""
-    used_names: set[str] = set()
-    for idx, entry in enumerate(entries, start=1):
-        base = _slugify(entry.name)
-        name = base
-        n = 1
-        while name in used_names:
-            n += 1
-            name = f"{base}-{n}"
-        used_names.add(name)
-        out_file = journals_src_dir / f"{idx:03d}-{name}.json"
-        # Include Classic Level key so the Foundry CLI packs primary docs
-        data = asdict(entry)
-        # Add Classic Level keys for Foundry CLI (root and pages)
-        data["_key"] = f"!journal!{entry._id}"
-        if isinstance(data.get("pages"), list):
-            for p in data["pages"]:
-                pid = p.get("_id")
-                if isinstance(pid, str) and pid:
-                    p["_key"] = f"!journal.pages!{entry._id}.{pid}"
-        with out_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+def write_chapter_sources(
+    chapters: Iterable[ChapterIR],
+    writer: JournalSourceWriter,
+    *,
+    mod_id: str,
+    mod_title: str,
+    toc: bool,
+) -> int:
+    """Map chapters to journal entries and write each one as it arrives.
+
+    A chapter whose inputs match the writer's previous build keeps its existing
+    file and is not mapped again. The TOC is built at the end from the
+    chapters' page IDs and written to the first file slot.
+
+    Returns:
+        Number of journal entries in the sources (including the TOC)
+    """
+    toc_title = "Table of Contents"
+    toc_slot = writer.reserve(toc_title) if toc else None
+    toc_meta: list[TocEntryRef] = []
+
+    count = 0
+    for chapter_index, chapter in enumerate(chapters, start=1):
+        input_hash = chapter_input_hash(chapter, chapter_index, writer.fingerprint)
+        slot = writer.reserve(chapter_entry_name(chapter, chapter_index))
+        record = writer.reuse(slot, input_hash, with_toc=True)
+        if record is not None and record.toc is not None:
+            toc_ref = record.toc
+        else:
+            entry = map_chapter_to_entry(chapter, chapter_index, mod_id=mod_id, doc_title=mod_title)
+            toc_ref = collect_toc_metadata([entry])[0]
+            writer.write(entry, slot, input_hash=input_hash, toc=toc_ref)
+        toc_meta.append(toc_ref)
+        count += 1
+
+    if toc_slot is not None:
+        try:
+            input_hash = toc_input_hash(toc_meta, toc_title, writer.fingerprint)
+            if writer.reuse(toc_slot, input_hash) is None:
+                writer.write(build_toc_entry(mod_id, toc_meta, title=toc_title), toc_slot, input_hash=input_hash)
+            count += 1
+        except Exception:
+            # On failure, follow error policy: omit TOC, continue
+            pass
+    return count
+
+
+def write_sources_streaming(
+    dl_doc: Any,
+    parsed_doc: ParsedDocument,
+    *,
+    assets_dir: Path,
+    journals_src_dir: Path,
+    options: PdfPipelineOptions,
+    mod_id: str,
+    mod_title: str,
+    toc: bool,
+    on_progress: ProgressCallback = None,
+    writer: JournalSourceWriter | None = None,
+) -> int:
+    """Stream pages through extract, clean, map and write, flushing each chapter as it closes.
+
+    Writes the same source files as the non-streaming pipeline, but holds only
+    the pages of the current chapter.
+
+    Returns:
+        Number of journal entries in the sources (including the TOC)
+    """
+    if writer is None:
+        writer = JournalSourceWriter(journals_src_dir)
+    pages = iter_semantic_pages(dl_doc, assets_dir, options, on_progress=on_progress)
+    chapters = iter_chapter_ir(parsed_doc, pages, mod_title, on_progress)
+    return write_chapter_sources(chapters, writer, mod_id=mod_id, mod_title=mod_title, toc=toc)
 
 
 def _write_module_manifest(
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import typer
 
+from pdf2foundry.ingest.doc_cache import DocCacheFormat
 from pdf2foundry.model.pipeline_options import PdfPipelineOptions
 
 
@@ -48,6 +49,7 @@ def display_docling_cache_behavior(
     fallback_on_json_failure: bool,
     out_dir: Path,
     mod_id: str,
+    cache_format: DocCacheFormat = DocCacheFormat.JSON,
 ) -> None:
     """Display Docling JSON cache behavior summary."""
     if docling_json is not None and write_docling_json:
@@ -55,10 +57,12 @@ def display_docling_cache_behavior(
     if docling_json is not None:
         typer.echo(f"🗃️  Docling JSON cache: {docling_json} (load if exists; else convert then save)")
     elif write_docling_json:
-        default_json_path = out_dir / mod_id / "sources" / "docling.json"
+        default_json_path = out_dir / mod_id / "sources" / cache_format.default_filename
         typer.echo(f"🗃️  Docling JSON cache: will write to default path {default_json_path} when converting")
     else:
         typer.echo("🗃️  Docling JSON cache: disabled (no load/save)")
+    if cache_format is DocCacheFormat.BINARY and (docling_json is not None or write_docling_json):
+        typer.echo("🗃️  Docling cache format: binary (compressed, tied to this PDF's hash)")
     if fallback_on_json_failure:
         typer.echo("↩️  Fallback on JSON failure: enabled")
 
@@ -0,0 +1,41 @@
+"""Environment check command for the CLI."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def doctor(
+    refresh: Annotated[
+        bool, typer.Option("--refresh", help="Probe again instead of using the cached result for this environment")
+    ] = False,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option("--cache-dir", help="Directory for persistent caches (default: per-user cache directory)"),
+    ] = None,
+) -> None:
+    """Check environment for Docling and docling-core availability.
+
+    This command performs a lightweight probe without processing any PDFs.
+    It reports installed versions and whether a minimal DocumentConverter
+    can be constructed. A successful probe is cached per interpreter, platform
+    and Docling version under --cache-dir; --refresh probes again.
+    """
+    # Import inside the function to avoid hard dependency at CLI import time
+    try:
+        from pdf2foundry.docling_env import (
+            format_report_lines,
+            probe_docling_cached,
+            report_is_ok,
+        )
+    except Exception as exc:  # pragma: no cover - extremely unlikely
+        typer.echo(f"Error: failed to load environment probe: {exc}", err=True)
+        raise typer.Exit(1) from exc
+
+    report = probe_docling_cached(refresh=refresh, cache_dir=cache_dir)
+    for line in format_report_lines(report):
+        typer.echo(line)
+
+    if not report_is_ok(report):
+        raise typer.Exit(1)
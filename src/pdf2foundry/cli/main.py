@@ -5,15 +5,17 @@ from typing import Annotated
 
 import typer
 
-from pdf2foundry import __version__
-from pdf2foundry.cli.conversion import run_conversion_pipeline
-from pdf2foundry.cli.display import (
-    display_configuration,
-    display_docling_cache_behavior,
-    display_validation_warnings,
-)
-from pdf2foundry.cli.interactive import prompt_for_missing_args
+from pdf2foundry.cli.batch import batch
+from pdf2foundry.cli.cache import cache_app
+from pdf2foundry.cli.doctor import doctor
 from pdf2foundry.cli.parse import parse_page_spec
+from pdf2foundry.cli.version import version, version_callback
+from pdf2foundry.ingest.doc_cache import DocCacheFormat
+
+# Keep this module cheap to import: `pdf2foundry --help`, `version` and
+# `doctor` must not pay for the conversion pipeline (builder, ingest, PIL,
+# pytesseract, rich). Commands import what they need when they run; see
+# tests/unit/test_cli_import_time.py for the budget.
 
 app = typer.Typer(
     name="pdf2foundry",
@@ -154,6 +156,14 @@ def convert(
             help=("If loading from JSON fails, fall back to conversion " "(and overwrite when applicable)."),
         ),
     ] = False,
+    docling_cache_format: Annotated[
+        DocCacheFormat,
+        typer.Option(
+            "--docling-cache-format",
+            metavar="FORMAT",
+            help="Format for writing the Docling cache: 'json' (text) or 'binary' (compact; loads either).",
+        ),
+    ] = DocCacheFormat.JSON,
     pages: Annotated[
         str | None,
         typer.Option(
@@ -178,6 +188,38 @@ def convert(
             ),
         ),
     ] = False,  # Default: disabled (experimental feature, may affect text order)
+    disk_cache: Annotated[
+        bool,
+        typer.Option(
+            "--disk-cache/--no-disk-cache",
+            help="Reuse conversions, OCR results and captions from earlier runs via the persistent cache (default: yes)",
+        ),
+    ] = True,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option("--cache-dir", help="Directory for persistent caches (default: per-user cache directory)"),
+    ] = None,
+    image_cache_mb: Annotated[
+        int,
+        typer.Option("--image-cache-mb", help="Memory budget for cached page/region images in MB (0 = no byte limit)"),
+    ] = 512,
+    streaming: Annotated[
+        bool,
+        typer.Option(
+            "--streaming", help="Write each chapter as soon as its pages are processed (flat memory on long books)"
+        ),
+    ] = False,
+    rebuild: Annotated[
+        bool,
+        typer.Option(
+            "--rebuild",
+            help="Regenerate every journal entry and recompile the pack, ignoring the previous build manifest",
+        ),
+    ] = False,
+    refresh_probe: Annotated[
+        bool,
+        typer.Option("--refresh-probe", help="Probe the Docling environment again instead of using the cached result"),
+    ] = False,
     no_ml: Annotated[
         bool,
         typer.Option(
@@ -236,6 +278,14 @@ def convert(
         pdf2foundry convert "Academic.pdf" --mod-id "paper" --mod-title "Research Paper" \\
             --reflow-columns
     """
+    from pdf2foundry.cli.conversion import run_conversion_pipeline
+    from pdf2foundry.cli.display import (
+        display_configuration,
+        display_docling_cache_behavior,
+        display_validation_warnings,
+    )
+    from pdf2foundry.cli.interactive import prompt_for_missing_args
+
     # Configure logging based on verbosity level
     from pdf2foundry.ingest.logging_config import configure_logging
 
@@ -319,6 +369,10 @@ def convert(
             pages=parsed_pages,
             workers=workers,
             reflow_columns=reflow_columns,
+            disk_cache=disk_cache,
+            cache_dir=str(cache_dir) if cache_dir is not None else None,
+            image_cache_mb=image_cache_mb,
+            streaming=streaming,
         )
     except ValueError as exc:
         typer.echo(f"Error: {exc}")
@@ -365,7 +419,9 @@ def convert(
     )
 
     # Summarize Docling JSON cache behavior
-    display_docling_cache_behavior(docling_json, write_docling_json, fallback_on_json_failure, out_dir, mod_id)
+    display_docling_cache_behavior(
+        docling_json, write_docling_json, fallback_on_json_failure, out_dir, mod_id, docling_cache_format
+    )
 
     # Execute single-pass ingestion pipeline
     run_conversion_pipeline(
@@ -383,6 +439,7 @@ def convert(
         docling_json=docling_json,
         write_docling_json=write_docling_json,
         fallback_on_json_failure=fallback_on_json_failure,
+        docling_cache_format=docling_cache_format,
         ocr=ocr,
         picture_descriptions=picture_descriptions,
         vlm_repo_id=vlm_repo_id,
@@ -391,22 +448,12 @@ def convert(
         reflow_columns=reflow_columns,
         verbose=verbose,
         no_ml=no_ml,
+        pipeline_options=pipeline_options,
+        rebuild=rebuild,
+        refresh_probe=refresh_probe,
     )
 
 
-@app.command()
-def version() -> None:
-    """Show version information."""
-    typer.echo(f"pdf2foundry version {__version__}")
-
-
-def version_callback(value: bool) -> None:
-    """Version callback for --version flag."""
-    if value:
-        typer.echo(f"pdf2foundry version {__version__}")
-        raise typer.Exit()
-
-
 @app.callback()
 def main(
     version: Annotated[
@@ -437,31 +484,10 @@ def main(
     pass
 
 
-@app.command()
-def doctor() -> None:
-    """Check environment for Docling and docling-core availability.
-
-    This command performs a lightweight probe without processing any PDFs.
-    It reports installed versions and whether a minimal DocumentConverter
-    can be constructed.
-    """
-    # Import inside the function to avoid hard dependency at CLI import time
-    try:
-        from pdf2foundry.docling_env import (
-            format_report_lines,
-            probe_docling,
-            report_is_ok,
-        )
-    except Exception as exc:  # pragma: no cover - extremely unlikely
-        typer.echo(f"Error: failed to load environment probe: {exc}", err=True)
-        raise typer.Exit(1) from exc
-
-    report = probe_docling()
-    for line in format_report_lines(report):
-        typer.echo(line)
-
-    if not report_is_ok(report):
-        raise typer.Exit(1)
+app.command()(version)
+app.command()(doctor)
+app.command()(batch)
+app.add_typer(cache_app, name="cache")
 
 
 if __name__ == "__main__":  # pragma: no cover - executed only via `python -m`
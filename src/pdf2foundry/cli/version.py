@@ -0,0 +1,17 @@
+"""Version command and --version flag for the CLI."""
+
+import typer
+
+
+def version() -> None:
+    """Show version information."""
+    from pdf2foundry import __version__
+
+    typer.echo(f"pdf2foundry version {__version__}")
+
+
+def version_callback(value: bool) -> None:
+    """Version callback for --version flag."""
+    if value:
+        version()
+        raise typer.Exit()
@@ -0,0 +1,50 @@
+"""Location of PDF2Foundry's persistent caches.
+
+Caches that outlive a single run (OCR results, captions, conversions) live under
+one per-user root directory so that they are shared between output folders and
+can be inspected or cleared in one place.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+# Environment variable overriding the cache root (used by tests and CI)
+CACHE_DIR_ENV = "PDF2FOUNDRY_CACHE_DIR"
+
+
+def get_cache_root(override: str | Path | None = None) -> Path:
+    """Return the root directory for persistent caches.
+
+    Resolution order: explicit override, ``PDF2FOUNDRY_CACHE_DIR``, then the
+    platform's user cache directory (``%LOCALAPPDATA%`` on Windows,
+    ``~/Library/Caches`` on macOS, ``$XDG_CACHE_HOME`` or ``~/.cache`` elsewhere).
+
+    Args:
+        override: Optional directory taking precedence over everything else
+
+    Returns:
+        Cache root path (not created)
+    """
+    if override:
+        return Path(override).expanduser()
+
+    env_dir = os.environ.get(CACHE_DIR_ENV)
+    if env_dir:
+        return Path(env_dir).expanduser()
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "pdf2foundry"
+
+
+__all__ = [
+    "CACHE_DIR_ENV",
+    "get_cache_root",
+]
@@ -0,0 +1,81 @@
+"""Reuse of expensive resources across the documents of one process.
+
+A single conversion builds its Docling DocumentConverter, caption engine and
+backend capability report once and throws them away when it ends. A batch run
+converting many PDFs in one process would pay for model loading and probing
+again for every document.
+
+Inside ``warm_resources()``, get_or_create() keeps each resource after its
+first use and hands the same instance to every later document asking with the
+same key. Outside of it, get_or_create() simply calls the factory, so single
+conversions (and tests that patch the factories) behave as before.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_registry: dict[Hashable, Any] | None = None
+_lock = threading.RLock()
+
+
+@contextmanager
+def warm_resources() -> Iterator[None]:
+    """Keep resources created by get_or_create() until the block exits.
+
+    Nested blocks share the outermost registry.
+    """
+    global _registry
+    with _lock:
+        outermost = _registry is None
+        if outermost:
+            _registry = {}
+    try:
+        yield
+    finally:
+        if outermost:
+            with _lock:
+                released = len(_registry or {})
+                _registry = None
+            logger.debug("Released %d warm resources", released)
+
+
+def get_or_create(key: Hashable, factory: Callable[[], T]) -> T:  # noqa: UP047
+    """Return the warm resource for ``key``, creating it with ``factory`` on first use.
+
+    Args:
+        key: Identifies the resource and every setting it was built with
+        factory: Builds the resource; failures propagate and nothing is kept
+
+    Returns:
+        The shared instance inside warm_resources(), otherwise a new one
+    """
+    with _lock:
+        if _registry is None:
+            return factory()
+        if key in _registry:
+            return _registry[key]  # type: ignore[no-any-return]
+        resource = factory()
+        _registry[key] = resource
+        logger.debug("Keeping warm resource: %s", key)
+        return resource
+
+
+def is_warm() -> bool:
+    """Whether resources are currently kept between documents."""
+    return _registry is not None
+
+
+__all__ = [
+    "get_or_create",
+    "is_warm",
+    "warm_resources",
+]
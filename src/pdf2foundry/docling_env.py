@@ -3,11 +3,36 @@
 This module provides a lightweight probe to verify whether Docling and
 Docling Core are available and minimally usable in the current Python
 environment without performing heavy PDF processing.
+
+The probe imports Docling and constructs a DocumentConverter, which is slow.
+probe_docling_cached() keeps successful probe results in ``capabilities.json``
+under the persistent cache root, keyed by the interpreter, the platform and the
+installed docling/docling-core versions, so later runs skip the probe.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+import platform
+import sys
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from pdf2foundry.core.cache_paths import get_cache_root
+
+logger = logging.getLogger(__name__)
+
+CAPABILITY_CACHE_FILENAME = "capabilities.json"
+
+# Bump when DoclingProbeReport or the probe itself changes
+_PROBE_FORMAT_VERSION = 1
+
+# Environments remembered in the capability cache (oldest dropped first)
+_MAX_CACHED_PROBES = 16
 
 
 @dataclass
@@ -135,6 +160,86 @@ def probe_docling() -> DoclingProbeReport:
     )
 
 
+def probe_cache_key() -> str:
+    """Identify the environment a probe result is valid for, without importing Docling."""
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as pkg_version
+
+    versions: dict[str, str | None] = {}
+    for dist in ("docling", "docling-core"):
+        try:
+            versions[dist] = pkg_version(dist)
+        except PackageNotFoundError:
+            versions[dist] = None
+    material = {
+        "format": _PROBE_FORMAT_VERSION,
+        "interpreter": sys.executable,
+        "python": sys.version,
+        "platform": sys.platform,
+        "machine": platform.machine(),
+        "versions": versions,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def probe_docling_cached(
+    *,
+    refresh: bool = False,
+    cache_dir: str | Path | None = None,
+    probe: Callable[[], DoclingProbeReport] = probe_docling,
+) -> DoclingProbeReport:
+    """Return the probe result for this environment, probing only on a cache miss.
+
+    Only successful probes are cached: a failed one is cheap to repeat and
+    should not outlive the fix (e.g. installing a missing dependency).
+
+    Args:
+        refresh: Probe again even if a cached result exists, and store it
+        cache_dir: Persistent cache root override (see core/cache_paths.py)
+        probe: Function performing the actual probe
+
+    Returns:
+        Cached or freshly probed report
+    """
+    path = get_cache_root(cache_dir) / CAPABILITY_CACHE_FILENAME
+    key = probe_cache_key()
+
+    cached: dict[str, dict[str, object]] = {}
+    try:
+        loaded = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(loaded, dict):
+            cached = loaded
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.debug("Ignoring unreadable capability cache %s: %s", path, exc)
+
+    if not refresh and key in cached:
+        try:
+            report = DoclingProbeReport(**cached[key])  # type: ignore[arg-type]
+            logger.debug("Using cached Docling probe from %s", path)
+            return report
+        except TypeError as exc:
+            logger.debug("Ignoring malformed capability cache entry: %s", exc)
+
+    report = probe()
+    try:
+        if not report_is_ok(report):
+            return report
+        cached.pop(key, None)
+        cached[key] = asdict(report)
+        while len(cached) > _MAX_CACHED_PROBES:
+            cached.pop(next(iter(cached)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cached, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.debug("Could not write capability cache %s: %s", path, exc)
+    return report
+
+
 def report_is_ok(report: DoclingProbeReport) -> bool:
     """Return True when the environment appears suitable for Docling usage."""
 
@@ -165,8 +270,11 @@ def format_report_lines(report: DoclingProbeReport) -> list[str]:
 
 
 __all__ = [
+    "CAPABILITY_CACHE_FILENAME",
     "DoclingProbeReport",
     "format_report_lines",
+    "probe_cache_key",
     "probe_docling",
+    "probe_docling_cached",
     "report_is_ok",
 ]
@@ -0,0 +1,111 @@
+"""Content-addressed storage for extracted image assets.
+
+Images are stored in the module's ``assets/`` directory under a name derived
+from the SHA-256 of their bytes, so an image repeated across pages (a logo, a
+page border) is written once, and every ImageAsset and ``<img>`` src showing
+it points at the same file. A file that already exists under its hash name is
+never written again.
+
+Image files referenced by the exported HTML are hard-linked into the assets
+directory, or reflinked (copy-on-write clone) where hard links are not
+possible, and copied only as a last resort.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Hex digits of the SHA-256 kept in asset names (64 bits)
+ASSET_HASH_CHARS = 16
+
+# ioctl request of the Linux FICLONE operation
+_FICLONE = 0x40049409
+
+
+def asset_name(digest: str, ext: str) -> str:
+    """Return the file name of an asset with the given content digest."""
+    return f"img-{digest[:ASSET_HASH_CHARS]}.{ext}"
+
+
+def _tmp_path(dest: Path) -> Path:
+    return dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+
+
+def store_bytes(assets_dir: Path, data: bytes, ext: str) -> str:
+    """Store image bytes under their content hash.
+
+    Args:
+        assets_dir: The module's assets directory
+        data: Encoded image bytes
+        ext: File extension without the dot
+
+    Returns:
+        The asset's file name inside ``assets_dir``
+    """
+    name = asset_name(hashlib.sha256(data).hexdigest(), ext)
+    dest = assets_dir / name
+    if not dest.exists():
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        tmp = _tmp_path(dest)
+        tmp.write_bytes(data)
+        os.replace(tmp, dest)
+    return name
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    """Clone ``src`` to ``dest`` without copying data, if the filesystem supports it."""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        dest.unlink(missing_ok=True)
+        return False
+
+
+def store_file(assets_dir: Path, src: Path) -> str:
+    """Store an image file under its content hash.
+
+    The file is hard-linked, reflinked or, failing both, copied.
+
+    Args:
+        assets_dir: The module's assets directory
+        src: Existing image file
+
+    Returns:
+        The asset's file name inside ``assets_dir``
+
+    Raises:
+        OSError: If the file cannot be read or stored
+    """
+    with open(src, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    name = asset_name(digest, src.suffix.lstrip(".").lower() or "bin")
+    dest = assets_dir / name
+    if dest.exists():
+        return name
+
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path(dest)
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        if not _reflink(src, tmp):
+            shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+    return name
+
+
+__all__ = ["ASSET_HASH_CHARS", "asset_name", "store_bytes", "store_file"]
@@ -0,0 +1,166 @@
+"""Caption result caching for PDF2Foundry.
+
+CaptionCache keeps generated captions in an in-memory LRU, optionally backed by
+a persistent DiskCache so that each caption is generated once across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+from PIL import Image
+
+from pdf2foundry.ingest.lru_cache import LruCache
+
+if TYPE_CHECKING:
+    from pdf2foundry.ingest.caption_engine import HFCaptionEngine
+    from pdf2foundry.ingest.disk_cache import DiskCache
+    from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+logger = logging.getLogger(__name__)
+
+# Byte budget of the persistent caption cache
+DEFAULT_CAPTION_DISK_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class CaptionCache:
+    """LRU cache for caption results to avoid reprocessing.
+
+    An optional DiskCache sits behind the in-memory LRU so that each caption is
+    generated once across runs and across books sharing artwork. Disk entries
+    are keyed by image hash and the caption engine fingerprint (model id and
+    generation parameters).
+
+    Thread Safety:
+    - This cache is NOT thread-safe by design for performance reasons
+    - It's intended to be used within a single pipeline execution thread
+    - If multi-threading is needed, each thread should have its own cache instance
+    - The current PDF2Foundry pipeline is single-threaded per document
+    """
+
+    def __init__(self, max_size: int = 2000, disk_cache: DiskCache | None = None, model_fingerprint: str = "") -> None:
+        """Initialize caption cache with LRU eviction.
+
+        Args:
+            max_size: Maximum number of entries to cache
+            disk_cache: Optional persistent tier consulted on in-memory misses
+            model_fingerprint: Caption engine identity included in persistent keys
+        """
+        self._cache: LruCache[str, str | None] = LruCache(max_entries=max_size)
+        self._max_size = max_size
+        self._disk_cache = disk_cache
+        self._model_fingerprint = model_fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    def _get_image_hash(self, image: Image.Image) -> str:
+        """Generate a hash key for an image."""
+        # Use shared image hashing utility for consistency
+        from pdf2foundry.ingest.image_cache import get_image_hash
+
+        return get_image_hash(image)
+
+    def _disk_key(self, key: str) -> str:
+        return hashlib.sha256(f"{key}:{self._model_fingerprint}".encode()).hexdigest()
+
+    def _disable_disk_cache(self, error: Exception) -> None:
+        logger.warning(f"Persistent caption cache disabled: {error}")
+        self._disk_cache = None
+
+    def get(self, image: Image.Image) -> str | None | object:
+        """Get cached caption result if available.
+
+        Returns:
+            Cached caption string, None if no caption was generated,
+            or a sentinel object if not in cache
+        """
+        key = self._get_image_hash(image)
+
+        if key in self._cache:
+            # None is a valid cached value (no caption was generated)
+            self.hits += 1
+            return self._cache.get(key)
+
+        if self._disk_cache is not None:
+            try:
+                payload = self._disk_cache.get(self._disk_key(key))
+            except (sqlite3.Error, OSError) as e:
+                self._disable_disk_cache(e)
+                payload = None
+            if payload is not None:
+                caption: str | None = json.loads(payload)
+                self._cache.put(key, caption)
+                self.hits += 1
+                return caption
+
+        self.misses += 1
+        return object()  # Sentinel for "not found"
+
+    def set(self, image: Image.Image, caption: str | None) -> None:
+        """Cache caption result with LRU eviction."""
+        key = self._get_image_hash(image)
+        self._cache.put(key, caption)
+
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(self._disk_key(key), json.dumps(caption).encode("utf-8"))
+            except (sqlite3.Error, OSError) as e:
+                self._disable_disk_cache(e)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for this run plus persistent tier statistics."""
+        stats: dict[str, Any] = {"entries": len(self._cache), "hits": self.hits, "misses": self.misses, "disk": None}
+        if self._disk_cache is not None:
+            try:
+                stats["disk"] = self._disk_cache.stats()
+            except (sqlite3.Error, OSError) as e:
+                self._disable_disk_cache(e)
+        return stats
+
+    def format_stats(self) -> str:
+        """Summarize cache effectiveness in one line for logs and reports."""
+        stats = self.stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups * 100 if lookups else 0.0
+        summary = f"Caption cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.1f}% hit rate)"
+        disk = stats["disk"]
+        if disk is not None:
+            summary += (
+                f"; disk: {disk['entries']} entries, {disk['bytes'] / 1024 / 1024:.1f}/"
+                f"{disk['max_bytes'] / 1024 / 1024:.0f} MB, {disk['evictions']} evicted"
+            )
+        return summary
+
+    def clear(self) -> None:
+        """Clear the in-memory cache (the persistent tier is left untouched)."""
+        self._cache.clear()
+
+
+def create_caption_cache(options: PdfPipelineOptions, engine: HFCaptionEngine, max_size: int = 2000) -> CaptionCache:
+    """Build the caption cache for a pipeline run, with a disk tier unless disabled.
+
+    Args:
+        options: Pipeline options (``disk_cache`` and ``cache_dir`` are honored)
+        engine: Caption engine whose fingerprint scopes persistent entries
+        max_size: Maximum number of in-memory entries
+
+    Returns:
+        CaptionCache instance
+    """
+    if not getattr(options, "disk_cache", False):
+        return CaptionCache(max_size=max_size)
+
+    from pdf2foundry.ingest.disk_cache import open_disk_cache
+
+    disk_cache = open_disk_cache("captions", DEFAULT_CAPTION_DISK_CACHE_BYTES, getattr(options, "cache_dir", None))
+    return CaptionCache(max_size=max_size, disk_cache=disk_cache, model_fingerprint=engine.cache_fingerprint())
+
+
+__all__ = [
+    "CaptionCache",
+    "create_caption_cache",
+]
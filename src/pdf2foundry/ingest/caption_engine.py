@@ -7,13 +7,23 @@ images when picture descriptions are enabled.
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any, Protocol
 
 from PIL import Image
 
+from pdf2foundry.ingest.caption_cache import CaptionCache, create_caption_cache
+
 logger = logging.getLogger(__name__)
 
+# Florence-2 prompt and decoding parameters (part of the persistent cache key)
+_FLORENCE_PROMPT = "<MORE_DETAILED_CAPTION>"
+_FLORENCE_GENERATION_KWARGS: dict[str, Any] = {"max_new_tokens": 1024, "num_beams": 3, "do_sample": False}
+
+# Bump when caption post-processing changes so stale persistent entries are ignored
+_CAPTION_FORMAT_VERSION = 1
+
 
 class CaptionEngine(Protocol):
     """Protocol for image captioning engines."""
@@ -29,6 +39,10 @@ class CaptionEngine(Protocol):
         """
         ...
 
+    def generate_batch(self, pil_images: list[Image.Image]) -> list[str | None]:
+        """Generate captions for several PIL images, in input order."""
+        ...
+
     def is_available(self) -> bool:
         """Check if the caption engine is available and functional."""
         ...
@@ -77,6 +91,13 @@ class HFCaptionEngine:
                 self._available = False
         return self._available
 
+    def cache_fingerprint(self) -> str:
+        """Identify the model and generation parameters for persistent cache keys."""
+        params: dict[str, Any] = {"model": self.model_id, "format": _CAPTION_FORMAT_VERSION}
+        if "florence" in self.model_id.lower():
+            params.update(prompt=_FLORENCE_PROMPT, **_FLORENCE_GENERATION_KWARGS)
+        return json.dumps(params, sort_keys=True)
+
     def _load_pipeline(self) -> None:
         """Lazily load the transformers pipeline with robust error handling and timeout."""
         if self._pipeline is None:
@@ -201,74 +222,25 @@ class HFCaptionEngine:
                 processor = self._pipeline["processor"]
 
                 # Florence-2 uses a specific prompt format for captioning
-                prompt = "<MORE_DETAILED_CAPTION>"
+                prompt = _FLORENCE_PROMPT
                 inputs = processor(text=prompt, images=pil_image, return_tensors="pt")
 
                 # Generate with Florence-2
                 generated_ids = model.generate(
                     input_ids=inputs["input_ids"],
                     pixel_values=inputs["pixel_values"],
-                    max_new_tokens=1024,
-                    num_beams=3,
-                    do_sample=False,
+                    **_FLORENCE_GENERATION_KWARGS,
                 )
 
-                # Decode the result
-                generated_text = processor.batch_decode(generated_ids, skip_special_tokens=False)[0]
-
-                # Extract the caption from Florence-2's response format
-                # Florence-2 returns: "<MORE_DETAILED_CAPTION>actual caption text"
-                result = generated_text.replace(prompt, "").strip() if prompt in generated_text else generated_text.strip()
-
-                # Convert to expected format for downstream processing
-                result = [{"generated_text": result}]
+                # Decode the result into the format expected downstream
+                result = _florence_results(processor, generated_ids)[0]
             else:
                 # Standard pipeline generation
                 result = self._pipeline(pil_image)
 
-            # Extract text from result - format varies by model
-            if isinstance(result, list) and len(result) > 0:
-                if isinstance(result[0], dict) and "generated_text" in result[0]:
-                    caption = result[0]["generated_text"]
-                elif isinstance(result[0], dict) and "text" in result[0]:
-                    caption = result[0]["text"]
-                else:
-                    # Fallback: convert to string
-                    caption = str(result[0])
-            elif isinstance(result, dict):
-                if "generated_text" in result:
-                    caption = result["generated_text"]
-                elif "text" in result:
-                    caption = result["text"]
-                else:
-                    caption = str(result)
-            else:
-                caption = str(result)
-
-            # Clean up the caption
-            caption = caption.strip()
-
-            # Remove common prefixes that some models add
-            prefixes_to_remove = [
-                "a photo of ",
-                "an image of ",
-                "this is ",
-                "the image shows ",
-                "image: ",
-            ]
-
-            caption_lower = caption.lower()
-            for prefix in prefixes_to_remove:
-                if caption_lower.startswith(prefix):
-                    caption = caption[len(prefix) :]
-                    break
-
-            # Capitalize first letter
-            if caption:
-                caption = caption[0].upper() + caption[1:]
-
+            caption = _caption_from_result(result)
             logger.debug(f"Generated caption: {caption}")
-            return caption if caption else None
+            return caption
 
         except Exception as e:
             # Import here to avoid circular imports
@@ -282,75 +254,128 @@ class HFCaptionEngine:
                 logger.error(f"Caption generation failed: {e}")
             return None
 
+    def generate_batch(self, pil_images: list[Image.Image]) -> list[str | None]:
+        """Generate captions for several images in one model call.
 
-class CaptionCache:
-    """LRU cache for caption results to avoid reprocessing.
-
-    Thread Safety:
-    - This cache is NOT thread-safe by design for performance reasons
-    - It's intended to be used within a single pipeline execution thread
-    - If multi-threading is needed, each thread should have its own cache instance
-    - The current PDF2Foundry pipeline is single-threaded per document
-    """
-
-    def __init__(self, max_size: int = 2000) -> None:
-        """Initialize caption cache with LRU eviction.
+        Florence-2 inputs are stacked into a single ``generate`` call and other
+        models go through the pipeline with ``batch_size``, which amortizes
+        per-call overhead. If the batched call fails, images are captioned one
+        by one so a single bad image does not cost the whole batch.
 
         Args:
-            max_size: Maximum number of entries to cache
-        """
-        self._cache: dict[str, str | None] = {}
-        self._access_order: list[str] = []
-        self._max_size = max_size
-
-    def _get_image_hash(self, image: Image.Image) -> str:
-        """Generate a hash key for an image."""
-        # Use shared image hashing utility for consistency
-        from pdf2foundry.ingest.image_cache import get_image_hash
-
-        return get_image_hash(image)
-
-    def get(self, image: Image.Image) -> str | None | object:
-        """Get cached caption result if available.
+            pil_images: PIL Images to caption
 
         Returns:
-            Cached caption string, None if no caption was generated,
-            or a sentinel object if not in cache
+            Captions in input order (None where captioning failed)
         """
-        key = self._get_image_hash(image)
+        if len(pil_images) <= 1:
+            return [self.generate(pil_image) for pil_image in pil_images]
 
-        if key in self._cache:
-            # Update access order (move to end)
-            self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._cache[key]
+        if not self.is_available():
+            logger.warning("HF Caption engine not available")
+            return [None] * len(pil_images)
 
-        return object()  # Sentinel for "not found"
+        try:
+            if self._pipeline is None:
+                self._load_pipeline()
 
-    def set(self, image: Image.Image, caption: str | None) -> None:
-        """Cache caption result with LRU eviction."""
-        key = self._get_image_hash(image)
+            results: list[Any]
+            if isinstance(self._pipeline, dict) and self._pipeline.get("type") == "florence2":
+                model = self._pipeline["model"]
+                processor = self._pipeline["processor"]
 
-        # If already exists, update access order
-        if key in self._cache:
-            self._access_order.remove(key)
+                inputs = processor(text=[_FLORENCE_PROMPT] * len(pil_images), images=pil_images, return_tensors="pt")
+                generated_ids = model.generate(
+                    input_ids=inputs["input_ids"],
+                    pixel_values=inputs["pixel_values"],
+                    **_FLORENCE_GENERATION_KWARGS,
+                )
+                # Same decoding as generate(), so captions do not depend on batch grouping
+                results = _florence_results(processor, generated_ids)
+            else:
+                results = list(self._pipeline(list(pil_images), batch_size=len(pil_images)))
 
-        self._cache[key] = caption
-        self._access_order.append(key)
+            if len(results) != len(pil_images):
+                raise ValueError(f"Expected {len(pil_images)} captions, got {len(results)}")
+            captions = [_caption_from_result(result) for result in results]
+            logger.debug(f"Generated {len(captions)} captions in one batch")
+            return captions
 
-        # Evict oldest if over limit
-        while len(self._cache) > self._max_size:
-            oldest_key = self._access_order.pop(0)
-            self._cache.pop(oldest_key, None)
+        except Exception as e:
+            from pdf2foundry.core.exceptions import ModelNotAvailableError
 
-    def clear(self) -> None:
-        """Clear the cache."""
-        self._cache.clear()
-        self._access_order.clear()
+            if isinstance(e, ModelNotAvailableError):
+                logger.info(f"Caption generation skipped - model not available: {e}")
+                return [None] * len(pil_images)
+            logger.warning(f"Batched caption generation failed, captioning images individually: {e}")
+            return [self.generate(pil_image) for pil_image in pil_images]
+
+
+def _florence_results(processor: Any, generated_ids: Any) -> list[Any]:
+    """Decode Florence-2 output into one pipeline-style result per image."""
+    texts = processor.batch_decode(generated_ids, skip_special_tokens=False)
+    # Sequences of a batch are padded to the longest one; a single image has no padding
+    pad_token = getattr(getattr(processor, "tokenizer", None), "pad_token", None)
+    results = []
+    for text in texts:
+        if isinstance(pad_token, str) and pad_token:
+            text = text.replace(pad_token, "")
+        # Extract the caption from Florence-2's response format
+        # Florence-2 returns: "<MORE_DETAILED_CAPTION>actual caption text"
+        caption = text.replace(_FLORENCE_PROMPT, "").strip() if _FLORENCE_PROMPT in text else text.strip()
+        results.append([{"generated_text": caption}])
+    return results
+
+
+def _caption_from_result(result: Any) -> str | None:
+    """Extract and normalize the caption text from a model or pipeline result."""
+    # Extract text from result - format varies by model
+    if isinstance(result, list) and len(result) > 0:
+        if isinstance(result[0], dict) and "generated_text" in result[0]:
+            caption = result[0]["generated_text"]
+        elif isinstance(result[0], dict) and "text" in result[0]:
+            caption = result[0]["text"]
+        else:
+            # Fallback: convert to string
+            caption = str(result[0])
+    elif isinstance(result, dict):
+        if "generated_text" in result:
+            caption = result["generated_text"]
+        elif "text" in result:
+            caption = result["text"]
+        else:
+            caption = str(result)
+    else:
+        caption = str(result)
+
+    # Clean up the caption
+    caption = caption.strip()
+
+    # Remove common prefixes that some models add
+    prefixes_to_remove = [
+        "a photo of ",
+        "an image of ",
+        "this is ",
+        "the image shows ",
+        "image: ",
+    ]
+
+    caption_lower = caption.lower()
+    for prefix in prefixes_to_remove:
+        if caption_lower.startswith(prefix):
+            caption = caption[len(prefix) :]
+            break
+
+    # Capitalize first letter
+    if caption:
+        caption = caption[0].upper() + caption[1:]
+
+    return caption if caption else None
 
 
 __all__ = [
     "CaptionCache",
     "CaptionEngine",
     "HFCaptionEngine",
+    "create_caption_cache",
 ]
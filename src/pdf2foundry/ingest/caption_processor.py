@@ -14,7 +14,8 @@ from typing import Any
 
 from PIL import Image
 
-from pdf2foundry.ingest.caption_engine import CaptionCache, HFCaptionEngine
+from pdf2foundry.core.warm_resources import get_or_create
+from pdf2foundry.ingest.caption_engine import CaptionCache, HFCaptionEngine, create_caption_cache
 from pdf2foundry.ingest.feature_logger import log_error_policy, log_feature_availability
 from pdf2foundry.model.content import ImageAsset
 from pdf2foundry.model.pipeline_options import PdfPipelineOptions
@@ -67,11 +68,20 @@ def apply_captions_to_images(
 
     logger.info(f"Generating captions for {len(images)} images")
 
-    captioned_count = 0
+    # Assets are content-addressed, so pages showing the same image share one
+    # file; each file is loaded and captioned once
+    by_name: dict[str, list[ImageAsset]] = {}
     for image in images:
+        by_name.setdefault(image.name, []).append(image)
+
+    # Cache misses are collected and captioned in batches
+    batch_size = max(1, options.caption_batch_size)
+    pending: list[tuple[list[ImageAsset], Image.Image]] = []
+    captioned_count = 0
+    for name, group in by_name.items():
         try:
             # Load the image file
-            image_path = assets_dir / image.name
+            image_path = assets_dir / name
             if not image_path.exists():
                 logger.warning(f"Image file not found: {image_path}")
                 continue
@@ -83,34 +93,25 @@ def apply_captions_to_images(
             cached_caption = caption_cache.get(pil_image)
             if isinstance(cached_caption, str | type(None)):
                 # Cache hit: either a string caption or None (no caption was generated)
-                caption = cached_caption
-                logger.debug(f"Using cached caption for {image.name}")
-            else:
-                # Generate caption
-                logger.debug(f"Generating caption for {image.name}")
-                caption = caption_engine.generate(pil_image)
-                caption_cache.set(pil_image, caption)
-
-                _safe_emit(
-                    on_progress,
-                    "caption:image_processed",
-                    {"image_name": image.name, "has_caption": caption is not None},
-                )
-
-            # Apply caption to image
-            if caption:
-                image.caption = caption
-                # alt_text is automatically set via the property
-                captioned_count += 1
-                logger.debug(f"Applied caption to {image.name}: {caption}")
+                logger.debug(f"Using cached caption for {name}")
+                captioned_count += _apply_caption(group, cached_caption)
             else:
-                logger.debug(f"No caption generated for {image.name}")
+                pending.append((group, pil_image))
 
         except Exception as e:
-            logger.warning(f"Failed to caption image {image.name}: {e}")
+            logger.warning(f"Failed to caption image {name}: {e}")
             continue
 
+        if len(pending) >= batch_size:
+            captioned_count += _caption_pending(pending, caption_engine, caption_cache, on_progress)
+            pending = []
+
+    if pending:
+        captioned_count += _caption_pending(pending, caption_engine, caption_cache, on_progress)
+
     logger.info(f"Successfully captioned {captioned_count}/{len(images)} images")
+    if isinstance(caption_cache, CaptionCache):
+        logger.info(caption_cache.format_stats())
 
     _safe_emit(
         on_progress,
@@ -119,6 +120,48 @@ def apply_captions_to_images(
     )
 
 
+def _apply_caption(images: list[ImageAsset], caption: str | None) -> int:
+    """Attach a caption to the assets of one image file, returning how many were captioned."""
+    name = images[0].name
+    if not caption:
+        logger.debug(f"No caption generated for {name}")
+        return 0
+    for image in images:
+        image.caption = caption
+    # alt_text is automatically set via the property
+    logger.debug(f"Applied caption to {name}: {caption}")
+    return len(images)
+
+
+def _caption_pending(
+    pending: list[tuple[list[ImageAsset], Image.Image]],
+    caption_engine: HFCaptionEngine,
+    caption_cache: CaptionCache,
+    on_progress: ProgressCallback,
+) -> int:
+    """Caption a batch of uncached images and scatter the results back to their assets."""
+    logger.debug(f"Generating captions for a batch of {len(pending)} images")
+    try:
+        captions = caption_engine.generate_batch([pil_image for _, pil_image in pending])
+    except Exception as e:
+        logger.warning(f"Failed to caption {len(pending)} images: {e}")
+        return 0
+
+    captioned_count = 0
+    for (group, pil_image), caption in zip(pending, captions, strict=True):
+        try:
+            caption_cache.set(pil_image, caption)
+            _safe_emit(
+                on_progress,
+                "caption:image_processed",
+                {"image_name": group[0].name, "has_caption": caption is not None},
+            )
+            captioned_count += _apply_caption(group, caption)
+        except Exception as e:
+            logger.warning(f"Failed to caption image {group[0].name}: {e}")
+    return captioned_count
+
+
 def initialize_caption_components(
     options: PdfPipelineOptions,
     on_progress: ProgressCallback = None,
@@ -150,13 +193,15 @@ def initialize_caption_components(
             _safe_emit(on_progress, "caption:no_model", {"reason": "no_vlm_repo_id"})
         else:
             try:
-                caption_engine = HFCaptionEngine(options.vlm_repo_id)
+                # In a batch, one engine (and its loaded model) serves every document
+                model_id = options.vlm_repo_id
+                caption_engine = get_or_create(("caption_engine", model_id), lambda: HFCaptionEngine(model_id))
                 # Use cache limits from shared cache if available
                 if shared_image_cache and hasattr(shared_image_cache, "_limits"):
                     cache_size = shared_image_cache._limits.caption_cache
                 else:
                     cache_size = 2000
-                caption_cache = CaptionCache(max_size=cache_size)
+                caption_cache = create_caption_cache(options, caption_engine, cache_size)
                 if caption_engine.is_available():
                     log_feature_availability("Captions", True)
                     _safe_emit(
@@ -7,15 +7,18 @@ from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Literal, Protocol
 
+from pdf2foundry.ingest.asset_store import store_bytes, store_file
 from pdf2foundry.ingest.caption_processor import (
     apply_captions_to_images,
     initialize_caption_components,
 )
+from pdf2foundry.ingest.docling_adapter import document_page_count
 from pdf2foundry.ingest.feature_logger import (
     log_feature_availability,
     log_pipeline_configuration,
 )
-from pdf2foundry.ingest.ocr_engine import OcrCache, TesseractOcrEngine
+from pdf2foundry.ingest.html_export import PICTURE_REF_PREFIX, iter_page_html, picture_png
+from pdf2foundry.ingest.ocr_engine import TesseractOcrEngine, create_ocr_cache
 from pdf2foundry.ingest.ocr_processor import apply_ocr_to_page
 from pdf2foundry.ingest.table_processor import (
     _process_tables,
@@ -90,27 +93,40 @@ class DocumentLike(Protocol):
     def export_to_html(self, **kwargs: object) -> str: ...
 
 
-def _write_base64_image(data_b64: str, dest_dir: Path, filename: str) -> str:
-    dest_dir.mkdir(parents=True, exist_ok=True)
+def _decode_base64(data_b64: str) -> bytes:
     try:
-        data_bytes = base64.b64decode(data_b64)
+        return base64.b64decode(data_b64)
     except Exception:
-        data_bytes = b""
-    (dest_dir / filename).write_bytes(data_bytes)
-    return filename
+        return b""
 
 
-def _extract_images_from_html(html: str, page_no: int, assets_dir: Path, name_prefix: str) -> tuple[str, list[ImageAsset]]:
-    pattern = re.compile(r'src="data:image/(?P<ext>[^;\"]+);base64,(?P<data>[^\"]+)"')
+def _extract_images_from_html(
+    html: str, page_no: int, assets_dir: Path, doc: object | None = None
+) -> tuple[str, list[ImageAsset]]:
+    """Store embedded images as content-addressed assets and rewrite their src to assets/.
+
+    Handles base64 data URIs and, when ``doc`` is given, pictures exported by
+    reference (see html_export.PICTURE_REF_PREFIX), whose PNG bytes are taken
+    straight from the document without a base64 round trip. Identical images
+    share one file (see ingest/asset_store.py).
+    """
+    pattern = re.compile(
+        r'src="(?:data:image/(?P<ext>[^;\"]+);base64,(?P<data>[^\"]+)|'
+        + re.escape(PICTURE_REF_PREFIX)
+        + r'(?P<ref>[^\"]+))"'
+    )
     images: list[ImageAsset] = []
-    counter = {"n": 0}
 
     def repl(m: re.Match[str]) -> str:
-        counter["n"] += 1
-        raw_ext = m.group("ext").lower().strip()
-        ext = "jpg" if raw_ext == "jpeg" else ("svg" if "svg" in raw_ext else raw_ext)
-        fname = f"{name_prefix}_img_{counter['n']:04d}.{ext}"
-        _write_base64_image(m.group("data"), assets_dir, fname)
+        if m.group("ref") is not None:
+            data = picture_png(doc, m.group("ref")) if doc is not None else None
+            if data is None:
+                return 'src=""'
+            fname = store_bytes(assets_dir, data, "png")
+        else:
+            raw_ext = m.group("ext").lower().strip()
+            ext = "jpg" if raw_ext == "jpeg" else ("svg" if "svg" in raw_ext else raw_ext)
+            fname = store_bytes(assets_dir, _decode_base64(m.group("data")), ext)
         rel = f"assets/{fname}"
         images.append(ImageAsset(src=rel, page_no=page_no, name=fname))
         return f'src="{rel}"'
@@ -119,21 +135,16 @@ def _extract_images_from_html(html: str, page_no: int, assets_dir: Path, name_pr
     return updated, images
 
 
-def _rewrite_and_copy_referenced_images(
-    html: str, page_no: int, assets_dir: Path, name_prefix: str
-) -> tuple[str, list[ImageAsset]]:
-    """Copy non-embedded image sources to assets and rewrite src to assets/.
+def _rewrite_and_copy_referenced_images(html: str, page_no: int, assets_dir: Path) -> tuple[str, list[ImageAsset]]:
+    """Store non-embedded image sources as content-addressed assets and rewrite src to assets/.
 
     Handles local file paths, file:// URIs, and relative paths; leaves http(s) and
-    data URIs untouched.
+    data URIs untouched. Files are hard-linked or reflinked where possible.
     """
     pattern = re.compile(r'src="(?P<src>(?!data:|https?://|mailto:|assets/)[^"]+)"', re.IGNORECASE)
-    assets_dir.mkdir(parents=True, exist_ok=True)
     images: list[ImageAsset] = []
-    counter = 0
 
     def repl(m: re.Match[str]) -> str:
-        nonlocal counter
         raw = m.group("src")
         src_path = raw
         if raw.lower().startswith("file://"):
@@ -141,13 +152,10 @@ def _rewrite_and_copy_referenced_images(
 
             src_path = _urlparse(raw).path or ""
         p = Path(src_path)
-        if not p.exists():
+        if not p.is_file():
             return m.group(0)
-        counter += 1
-        fname = p.name if p.name else f"{name_prefix}_img_{counter:04d}.bin"
-        dest = assets_dir / fname
         try:
-            dest.write_bytes(p.read_bytes())
+            fname = store_file(assets_dir, p)
         except Exception:
             return m.group(0)
         rel = f"assets/{fname}"
@@ -169,6 +177,17 @@ def _detect_links(html: str, page_no: int) -> list[LinkRef]:
     return links
 
 
+def _html_export_options() -> tuple[object | None, object | None]:
+    """Return (included content layers, image mode) for per-page HTML export."""
+    try:
+        # Optional advanced options when docling-core is present
+        from docling_core.types.doc import ImageRefMode
+        from docling_core.types.doc.document import ContentLayer
+    except Exception:  # pragma: no cover - optional dependency path
+        return None, None
+    return {ContentLayer.BODY, ContentLayer.BACKGROUND, ContentLayer.FURNITURE}, ImageRefMode.EMBEDDED
+
+
 def extract_semantic_content(
     doc: DocumentLike,
     out_assets: Path,
@@ -192,18 +211,15 @@ def extract_semantic_content(
         ParsedContent with pages, images, tables, and links
 
     Note:
-        - Images embedded as base64 are extracted to files and srcs rewritten
+        - Embedded images are stored once per unique content in the assets dir and srcs rewritten
         - Links are collected from anchor tags in the HTML
         - Tables support structured extraction, HTML fallback, or image-only modes
     """
 
     pipeline_options = options
 
-    # Determine page count
-    try:
-        page_count = int(doc.num_pages())
-    except Exception:
-        page_count = int(getattr(doc, "num_pages", 0) or 0)
+    # Determine page count (the last page number, for a document converted with --pages)
+    page_count = document_page_count(doc)
 
     # Determine selected pages and validate
     selected_pages = _resolve_selected_pages(page_count, pipeline_options.pages)
@@ -226,16 +242,7 @@ def extract_semantic_content(
     else:
         logger.info("Processing all pages (%d total)", page_count)
 
-    image_mode: object | None = None
-    try:
-        # Optional advanced options when docling-core is present
-        from docling_core.types.doc import ImageRefMode  # type: ignore[attr-defined]
-        from docling_core.types.doc.document import ContentLayer
-
-        include_layers = {ContentLayer.BODY, ContentLayer.BACKGROUND, ContentLayer.FURNITURE}
-        image_mode = ImageRefMode.EMBEDDED
-    except Exception:  # pragma: no cover - optional dependency path
-        include_layers = None
+    include_layers, image_mode = _html_export_options()
 
     pages: list[HtmlPage] = []
     images: list[ImageAsset] = []
@@ -249,23 +256,20 @@ def extract_semantic_content(
         should_enable_image_cache,
     )
 
+    cache_limits = CacheLimits(memory_budget_mb=pipeline_options.image_cache_mb)
     shared_image_cache = None
     if should_enable_image_cache(
         pipeline_options.tables_mode.value,
         pipeline_options.ocr_mode.value,
         pipeline_options.picture_descriptions,
     ):
-        # Get cache limits from options if available, otherwise use defaults
-        cache_limits = getattr(pipeline_options, "cache_limits", None) or CacheLimits()
         shared_image_cache = SharedImageCache(cache_limits)
         logger.debug("Initialized shared image cache")
 
     # Initialize OCR components
     try:
-        ocr_engine = TesseractOcrEngine()
-        # Pass cache limits to OCR cache
-        ocr_cache_size = cache_limits.ocr_cache if shared_image_cache else 2000
-        ocr_cache = OcrCache(max_size=ocr_cache_size)
+        ocr_engine = TesseractOcrEngine(detect_script=pipeline_options.ocr_detect_script)
+        ocr_cache = create_ocr_cache(pipeline_options, ocr_engine, cache_limits.ocr_cache)
         if ocr_engine.is_available():
             log_feature_availability("OCR", True)
             _safe_emit(on_progress, "ocr:initialized", {"mode": pipeline_options.ocr_mode.value})
@@ -283,15 +287,10 @@ def extract_semantic_content(
     caption_engine, caption_cache = initialize_caption_components(pipeline_options, on_progress, shared_image_cache)
 
     # Check if we should use parallel processing
-    # Note: Parallel processing is disabled when OCR or captions are enabled
-    # because these components use caches that are not thread/process-safe
+    # Note: Workers run OCR with their own per-process engine and caches, and
+    # captions are applied afterwards in this process, so neither forces sequential mode
     workers_effective = getattr(pipeline_options, "workers_effective", pipeline_options.workers)
-    use_parallel = workers_effective > 1 and ocr_engine is None and caption_engine is None
-
-    if workers_effective > 1 and not use_parallel:
-        logger.info(
-            "Parallel processing disabled due to OCR or caption processing. " "Using sequential mode for cache safety."
-        )
+    use_parallel = workers_effective > 1
 
     if use_parallel:
         # Use parallel processing for CPU-bound page operations
@@ -330,38 +329,9 @@ def extract_semantic_content(
         tables = []
         links = []
 
-        # Per-page export with images embedded for reliable extraction
-        for page_no, _p in yield_pages(doc, selected_pages):
-            try:
-                if include_layers is not None:
-                    if image_mode is not None:
-                        html = doc.export_to_html(
-                            page_no=page_no,
-                            split_page_view=False,
-                            included_content_layers=include_layers,
-                            image_mode=image_mode,
-                        )
-                    else:
-                        html = doc.export_to_html(
-                            page_no=page_no,
-                            split_page_view=False,
-                            included_content_layers=include_layers,
-                        )
-                else:
-                    if image_mode is not None:
-                        html = doc.export_to_html(
-                            page_no=page_no,
-                            split_page_view=False,
-                            image_mode=image_mode,
-                        )
-                    else:
-                        html = doc.export_to_html(
-                            page_no=page_no,
-                            split_page_view=False,
-                        )
-            except Exception:
-                html = ""
-
+        # Per-page HTML, exported in a single pass over the document; pictures
+        # are referenced by item and written straight to assets below
+        for page_no, html in iter_page_html(doc, selected_pages, include_layers, image_mode, picture_refs=True):
             _safe_emit(on_progress, "extract_content:page_exported", {"page_no": page_no})
 
             # Multi-column detection and flattening (no-op + warning in v1)
@@ -373,11 +343,11 @@ def extract_semantic_content(
                 # If transform fails for any reason, proceed with original HTML
                 pass
 
-            # Extract images (embedded base64)
-            html, page_images = _extract_images_from_html(html, page_no, out_assets, f"page-{page_no:04d}")
+            # Extract images (embedded base64 or referenced pictures)
+            html, page_images = _extract_images_from_html(html, page_no, out_assets, doc)
             images.extend(page_images)
             # Copy referenced images (local paths)
-            html, ref_images = _rewrite_and_copy_referenced_images(html, page_no, out_assets, f"page-{page_no:04d}")
+            html, ref_images = _rewrite_and_copy_referenced_images(html, page_no, out_assets)
             images.extend(ref_images)
             if ref_images:
                 _safe_emit(
@@ -451,7 +421,8 @@ def extract_semantic_content(
         metrics = shared_image_cache.get_metrics()
         logger.debug(
             "Image cache metrics: page_hits=%d page_misses=%d (%.1f%% hit rate), "
-            "region_hits=%d region_misses=%d (%.1f%% hit rate), rasterize_calls=%d",
+            "region_hits=%d region_misses=%d (%.1f%% hit rate), rasterize_calls=%d, "
+            "evictions=%d pages/%d regions, %.1f MB held",
             metrics["page_hits"],
             metrics["page_misses"],
             metrics["page_hit_rate"] * 100,
@@ -459,6 +430,9 @@ def extract_semantic_content(
             metrics["region_misses"],
             metrics["region_hit_rate"] * 100,
             metrics["rasterize_calls"],
+            metrics["page_evictions"],
+            metrics["region_evictions"],
+            metrics["memory_bytes"] / 1024 / 1024,
         )
 
     _safe_emit(
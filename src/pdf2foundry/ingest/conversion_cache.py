@@ -0,0 +1,234 @@
+"""Persistent, content-addressed cache of Docling conversions.
+
+Converting a PDF with Docling is by far the most expensive step of a run. The
+in-process memo in docling_adapter only lasts for one process and is keyed by
+path, so every new run (or a renamed copy of the same book) converts again.
+
+This cache stores each converted document under the persistent cache root
+(see core/cache_paths.py), in ``conversions/<key>.bin``, where the key is the
+SHA-256 of:
+
+- the PDF bytes,
+- the conversion options that affect Docling's output,
+- the installed Docling and docling-core versions, and
+- the binary cache format version.
+
+Entries use the binary format from doc_cache, written atomically, so
+concurrent jobs on the same machine can share the directory without locking.
+A hit refreshes the entry's modification time; once the directory exceeds its
+byte budget the least recently used entries are deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from pdf2foundry.core.cache_paths import get_cache_root
+from pdf2foundry.ingest.doc_cache import FORMAT_VERSION, load_document_cache, read_binary_header, write_binary_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONVERSION_CACHE_BYTES = 2 * 1024 * 1024 * 1024
+
+_SUFFIX = ".bin"
+
+
+@dataclass(frozen=True)
+class ConversionCacheEntry:
+    """One cached conversion.
+
+    Attributes:
+        key: Cache key (hex SHA-256)
+        path: File holding the cached document
+        size: File size in bytes
+        last_used: Time of the last write or hit (seconds since the epoch)
+        source_sha256: SHA-256 of the PDF the document was converted from
+    """
+
+    key: str
+    path: Path
+    size: int
+    last_used: float
+    source_sha256: str | None
+
+
+@cache
+def docling_versions() -> dict[str, str]:
+    """Installed versions of the Docling packages that shape conversion output."""
+    versions: dict[str, str] = {}
+    for dist in ("docling", "docling-core"):
+        try:
+            versions[dist] = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            versions[dist] = "missing"
+    return versions
+
+
+def conversion_key(pdf_sha256: str, options: Mapping[str, Any]) -> str:
+    """Compute the cache key for converting a PDF with the given options.
+
+    Args:
+        pdf_sha256: Hex SHA-256 of the PDF bytes
+        options: Conversion options affecting Docling's output (JSON-serializable)
+
+    Returns:
+        Hex SHA-256 cache key
+    """
+    material = {
+        "pdf": pdf_sha256,
+        "options": dict(options),
+        "docling": docling_versions(),
+        "format": FORMAT_VERSION,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ConversionCache:
+    """Directory of converted documents with LRU eviction under a byte budget."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_CONVERSION_CACHE_BYTES) -> None:
+        """Initialize the conversion cache.
+
+        Args:
+            directory: Directory holding the cache entries (created on first write)
+            max_bytes: Maximum total size of the entries (0 = unbounded)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max(0, max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached document for a key, or None on a miss.
+
+        Unreadable entries are deleted and reported as misses.
+        """
+        path = self._path(key)
+        try:
+            doc = load_document_cache(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Discarding unreadable conversion cache entry %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        with suppress(OSError):
+            os.utime(path)  # Mark as most recently used
+        self.hits += 1
+        return doc
+
+    def put(self, key: str, doc: object, *, source_sha256: str | None = None) -> Path:
+        """Store a document, then evict least recently used entries if over budget."""
+        path = self._path(key)
+        write_binary_cache(path, doc, source_sha256=source_sha256)
+        if self.max_bytes:
+            self.prune(self.max_bytes, keep=key)
+        return path
+
+    def entries(self) -> list[ConversionCacheEntry]:
+        """List entries from least to most recently used."""
+        entries: list[ConversionCacheEntry] = []
+        if not self.directory.is_dir():
+            return entries
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by a concurrent prune
+            try:
+                source = read_binary_header(path).source_sha256
+            except (OSError, ValueError):
+                source = None
+            entries.append(ConversionCacheEntry(path.stem, path, stat.st_size, stat.st_mtime, source))
+        entries.sort(key=lambda entry: entry.last_used)
+        return entries
+
+    def prune(self, max_bytes: int | None = None, *, older_than: float | None = None, keep: str | None = None) -> int:
+        """Delete entries until the cache fits a budget.
+
+        Args:
+            max_bytes: Byte budget to shrink to (defaults to the cache's own budget, where 0 = no size limit)
+            older_than: Also delete entries not used for this many seconds
+            keep: Key that must not be deleted (e.g. the entry just written)
+
+        Returns:
+            Number of entries deleted
+        """
+        budget = (self.max_bytes or None) if max_bytes is None else max(0, max_bytes)
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+        cutoff = time.time() - older_than if older_than is not None else None
+        removed = 0
+        for entry in entries:
+            over_budget = budget is not None and total > budget
+            expired = cutoff is not None and entry.last_used < cutoff
+            if entry.key == keep or not (over_budget or expired):
+                continue
+            entry.path.unlink(missing_ok=True)
+            total -= entry.size
+            removed += 1
+        if removed:
+            logger.debug("Pruned %d conversion cache entries from %s", removed, self.directory)
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry, returning the number deleted."""
+        entries = self.entries()
+        for entry in entries:
+            entry.path.unlink(missing_ok=True)
+        return len(entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count, stored bytes, budget and this session's hit/miss counters."""
+        entries = self.entries()
+        return {
+            "path": str(self.directory),
+            "entries": len(entries),
+            "bytes": sum(entry.size for entry in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def open_conversion_cache(
+    cache_dir: str | Path | None = None, max_bytes: int = DEFAULT_CONVERSION_CACHE_BYTES
+) -> ConversionCache:
+    """Create the conversion cache under the persistent cache root.
+
+    Args:
+        cache_dir: Optional cache root overriding the user cache directory
+        max_bytes: Byte budget for stored conversions
+
+    Returns:
+        A ConversionCache (its directory is created on first write)
+    """
+    return ConversionCache(get_cache_root(cache_dir) / "conversions", max_bytes)
+
+
+__all__ = [
+    "DEFAULT_CONVERSION_CACHE_BYTES",
+    "ConversionCache",
+    "ConversionCacheEntry",
+    "conversion_key",
+    "docling_versions",
+    "open_conversion_cache",
+]
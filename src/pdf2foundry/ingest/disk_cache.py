@@ -0,0 +1,166 @@
+"""Persistent, size-bounded key/value store for expensive per-image results.
+
+The in-memory OCR and caption caches only live for one run. This module adds a
+disk tier behind them: a single SQLite file per cache under the user cache
+directory (see core/cache_paths.py). SQLite gives atomic writes and safe
+concurrent access from page worker processes without extra dependencies.
+
+Entries are evicted least-recently-used first once the stored payload exceeds
+the byte budget.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pdf2foundry.core.cache_paths import get_cache_root
+
+logger = logging.getLogger(__name__)
+
+# After exceeding the budget, evict down to this fraction of it
+_EVICT_TO_FRACTION = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+class DiskCache:
+    """SQLite-backed byte store with LRU eviction under a byte budget.
+
+    The database is opened lazily on first use, so constructing a cache that is
+    never consulted does not touch the filesystem. Each process opens its own
+    connection; instances are not meant to be pickled.
+    """
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        """Initialize the disk cache.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum total payload size before eviction (0 = unbounded)
+        """
+        self.path = Path(path)
+        self.max_bytes = max(0, max_bytes)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._total_bytes = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0])
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored value for a key, or None if absent."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value, evicting least-recently-used entries if over budget."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), time.time()),
+            )
+            self._total_bytes += len(value)
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Other processes may have written too, so recount before evicting
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0])
+        target = int(self.max_bytes * _EVICT_TO_FRACTION)
+        if total <= self.max_bytes:
+            self._total_bytes = total
+            return
+
+        victims: list[str] = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed ASC"):
+            if total <= target:
+                break
+            victims.append(key)
+            total -= size
+
+        conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in victims])
+        self.evictions += len(victims)
+        self._total_bytes = total
+        logger.debug("Evicted %d entries from %s", len(victims), self.path.name)
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count, stored bytes, budget and this session's hit/miss counters."""
+        with self._lock:
+            conn = self._connection()
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": int(entries),
+            "bytes": int(size),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._connection().execute("DELETE FROM entries")
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def open_disk_cache(name: str, max_bytes: int, cache_dir: str | Path | None = None) -> DiskCache:
+    """Create the named disk cache under the persistent cache root.
+
+    Args:
+        name: Cache name, used as the database file stem (e.g. "ocr")
+        max_bytes: Byte budget for stored values
+        cache_dir: Optional cache root overriding the user cache directory
+
+    Returns:
+        A lazily opened DiskCache
+    """
+    return DiskCache(get_cache_root(cache_dir) / f"{name}.sqlite3", max_bytes)
+
+
+__all__ = [
+    "DiskCache",
+    "open_disk_cache",
+]
@@ -0,0 +1,317 @@
+"""Compact binary format for the Docling document cache.
+
+The JSON cache written by json_io is pretty-printed, sorted text: easy to
+inspect, but slow to write and read and several times larger than needed. The
+binary format stores the same document object encoded with msgpack (compact
+JSON when msgpack is not installed) and compressed with zstd (zlib when
+zstandard is not installed), behind a fixed header:
+
+    magic        8 bytes   b"P2FDOC\\r\\n"
+    version      uint16    cache format version (FORMAT_VERSION)
+    codec        uint8     compression codec (see _Codec)
+    encoding     uint8     payload encoding (see _Encoding)
+    source hash  32 bytes  SHA-256 of the source PDF (all zero when unknown)
+
+All integers are little-endian. The header lets a loader reject a cache built
+from a different PDF, or by an incompatible version, before decompressing
+anything. Loaders detect the format from the magic bytes, so a binary cache can
+be passed anywhere a JSON cache is accepted.
+
+A JSON cache records its source PDF in a sidecar file next to it
+(``docling.json.sha256``, holding the hex SHA-256), so the JSON document itself
+stays a plain DoclingDocument. A cache without a recorded source is accepted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pdf2foundry.ingest.json_io import (
+    atomic_write_bytes,
+    atomic_write_text,
+    doc_from_data,
+    doc_from_json_file,
+    doc_to_data,
+    read_json_file,
+)
+
+try:  # Optional fast JSON backend
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None  # type: ignore[assignment]
+
+FORMAT_VERSION = 1
+MAGIC = b"P2FDOC\r\n"  # CR/LF detect text-mode mangling, as in PNG
+
+_HEADER = struct.Struct("<8sHBB32s")
+_NO_SOURCE = bytes(32)
+_ZLIB_LEVEL = 1  # Fast; the payload is repetitive markup that compresses well anyway
+_ZSTD_LEVEL = 3
+
+
+class DocCacheFormat(Enum):
+    """On-disk format used when writing the Docling document cache."""
+
+    JSON = "json"  # Pretty-printed, sorted JSON text
+    BINARY = "binary"  # Compressed msgpack/JSON behind a versioned header
+
+    @property
+    def default_filename(self) -> str:
+        """File name used for the cache under dist/<mod-id>/sources/."""
+        return "docling.json" if self is DocCacheFormat.JSON else "docling.bin"
+
+
+class _Codec(IntEnum):
+    ZLIB = 1
+    ZSTD = 2
+
+
+class _Encoding(IntEnum):
+    JSON = 1
+    MSGPACK = 2
+
+
+class CacheSourceMismatchError(ValueError):
+    """Raised when a cache was built from a different source PDF."""
+
+
+@dataclass(frozen=True)
+class BinaryCacheHeader:
+    """Decoded binary cache header.
+
+    Attributes:
+        format_version: Cache format version the file was written with
+        codec: Compression codec name ("zlib" or "zstd")
+        encoding: Payload encoding name ("json" or "msgpack")
+        source_sha256: Hex SHA-256 of the source PDF, or None if not recorded
+    """
+
+    format_version: int
+    codec: str
+    encoding: str
+    source_sha256: str | None
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_binary_cache(path: Path) -> bool:
+    """Return True if the file starts with the binary cache magic bytes."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+@cache
+def _optional_module(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _encode(obj: Any) -> tuple[_Encoding, bytes]:
+    msgpack = _optional_module("msgpack")
+    if msgpack is not None:
+        return _Encoding.MSGPACK, msgpack.packb(obj, use_bin_type=True)
+    if _orjson is not None:
+        return _Encoding.JSON, _orjson.dumps(obj)
+    return _Encoding.JSON, json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(encoding: _Encoding, payload: bytes) -> Any:
+    if encoding is _Encoding.MSGPACK:
+        msgpack = _optional_module("msgpack")
+        if msgpack is None:
+            raise ValueError("binary cache is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    return _orjson.loads(payload) if _orjson is not None else json.loads(payload)
+
+
+def _compress(payload: bytes) -> tuple[_Codec, bytes]:
+    zstandard = _optional_module("zstandard")
+    if zstandard is not None:
+        return _Codec.ZSTD, zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(payload)
+    return _Codec.ZLIB, zlib.compress(payload, _ZLIB_LEVEL)
+
+
+def _decompress(codec: _Codec, data: memoryview) -> bytes:
+    if codec is _Codec.ZSTD:
+        zstandard = _optional_module("zstandard")
+        if zstandard is None:
+            raise ValueError("binary cache is zstd-compressed but zstandard is not installed")
+        return bytes(zstandard.ZstdDecompressor().decompress(data))
+    try:
+        return zlib.decompress(data)
+    except zlib.error as e:
+        raise ValueError(f"corrupt binary cache payload: {e}") from e
+
+
+def _parse_header(data: bytes | memoryview) -> tuple[BinaryCacheHeader, _Codec, _Encoding]:
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated binary cache header")
+    magic, version, codec, encoding, source = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a pdf2foundry binary cache")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary cache version {version} (expected {FORMAT_VERSION})")
+    try:
+        codec_id, encoding_id = _Codec(codec), _Encoding(encoding)
+    except ValueError as e:
+        raise ValueError(f"unknown binary cache codec or encoding: {e}") from e
+    header = BinaryCacheHeader(
+        format_version=version,
+        codec=codec_id.name.lower(),
+        encoding=encoding_id.name.lower(),
+        source_sha256=source.hex() if source != _NO_SOURCE else None,
+    )
+    return header, codec_id, encoding_id
+
+
+def read_binary_header(path: Path) -> BinaryCacheHeader:
+    """Read and validate the header of a binary cache file.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the header is missing, truncated or unsupported
+    """
+    with open(path, "rb") as f:
+        return _parse_header(f.read(_HEADER.size))[0]
+
+
+def encode_binary_cache(doc: object, *, source_sha256: str | None = None) -> bytes:
+    """Serialize a Docling-like document to the binary cache format.
+
+    Args:
+        doc: Document to serialize (see json_io.doc_to_data)
+        source_sha256: Hex SHA-256 of the source PDF to record in the header
+
+    Returns:
+        Header followed by the compressed payload
+    """
+    source = bytes.fromhex(source_sha256) if source_sha256 else _NO_SOURCE
+    if len(source) != 32:
+        raise ValueError("source_sha256 must be a hex SHA-256 digest")
+    encoding, payload = _encode(doc_to_data(doc))
+    codec, compressed = _compress(payload)
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, codec, encoding, source) + compressed
+
+
+def write_binary_cache(path: Path, doc: object, *, source_sha256: str | None = None) -> None:
+    """Atomically write a document to a binary cache file."""
+    atomic_write_bytes(path, encode_binary_cache(doc, source_sha256=source_sha256))
+
+
+def _check_source(recorded: str | None, expected: str | None) -> None:
+    if expected and recorded and recorded != expected:
+        raise CacheSourceMismatchError(
+            f"cache was built from a different PDF (sha256 {recorded[:12]}…, expected {expected[:12]}…)"
+        )
+
+
+def read_binary_data(path: Path, *, expected_source_sha256: str | None = None) -> Any:
+    """Read the document object stored in a binary cache file.
+
+    The file is memory-mapped and decompressed straight from the mapping. When
+    ``expected_source_sha256`` is given and the header records a different
+    source, the payload is not decoded at all.
+
+    Raises:
+        OSError: If the file cannot be read
+        CacheSourceMismatchError: If the cache was built from a different PDF
+        ValueError: If the file is not a valid binary cache
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        header, codec, encoding = _parse_header(view)
+        _check_source(header.source_sha256, expected_source_sha256)
+        with view[_HEADER.size :] as compressed:
+            payload = _decompress(codec, compressed)
+    return _decode(encoding, payload)
+
+
+def json_source_path(path: Path) -> Path:
+    """Return the sidecar file recording the source PDF of a JSON cache."""
+    return path.with_name(f"{path.name}.sha256")
+
+
+def write_json_source(path: Path, source_sha256: str | None) -> None:
+    """Record the source PDF of the JSON cache at ``path`` (None removes the record)."""
+    sidecar = json_source_path(path)
+    if source_sha256 is None:
+        sidecar.unlink(missing_ok=True)
+    else:
+        atomic_write_text(sidecar, f"{source_sha256}\n")
+
+
+def read_json_source(path: Path) -> str | None:
+    """Return the recorded source PDF SHA-256 of a JSON cache, or None if not recorded."""
+    try:
+        digest = json_source_path(path).read_text(encoding="ascii").strip().lower()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        return None
+    return digest
+
+
+def check_json_source(path: Path, expected_source_sha256: str | None) -> None:
+    """Reject the JSON cache at ``path`` if it records a different source PDF.
+
+    Raises:
+        CacheSourceMismatchError: If the cache was built from a different PDF
+    """
+    _check_source(read_json_source(path), expected_source_sha256)
+
+
+def read_cache_data(path: Path, *, expected_source_sha256: str | None = None) -> Any:
+    """Read the document object from a JSON or binary cache, detected by content."""
+    if is_binary_cache(path):
+        return read_binary_data(path, expected_source_sha256=expected_source_sha256)
+    check_json_source(path, expected_source_sha256)
+    return read_json_file(path)
+
+
+def load_document_cache(path: Path) -> Any:
+    """Load a Docling-like document from a JSON or binary cache file."""
+    if is_binary_cache(path):
+        return doc_from_data(read_binary_data(path))
+    return doc_from_json_file(path)
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "MAGIC",
+    "BinaryCacheHeader",
+    "CacheSourceMismatchError",
+    "DocCacheFormat",
+    "check_json_source",
+    "encode_binary_cache",
+    "file_sha256",
+    "is_binary_cache",
+    "json_source_path",
+    "load_document_cache",
+    "read_binary_data",
+    "read_binary_header",
+    "read_cache_data",
+    "read_json_source",
+    "write_binary_cache",
+    "write_json_source",
+]
@@ -34,7 +34,10 @@ def run_docling_conversion(
     """Convert a PDF to a Docling document with caching and light API guards.
 
     Results are cached per normalized parameter tuple to ensure a single conversion
-    per unique configuration within the process lifetime.
+    per unique configuration within the process lifetime. Only the ``pages``
+    selection (1-based) is converted, keeping its page numbers. With ``workers`` > 1,
+    long PDFs are converted as page-range shards in parallel processes (see
+    sharded_conversion.py).
     """
     key = (
         str(pdf_path),
@@ -53,6 +56,60 @@ def run_docling_conversion(
     return doc
 
 
+def conversion_options(
+    *,
+    images: bool = True,
+    ocr: bool = False,
+    tables_mode: str = "auto",
+    vlm: str | None = None,
+    pages: list[int] | None = None,
+) -> dict[str, Any]:
+    """Return the options that determine Docling's output, for persistent cache keys.
+
+    Defaults match run_docling_conversion(). The environment switches that
+    override the Docling pipeline in _do_docling_convert_impl are included;
+    ``workers`` is not, since it does not change the result.
+    """
+    import os
+
+    return {
+        "images": bool(images),
+        "ocr": bool(ocr),
+        "tables_mode": str(tables_mode),
+        "vlm": vlm,
+        "pages": sorted(set(pages)) if pages is not None else None,
+        "ci_minimal": os.environ.get("PDF2FOUNDRY_CI_MINIMAL") == "1",
+        "no_ml": os.environ.get("PDF2FOUNDRY_NO_ML") == "1",
+    }
+
+
+def document_page_numbers(doc: object) -> set[int] | None:
+    """Return the page numbers present in a document, or None if it does not say.
+
+    A conversion limited to selected pages keeps the PDF's page numbers, so a
+    document converted with ``--pages 40-45`` holds pages 40..45.
+    """
+    pages = getattr(doc, "pages", None)
+    if not isinstance(pages, dict) or not pages:
+        return None
+    try:
+        return {int(page_no) for page_no in pages}
+    except (TypeError, ValueError):
+        return None
+
+
+def document_page_count(doc: object) -> int:
+    """Return the number of the last page of a document (its page count when complete)."""
+    page_numbers = document_page_numbers(doc)
+    if page_numbers:
+        return max(page_numbers)
+    try:
+        num_pages_fn = getattr(doc, "num_pages", None)
+        return int(num_pages_fn()) if callable(num_pages_fn) else int(getattr(doc, "num_pages", 0) or 0)
+    except Exception:
+        return int(getattr(doc, "num_pages", 0) or 0)
+
+
 def load_docling_document(
     pdf: Path,
     *,
@@ -90,6 +147,16 @@ def _cached_convert(
     pdf_path_str, images, ocr, tables_mode, vlm, pages_tuple, workers = key
     pdf_path = Path(pdf_path_str)
     pages = list(pages_tuple) if pages_tuple is not None else None
+    if pages:
+        from pdf2foundry.ingest.sharded_conversion import convert_page_selection
+
+        return convert_page_selection(pdf_path, pages, workers, images=images, ocr=ocr, tables_mode=tables_mode, vlm=vlm)
+    if workers > 1:
+        from pdf2foundry.ingest.sharded_conversion import convert_sharded, plan_conversion_shards
+
+        shards = plan_conversion_shards(pdf_path, workers)
+        if shards:
+            return convert_sharded(pdf_path, shards, images=images, ocr=ocr, tables_mode=tables_mode, vlm=vlm, pages=pages)
     return _do_docling_convert_impl(
         pdf_path,
         images=images,
@@ -110,13 +177,15 @@ def _do_docling_convert_impl(
     vlm: str | None,
     pages: list[int] | None,
     workers: int,
+    page_range: tuple[int, int] | None = None,
 ) -> DoclingDocumentLike:
     """Actual Docling call isolated for monkeypatching in tests.
 
     Imports are inside the function to avoid hard dependency at module import time.
     Non-essential parameters like tables_mode/vlm/pages/workers are accepted for
     forward-compatibility and included in the cache key, even if not all are used
-    by the underlying Docling API.
+    by the underlying Docling API. ``page_range`` (1-based, inclusive) limits the
+    conversion to a slice of the PDF, as used by sharded conversion.
 
     Raises:
         PdfParseError: If PDF conversion fails fatally
@@ -135,6 +204,7 @@ def _do_docling_convert_impl(
             "vlm": vlm,
             "pages": pages,
             "workers": workers,
+            "page_range": page_range,
         },
     )
     error_mgr = ErrorManager(context)
@@ -176,7 +246,20 @@ def _do_docling_convert_impl(
         # Note: pages, workers, tables_mode, vlm are accepted but may require
         # additional wiring based on Docling capabilities; kept in signature and
         # cache key for deterministic behavior across configurations.
-        conv = DocumentConverter(format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipe_opts)})
+        # In a batch, one converter (and its loaded models) serves every document.
+        from pdf2foundry.core.warm_resources import get_or_create
+
+        converter_key = (
+            "docling_converter",
+            os.environ.get("PDF2FOUNDRY_CI_MINIMAL") == "1",
+            os.environ.get("PDF2FOUNDRY_NO_ML") == "1",
+            images,
+            ocr,
+        )
+        conv = get_or_create(
+            converter_key,
+            lambda: DocumentConverter(format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipe_opts)}),
+        )
 
         # Get timeout from environment or use default (45 seconds for CI minimal, 10 minutes for CI, 30 minutes for local)
         # Structured table processing requires more time than basic conversion
@@ -191,6 +274,8 @@ def _do_docling_convert_impl(
 
         def _convert_with_timeout() -> Any:
             """Perform the actual conversion in a separate thread."""
+            if page_range is not None:
+                return conv.convert(str(pdf_path), page_range=page_range)
             return conv.convert(str(pdf_path))
 
         # Use ThreadPoolExecutor to run conversion with timeout
@@ -211,7 +296,7 @@ def _do_docling_convert_impl(
                 logger.info(
                     (
                         "Converted PDF to Docling document: path=%s images=%s ocr=%s "
-                        "tables_mode=%s vlm=%s pages=%s workers=%s"
+                        "tables_mode=%s vlm=%s pages=%s workers=%s page_range=%s"
                     ),
                     pdf_path,
                     images,
@@ -220,6 +305,7 @@ def _do_docling_convert_impl(
                     vlm,
                     pages,
                     workers,
+                    page_range,
                 )
                 return doc
 
@@ -283,6 +369,9 @@ def _do_docling_convert_impl(
 
 __all__ = [
     "DoclingDocumentLike",
+    "conversion_options",
+    "document_page_count",
+    "document_page_numbers",
     "load_docling_document",
     "run_docling_conversion",
 ]
@@ -17,6 +17,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 
+from pdf2foundry.ingest.docling_adapter import document_page_count
 from pdf2foundry.ingest.error_handling import ErrorContext, ErrorManager
 from pdf2foundry.model.document import OutlineNode, ParsedDocument
 
@@ -75,11 +76,7 @@ def parse_structure_from_doc(doc, on_progress: ProgressCallback = None) -> Parse
     Returns:
         ParsedDocument with page count and outline structure
     """
-    try:
-        num_pages_fn = getattr(doc, "num_pages", None)
-        page_count = int(num_pages_fn()) if callable(num_pages_fn) else int(getattr(doc, "num_pages", 0) or 0)
-    except Exception:
-        page_count = int(getattr(doc, "num_pages", 0) or 0)
+    page_count = document_page_count(doc)
 
     _safe_emit(on_progress, "parse_structure:start", {"page_count": page_count})
 
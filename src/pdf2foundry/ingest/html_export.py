@@ -0,0 +1,221 @@
+"""Per-page HTML export of Docling documents.
+
+DoclingDocument.export_to_html(page_no=...) walks the whole document tree and
+filters it down to one page, so exporting a book page by page costs
+O(pages x items). iter_page_html() serializes a DoclingDocument in one
+traversal instead and splits the output at page changes, the same way
+Docling's own split-page view does: an item belongs to the page of its first
+provenance, and a list or inline group stays whole on the page it starts on.
+
+Documents that are not DoclingDocuments (the lightweight documents rebuilt
+from a JSON cache, test doubles) are exported page by page.
+
+With ``picture_refs``, pictures are not base64-encoded into the HTML. Their
+``src`` is a PICTURE_REF_PREFIX reference to the picture item instead, and
+content_extractor._extract_images_from_html() stores each picture's PNG bytes
+straight in the assets directory (see picture_png()).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Sequence
+from functools import cache
+from io import BytesIO
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# src of a picture exported by reference: the prefix followed by the item's self_ref
+PICTURE_REF_PREFIX = "pdf2foundry-picture:"
+
+
+def export_page_html(doc: Any, page_no: int, include_layers: Any = None, image_mode: Any = None) -> str:
+    """Export one page with ``doc.export_to_html``.
+
+    Returns:
+        The page HTML, or an empty string if the export fails
+    """
+    kwargs: dict[str, Any] = {"page_no": page_no, "split_page_view": False}
+    if include_layers is not None:
+        kwargs["included_content_layers"] = include_layers
+    if image_mode is not None:
+        kwargs["image_mode"] = image_mode
+    try:
+        return str(doc.export_to_html(**kwargs))
+    except Exception:
+        return ""
+
+
+def _is_docling_document(doc: Any) -> bool:
+    try:
+        from docling_core.types.doc.document import DoclingDocument
+    except Exception:  # pragma: no cover - optional dependency path
+        return False
+    return isinstance(doc, DoclingDocument)
+
+
+def _part_page(part: Any) -> int | None:
+    """Page of the first item with a provenance in a serialization result."""
+    for span in getattr(part, "spans", None) or ():
+        prov = getattr(span.item, "prov", None)
+        if prov:
+            return int(prov[0].page_no)
+    return None
+
+
+@cache
+def _picture_ref_serializer_class() -> type:
+    from docling_core.transforms.serializer.base import SerializationResult
+    from docling_core.transforms.serializer.common import create_ser_result
+    from docling_core.transforms.serializer.html import HTMLParams, HTMLPictureSerializer
+    from docling_core.types.doc import ImageRefMode
+
+    class PictureRefSerializer(HTMLPictureSerializer):
+        """Emit embedded pictures as PICTURE_REF_PREFIX references instead of data URIs."""
+
+        def serialize(self, *, item: Any, doc_serializer: Any, doc: Any, **kwargs: Any) -> SerializationResult:
+            params = HTMLParams(**kwargs)
+            image_uri = getattr(item.image, "uri", None)
+            if (
+                params.image_mode != ImageRefMode.EMBEDDED
+                or len(item.prov) > 1
+                or getattr(image_uri, "scheme", None) == "data"  # Already base64 in the document
+                or item.self_ref in doc_serializer.get_excluded_refs(**kwargs)
+            ):
+                return super().serialize(item=item, doc_serializer=doc_serializer, doc=doc, **kwargs)
+
+            # Serialize the figure without its image, then put the reference where
+            # Docling puts the image: after the caption, before any chart table
+            placeholder_kwargs = {**kwargs, "image_mode": ImageRefMode.PLACEHOLDER}
+            figure = super().serialize(item=item, doc_serializer=doc_serializer, doc=doc, **placeholder_kwargs).text
+            caption = doc_serializer.serialize_captions(item=item, tag="figcaption", **kwargs).text
+            rest = figure[len("<figure>") + len(caption) : -len("</figure>")] if figure else ""
+            img = f'<img src="{PICTURE_REF_PREFIX}{item.self_ref}">'
+            return create_ser_result(text=f"<figure>{caption}{img}{rest}</figure>", span_source=item)
+
+    return PictureRefSerializer
+
+
+def picture_png(doc: Any, ref: str) -> bytes | None:
+    """Encode the image of the picture item ``ref`` as PNG.
+
+    Returns:
+        The PNG bytes, or None if the reference does not resolve or the
+        picture has no image
+    """
+    try:
+        from docling_core.types.doc.document import RefItem
+
+        image = RefItem(cref=ref).resolve(doc).get_image(doc)
+    except Exception as e:
+        logger.warning("Could not resolve picture %s: %s", ref, e)
+        return None
+    if image is None:
+        logger.warning("Could not get image of picture %s", ref)
+        return None
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _iter_docling_page_html(
+    doc: Any, page_numbers: list[int], include_layers: Any, image_mode: Any, picture_refs: bool = False
+) -> Iterator[tuple[int, str]]:
+    """Serialize a DoclingDocument once and yield the HTML of each requested page."""
+    from docling_core.transforms.serializer.html import HTMLDocSerializer, HTMLParams
+    from docling_core.types.doc.document import DEFAULT_CONTENT_LAYERS, DOCUMENT_TOKENS_EXPORT_LABELS
+
+    # Same parameters as export_to_html(), without the page filter
+    params = HTMLParams(
+        labels=DOCUMENT_TOKENS_EXPORT_LABELS,
+        layers=include_layers if include_layers is not None else DEFAULT_CONTENT_LAYERS,
+    )
+    if image_mode is not None:
+        params.image_mode = image_mode
+    serializer_kwargs: dict[str, Any] = {}
+    if picture_refs:
+        serializer_kwargs["picture_serializer"] = _picture_ref_serializer_class()()
+    serializer = HTMLDocSerializer(doc=doc, params=params, **serializer_kwargs)
+
+    wanted = set(page_numbers)
+    pending = iter(page_numbers)
+    next_page = next(pending, None)
+    current: int | None = None
+    parts: list[Any] = []
+
+    def emit_through(page_limit: int | None) -> Iterator[tuple[int, str]]:
+        """Yield every requested page up to page_limit (all if None)."""
+        nonlocal next_page
+        while next_page is not None and (page_limit is None or next_page <= page_limit):
+            page_parts = parts if next_page == current else []
+            yield next_page, serializer.serialize_doc(parts=page_parts).text
+            next_page = next(pending, None)
+
+    # Mirrors HTMLDocSerializer.get_parts(): children serialized by their group
+    # are marked visited and skipped when the traversal reaches them
+    visited: set[str] = {doc.body.self_ref}
+    for item, _level in doc.iterate_items(with_groups=True, included_content_layers=params.layers):
+        if next_page is None:
+            break
+        if item.self_ref in visited:
+            continue
+        visited.add(item.self_ref)
+        part = serializer.serialize(item=item, visited=visited)
+        if not part.text:
+            continue
+        page_no = _part_page(part)
+        if page_no is not None and (current is None or page_no > current):
+            if current is not None:
+                yield from emit_through(current)
+                parts = []
+            current = page_no
+        if current in wanted:
+            parts.append(part)
+    yield from emit_through(current)
+    parts = []
+    yield from emit_through(None)
+
+
+def iter_page_html(
+    doc: Any,
+    page_numbers: Sequence[int],
+    include_layers: Any = None,
+    image_mode: Any = None,
+    *,
+    picture_refs: bool = False,
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(page_no, html)`` for each requested page, in ascending page order.
+
+    A DoclingDocument is serialized in a single traversal; each page is yielded
+    as soon as the traversal moves past it. If that fails, the remaining pages
+    are exported one by one.
+
+    Args:
+        doc: Docling document, or any object with ``export_to_html(page_no=...)``
+        page_numbers: 1-based page numbers to export
+        include_layers: Optional content layers for the export
+        image_mode: Optional image mode for the export
+        picture_refs: Reference embedded pictures of a DoclingDocument by item
+            instead of base64-encoding them; the caller must then pass the
+            document to _extract_images_from_html()
+
+    Yields:
+        Page number and the page's standalone HTML document (empty string if
+        the per-page export of that page failed)
+    """
+    pages = sorted(set(page_numbers))
+    done = 0
+    if pages and _is_docling_document(doc):
+        try:
+            for page_no, html in _iter_docling_page_html(doc, pages, include_layers, image_mode, picture_refs):
+                done += 1
+                yield page_no, html
+            return
+        except Exception as e:
+            logger.warning("Single-pass HTML export failed (%s: %s); exporting page by page", type(e).__name__, e)
+    for page_no in pages[done:]:
+        yield page_no, export_page_html(doc, page_no, include_layers, image_mode)
+
+
+__all__ = ["PICTURE_REF_PREFIX", "export_page_html", "iter_page_html", "picture_png"]
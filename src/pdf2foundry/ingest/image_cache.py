@@ -11,7 +11,8 @@ Thread Safety Architecture:
 
 Performance Considerations:
 - Shared image cache reduces redundant rasterization across components
-- LRU eviction prevents unbounded memory growth
+- LRU eviction (O(1), see lru_cache.py) prevents unbounded memory growth
+- Page and region images share a memory budget measured in pixel bytes
 - Feature gates ensure caches are only allocated when needed
 - Metrics tracking helps identify optimization opportunities
 """
@@ -21,12 +22,13 @@ from __future__ import annotations
 import hashlib
 import logging
 import threading
-from dataclasses import dataclass
-from io import BytesIO
+from dataclasses import dataclass, field
 from typing import Any, NamedTuple
 
 from PIL import Image
 
+from pdf2foundry.ingest.lru_cache import LruCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,24 +62,41 @@ class BBox(NamedTuple):
 
 @dataclass
 class CachedImage:
-    """Container for a cached PIL image with metadata."""
+    """Container for a cached PIL image with metadata.
+
+    The content hash is computed on first access and memoized, so an image that
+    is looked up in several result caches is only hashed once.
+    """
 
     image: Image.Image
-    hash: str
     page_index: int
     bbox: BBox | None = None
     dpi: int = 150
     color_mode: str = "RGB"
+    _hash: str | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def hash(self) -> str:
+        """Content hash of the image (see get_image_hash)."""
+        if self._hash is None:
+            self._hash = get_image_hash(self.image)
+        return self._hash
 
 
 @dataclass
 class CacheLimits:
-    """Configuration for cache size limits."""
+    """Configuration for cache size limits.
+
+    Page and region images are bounded both by entry counts and by a shared
+    memory budget (``memory_budget_mb``, 0 = counts only). A 300 DPI RGB page
+    is about 25 MB, so the budget is usually the limit that matters.
+    """
 
     page_raster_cache: int = 32
     region_image_cache: int = 512
     ocr_cache: int = 2000
     caption_cache: int = 2000
+    memory_budget_mb: int = 512
 
 
 class SharedImageCache:
@@ -95,7 +114,7 @@ class SharedImageCache:
     - Rasterization operations are performed outside locks to avoid blocking
 
     Performance Notes:
-    - LRU eviction keeps memory usage bounded
+    - LRU eviction keeps memory usage bounded; touches and evictions are O(1)
     - Cache keys are designed to avoid collisions across different use cases
     - Metrics tracking helps identify cache effectiveness
     """
@@ -110,12 +129,14 @@ class SharedImageCache:
         self._lock = threading.RLock()
 
         # Page-level cache: (page_index, dpi, color_mode) -> CachedImage
-        self._page_cache: dict[tuple[int, int, str], CachedImage] = {}
-        self._page_access_order: list[tuple[int, int, str]] = []
+        self._page_cache: LruCache[tuple[int, int, str], CachedImage] = LruCache(
+            max_entries=self._limits.page_raster_cache, sizeof=_cached_nbytes, on_evict=_log_page_eviction
+        )
 
         # Region-level cache: (page_index, bbox_norm, dpi, color_mode) -> CachedImage
-        self._region_cache: dict[tuple[int, BBox, int, str], CachedImage] = {}
-        self._region_access_order: list[tuple[int, BBox, int, str]] = []
+        self._region_cache: LruCache[tuple[int, BBox, int, str], CachedImage] = LruCache(
+            max_entries=self._limits.region_image_cache, sizeof=_cached_nbytes, on_evict=_log_region_eviction
+        )
 
         # Metrics
         self._page_hits = 0
@@ -146,19 +167,10 @@ class SharedImageCache:
 
         with self._lock:
             # Check cache first
-            if key in self._page_cache:
+            cached = self._page_cache.get(key)
+            if cached is not None:
                 self._page_hits += 1
-                # Update access order (move to end)
-                self._page_access_order.remove(key)
-                self._page_access_order.append(key)
-                cached = self._page_cache[key]
-                logger.debug(
-                    "Page cache hit: page=%d dpi=%d mode=%s hash=%s",
-                    page_index,
-                    dpi,
-                    color_mode,
-                    cached.hash[:8],
-                )
+                logger.debug("Page cache hit: page=%d dpi=%d mode=%s", page_index, dpi, color_mode)
                 return cached
 
             # Cache miss - need to rasterize
@@ -170,11 +182,9 @@ class SharedImageCache:
         if pil_image is None:
             return None
 
-        # Compute hash and create cached image
-        image_hash = get_image_hash(pil_image)
+        # The content hash is computed lazily, only if a result cache needs it
         cached_image = CachedImage(
             image=pil_image,
-            hash=image_hash,
             page_index=page_index,
             bbox=None,  # Full page
             dpi=dpi,
@@ -183,27 +193,14 @@ class SharedImageCache:
 
         with self._lock:
             # Store in cache with LRU eviction
-            self._page_cache[key] = cached_image
-            self._page_access_order.append(key)
-
-            # Evict oldest if over limit
-            while len(self._page_cache) > self._limits.page_raster_cache:
-                oldest_key = self._page_access_order.pop(0)
-                evicted = self._page_cache.pop(oldest_key, None)
-                if evicted:
-                    logger.debug(
-                        "Evicted page from cache: page=%d dpi=%d mode=%s",
-                        oldest_key[0],
-                        oldest_key[1],
-                        oldest_key[2],
-                    )
+            self._page_cache.put(key, cached_image)
+            self._enforce_memory_budget()
 
             logger.debug(
-                "Page cached: page=%d dpi=%d mode=%s hash=%s size=%dx%d",
+                "Page cached: page=%d dpi=%d mode=%s size=%dx%d",
                 page_index,
                 dpi,
                 color_mode,
-                image_hash[:8],
                 pil_image.width,
                 pil_image.height,
             )
@@ -235,20 +232,16 @@ class SharedImageCache:
 
         with self._lock:
             # Check region cache first
-            if key in self._region_cache:
+            cached = self._region_cache.get(key)
+            if cached is not None:
                 self._region_hits += 1
-                # Update access order
-                self._region_access_order.remove(key)
-                self._region_access_order.append(key)
-                cached = self._region_cache[key]
                 logger.debug(
-                    "Region cache hit: page=%d bbox=%.1f,%.1f,%.1f,%.1f hash=%s",
+                    "Region cache hit: page=%d bbox=%.1f,%.1f,%.1f,%.1f",
                     page_index,
                     bbox_norm.x0,
                     bbox_norm.y0,
                     bbox_norm.x1,
                     bbox_norm.y1,
-                    cached.hash[:8],
                 )
                 return cached
 
@@ -300,11 +293,8 @@ class SharedImageCache:
             logger.warning("Failed to crop region from page %d: %s", page_index, e)
             return None
 
-        # Compute hash and create cached image
-        region_hash = get_image_hash(cropped_img)
         cached_region = CachedImage(
             image=cropped_img,
-            hash=region_hash,
             page_index=page_index,
             bbox=bbox_norm,
             dpi=dpi,
@@ -313,37 +303,40 @@ class SharedImageCache:
 
         with self._lock:
             # Store in region cache with LRU eviction
-            self._region_cache[key] = cached_region
-            self._region_access_order.append(key)
-
-            # Evict oldest if over limit
-            while len(self._region_cache) > self._limits.region_image_cache:
-                oldest_key = self._region_access_order.pop(0)
-                evicted = self._region_cache.pop(oldest_key, None)
-                if evicted:
-                    logger.debug(
-                        "Evicted region from cache: page=%d bbox=%.1f,%.1f,%.1f,%.1f",
-                        oldest_key[0],
-                        oldest_key[1].x0,
-                        oldest_key[1].y0,
-                        oldest_key[1].x1,
-                        oldest_key[1].y1,
-                    )
+            self._region_cache.put(key, cached_region)
+            self._enforce_memory_budget()
 
             logger.debug(
-                "Region cached: page=%d bbox=%.1f,%.1f,%.1f,%.1f hash=%s size=%dx%d",
+                "Region cached: page=%d bbox=%.1f,%.1f,%.1f,%.1f size=%dx%d",
                 page_index,
                 bbox_norm.x0,
                 bbox_norm.y0,
                 bbox_norm.x1,
                 bbox_norm.y1,
-                region_hash[:8],
                 cropped_img.width,
                 cropped_img.height,
             )
 
         return cached_region
 
+    def _enforce_memory_budget(self) -> None:
+        """Evict images until both tiers together fit the memory budget.
+
+        Regions go first: an evicted region is re-cropped from its cached page
+        without rasterizing again. Pages are evicted oldest first, but the most
+        recently stored page is always kept. Must be called with the lock held.
+        """
+        budget = self._limits.memory_budget_mb * 1024 * 1024
+        if budget <= 0:
+            return
+        while self._page_cache.total_bytes + self._region_cache.total_bytes > budget:
+            if len(self._region_cache) > 0:
+                self._region_cache.evict_oldest()
+            elif len(self._page_cache) > 1:
+                self._page_cache.evict_oldest()
+            else:
+                break
+
     def _rasterize_page_impl(self, doc: Any, page_index: int, dpi: int = 150, color_mode: str = "RGB") -> Image.Image | None:
         """Internal implementation of page rasterization.
 
@@ -393,15 +386,18 @@ class SharedImageCache:
                 "rasterize_calls": self._rasterize_calls,
                 "page_cache_size": len(self._page_cache),
                 "region_cache_size": len(self._region_cache),
+                "page_evictions": self._page_cache.evictions,
+                "region_evictions": self._region_cache.evictions,
+                "memory_bytes": self._page_cache.total_bytes + self._region_cache.total_bytes,
             }
 
     def clear(self) -> None:
         """Clear all caches and reset metrics."""
         with self._lock:
             self._page_cache.clear()
-            self._page_access_order.clear()
             self._region_cache.clear()
-            self._region_access_order.clear()
+            self._page_cache.evictions = 0
+            self._region_cache.evictions = 0
 
             self._page_hits = 0
             self._page_misses = 0
@@ -412,29 +408,55 @@ class SharedImageCache:
         logger.debug("Cleared all image caches")
 
 
-def get_image_hash(image: Image.Image) -> str:
+def image_nbytes(image: Image.Image) -> int:
+    """Approximate pixel memory of a PIL image in bytes."""
+    bytes_per_band = {"I": 4, "F": 4, "I;16": 2, "I;16B": 2, "I;16L": 2}.get(image.mode, 1)
+    if image.mode == "1":
+        return (image.width + 7) // 8 * image.height
+    return image.width * image.height * len(image.getbands()) * bytes_per_band
+
+
+def _cached_nbytes(cached: CachedImage) -> int:
+    return image_nbytes(cached.image)
+
+
+def _log_page_eviction(key: tuple[int, int, str], _image: CachedImage) -> None:
+    logger.debug("Evicted page from cache: page=%d dpi=%d mode=%s", *key)
+
+
+def _log_region_eviction(key: tuple[int, BBox, int, str], _image: CachedImage) -> None:
+    page_index, bbox, _dpi, _mode = key
+    logger.debug(
+        "Evicted region from cache: page=%d bbox=%.1f,%.1f,%.1f,%.1f", page_index, bbox.x0, bbox.y0, bbox.x1, bbox.y1
+    )
+
+
+def get_image_hash(image: Image.Image | CachedImage) -> str:
     """Generate a consistent hash for a PIL image.
 
+    The raw pixel buffer is hashed with BLAKE2b together with the mode and
+    size; no re-encoding or color conversion takes place, so images with the
+    same pixels in different modes hash differently. A CachedImage returns its
+    memoized hash.
+
     Args:
-        image: PIL Image to hash
+        image: PIL Image (or CachedImage) to hash
 
     Returns:
         16-character hex hash string
     """
-    # Normalize to RGB for consistent hashing
-    norm_image = image.convert("RGB") if image.mode != "RGB" else image
-
-    # Create hash from mode, size, and pixel data
-    hasher = hashlib.sha256()
-    hasher.update(norm_image.mode.encode())
-    hasher.update(f"{norm_image.width}x{norm_image.height}".encode())
+    if isinstance(image, CachedImage):
+        return image.hash
 
-    # Convert to bytes for hashing
-    buf = BytesIO()
-    norm_image.save(buf, format="PNG")
-    hasher.update(buf.getvalue())
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(f"{image.mode}:{image.width}x{image.height}".encode())
+    if image.mode in ("P", "PA"):
+        palette = image.getpalette()
+        if palette:
+            hasher.update(bytes(palette))
+    hasher.update(image.tobytes())
 
-    return hasher.hexdigest()[:16]
+    return hasher.hexdigest()
 
 
 def should_enable_image_cache(
@@ -466,5 +488,6 @@ __all__ = [
     "CachedImage",
     "SharedImageCache",
     "get_image_hash",
+    "image_nbytes",
     "should_enable_image_cache",
 ]
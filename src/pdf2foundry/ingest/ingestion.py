@@ -6,9 +6,13 @@ optional JSON caching to avoid re-conversion on subsequent runs.
 
 Key features:
 - Single-pass conversion: PDF → DoclingDocument (once per run)
-- JSON caching: Save/load DoclingDocument to/from JSON for faster re-runs
+- JSON caching: Save/load DoclingDocument to/from JSON for faster re-runs,
+  tied to the source PDF hash by a sidecar file
+- Binary caching: Optional compact cache format tied to the source PDF hash
+- Conversion cache: Persistent, content-addressed store of conversions shared
+  by every run on the machine (see conversion_cache.py)
 - Fallback handling: Graceful fallback to conversion if JSON loading fails
-- Validation: Ensure loaded documents have required methods and reasonable data
+- Validation: Cheap structural checks on loaded documents (optional deep render check)
 - Progress reporting: Emit events during conversion and loading
 
 The main entry point is `ingest_docling()` which handles the complete workflow
@@ -18,12 +22,13 @@ cache writing for future runs.
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, cast
 
+from pdf2foundry.ingest.doc_cache import DocCacheFormat
 from pdf2foundry.ingest.docling_adapter import DoclingDocumentLike
 from pdf2foundry.ingest.json_io import atomic_write_text, doc_to_json
 
@@ -65,11 +70,33 @@ class ConversionError(Exception):
         super().__init__(msg)
 
 
-def validate_doc(doc: DoclingDocumentLike) -> None:
+# Attributes every native DoclingDocument must carry
+_REQUIRED_DOCLING_FIELDS = ("body", "pages")
+
+
+def _supported_docling_schema_major() -> str | None:
+    """Return the DoclingDocument schema major version this install reads, if known."""
+    try:
+        from docling_core.types.doc.document import DoclingDocument
+
+        current_version = DoclingDocument.model_fields["version"].default
+    except Exception:
+        return None
+    return str(current_version).split(".")[0]
+
+
+def validate_doc(doc: DoclingDocumentLike, *, deep: bool = False) -> None:
     """Validate that a DoclingDocument has required fields and reasonable values.
 
+    The default checks are structural and cheap: a positive page count, an
+    ``export_to_html`` method and, for native DoclingDocuments, the schema name,
+    a readable schema version and the required fields. ``deep=True`` also
+    renders the whole document to HTML as a smoke test, which costs as much as
+    a full export on large books.
+
     Args:
         doc: The document to validate
+        deep: Also render the document to HTML
 
     Raises:
         JsonValidationError: If the document fails validation checks
@@ -88,7 +115,27 @@ def validate_doc(doc: DoclingDocumentLike) -> None:
     if not hasattr(doc, "export_to_html") or not callable(doc.export_to_html):
         raise JsonValidationError(Path("<unknown>"), "Missing or invalid 'export_to_html' method")
 
-    # Basic smoke test - try to call export_to_html to ensure it doesn't immediately fail
+    # Native DoclingDocuments carry their schema name and version
+    schema_name = getattr(doc, "schema_name", None)
+    if isinstance(schema_name, str):
+        if schema_name != "DoclingDocument":
+            raise JsonValidationError(Path("<unknown>"), f"Unexpected schema '{schema_name}'")
+
+        version = getattr(doc, "version", None)
+        supported_major = _supported_docling_schema_major()
+        if isinstance(version, str) and supported_major is not None and version.split(".")[0] != supported_major:
+            raise JsonValidationError(
+                Path("<unknown>"), f"Unsupported schema version {version} (expected {supported_major}.x)"
+            )
+
+        missing = [name for name in _REQUIRED_DOCLING_FIELDS if getattr(doc, name, None) is None]
+        if missing:
+            raise JsonValidationError(Path("<unknown>"), f"Missing required fields: {', '.join(missing)}")
+
+    if not deep:
+        return
+
+    # Deep check - render the document to ensure export doesn't immediately fail
     try:
         html_output = doc.export_to_html()
         if not isinstance(html_output, str):
@@ -97,39 +144,61 @@ def validate_doc(doc: DoclingDocumentLike) -> None:
         raise JsonValidationError(Path("<unknown>"), f"export_to_html() method failed: {e}") from e
 
 
-def load_json_file(path: Path) -> str:
-    """Load and parse JSON file, validating basic JSON syntax.
+def load_json_data(path: Path) -> Any:
+    """Read and parse a JSON file once (memory-mapped, orjson when available).
 
     Args:
         path: Path to the JSON file
 
     Returns:
-        The raw JSON text as a string
+        The parsed JSON value
 
     Raises:
         JsonLoadError: If the file cannot be read or parsed as JSON
     """
+    from pdf2foundry.ingest.json_io import read_json_file
+
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception as e:
+        return read_json_file(path)
+    except (OSError, ValueError) as e:
         raise JsonLoadError(path, e) from e
 
-    # Validate that it's parseable JSON
+
+def _load_cache_data(path: Path, source_sha256: str | None) -> Any:
+    """Parse a JSON or binary cache file, detected by content."""
+    from pdf2foundry.ingest.doc_cache import (
+        CacheSourceMismatchError,
+        check_json_source,
+        is_binary_cache,
+        read_binary_data,
+    )
+
     try:
-        json.loads(text)
-    except json.JSONDecodeError as e:
+        if not is_binary_cache(path):
+            check_json_source(path, source_sha256)
+            return load_json_data(path)
+        return read_binary_data(path, expected_source_sha256=source_sha256)
+    except CacheSourceMismatchError as e:
+        raise JsonValidationError(path, str(e)) from e
+    except (OSError, ValueError) as e:
         raise JsonLoadError(path, e) from e
 
-    return text
 
-
-def try_load_doc_from_json(path: Path, fallback_on_failure: bool) -> tuple[DoclingDocumentLike | None, list[str]]:
-    """Attempt to load a DoclingDocument from JSON with optional fallback.
+def try_load_doc_from_json(
+    path: Path,
+    fallback_on_failure: bool,
+    deep_validate: bool = False,
+    source_sha256: str | None = None,
+) -> tuple[DoclingDocumentLike | None, list[str]]:
+    """Attempt to load a DoclingDocument from a JSON or binary cache with optional fallback.
 
     Args:
-        path: Path to the JSON file
+        path: Path to the cache file (JSON, or the binary format from doc_cache)
         fallback_on_failure: If True, return None and warnings on failure;
                            if False, raise exceptions on failure
+        deep_validate: Also render the loaded document to HTML (see validate_doc)
+        source_sha256: SHA-256 of the source PDF; a cache recording a
+                       different source is rejected as invalid
 
     Returns:
         Tuple of (document or None, list of warning messages)
@@ -141,16 +210,17 @@ def try_load_doc_from_json(path: Path, fallback_on_failure: bool) -> tuple[Docli
     warnings: list[str] = []
 
     try:
-        # Load and parse the JSON file
-        json_text = load_json_file(path)
+        # Load and parse the cache file (a single parse, no intermediate string)
+        data = _load_cache_data(path, source_sha256)
 
         # Convert JSON to DoclingDocument
-        from pdf2foundry.ingest.json_io import doc_from_json
+        from pdf2foundry.ingest.json_io import doc_from_data
 
-        doc = doc_from_json(json_text)
+        doc = doc_from_data(data)
+        del data
 
         # Validate the document
-        validate_doc(doc)
+        validate_doc(doc, deep=deep_validate)
 
         logger.info("Successfully loaded DoclingDocument from cache: %s", path)
         return doc, warnings
@@ -182,6 +252,13 @@ class JsonOpts:
     - pretty: Pretty-print JSON when writing.
     - default_path: Default destination path computed by CLI when write is True
       and no explicit path is set (typically dist/<mod-id>/sources/docling.json).
+    - deep_validate: When True, render a loaded document to HTML as a smoke test
+      instead of only checking its structure.
+    - cache_format: Format used when writing the cache. Loading detects the
+      format from the file content, so either format can be loaded.
+    - conversion_cache: When True, look conversions up in (and add them to) the
+      persistent conversion cache keyed by the PDF's content.
+    - cache_dir: Root of the persistent caches (defaults to the user cache directory).
     """
 
     path: Path | None = None
@@ -189,6 +266,10 @@ class JsonOpts:
     fallback_on_json_failure: bool = False
     pretty: bool = True
     default_path: Path | None = None
+    deep_validate: bool = False
+    cache_format: DocCacheFormat = DocCacheFormat.JSON
+    conversion_cache: bool = True
+    cache_dir: Path | None = None
 
 
 ProgressCallback = Callable[[str, dict[str, int | str]], None] | None
@@ -203,10 +284,88 @@ def _safe_emit(on_progress: ProgressCallback, event: str, payload: dict[str, int
         on_progress(event, payload)
 
 
+def _source_sha256(pdf_path: Path) -> str | None:
+    """Hash the source PDF for the binary cache header (None if unreadable)."""
+    from pdf2foundry.ingest.doc_cache import file_sha256
+
+    try:
+        return file_sha256(pdf_path)
+    except OSError:
+        return None
+
+
+def _page_count(doc: object) -> int:
+    try:
+        num_pages_fn = getattr(doc, "num_pages", None)
+        return int(num_pages_fn()) if callable(num_pages_fn) else int(getattr(doc, "num_pages", 0) or 0)
+    except Exception:
+        return int(getattr(doc, "num_pages", 0) or 0)
+
+
+def _covers_pages(doc: object, pages: list[int] | None) -> bool:
+    """Return True unless the document is known to lack a selected page."""
+    from pdf2foundry.ingest.docling_adapter import document_page_numbers
+
+    page_numbers = document_page_numbers(doc)
+    return pages is None or page_numbers is None or set(pages) <= page_numbers
+
+
+def _convert(
+    pdf_path: Path,
+    json_opts: JsonOpts,
+    source_sha256: str | None,
+    on_progress: ProgressCallback,
+    workers: int = 1,
+    pages: list[int] | None = None,
+) -> DoclingDocumentLike:
+    """Convert a PDF, consulting the persistent conversion cache first when enabled."""
+    from pdf2foundry.ingest.docling_adapter import conversion_options, run_docling_conversion
+
+    cache = None
+    key = ""
+    if json_opts.conversion_cache and source_sha256 is not None:
+        from pdf2foundry.ingest.conversion_cache import conversion_key, open_conversion_cache
+
+        cache = open_conversion_cache(json_opts.cache_dir)
+        key = conversion_key(source_sha256, conversion_options(pages=pages))
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Loaded %s from the conversion cache (%s)", pdf_path.name, key[:12])
+            _safe_emit(
+                on_progress,
+                "ingest:loaded_from_cache",
+                {"path": str(cache.directory / f"{key}.bin"), "page_count": _page_count(cached)},
+            )
+            return cast(DoclingDocumentLike, cached)
+
+    # Conversion branch
+    _safe_emit(on_progress, "ingest:converting", {"pdf": str(pdf_path)})
+
+    try:
+        doc = run_docling_conversion(pdf_path, pages=pages, workers=workers)
+    except Exception as e:
+        # Emit conversion failure event
+        _safe_emit(on_progress, "ingest:conversion_failed", {"pdf": str(pdf_path), "error": str(e)})
+        raise
+
+    # Emit success with page_count if available
+    _safe_emit(on_progress, "ingest:converted", {"pdf": str(pdf_path), "page_count": _page_count(doc)})
+
+    if cache is not None:
+        try:
+            cache.put(key, doc, source_sha256=source_sha256)
+        except Exception as e:
+            logger.debug("Could not store conversion of %s in the conversion cache: %s", pdf_path.name, e)
+    return doc
+
+
 def ingest_docling(
     pdf_path: Path,
     json_opts: JsonOpts,
     on_progress: ProgressCallback = None,
+    *,
+    workers: int = 1,
+    pages: list[int] | None = None,
 ) -> DoclingDocumentLike:
     """Load or convert a Docling document once, optionally saving JSON.
 
@@ -219,24 +378,39 @@ def ingest_docling(
     - Else if json_opts.write and default_path provided: convert and save to the
       default path.
     - Else: convert only.
+
+    Conversions go through the persistent conversion cache unless
+    json_opts.conversion_cache is False, so an unchanged PDF is only converted
+    once per machine for a given set of options and Docling version. With
+    ``workers`` > 1, a long PDF is converted as page-range shards in parallel
+    processes; the worker count is not part of the cache key.
+
+    With ``pages`` (1-based), only those pages are converted and they keep
+    their page numbers. A loaded cache file that lacks any selected page is
+    ignored and the PDF converted instead. A conversion of selected pages is
+    never saved to the JSON/binary cache path, so a later full run cannot load
+    it as the whole book and an existing full cache is not overwritten.
     """
-    from pdf2foundry.ingest.docling_adapter import run_docling_conversion
+    source_sha256 = _source_sha256(pdf_path) if json_opts.conversion_cache else None
 
     # Convenience load path handling when explicit --docling-json PATH is provided
     if json_opts.path is not None and json_opts.path.exists():
         # Always allow fallback for convenience mode
-        doc, warnings = try_load_doc_from_json(json_opts.path, fallback_on_failure=True)
+        doc, warnings = try_load_doc_from_json(
+            json_opts.path,
+            fallback_on_failure=True,
+            deep_validate=json_opts.deep_validate,
+            source_sha256=source_sha256 or _source_sha256(pdf_path),
+        )
+        if doc is not None and not _covers_pages(doc, pages):
+            logger.info("%s does not contain every selected page; converting instead", json_opts.path)
+            doc = None
         if doc is not None:
             # Emit loaded event with page count
-            try:
-                num_pages_fn = getattr(doc, "num_pages", None)
-                page_count = int(num_pages_fn()) if callable(num_pages_fn) else int(getattr(doc, "num_pages", 0) or 0)
-            except Exception:
-                page_count = int(getattr(doc, "num_pages", 0) or 0)
             _safe_emit(
                 on_progress,
                 "ingest:loaded_from_cache",
-                {"path": str(json_opts.path), "page_count": page_count},
+                {"path": str(json_opts.path), "page_count": _page_count(doc)},
             )
             return doc
         # If load failed with fallback, emit a warning event and continue to convert
@@ -246,24 +420,7 @@ def ingest_docling(
             {"path": str(json_opts.path)},
         )
 
-    # Conversion branch
-    _safe_emit(on_progress, "ingest:converting", {"pdf": str(pdf_path)})
-
-    try:
-        doc = run_docling_conversion(pdf_path)
-    except Exception as e:
-        # Emit conversion failure event
-        _safe_emit(on_progress, "ingest:conversion_failed", {"pdf": str(pdf_path), "error": str(e)})
-        raise
-
-    # Emit success with page_count if available
-    page_count = 0
-    try:
-        num_pages_fn = getattr(doc, "num_pages", None)
-        page_count = int(num_pages_fn()) if callable(num_pages_fn) else int(getattr(doc, "num_pages", 0) or 0)
-    except Exception:
-        page_count = int(getattr(doc, "num_pages", 0) or 0)
-    _safe_emit(on_progress, "ingest:converted", {"pdf": str(pdf_path), "page_count": page_count})
+    doc = _convert(pdf_path, json_opts, source_sha256, on_progress, workers, pages)
 
     # Determine save path, if any
     json_path: Path | None = None
@@ -272,10 +429,22 @@ def ingest_docling(
     elif json_opts.write and json_opts.default_path is not None:
         json_path = json_opts.default_path
 
+    if json_path is not None and pages is not None:
+        logger.info("Not saving the conversion of selected pages to %s; only full conversions are cached there", json_path)
+        json_path = None
+
     if json_path is not None:
         try:
-            json_text = doc_to_json(doc, pretty=json_opts.pretty)
-            atomic_write_text(json_path, json_text)
+            if json_opts.cache_format is DocCacheFormat.BINARY:
+                from pdf2foundry.ingest.doc_cache import write_binary_cache
+
+                write_binary_cache(json_path, doc, source_sha256=source_sha256 or _source_sha256(pdf_path))
+            else:
+                from pdf2foundry.ingest.doc_cache import write_json_source
+
+                json_text = doc_to_json(doc, pretty=json_opts.pretty)
+                atomic_write_text(json_path, json_text)
+                write_json_source(json_path, source_sha256 or _source_sha256(pdf_path))
             _safe_emit(on_progress, "ingest:saved_to_cache", {"path": str(json_path)})
         except Exception:
             # Ignore write failures for now; detailed handling in Task 13.4
@@ -290,7 +459,7 @@ __all__ = [
     "JsonOpts",
     "JsonValidationError",
     "ingest_docling",
-    "load_json_file",
+    "load_json_data",
     "try_load_doc_from_json",
     "validate_doc",
 ]
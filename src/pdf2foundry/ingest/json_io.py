@@ -10,6 +10,8 @@ Key features:
 - Fallback serialization for minimal document structure
 - Atomic file writing to prevent corruption
 - Document reconstruction from JSON with validation
+- Single-parse cache loading through a read-only memory map, using orjson
+  when it is installed (``pip install pdf2foundry[speedups]``)
 
 The serialization strategy prioritizes native Docling methods but provides
 robust fallbacks to ensure caching works across different Docling versions.
@@ -18,24 +20,30 @@ robust fallbacks to ensure caching works across different Docling versions.
 from __future__ import annotations
 
 import json
+import mmap
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any, Protocol, cast
 
+try:  # Optional fast JSON backend
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None  # type: ignore[assignment]
+
 
 class _DocumentLikeForJson(Protocol):  # pragma: no cover - interface
     def num_pages(self) -> int: ...
     def export_to_html(self, **kwargs: object) -> str: ...
 
 
-def doc_to_json(doc: object, *, pretty: bool = True) -> str:
-    """Serialize a Docling-like document to deterministic JSON.
+def doc_to_data(doc: object) -> Any:
+    """Convert a Docling-like document to a JSON-serializable object.
 
     Strategy:
     - Prefer native to_json() if available
-    - Normalize to a Python object, then dump with sorted keys
-    - Fallback: serialize minimal shape if native unavailable
+    - Else a DoclingDocument's export_to_dict(), which doc_from_data() restores
+    - Fallback: minimal shape with the page count and per-page HTML
     """
     # 1) Native path if available
     to_json = getattr(doc, "to_json", None)
@@ -44,23 +52,26 @@ def doc_to_json(doc: object, *, pretty: bool = True) -> str:
             native = to_json()
             if isinstance(native, str):
                 try:
-                    obj = json.loads(native)
+                    return json.loads(native)
                 except Exception:
                     # Already a string; best-effort normalization by wrapping
-                    obj = {"_native": native}
-            else:
-                obj = native
-            return json.dumps(
-                obj,
-                ensure_ascii=False,
-                sort_keys=True,
-                indent=2 if pretty else None,
-            )
+                    return {"_native": native}
+            return native
         except Exception:
             # Fall through to fallback serializer
             pass
 
-    # 2) Fallback: comprehensive structure with per-page HTML content
+    # 2) Full DoclingDocument (docling 2.x has no to_json())
+    export_to_dict = getattr(doc, "export_to_dict", None)
+    if callable(export_to_dict):
+        try:
+            exported = export_to_dict()
+            if isinstance(exported, dict) and exported.get("schema_name") == "DoclingDocument":
+                return exported
+        except Exception:
+            pass
+
+    # 3) Fallback: comprehensive structure with per-page HTML content
     num_pages = 0
     try:
         num_pages_fn = getattr(doc, "num_pages", None)
@@ -80,19 +91,105 @@ def doc_to_json(doc: object, *, pretty: bool = True) -> str:
                 # If individual page export fails, store empty content for that page
                 pages_html.append("")
 
-    obj = {
+    return {
         "schema_version": 1,
         "num_pages": num_pages,
         "pages_html": pages_html,  # Store per-page HTML content
     }
+
+
+def doc_to_json(doc: object, *, pretty: bool = True) -> str:
+    """Serialize a Docling-like document to deterministic JSON.
+
+    The document is normalized with doc_to_data(), then dumped with sorted keys.
+    """
     return json.dumps(
-        obj,
+        doc_to_data(doc),
         ensure_ascii=False,
         sort_keys=True,
         indent=2 if pretty else None,
     )
 
 
+class _JsonDoc:
+    """Lightweight document rebuilt from the fallback JSON shape."""
+
+    def __init__(self, pages: int, pages_html: list[str] | None = None) -> None:
+        self._pages = pages
+        self._pages_html = pages_html or []
+
+    def num_pages(self) -> int:  # pragma: no cover - trivial
+        return self._pages
+
+    def export_to_html(self, page_no: int = 0, **_: object) -> str:
+        """Export cached HTML content for the specified page."""
+        if 0 <= page_no < len(self._pages_html):
+            return self._pages_html[page_no]
+        return ""  # Return empty string for invalid page numbers
+
+
+def _loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse JSON with orjson when available, else the standard library."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def read_json_file(path: Path) -> Any:
+    """Parse a JSON file exactly once.
+
+    The file is mapped read-only, so with orjson the parser reads straight from
+    the page cache and no bytes or str copy of the file is made; peak memory
+    stays close to the parsed object graph. Without orjson the mapped bytes
+    are copied once for the standard library parser.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the content is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return _loads(view)
+
+
+def doc_from_data(data: Any) -> _DocumentLikeForJson:
+    """Build a Docling-like document from already parsed JSON.
+
+    Native DoclingDocument payloads (``schema_name == "DoclingDocument"``) are
+    validated into a DoclingDocument; anything else uses the lightweight
+    fallback shape written by doc_to_json.
+    """
+    if isinstance(data, dict) and data.get("schema_name") == "DoclingDocument":
+        try:
+            from docling_core.types.doc.document import DoclingDocument
+
+            return cast(_DocumentLikeForJson, DoclingDocument.model_validate(data))
+        except ImportError:
+            pass
+
+    pages = 0
+    pages_html: list[str] = []
+    try:
+        if isinstance(data, dict):
+            if "num_pages" in data and isinstance(data["num_pages"], int):
+                pages = int(data["num_pages"])
+            elif "pages" in data and isinstance(data["pages"], list):
+                pages = len(data["pages"])
+
+            # Load cached HTML content if available
+            if "pages_html" in data and isinstance(data["pages_html"], list):
+                pages_html = [str(html) for html in data["pages_html"]]
+    except Exception:
+        pages = 0
+        pages_html = []
+
+    return cast(_DocumentLikeForJson, _JsonDoc(pages, pages_html))
+
+
 def doc_from_json(text: str) -> _DocumentLikeForJson:
     """Deserialize a Docling-like document from JSON.
 
@@ -112,41 +209,21 @@ def doc_from_json(text: str) -> _DocumentLikeForJson:
 
     data: Any
     try:
-        data = json.loads(text)
+        data = _loads(text)
     except Exception:
         data = {"num_pages": 0}
 
-    class _JsonDoc:
-        def __init__(self, pages: int, pages_html: list[str] | None = None) -> None:
-            self._pages = pages
-            self._pages_html = pages_html or []
-
-        def num_pages(self) -> int:  # pragma: no cover - trivial
-            return self._pages
+    return doc_from_data(data)
 
-        def export_to_html(self, page_no: int = 0, **_: object) -> str:
-            """Export cached HTML content for the specified page."""
-            if 0 <= page_no < len(self._pages_html):
-                return self._pages_html[page_no]
-            return ""  # Return empty string for invalid page numbers
-
-    pages = 0
-    pages_html: list[str] = []
-    try:
-        if isinstance(data, dict):
-            if "num_pages" in data and isinstance(data["num_pages"], int):
-                pages = int(data["num_pages"])
-            elif "pages" in data and isinstance(data["pages"], list):
-                pages = len(data["pages"])
 
-            # Load cached HTML content if available
-            if "pages_html" in data and isinstance(data["pages_html"], list):
-                pages_html = [str(html) for html in data["pages_html"]]
-    except Exception:
-        pages = 0
-        pages_html = []
+def doc_from_json_file(path: Path) -> _DocumentLikeForJson:
+    """Load a Docling-like document from a JSON file with a single parse.
 
-    return cast(_DocumentLikeForJson, _JsonDoc(pages, pages_html))
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the content is not valid JSON
+    """
+    return doc_from_data(read_json_file(path))
 
 
 def atomic_write_text(path: Path, data: str, *, encoding: str = "utf-8") -> None:
@@ -163,8 +240,24 @@ def atomic_write_text(path: Path, data: str, *, encoding: str = "utf-8") -> None
     os.replace(tmp_path, path)
 
 
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Atomically write bytes to a file, like atomic_write_text()."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile("wb", dir=str(path.parent), delete=False) as tmp:
+        tmp.write(data)
+        tmp.flush()
+        os.fsync(tmp.fileno())
+        tmp_path = Path(tmp.name)
+    os.replace(tmp_path, path)
+
+
 __all__ = [
+    "atomic_write_bytes",
     "atomic_write_text",
+    "doc_from_data",
     "doc_from_json",
+    "doc_from_json_file",
+    "doc_to_data",
     "doc_to_json",
+    "read_json_file",
 ]
@@ -0,0 +1,135 @@
+"""Least-recently-used mapping shared by the in-memory caches.
+
+SharedImageCache, OcrCache and CaptionCache all need the same primitive: a
+mapping that remembers access order and evicts the oldest entries once an
+entry-count or byte budget is exceeded. LruCache is built on OrderedDict, so
+lookups, touches, inserts and evictions are all O(1).
+
+Like the caches built on it, LruCache is not thread-safe; callers that share
+an instance between threads must hold their own lock.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Generic, TypeVar, overload
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+D = TypeVar("D")
+
+
+class LruCache(Generic[K, V]):  # noqa: UP046
+    """Mapping with LRU eviction under an entry-count and/or byte budget.
+
+    Either budget may be 0 to disable it. When a byte budget is set, ``sizeof``
+    reports the size of each value; sizes are recorded on insert.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        sizeof: Callable[[V], int] | None = None,
+        on_evict: Callable[[K, V], None] | None = None,
+    ) -> None:
+        """Initialize the LRU mapping.
+
+        Args:
+            max_entries: Maximum number of entries (0 = unbounded)
+            max_bytes: Maximum total size of values (0 = unbounded)
+            sizeof: Size of a value in bytes (required for a byte budget)
+            on_evict: Called with each entry evicted to satisfy a budget
+        """
+        if max_bytes and sizeof is None:
+            raise ValueError("A byte budget requires a sizeof function")
+        self.max_entries = max(0, max_entries)
+        self.max_bytes = max(0, max_bytes)
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self._data: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self.total_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate keys from least to most recently used."""
+        return iter(self._data)
+
+    @overload
+    def get(self, key: K) -> V | None: ...
+
+    @overload
+    def get(self, key: K, default: D) -> V | D: ...
+
+    def get(self, key: K, default: object = None) -> object:
+        """Return the value for a key and mark it most recently used."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def peek(self, key: K) -> V | None:
+        """Return the value for a key without changing its recency."""
+        entry = self._data.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or replace a value, then evict until within budget.
+
+        The new entry itself is never evicted, even if it alone exceeds the
+        byte budget.
+        """
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        self._data[key] = (value, size)
+        self.total_bytes += size
+        self._evict()
+
+    def pop(self, key: K) -> V | None:
+        """Remove a key, returning its value (None if absent)."""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry[1]
+        return entry[0]
+
+    def evict_oldest(self) -> tuple[K, V] | None:
+        """Evict the least recently used entry, returning it (None if empty)."""
+        if not self._data:
+            return None
+        key, (value, size) = self._data.popitem(last=False)
+        self.total_bytes -= size
+        self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+        return key, value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+        self.total_bytes = 0
+
+    def _over_budget(self) -> bool:
+        return bool(
+            (self.max_entries and len(self._data) > self.max_entries)
+            or (self.max_bytes and self.total_bytes > self.max_bytes)
+        )
+
+    def _evict(self) -> None:
+        while len(self._data) > 1 and self._over_budget():
+            self.evict_oldest()
+
+
+__all__ = [
+    "LruCache",
+]
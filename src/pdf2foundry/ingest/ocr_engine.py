@@ -8,15 +8,37 @@ text coverage is insufficient.
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import sqlite3
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 import pytesseract
 from PIL import Image
 
+from pdf2foundry.ingest.lru_cache import LruCache
+from pdf2foundry.ingest.ocr_layout import data_to_lines
+
+if TYPE_CHECKING:
+    from pdf2foundry.ingest.disk_cache import DiskCache
+    from pdf2foundry.ingest.image_cache import CachedImage
+    from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
 logger = logging.getLogger(__name__)
 
+# Tesseract configuration shared by every OCR call (part of the disk cache key)
+_TESSERACT_CONFIG = "--psm 6"  # Assume uniform block of text
+
+# Layout of persisted OCR results (part of the disk cache key)
+_OCR_RESULT_FORMAT = 2
+
+# Longest side of the thumbnail used for script detection (OSD)
+_OSD_THUMBNAIL_SIDE = 1024
+
+# Byte budget of the persistent OCR result cache
+DEFAULT_OCR_DISK_CACHE_BYTES = 256 * 1024 * 1024
+
 
 class OcrResult:
     """Result from OCR processing containing extracted text and metadata."""
@@ -27,6 +49,7 @@ class OcrResult:
         confidence: float = 0.0,
         language: str | None = None,
         bbox: tuple[float, float, float, float] | None = None,
+        paragraph: int | None = None,
     ) -> None:
         """Initialize OCR result.
 
@@ -35,11 +58,13 @@ class OcrResult:
             confidence: OCR confidence score (0.0-1.0)
             language: Detected or specified language code
             bbox: Bounding box as (x, y, width, height) if available
+            paragraph: Paragraph index for line results; lines sharing it form one paragraph
         """
         self.text = text
         self.confidence = confidence
         self.language = language
         self.bbox = bbox
+        self.paragraph = paragraph
 
     def to_html_span(self) -> str:
         """Convert OCR result to HTML span with metadata attributes."""
@@ -93,22 +118,37 @@ class OcrEngine(Protocol):
 class TesseractOcrEngine:
     """Tesseract-based OCR engine implementation."""
 
-    def __init__(self) -> None:
-        """Initialize Tesseract OCR engine."""
+    def __init__(self, detect_script: bool = False) -> None:
+        """Initialize Tesseract OCR engine.
+
+        Args:
+            detect_script: Run script detection (OSD) on a thumbnail when no
+                language is given. Off by default since it costs an extra pass.
+        """
         self._available: bool | None = None
+        self._version: str | None = None
+        self._detect_script = detect_script
 
     def is_available(self) -> bool:
         """Check if Tesseract is available."""
         if self._available is None:
             try:
                 # Test if tesseract is actually available
-                pytesseract.get_tesseract_version()
+                self._version = str(pytesseract.get_tesseract_version())
                 self._available = True
             except Exception as e:
                 logger.warning(f"Tesseract OCR not available: {e}")
                 self._available = False
         return self._available
 
+    def cache_fingerprint(self) -> str:
+        """Identify the Tesseract version and configuration for persistent cache keys."""
+        self.is_available()
+        return (
+            f"tesseract:{self._version or 'unknown'}:{_TESSERACT_CONFIG}"
+            f":osd={int(self._detect_script)}:v{_OCR_RESULT_FORMAT}"
+        )
+
     def run(
         self,
         image: Image.Image | Path | bytes,
@@ -121,7 +161,8 @@ class TesseractOcrEngine:
             language: Language code for OCR (e.g., 'eng', 'fra')
 
         Returns:
-            List of OCR results with extracted text and confidence
+            One OCR result per recognized line, in reading order, with its
+            bounding box, confidence and paragraph index
 
         Raises:
             ImportError: If pytesseract is not available
@@ -142,113 +183,192 @@ class TesseractOcrEngine:
             pil_image = image
 
         # Prepare OCR configuration
-        config = "--psm 6"  # Assume uniform block of text
+        config = _TESSERACT_CONFIG
         if language:
             config += f" -l {language}"
 
         try:
-            # Extract text with confidence data
+            # A single Tesseract pass yields the words with their boxes and confidences
             data = pytesseract.image_to_data(pil_image, config=config, output_type=pytesseract.Output.DICT)
+            lines = data_to_lines(data)
+            if not lines:
+                return []
 
-            # Extract text
-            text = pytesseract.image_to_string(pil_image, config=config).strip()
-
-            # Calculate average confidence
-            confidences = [int(conf) for conf in data.get("conf", []) if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
-
-            # Detect language if not specified
+            # Detect the script only on request, and only on a downscaled copy
             detected_lang = language
-            if not detected_lang:
-                try:
-                    lang_data = pytesseract.image_to_osd(pil_image, output_type=pytesseract.Output.DICT)
-                    detected_lang = lang_data.get("script", "unknown")
-                except Exception:
-                    detected_lang = "unknown"
-
-            if text:
-                return [
-                    OcrResult(
-                        text=text,
-                        confidence=avg_confidence,
-                        language=detected_lang,
-                    )
-                ]
-            else:
-                return []
+            if not detected_lang and self._detect_script:
+                detected_lang = self._detect_page_script(pil_image)
+
+            return [
+                OcrResult(
+                    text=line.text,
+                    confidence=line.confidence,
+                    language=detected_lang,
+                    bbox=line.bbox,
+                    paragraph=line.paragraph,
+                )
+                for line in lines
+            ]
 
         except Exception as e:
             logger.error(f"OCR processing failed: {e}")
             raise
 
+    def _detect_page_script(self, pil_image: Image.Image) -> str:
+        """Run Tesseract OSD on a thumbnail of the page and return the script name."""
+        try:
+            scale = _OSD_THUMBNAIL_SIDE / max(pil_image.size)
+            if scale < 1:
+                size = (max(1, round(pil_image.width * scale)), max(1, round(pil_image.height * scale)))
+                pil_image = pil_image.resize(size)
+            lang_data = pytesseract.image_to_osd(pil_image, output_type=pytesseract.Output.DICT)
+            return str(lang_data.get("script", "unknown"))
+        except Exception:
+            return "unknown"
+
 
 class OcrCache:
     """LRU cache for OCR results to avoid reprocessing.
 
+    An optional DiskCache sits behind the in-memory LRU so results survive
+    across runs. Disk entries are keyed by image hash, language and the OCR
+    engine fingerprint (Tesseract version and configuration).
+
     Thread Safety:
     - This cache is NOT thread-safe by design for performance reasons
     - It's intended to be used within a single pipeline execution thread
     - If multi-threading is needed, each thread should have its own cache instance
-    - The current PDF2Foundry pipeline is single-threaded per document
+    - Page worker processes each create their own instance
     """
 
-    def __init__(self, max_size: int = 2000) -> None:
+    def __init__(self, max_size: int = 2000, disk_cache: DiskCache | None = None, engine_fingerprint: str = "") -> None:
         """Initialize OCR cache with LRU eviction.
 
         Args:
             max_size: Maximum number of entries to cache
+            disk_cache: Optional persistent tier consulted on in-memory misses
+            engine_fingerprint: OCR engine identity included in persistent keys
         """
-        self._cache: dict[str, list[OcrResult]] = {}
-        self._access_order: list[str] = []
+        self._cache: LruCache[str, list[OcrResult]] = LruCache(max_entries=max_size)
         self._max_size = max_size
+        self._disk_cache = disk_cache
+        self._engine_fingerprint = engine_fingerprint
 
-    def _get_image_hash(self, image: Image.Image | Path | bytes) -> str:
-        """Generate a hash key for an image."""
-        if isinstance(image, Image.Image):
+    def _get_image_hash(self, image: Image.Image | CachedImage | Path | bytes) -> str:
+        """Generate a hash key for an image (memoized for CachedImage)."""
+        if isinstance(image, Path | str):
+            image_bytes = Path(image).read_bytes()
+        elif isinstance(image, bytes):
+            image_bytes = image
+        else:
             # Use shared image hashing utility for consistency
             from pdf2foundry.ingest.image_cache import get_image_hash
 
             return get_image_hash(image)
-        elif isinstance(image, Path | str):
-            image_bytes = Path(image).read_bytes()
-        else:
-            image_bytes = image
 
         # For non-PIL images, use direct byte hashing
         return hashlib.sha256(image_bytes).hexdigest()[:16]
 
-    def get(self, image: Image.Image | Path | bytes, language: str | None = None) -> list[OcrResult] | None:
+    def _disk_key(self, key: str) -> str:
+        return hashlib.sha256(f"{key}:{self._engine_fingerprint}".encode()).hexdigest()
+
+    def _disable_disk_cache(self, error: Exception) -> None:
+        logger.warning(f"Persistent OCR cache disabled: {error}")
+        self._disk_cache = None
+
+    def get(self, image: Image.Image | CachedImage | Path | bytes, language: str | None = None) -> list[OcrResult] | None:
         """Get cached OCR result if available."""
         key = f"{self._get_image_hash(image)}:{language or 'auto'}"
 
-        if key in self._cache:
-            # Update access order (move to end)
-            self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._cache[key]
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self._disk_cache is not None:
+            try:
+                payload = self._disk_cache.get(self._disk_key(key))
+            except (sqlite3.Error, OSError) as e:
+                self._disable_disk_cache(e)
+                return None
+            if payload is not None:
+                results = _decode_results(payload)
+                self._cache.put(key, results)
+                return results
 
         return None
 
-    def set(self, image: Image.Image | Path | bytes, language: str | None, results: list[OcrResult]) -> None:
+    def set(self, image: Image.Image | CachedImage | Path | bytes, language: str | None, results: list[OcrResult]) -> None:
         """Cache OCR results with LRU eviction."""
         key = f"{self._get_image_hash(image)}:{language or 'auto'}"
+        self._cache.put(key, results)
 
-        # If already exists, update access order
-        if key in self._cache:
-            self._access_order.remove(key)
-
-        self._cache[key] = results
-        self._access_order.append(key)
-
-        # Evict oldest if over limit
-        while len(self._cache) > self._max_size:
-            oldest_key = self._access_order.pop(0)
-            self._cache.pop(oldest_key, None)
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(self._disk_key(key), _encode_results(results))
+            except (sqlite3.Error, OSError) as e:
+                self._disable_disk_cache(e)
 
     def clear(self) -> None:
-        """Clear the cache."""
+        """Clear the in-memory cache (the persistent tier is left untouched)."""
         self._cache.clear()
-        self._access_order.clear()
+
+
+def _encode_results(results: list[OcrResult]) -> bytes:
+    """Serialize results column-wise: one array per field, boxes flattened, -1 for missing values."""
+    boxes: list[float] = []
+    for r in results:
+        boxes.extend(r.bbox if r.bbox else (-1, -1, -1, -1))
+    columns: dict[str, list[Any]] = {
+        "text": [r.text for r in results],
+        "conf": [round(r.confidence, 4) for r in results],
+        "lang": sorted({r.language for r in results if r.language}),
+        "bbox": [int(v) if float(v).is_integer() else v for v in boxes],
+        "par": [-1 if r.paragraph is None else r.paragraph for r in results],
+    }
+    languages = columns["lang"]
+    columns["lang_idx"] = [languages.index(r.language) if r.language else -1 for r in results]
+    return json.dumps(columns, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_results(payload: bytes) -> list[OcrResult]:
+    columns = json.loads(payload)
+    languages = columns["lang"]
+    boxes = columns["bbox"]
+    results = []
+    for i, text in enumerate(columns["text"]):
+        x, y, w, h = (float(v) for v in boxes[4 * i : 4 * i + 4])
+        lang_idx = columns["lang_idx"][i]
+        paragraph = columns["par"][i]
+        results.append(
+            OcrResult(
+                text=text,
+                confidence=columns["conf"][i],
+                language=languages[lang_idx] if lang_idx >= 0 else None,
+                bbox=(x, y, w, h) if w >= 0 else None,
+                paragraph=paragraph if paragraph >= 0 else None,
+            )
+        )
+    return results
+
+
+def create_ocr_cache(options: PdfPipelineOptions, engine: TesseractOcrEngine, max_size: int = 2000) -> OcrCache:
+    """Build the OCR cache for a pipeline run, with a disk tier unless disabled.
+
+    Args:
+        options: Pipeline options (``disk_cache`` and ``cache_dir`` are honored)
+        engine: OCR engine whose fingerprint scopes persistent entries
+        max_size: Maximum number of in-memory entries
+
+    Returns:
+        OcrCache instance
+    """
+    if not getattr(options, "disk_cache", False):
+        return OcrCache(max_size=max_size)
+
+    from pdf2foundry.ingest.disk_cache import open_disk_cache
+
+    disk_cache = open_disk_cache("ocr", DEFAULT_OCR_DISK_CACHE_BYTES, getattr(options, "cache_dir", None))
+    return OcrCache(max_size=max_size, disk_cache=disk_cache, engine_fingerprint=engine.cache_fingerprint())
 
 
 def compute_text_coverage(html: str) -> float:
@@ -309,5 +429,6 @@ __all__ = [
     "OcrResult",
     "TesseractOcrEngine",
     "compute_text_coverage",
+    "create_ocr_cache",
     "needs_ocr",
 ]
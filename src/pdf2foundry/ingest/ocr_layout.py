@@ -0,0 +1,150 @@
+"""Interpretation of Tesseract ``image_to_data`` output.
+
+``image_to_data`` returns one row per layout element (page, block, paragraph,
+line, word) with its text, confidence and position. Everything the OCR engine
+needs - line text, per-line confidence and bounding boxes - can be derived from
+this single call, so Tesseract only has to process each page once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+TesseractData = dict[str, list[Any]]
+
+
+@dataclass
+class OcrLine:
+    """One recognized text line.
+
+    Attributes:
+        text: Words of the line joined by spaces
+        confidence: Mean word confidence (0.0-1.0)
+        bbox: Union of the word boxes as (x, y, width, height) in image pixels
+        paragraph: Index of the paragraph the line belongs to, in Tesseract's reading order
+    """
+
+    text: str
+    confidence: float
+    bbox: tuple[float, float, float, float]
+    paragraph: int
+
+
+def _column(data: TesseractData, name: str, size: int) -> list[Any]:
+    values = data.get(name)
+    return list(values) if values is not None else [0] * size
+
+
+def _confidence(value: Any) -> float:
+    """Parse a Tesseract confidence value (-1 for non-word rows)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -1.0
+
+
+def data_to_text(data: TesseractData) -> str:
+    """Rebuild page text from word rows, matching ``image_to_string`` layout.
+
+    Words on the same line are joined by spaces, lines by newlines, and
+    paragraphs are separated by a blank line.
+
+    Args:
+        data: ``image_to_data`` output in ``Output.DICT`` form
+
+    Returns:
+        Page text (empty if no words were recognized)
+    """
+    words = data.get("text", [])
+    blocks = _column(data, "block_num", len(words))
+    pars = _column(data, "par_num", len(words))
+    lines = _column(data, "line_num", len(words))
+
+    out: list[str] = []
+    current: tuple[Any, Any, Any] | None = None
+    for i, raw in enumerate(words):
+        word = str(raw).strip()
+        if not word:
+            continue
+        key = (blocks[i], pars[i], lines[i])
+        if key == current:
+            out[-1] += " " + word
+            continue
+        if current is not None and key[:2] != current[:2]:
+            out.append("")  # Paragraph break
+        out.append(word)
+        current = key
+    return "\n".join(out)
+
+
+def data_to_lines(data: TesseractData) -> list[OcrLine]:
+    """Group word rows into lines with their own confidence and bounding box.
+
+    Args:
+        data: ``image_to_data`` output in ``Output.DICT`` form
+
+    Returns:
+        Lines in Tesseract's reading order (empty if no words were recognized)
+    """
+    words = data.get("text", [])
+    size = len(words)
+    blocks = _column(data, "block_num", size)
+    pars = _column(data, "par_num", size)
+    line_nums = _column(data, "line_num", size)
+    confs = _column(data, "conf", size)
+    lefts = _column(data, "left", size)
+    tops = _column(data, "top", size)
+    widths = _column(data, "width", size)
+    heights = _column(data, "height", size)
+
+    lines: list[OcrLine] = []
+    paragraphs: dict[tuple[Any, Any], int] = {}
+    current: tuple[Any, Any, Any] | None = None
+    line_words: list[str] = []
+    line_confs: list[float] = []
+    x0 = y0 = x1 = y1 = 0
+
+    def flush() -> None:
+        if current is None or not line_words:
+            return
+        confidence = sum(line_confs) / len(line_confs) / 100.0 if line_confs else 0.0
+        paragraph = paragraphs.setdefault(current[:2], len(paragraphs))
+        bbox = (float(x0), float(y0), float(x1 - x0), float(y1 - y0))
+        lines.append(OcrLine(" ".join(line_words), confidence, bbox, paragraph))
+
+    for i, raw in enumerate(words):
+        word = str(raw).strip()
+        if not word:
+            continue
+        left, top = int(lefts[i]), int(tops[i])
+        right, bottom = left + int(widths[i]), top + int(heights[i])
+        key = (blocks[i], pars[i], line_nums[i])
+        if key != current:
+            flush()
+            current = key
+            line_words, line_confs = [], []
+            x0, y0, x1, y1 = left, top, right, bottom
+        else:
+            x0, y0, x1, y1 = min(x0, left), min(y0, top), max(x1, right), max(y1, bottom)
+        line_words.append(word)
+        confidence = _confidence(confs[i])
+        if confidence > 0:
+            line_confs.append(confidence)
+    flush()
+    return lines
+
+
+def mean_confidence(data: TesseractData) -> float:
+    """Average word confidence on a 0.0-1.0 scale (0.0 when no word has one)."""
+    confidences = [c for c in (_confidence(value) for value in data.get("conf", [])) if c > 0]
+    return sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
+
+
+__all__ = [
+    "OcrLine",
+    "TesseractData",
+    "data_to_lines",
+    "data_to_text",
+    "mean_confidence",
+]
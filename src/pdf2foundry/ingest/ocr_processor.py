@@ -126,15 +126,18 @@ def apply_ocr_to_page(
                 logger.warning(f"Page {page_no}: Could not rasterize page for OCR")
                 return html
             page_image = cached_image.image
+            # The cached image memoizes its hash across cache lookups
+            cache_key: Any = cached_image
         else:
             # Fallback to direct rasterization
             page_image = _rasterize_page(doc, page_no)
             if page_image is None:
                 logger.warning(f"Page {page_no}: Could not rasterize page for OCR")
                 return html
+            cache_key = page_image
 
         # Check cache first
-        ocr_results = ocr_cache.get(page_image)
+        ocr_results = ocr_cache.get(cache_key)
         if ocr_results is None:
             # Log OCR decision when actually running OCR
             if options.ocr_mode.value == "auto":
@@ -153,7 +156,7 @@ def apply_ocr_to_page(
             # Run OCR
             logger.info(f"Page {page_no}: Running OCR (coverage={compute_text_coverage(html):.3f})")
             ocr_results = ocr_engine.run(page_image)
-            ocr_cache.set(page_image, None, ocr_results)
+            ocr_cache.set(cache_key, None, ocr_results)
 
             _safe_emit(
                 on_progress,
@@ -166,7 +169,7 @@ def apply_ocr_to_page(
         # Merge OCR results into HTML
         if ocr_results:
             ocr_html = _merge_ocr_results(ocr_results, html)
-            logger.info(f"Page {page_no}: OCR added {len(ocr_results)} text blocks")
+            logger.info(f"Page {page_no}: OCR added {len(ocr_results)} text lines")
             return ocr_html
         else:
             logger.info(f"Page {page_no}: OCR found no text")
@@ -221,9 +224,59 @@ def _rasterize_page(doc: Any, page_no: int) -> Any | None:
         return None
 
 
+def _reading_order(results: list[OcrResult]) -> list[list[OcrResult]]:
+    """Group line results into paragraphs, ordered as Tesseract read them.
+
+    Paragraphs keep the order of their first line; lines within a paragraph are
+    sorted top to bottom, then left to right. Results without a paragraph index
+    (e.g. whole-page results) form a paragraph of their own.
+    """
+    paragraphs: dict[object, list[OcrResult]] = {}
+    for index, result in enumerate(results):
+        key: object = ("line", result.paragraph) if result.paragraph is not None else ("single", index)
+        paragraphs.setdefault(key, []).append(result)
+
+    def position(result: OcrResult) -> tuple[float, float]:
+        return (result.bbox[1], result.bbox[0]) if result.bbox else (0.0, 0.0)
+
+    return [sorted(lines, key=position) for lines in paragraphs.values()]
+
+
+def _ocr_attributes(confidence: float, language: str | None, bbox: tuple[float, float, float, float] | None) -> str:
+    attrs = ['data-ocr="true"']
+
+    if confidence > 0:
+        attrs.append(f'data-ocr-confidence="{confidence:.3f}"')
+
+    if language:
+        attrs.append(f'data-ocr-language="{language}"')
+
+    if bbox:
+        # Convert bbox to x,y,w,h format expected by tests
+        x, y, w, h = bbox
+        attrs.append(f'data-bbox="{x},{y},{w},{h}"')
+
+    return " " + " ".join(attrs)
+
+
+def _union_bbox(lines: list[OcrResult]) -> tuple[float, float, float, float] | None:
+    boxes = [line.bbox for line in lines if line.bbox]
+    if not boxes:
+        return None
+    x0 = min(x for x, _, _, _ in boxes)
+    y0 = min(y for _, y, _, _ in boxes)
+    x1 = max(x + w for x, _, w, _ in boxes)
+    y1 = max(y + h for _, y, _, h in boxes)
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
 def _merge_ocr_results(ocr_results: list[OcrResult], html: str) -> str:
     """Merge OCR results into HTML content.
 
+    Line results are grouped into one ``<p>`` per paragraph in reading order.
+    The paragraph carries the union bounding box and mean confidence, and each
+    line keeps its own box and confidence on a ``<span>``.
+
     Args:
         ocr_results: List of OCR results to merge
         html: Original HTML content
@@ -243,27 +296,19 @@ def _merge_ocr_results(ocr_results: list[OcrResult], html: str) -> str:
     # Create OCR content section
     ocr_html_parts = ['<div class="ocr-content" data-source="ocr">']
 
-    for result in valid_results:
-        # Build attributes for the paragraph tag
-        attrs = ['data-ocr="true"']
-
-        if result.confidence > 0:
-            attrs.append(f'data-ocr-confidence="{result.confidence:.3f}"')
-
-        if result.language:
-            attrs.append(f'data-ocr-language="{result.language}"')
-
-        if result.bbox:
-            # Convert bbox to x,y,w,h format expected by tests
-            x, y, w, h = result.bbox
-            attrs.append(f'data-bbox="{x},{y},{w},{h}"')
-
-        attrs_str = " " + " ".join(attrs) if attrs else ""
-
-        # Escape HTML in the text content
-        escaped_text = result.text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-        ocr_html_parts.append(f"<p{attrs_str}>{escaped_text}</p>")
+    for lines in _reading_order(valid_results):
+        if len(lines) == 1:
+            result = lines[0]
+            attrs_str = _ocr_attributes(result.confidence, result.language, result.bbox)
+            # Escape HTML in the text content
+            escaped_text = result.text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            ocr_html_parts.append(f"<p{attrs_str}>{escaped_text}</p>")
+            continue
+
+        confidence = sum(line.confidence for line in lines) / len(lines)
+        attrs_str = _ocr_attributes(confidence, lines[0].language, _union_bbox(lines))
+        spans = "<br>".join(line.to_html_span() for line in lines)
+        ocr_html_parts.append(f"<p{attrs_str}>{spans}</p>")
 
     ocr_html_parts.append("</div>")
 
@@ -0,0 +1,216 @@
+"""Batch scheduling and worker pool management for page-level transforms.
+
+Submitting one future per page makes short pages pay the full task scheduling
+and IPC overhead. This module groups pages into batches whose size adapts to the
+measured ``processing_time`` of completed pages, keeps a bounded number of
+batches in flight so every worker stays busy, and optionally keeps a process
+pool warm across documents converted by the same process.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import multiprocessing
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pdf2foundry.ingest.parallel_processor import PageProcessingContext, PageProcessingResult
+
+logger = logging.getLogger(__name__)
+
+# Desired wall time of one batch: long enough to amortize IPC, short enough to balance load
+DEFAULT_TARGET_BATCH_SECONDS = 0.5
+DEFAULT_MAX_BATCH_SIZE = 32
+# Smoothing factor for the per-page processing time estimate
+_EMA_ALPHA = 0.3
+
+
+class AdaptiveBatchPlanner:
+    """Size page batches from the measured processing time of earlier pages.
+
+    The first batches contain a single page so that timings are available
+    quickly. Afterwards the batch size targets ``target_batch_seconds`` of work
+    while leaving at least two batches per worker for the remaining pages.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        fixed_size: int = 0,
+        target_batch_seconds: float = DEFAULT_TARGET_BATCH_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            workers: Number of worker processes consuming batches
+            fixed_size: Use this batch size instead of adapting (0 = adaptive)
+            target_batch_seconds: Desired processing time per batch
+            max_batch_size: Upper bound for adaptive batch sizes
+        """
+        self._workers = max(1, workers)
+        self._fixed_size = max(0, fixed_size)
+        self._target = target_batch_seconds
+        self._max_batch_size = max(1, max_batch_size)
+        self._seconds_per_page: float | None = None
+
+    @property
+    def seconds_per_page(self) -> float | None:
+        """Smoothed processing time per page, or None before any measurement."""
+        return self._seconds_per_page
+
+    def record(self, results: Sequence[PageProcessingResult]) -> None:
+        """Fold the processing times of a completed batch into the estimate."""
+        if not results:
+            return
+        sample = sum(r.processing_time for r in results) / len(results)
+        if self._seconds_per_page is None:
+            self._seconds_per_page = sample
+        else:
+            self._seconds_per_page = _EMA_ALPHA * sample + (1 - _EMA_ALPHA) * self._seconds_per_page
+
+    def next_size(self, remaining: int) -> int:
+        """Return the size of the next batch given the number of unscheduled pages."""
+        if remaining <= 0:
+            return 0
+        if self._fixed_size:
+            return min(self._fixed_size, remaining)
+        if self._seconds_per_page is None:
+            return 1
+
+        by_time = max(1, round(self._target / max(self._seconds_per_page, 1e-6)))
+        fair_share = max(1, math.ceil(remaining / (self._workers * 2)))
+        return min(by_time, fair_share, self._max_batch_size, remaining)
+
+
+def _describe_batch(batch: Sequence[PageProcessingContext]) -> str:
+    first, last = batch[0].page_no, batch[-1].page_no
+    return f"Page {first}" if len(batch) == 1 else f"Pages {first}-{last}"
+
+
+def iter_page_batches(
+    executor: Executor,
+    batch_fn: Callable[..., list[PageProcessingResult]],
+    contexts: Sequence[PageProcessingContext],
+    planner: AdaptiveBatchPlanner,
+    *batch_args: Any,
+    max_in_flight: int,
+    in_order: bool = True,
+) -> Iterator[PageProcessingResult]:
+    """Yield page results as their batches complete.
+
+    With ``in_order``, results are yielded in the order of ``contexts``.
+    Batches that finish ahead of an earlier, slower batch are held back, and
+    they count against ``max_in_flight``, so at most ``max_in_flight`` batches
+    of results are ever waiting to be consumed.
+
+    Raises:
+        RuntimeError: If any batch fails; outstanding batches are cancelled
+    """
+    in_flight: dict[Future[list[PageProcessingResult]], tuple[int, list[PageProcessingContext]]] = {}
+    held: dict[int, tuple[int, list[PageProcessingResult]]] = {}  # Completed (size, results) by start index
+    next_index = 0
+    next_yield = 0
+
+    while next_index < len(contexts) or in_flight or held:
+        # Keep the executor fed with freshly sized batches
+        while next_index < len(contexts) and len(in_flight) + len(held) < max_in_flight:
+            size = planner.next_size(len(contexts) - next_index)
+            batch = list(contexts[next_index : next_index + size])
+            try:
+                future = executor.submit(batch_fn, batch, *batch_args)
+            except Exception as e:
+                # Handle pickling/serialization errors at submission time
+                logger.warning(f"Failed to submit {_describe_batch(batch).lower()} for parallel processing: {e}")
+                raise
+            in_flight[future] = (next_index, batch)
+            next_index += size
+
+        if in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, batch = in_flight.pop(future)
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    logger.error(f"{_describe_batch(batch)} failed: {e}")
+                    for remaining_future in in_flight:
+                        remaining_future.cancel()
+                    raise RuntimeError(f"{_describe_batch(batch)} processing failed: {e}") from e
+
+                planner.record(batch_results)
+                for result in batch_results:
+                    logger.debug(f"Page {result.page_no} completed in {result.processing_time:.3f}s")
+                if in_order:
+                    held[start] = (len(batch), batch_results)
+                else:
+                    yield from batch_results
+
+        # Release completed batches that continue the ordered prefix
+        while next_yield in held:
+            size, batch_results = held.pop(next_yield)
+            next_yield += size
+            yield from batch_results
+
+
+# Process-lifetime pools keyed by (workers, start_method)
+_POOLS: dict[tuple[int, str], ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_page_pool(workers: int, start_method: str) -> ProcessPoolExecutor:
+    """Return a warm process pool that outlives a single document.
+
+    Workers of a persistent pool receive documents lazily through their
+    SharedDocumentHandle, so no per-document initializer is needed.
+
+    Args:
+        workers: Number of worker processes
+        start_method: Multiprocessing start method
+
+    Returns:
+        A ProcessPoolExecutor shared by every caller with the same configuration
+    """
+    key = (workers, start_method)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+            _POOLS[key] = pool
+            logger.debug("Started persistent page pool: workers=%d start_method=%s", workers, start_method)
+        return pool
+
+
+def discard_page_pool(workers: int, start_method: str) -> None:
+    """Shut down and forget a persistent pool, e.g. after a worker crashed."""
+    with _POOLS_LOCK:
+        pool = _POOLS.pop((workers, start_method), None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_page_pools() -> None:
+    """Shut down every persistent page pool."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_page_pools)
+
+
+__all__ = [
+    "AdaptiveBatchPlanner",
+    "discard_page_pool",
+    "get_page_pool",
+    "iter_page_batches",
+    "shutdown_page_pools",
+]
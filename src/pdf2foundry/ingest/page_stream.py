@@ -0,0 +1,138 @@
+"""Streaming page extraction with bounded memory.
+
+extract_semantic_content() returns every page's HTML together with every
+extracted image, table and link, so its memory grows with the book. This
+module yields finished pages one at a time instead: pages are extracted in
+order (by a worker pool when ``workers_effective`` > 1), finalized in small
+windows (structured table placeholders, picture captions) and handed on. Image,
+table and link records are dropped once their window is finalized, so only
+the pages of the current window are held.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from pdf2foundry.ingest.content_extractor import _html_export_options, _resolve_selected_pages
+from pdf2foundry.ingest.docling_adapter import document_page_count
+from pdf2foundry.ingest.html_export import iter_page_html
+from pdf2foundry.ingest.parallel_processor import (
+    PageProcessingContext,
+    PageProcessingResult,
+    iter_pages_parallel,
+    process_page_content,
+)
+from pdf2foundry.model.content import HtmlPage
+from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[str, dict[str, int | str]], None] | None
+
+# Pages finalized together; captions for their images are generated in one batch
+STREAM_WINDOW_PAGES = 8
+
+
+def _safe_emit(on_progress: ProgressCallback, event: str, payload: dict[str, int | str]) -> None:
+    if on_progress is None:
+        return
+    from contextlib import suppress
+
+    with suppress(Exception):
+        on_progress(event, payload)
+
+
+def iter_page_results(
+    doc: Any,
+    selected_pages: list[int],
+    out_assets: Path,
+    options: PdfPipelineOptions,
+    include_layers: Any = None,
+    image_mode: Any = None,
+) -> Iterator[PageProcessingResult]:
+    """Yield extracted pages in page order.
+
+    With more than one effective worker, pages come from a worker pool as
+    batches complete. If the pool fails, the remaining pages are extracted in
+    this process.
+    """
+    contexts = [
+        PageProcessingContext(
+            page_no=page_no, out_assets_path=str(out_assets), name_prefix=f"page-{page_no:04d}", pipeline_options=options
+        )
+        for page_no in selected_pages
+    ]
+    workers = getattr(options, "workers_effective", options.workers)
+    done = 0
+    if workers > 1 and len(contexts) > 1:
+        try:
+            for result in iter_pages_parallel(doc, contexts, workers, options, include_layers, image_mode):
+                done += 1
+                yield result
+            return
+        except Exception as e:
+            logger.warning(
+                "Parallel processing failed (%s: %s). Continuing sequentially from page %d.",
+                type(e).__name__,
+                e,
+                contexts[done].page_no if done < len(contexts) else 0,
+            )
+    remaining = {context.page_no: context for context in contexts[done:]}
+    for page_no, html in iter_page_html(doc, list(remaining), include_layers, image_mode, picture_refs=True):
+        yield process_page_content(doc, remaining[page_no], include_layers, image_mode, html)
+
+
+def iter_semantic_pages(
+    doc: Any,
+    out_assets: Path,
+    options: PdfPipelineOptions,
+    on_progress: ProgressCallback = None,
+) -> Iterator[HtmlPage]:
+    """Yield the finished HTML of each selected page, in page order.
+
+    Produces the same pages as extract_semantic_content(), but holds at most
+    STREAM_WINDOW_PAGES pages (and their images and tables) at a time.
+
+    Raises:
+        ValueError: If a selected page exceeds the document length
+    """
+    from pdf2foundry.ingest.caption_html import update_html_with_captions
+    from pdf2foundry.ingest.caption_processor import apply_captions_to_images, initialize_caption_components
+    from pdf2foundry.ingest.table_processor import replace_table_placeholders_in_pages
+
+    selected_pages = _resolve_selected_pages(document_page_count(doc), options.pages)
+    _safe_emit(on_progress, "extract_content:start", {"page_count": len(selected_pages)})
+    include_layers, image_mode = _html_export_options()
+    caption_engine, caption_cache = initialize_caption_components(options, on_progress, None)
+
+    counts = {"pages": 0, "images": 0, "tables": 0}
+    window: list[PageProcessingResult] = []
+
+    def finish_window() -> list[HtmlPage]:
+        pages = [result.html_page for result in window]
+        images = [image for result in window for image in result.images]
+        tables = [table for result in window for table in result.tables]
+        replace_table_placeholders_in_pages(pages, tables)
+        if images and options.picture_descriptions:
+            apply_captions_to_images(images, out_assets, options, caption_engine, caption_cache, on_progress)
+            update_html_with_captions(pages, images)
+        counts["pages"] += len(pages)
+        counts["images"] += len(images)
+        counts["tables"] += len(tables)
+        window.clear()
+        return pages
+
+    for result in iter_page_results(doc, selected_pages, out_assets, options, include_layers, image_mode):
+        _safe_emit(on_progress, "extract_content:page_exported", {"page_no": result.page_no})
+        window.append(result)
+        if len(window) >= STREAM_WINDOW_PAGES:
+            yield from finish_window()
+    yield from finish_window()
+
+    _safe_emit(on_progress, "extract_content:success", dict(counts))
+
+
+__all__ = ["STREAM_WINDOW_PAGES", "iter_page_results", "iter_semantic_pages"]
@@ -2,27 +2,57 @@
 
 This module provides ProcessPoolExecutor-based parallelization for per-page
 content extraction stages while maintaining compatibility with sequential
-processing and ensuring deterministic output ordering.
+processing and ensuring deterministic output ordering. Pages are dispatched in
+adaptive batches (see ingest/page_scheduler.py), and each batch exports the
+HTML of its pages in one pass over the document (see ingest/html_export.py).
+
+OCR runs inside the page workers: every worker process lazily builds its own
+TesseractOcrEngine, OcrCache and SharedImageCache, so no cache state is shared
+between processes and the OCR output is merged into each page's HTML before the
+result is returned. The components are rebuilt whenever a page arrives with
+different OCR and cache options, since persistent pools and batch runs reuse a
+process across documents. Captioning stays in the parent process, after all
+pages have been collected.
 """
 
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from pdf2foundry.ingest.html_export import export_page_html, iter_page_html
+from pdf2foundry.ingest.page_scheduler import (
+    AdaptiveBatchPlanner,
+    discard_page_pool,
+    get_page_pool,
+    iter_page_batches,
+)
+from pdf2foundry.ingest.shared_document import (
+    SharedDocumentHandle,
+    init_worker_document,
+    publish_document,
+    resolve_worker_document,
+)
 from pdf2foundry.ingest.table_processor import (
     _process_tables,
     _process_tables_with_options,
 )
 from pdf2foundry.model.content import HtmlPage, ImageAsset, LinkRef, TableContent
-from pdf2foundry.model.pipeline_options import PdfPipelineOptions, TableMode
+from pdf2foundry.model.pipeline_options import OcrMode, PdfPipelineOptions, TableMode, WorkerPoolLifetime
 
 logger = logging.getLogger(__name__)
 
+# Per-process OCR components: (ocr_engine, ocr_cache, shared_image_cache), and
+# the option values they were built from (see _worker_ocr_key)
+_WORKER_OCR: tuple[Any, Any, Any] | None = None
+_WORKER_OCR_KEY: tuple[Any, ...] | None = None
+
 
 @dataclass
 class PageProcessingContext:
@@ -32,7 +62,8 @@ class PageProcessingContext:
     out_assets_path: str  # Path as string for serialization
     name_prefix: str
     pipeline_options: PdfPipelineOptions
-    # Note: We'll pass the document separately as it may not be serializable
+    # Note: The document is never part of the context; workers obtain it once
+    # through a SharedDocumentHandle (see ingest/shared_document.py)
 
 
 @dataclass
@@ -47,20 +78,18 @@ class PageProcessingResult:
     processing_time: float
 
 
-def _extract_images_from_html(html: str, page_no: int, out_assets: Path, name_prefix: str) -> tuple[str, list[ImageAsset]]:
-    """Extract base64-encoded images from HTML and save to files.
+def _extract_images_from_html(html: str, page_no: int, out_assets: Path, doc: Any = None) -> tuple[str, list[ImageAsset]]:
+    """Extract embedded and referenced pictures from HTML and save to files.
 
     This is imported from the content_extractor module.
     """
     # Import here to avoid circular imports
     from pdf2foundry.ingest.content_extractor import _extract_images_from_html as _extract
 
-    return _extract(html, page_no, out_assets, name_prefix)
+    return _extract(html, page_no, out_assets, doc)
 
 
-def _rewrite_and_copy_referenced_images(
-    html: str, page_no: int, out_assets: Path, name_prefix: str
-) -> tuple[str, list[ImageAsset]]:
+def _rewrite_and_copy_referenced_images(html: str, page_no: int, out_assets: Path) -> tuple[str, list[ImageAsset]]:
     """Copy referenced images and rewrite HTML paths.
 
     This is imported from the content_extractor module.
@@ -68,7 +97,7 @@ def _rewrite_and_copy_referenced_images(
     # Import here to avoid circular imports
     from pdf2foundry.ingest.content_extractor import _rewrite_and_copy_referenced_images as _rewrite
 
-    return _rewrite(html, page_no, out_assets, name_prefix)
+    return _rewrite(html, page_no, out_assets)
 
 
 def _detect_links(html: str, page_no: int) -> list[LinkRef]:
@@ -82,11 +111,60 @@ def _detect_links(html: str, page_no: int) -> list[LinkRef]:
     return _detect(html, page_no)
 
 
+def _worker_ocr_key(pipeline_options: PdfPipelineOptions) -> tuple[Any, ...]:
+    """Option values the per-process OCR components are built from."""
+    return (
+        pipeline_options.ocr_detect_script,
+        pipeline_options.disk_cache,
+        pipeline_options.cache_dir,
+        pipeline_options.image_cache_mb,
+        pipeline_options.workers_effective,
+        pipeline_options.tables_mode,
+        pipeline_options.ocr_mode,
+        pipeline_options.picture_descriptions,
+    )
+
+
+def _get_worker_ocr_components(pipeline_options: PdfPipelineOptions) -> tuple[Any, Any, Any]:
+    """Return the OCR engine and caches owned by the current process.
+
+    The components are created on first use and reused for every later page
+    handled by the same process, so each worker keeps a warm OCR cache. They
+    are rebuilt when the options they depend on change, e.g. when a persistent
+    pool or a batch run moves on to a document converted with other options.
+    """
+    global _WORKER_OCR, _WORKER_OCR_KEY
+
+    key = _worker_ocr_key(pipeline_options)
+    if _WORKER_OCR is None or key != _WORKER_OCR_KEY:
+        from pdf2foundry.ingest.image_cache import CacheLimits, SharedImageCache, should_enable_image_cache
+        from pdf2foundry.ingest.ocr_engine import TesseractOcrEngine, create_ocr_cache
+
+        # Every worker holds its own image cache, so they split the memory budget
+        budget_mb = pipeline_options.image_cache_mb
+        if budget_mb > 0:
+            budget_mb = max(1, budget_mb // max(1, pipeline_options.workers_effective))
+        cache_limits = CacheLimits(memory_budget_mb=budget_mb)
+        shared_image_cache = None
+        if should_enable_image_cache(
+            pipeline_options.tables_mode.value,
+            pipeline_options.ocr_mode.value,
+            pipeline_options.picture_descriptions,
+        ):
+            shared_image_cache = SharedImageCache(cache_limits)
+        ocr_engine = TesseractOcrEngine(detect_script=pipeline_options.ocr_detect_script)
+        ocr_cache = create_ocr_cache(pipeline_options, ocr_engine, cache_limits.ocr_cache)
+        _WORKER_OCR = (ocr_engine, ocr_cache, shared_image_cache)
+        _WORKER_OCR_KEY = key
+    return _WORKER_OCR
+
+
 def process_page_content(
     doc: Any,
     context: PageProcessingContext,
     include_layers: Any = None,
     image_mode: Any = None,
+    html: str | None = None,
 ) -> PageProcessingResult:
     """Process a single page's content extraction.
 
@@ -103,6 +181,7 @@ def process_page_content(
         context: Page processing context with serializable parameters
         include_layers: Optional content layers for HTML export
         image_mode: Optional image mode for HTML export
+        html: The page's exported HTML, if already exported (see iter_page_html)
 
     Returns:
         PageProcessingResult with all extracted content
@@ -116,36 +195,9 @@ def process_page_content(
 
     logger.debug(f"Processing page {page_no} in worker process")
 
-    # 1. Export HTML from Docling document
-    try:
-        if include_layers is not None:
-            if image_mode is not None:
-                html = doc.export_to_html(
-                    page_no=page_no,
-                    split_page_view=False,
-                    included_content_layers=include_layers,
-                    image_mode=image_mode,
-                )
-            else:
-                html = doc.export_to_html(
-                    page_no=page_no,
-                    split_page_view=False,
-                    included_content_layers=include_layers,
-                )
-        else:
-            if image_mode is not None:
-                html = doc.export_to_html(
-                    page_no=page_no,
-                    split_page_view=False,
-                    image_mode=image_mode,
-                )
-            else:
-                html = doc.export_to_html(
-                    page_no=page_no,
-                    split_page_view=False,
-                )
-    except Exception:
-        html = ""
+    # 1. Export HTML from Docling document (unless exported with its batch)
+    if html is None:
+        html = export_page_html(doc, page_no, include_layers, image_mode)
 
     # 2. Multi-column detection and flattening (no-op + warning in v1)
     try:
@@ -156,12 +208,12 @@ def process_page_content(
         # If transform fails for any reason, proceed with original HTML
         pass
 
-    # 3. Extract images (embedded base64)
-    html, page_images = _extract_images_from_html(html, page_no, out_assets, name_prefix)
+    # 3. Extract images (embedded base64, or referenced pictures written straight from the document)
+    html, page_images = _extract_images_from_html(html, page_no, out_assets, doc)
     images = list(page_images)
 
     # 4. Copy referenced images (local paths)
-    html, ref_images = _rewrite_and_copy_referenced_images(html, page_no, out_assets, name_prefix)
+    html, ref_images = _rewrite_and_copy_referenced_images(html, page_no, out_assets)
     images.extend(ref_images)
 
     # 5. Tables - use new structured processing if available, fall back to legacy
@@ -177,8 +229,20 @@ def process_page_content(
     page_links = _detect_links(html, page_no)
     links = list(page_links)
 
-    # 7. OCR processing is not supported in parallel mode due to cache serialization issues
-    # OCR processing is handled separately in sequential mode when enabled
+    # 7. OCR with this process's own engine and caches
+    if pipeline_options.ocr_mode != OcrMode.OFF:
+        from pdf2foundry.ingest.ocr_processor import apply_ocr_to_page
+
+        ocr_engine, ocr_cache, shared_image_cache = _get_worker_ocr_components(pipeline_options)
+        html = apply_ocr_to_page(
+            doc,
+            html,
+            page_no,
+            pipeline_options,
+            ocr_engine,
+            ocr_cache,
+            shared_image_cache=shared_image_cache,
+        )
 
     processing_time = time.perf_counter() - start_time
 
@@ -192,6 +256,21 @@ def process_page_content(
     )
 
 
+def _process_page_batch(
+    contexts: list[PageProcessingContext],
+    handle: SharedDocumentHandle,
+    include_layers: Any = None,
+    image_mode: Any = None,
+) -> list[PageProcessingResult]:
+    """Worker entry point: resolve the shared document and process a batch of pages."""
+    doc = resolve_worker_document(handle)
+    by_page = {context.page_no: context for context in contexts}
+    return [
+        process_page_content(doc, by_page[page_no], include_layers, image_mode, html)
+        for page_no, html in iter_page_html(doc, list(by_page), include_layers, image_mode, picture_refs=True)
+    ]
+
+
 def process_pages_parallel(
     doc: Any,
     selected_pages: list[int],
@@ -202,6 +281,10 @@ def process_pages_parallel(
 ) -> tuple[list[HtmlPage], list[ImageAsset], list[TableContent], list[LinkRef], float]:
     """Process multiple pages in parallel using ProcessPoolExecutor.
 
+    The document is published to the workers once per pool (fork inheritance,
+    the Docling JSON cache file, or an mmap'd pickle blob) so that each task only
+    carries its PageProcessingContext.
+
     Args:
         doc: Docling document object
         selected_pages: List of 1-based page numbers to process
@@ -234,42 +317,10 @@ def process_pages_parallel(
         )
         contexts.append(context)
 
-    # Process pages in parallel
-    results: dict[int, PageProcessingResult] = {}
-
+    # Process pages in parallel, in batches sized from measured page times
     try:
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            # Submit all tasks
-            future_to_page = {}
-            for context in contexts:
-                try:
-                    future = executor.submit(
-                        process_page_content,
-                        doc,
-                        context,
-                        include_layers,
-                        image_mode,
-                    )
-                    future_to_page[future] = context.page_no
-                except Exception as e:
-                    # Handle pickling/serialization errors at submission time
-                    logger.warning(f"Failed to submit page {context.page_no} for parallel processing: {e}")
-                    raise
-
-            # Collect results as they complete
-            for future in as_completed(future_to_page):
-                page_no = future_to_page[future]
-                try:
-                    result = future.result()
-                    results[page_no] = result
-                    logger.debug(f"Page {page_no} completed in {result.processing_time:.3f}s")
-                except Exception as e:
-                    logger.error(f"Page {page_no} failed: {e}")
-                    # Cancel remaining futures and re-raise
-                    for remaining_future in future_to_page:
-                        remaining_future.cancel()
-                    raise RuntimeError(f"Page {page_no} processing failed: {e}") from e
-
+        batches = iter_pages_parallel(doc, contexts, workers, pipeline_options, include_layers, image_mode, in_order=False)
+        results = {result.page_no: result for result in batches}
     except Exception as e:
         # Handle various failure modes:
         # - Pickling/serialization errors (Windows/macOS spawn mode)
@@ -306,6 +357,71 @@ def process_pages_parallel(
     return pages, images, tables, links, total_time
 
 
+def iter_pages_parallel(
+    doc: Any,
+    contexts: list[PageProcessingContext],
+    workers: int,
+    pipeline_options: PdfPipelineOptions,
+    include_layers: Any = None,
+    image_mode: Any = None,
+    *,
+    in_order: bool = True,
+) -> Iterator[PageProcessingResult]:
+    """Yield page results from a worker pool as batches complete.
+
+    Results come in page order when ``in_order`` is set, so a consumer can
+    stream them onward while later pages are still being processed.
+
+    Raises:
+        Exception: Pool, pickling or batch failures; a persistent pool that
+            failed is discarded first
+    """
+    planner = AdaptiveBatchPlanner(workers, fixed_size=getattr(pipeline_options, "page_batch_size", 0))
+    persistent = getattr(pipeline_options, "worker_pool", WorkerPoolLifetime.DOCUMENT) == WorkerPoolLifetime.PROCESS
+    start_method = multiprocessing.get_start_method()
+
+    try:
+        json_path = getattr(pipeline_options, "docling_json_path", None)
+        with publish_document(doc, start_method=start_method, json_path=json_path, allow_inherit=not persistent) as handle:
+            batch_args = (handle, include_layers, image_mode)
+            if persistent:
+                # Warm pool shared with later documents; workers load the document lazily
+                executor = get_page_pool(workers, start_method)
+                yield from iter_page_batches(
+                    executor,
+                    _process_page_batch,
+                    contexts,
+                    planner,
+                    *batch_args,
+                    max_in_flight=workers * 2,
+                    in_order=in_order,
+                )
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(start_method),
+                    initializer=init_worker_document,
+                    initargs=(handle,),
+                ) as pool:
+                    yield from iter_page_batches(
+                        pool,
+                        _process_page_batch,
+                        contexts,
+                        planner,
+                        *batch_args,
+                        max_in_flight=workers * 2,
+                        in_order=in_order,
+                    )
+    except Exception:
+        if persistent:
+            # Do not hand a possibly broken pool to the next document
+            discard_page_pool(workers, start_method)
+        raise
+
+    if planner.seconds_per_page is not None:
+        logger.debug("Measured %.3fs per page across parallel batches", planner.seconds_per_page)
+
+
 def _process_pages_sequential(
     doc: Any,
     selected_pages: list[int],
@@ -328,7 +444,7 @@ def _process_pages_sequential(
     tables = []
     links = []
 
-    for page_no in selected_pages:
+    for page_no, html in iter_page_html(doc, selected_pages, include_layers, image_mode, picture_refs=True):
         context = PageProcessingContext(
             page_no=page_no,
             out_assets_path=str(out_assets),
@@ -336,7 +452,7 @@ def _process_pages_sequential(
             pipeline_options=pipeline_options,
         )
 
-        result = process_page_content(doc, context, include_layers, image_mode)
+        result = process_page_content(doc, context, include_layers, image_mode, html)
 
         pages.append(result.html_page)
         images.extend(result.images)
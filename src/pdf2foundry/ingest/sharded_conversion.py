@@ -0,0 +1,260 @@
+"""Page-range sharded Docling conversion.
+
+Docling converts a PDF page by page on one thread, so for long books the
+conversion dominates wall time. When more than one worker is requested, the
+PDF is split into contiguous page ranges that are converted in parallel
+processes (each with its own DocumentConverter) and the partial documents are
+merged back into one DoclingDocument with ``DoclingDocument.concatenate``.
+Shards are concatenated in page order, which numbers the merged pages 1..N
+exactly as a single conversion would.
+
+Shard workers use the ``spawn`` start method: the parent may already have
+loaded Docling's models (and their thread pools), which is not safe to fork.
+
+The same machinery converts a ``--pages`` selection: each contiguous run of
+selected pages becomes a page range, so unselected pages are never converted.
+Docling keeps original page numbers for a page range, and merged selections
+are renumbered back to them, so page 40 of the PDF stays page 40.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, cast
+
+from pdf2foundry.ingest.docling_adapter import DoclingDocumentLike
+
+logger = logging.getLogger(__name__)
+
+# Below this many pages per shard, per-process model loading outweighs the gain
+MIN_SHARD_PAGES = 20
+
+PageRange = tuple[int, int]
+
+
+def pdf_page_count(pdf_path: Path) -> int | None:
+    """Return the number of pages in a PDF, or None if it cannot be determined.
+
+    Uses pypdfium2, which Docling itself depends on, so no PDF is parsed twice
+    by Docling just to plan shards.
+    """
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    try:
+        pdf = pypdfium2.PdfDocument(str(pdf_path))
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    except Exception as e:
+        logger.debug("Could not count pages of %s: %s", pdf_path, e)
+        return None
+
+
+def plan_shards(total_pages: int, workers: int, min_shard_pages: int = MIN_SHARD_PAGES) -> list[PageRange]:
+    """Split pages 1..total_pages into at most ``workers`` contiguous ranges.
+
+    Every shard gets at least ``min_shard_pages`` pages; sizes differ by at most
+    one page.
+
+    Returns:
+        1-based inclusive (start, end) ranges in page order
+    """
+    if total_pages <= 0:
+        return []
+    count = max(1, min(workers, total_pages // max(1, min_shard_pages)))
+    base, extra = divmod(total_pages, count)
+    shards: list[PageRange] = []
+    start = 1
+    for index in range(count):
+        size = base + (1 if index < extra else 0)
+        shards.append((start, start + size - 1))
+        start += size
+    return shards
+
+
+def page_runs(pages: Sequence[int]) -> list[PageRange]:
+    """Group 1-based page numbers into contiguous (start, end) ranges."""
+    runs: list[PageRange] = []
+    for page in sorted(set(pages)):
+        if runs and page == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+
+def plan_selection_shards(pages: Sequence[int], workers: int) -> list[PageRange]:
+    """Plan page ranges covering exactly the selected pages.
+
+    Each contiguous run of pages is one range, split further across workers
+    when it is long enough to be worth sharding.
+    """
+    shards: list[PageRange] = []
+    for start, end in page_runs(pages):
+        for first, last in plan_shards(end - start + 1, workers):
+            shards.append((start + first - 1, start + last - 1))
+    return shards
+
+
+def can_merge_documents() -> bool:
+    """Return True if the installed docling-core can concatenate documents."""
+    try:
+        from docling_core.types.doc.document import DoclingDocument
+    except ImportError:
+        return False
+    return callable(getattr(DoclingDocument, "concatenate", None))
+
+
+def merge_documents(docs: Sequence[Any], *, keep_page_numbers: bool = False) -> DoclingDocumentLike:
+    """Concatenate shard documents, in page order, into one document.
+
+    Concatenation numbers the merged pages 1..N. With ``keep_page_numbers``,
+    pages are renumbered afterwards to the page numbers of the shards, which
+    is needed when the shards are a selection with gaps between them.
+    """
+    if len(docs) == 1:
+        return cast(DoclingDocumentLike, docs[0])
+    from docling_core.types.doc.document import DoclingDocument
+
+    merged = DoclingDocument.concatenate(list(docs))
+    if keep_page_numbers:
+        original = sorted({page_no for doc in docs for page_no in doc.pages})
+        _renumber_pages(merged, dict(enumerate(original, start=1)))
+    return cast(DoclingDocumentLike, merged)
+
+
+def _renumber_pages(doc: Any, mapping: dict[int, int]) -> None:
+    """Rewrite page numbers of a DoclingDocument's pages and item provenance."""
+    pages = {}
+    for page_no, page in doc.pages.items():
+        page.page_no = mapping.get(page_no, page_no)
+        pages[page.page_no] = page
+    doc.pages = pages
+    for name in ("texts", "pictures", "tables", "key_value_items", "form_items", "field_regions", "field_items"):
+        for item in getattr(doc, name, None) or []:
+            for prov in getattr(item, "prov", None) or []:
+                prov.page_no = mapping.get(prov.page_no, prov.page_no)
+            graph = getattr(item, "graph", None)
+            for cell in getattr(graph, "cells", None) or []:
+                if cell.prov is not None:
+                    cell.prov.page_no = mapping.get(cell.prov.page_no, cell.prov.page_no)
+
+
+def _convert_shard(pdf_path: str, page_range: PageRange, options: dict[str, Any]) -> Any:
+    """Convert one page range (runs in a shard worker process)."""
+    from pdf2foundry.ingest import docling_adapter
+
+    return docling_adapter._do_docling_convert_impl(Path(pdf_path), page_range=page_range, workers=1, **options)
+
+
+def _shard_executor(workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def convert_sharded(
+    pdf_path: Path,
+    shards: Sequence[PageRange],
+    *,
+    images: bool,
+    ocr: bool,
+    tables_mode: str,
+    vlm: str | None,
+    pages: list[int] | None,
+    parallel: bool = True,
+) -> DoclingDocumentLike:
+    """Convert page ranges and merge the results.
+
+    Shards run in parallel processes, or one after another in this process
+    when ``parallel`` is False. Page numbers of a ``pages`` selection are kept.
+
+    Raises:
+        PdfParseError: If any shard fails to convert
+    """
+    options = {"images": images, "ocr": ocr, "tables_mode": tables_mode, "vlm": vlm, "pages": pages}
+    if parallel and len(shards) > 1:
+        logger.info("Converting %s in %d page-range shards: %s", pdf_path.name, len(shards), list(shards))
+        with _shard_executor(len(shards)) as executor:
+            futures = [executor.submit(_convert_shard, str(pdf_path), shard, options) for shard in shards]
+            docs = [future.result() for future in futures]
+    else:
+        docs = [_convert_shard(str(pdf_path), shard, options) for shard in shards]
+    return merge_documents(docs, keep_page_numbers=pages is not None)
+
+
+def plan_conversion_shards(pdf_path: Path, workers: int) -> list[PageRange]:
+    """Plan shards for converting a whole PDF with ``workers`` processes.
+
+    Returns an empty list when sharding does not apply: a single worker, a
+    document too short to split, an unreadable page count, or a docling-core
+    without document concatenation.
+    """
+    if workers <= 1:
+        return []
+    total_pages = pdf_page_count(pdf_path)
+    if total_pages is None:
+        return []
+    shards = plan_shards(total_pages, workers)
+    if len(shards) <= 1:
+        return []
+    if not can_merge_documents():
+        logger.warning("docling-core cannot merge documents; converting %s without sharding", pdf_path.name)
+        return []
+    return shards
+
+
+def convert_page_selection(
+    pdf_path: Path,
+    pages: Sequence[int],
+    workers: int,
+    *,
+    images: bool,
+    ocr: bool,
+    tables_mode: str,
+    vlm: str | None,
+) -> DoclingDocumentLike:
+    """Convert only the selected pages of a PDF, keeping their page numbers.
+
+    Raises:
+        ValueError: If a selected page is beyond the end of the PDF
+        PdfParseError: If conversion fails
+    """
+    total_pages = pdf_page_count(pdf_path)
+    if total_pages is not None and max(pages) > total_pages:
+        raise ValueError(f"Requested page {max(pages)} exceeds document length {total_pages}")
+
+    shards = plan_selection_shards(pages, workers)
+    if len(shards) > 1 and not can_merge_documents():
+        # Without merging, convert the smallest single range covering the selection
+        shards = [(shards[0][0], shards[-1][1])]
+    logger.info("Converting %d selected pages of %s", sum(end - start + 1 for start, end in shards), pdf_path.name)
+    return convert_sharded(
+        pdf_path,
+        shards,
+        images=images,
+        ocr=ocr,
+        tables_mode=tables_mode,
+        vlm=vlm,
+        pages=list(pages),
+        parallel=workers > 1,
+    )
+
+
+__all__ = [
+    "MIN_SHARD_PAGES",
+    "can_merge_documents",
+    "convert_page_selection",
+    "convert_sharded",
+    "merge_documents",
+    "page_runs",
+    "pdf_page_count",
+    "plan_conversion_shards",
+    "plan_selection_shards",
+    "plan_shards",
+]
@@ -0,0 +1,172 @@
+"""Hand a Docling document to page worker processes exactly once.
+
+Submitting ``process_page_content(doc, ...)`` per page pickles the whole
+DoclingDocument for every task, which makes parallel extraction slower than
+sequential processing on large books. This module publishes the document once
+per pool and gives each task a tiny picklable handle instead.
+
+Publication modes (chosen in this order):
+- ``inherit``: with the ``fork`` start method the document is stored in a module
+  global before the workers are forked, so children inherit it for free.
+- ``json``: when the document is backed by a Docling JSON cache file, each worker
+  loads that file itself and the parent serializes nothing.
+- ``mmap``: the document is pickled once into a temporary file that workers map
+  read-only and unpickle, so the bytes are shared through the OS page cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+PublishMode = Literal["inherit", "json", "mmap"]
+
+# Worker-side state: the document currently resolved in this process
+_WORKER_DOC: Any = None
+_WORKER_DOC_ID: str | None = None
+
+
+@dataclass(frozen=True)
+class SharedDocumentHandle:
+    """Picklable reference that lets a worker obtain the published document."""
+
+    doc_id: str
+    mode: PublishMode
+    location: str | None = None  # JSON cache path or pickle blob path
+    size: int = 0  # Blob size in bytes (mmap mode only)
+
+
+def choose_publish_mode(start_method: str, json_path: str | None = None, *, allow_inherit: bool = True) -> PublishMode:
+    """Pick the cheapest way to make the document available to workers.
+
+    Args:
+        start_method: Multiprocessing start method used for the pool
+        json_path: Optional path of a Docling JSON cache backing the document
+        allow_inherit: False when the workers already exist (persistent pools),
+            since they were forked before the document was published
+
+    Returns:
+        The publication mode to use
+    """
+    if start_method == "fork" and allow_inherit:
+        return "inherit"
+    if json_path and Path(json_path).exists():
+        return "json"
+    return "mmap"
+
+
+@contextmanager
+def publish_document(
+    doc: Any,
+    *,
+    start_method: str,
+    json_path: str | None = None,
+    allow_inherit: bool = True,
+) -> Iterator[SharedDocumentHandle]:
+    """Publish a document for worker processes for the duration of the context.
+
+    Args:
+        doc: Docling document to share
+        start_method: Multiprocessing start method used for the pool
+        json_path: Optional path of a Docling JSON cache backing the document
+        allow_inherit: Whether fork inheritance may be used (see choose_publish_mode)
+
+    Yields:
+        Handle to pass to the worker initializer and tasks
+
+    Raises:
+        pickle.PicklingError, TypeError, AttributeError: If mmap mode is required
+            and the document cannot be pickled
+    """
+    global _WORKER_DOC, _WORKER_DOC_ID
+
+    doc_id = uuid.uuid4().hex
+    mode = choose_publish_mode(start_method, json_path, allow_inherit=allow_inherit)
+    blob_path: Path | None = None
+
+    if mode == "inherit":
+        _WORKER_DOC, _WORKER_DOC_ID = doc, doc_id
+        handle = SharedDocumentHandle(doc_id=doc_id, mode=mode)
+    elif mode == "json":
+        handle = SharedDocumentHandle(doc_id=doc_id, mode=mode, location=str(json_path))
+    else:
+        blob = pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL)
+        fd, tmp_name = tempfile.mkstemp(prefix="pdf2foundry-doc-", suffix=".pkl")
+        blob_path = Path(tmp_name)
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        handle = SharedDocumentHandle(doc_id=doc_id, mode=mode, location=tmp_name, size=len(blob))
+        del blob
+
+    logger.debug("Published document %s to page workers (mode=%s, size=%d)", doc_id[:8], mode, handle.size)
+
+    try:
+        yield handle
+    finally:
+        if mode == "inherit" and doc_id == _WORKER_DOC_ID:
+            _WORKER_DOC, _WORKER_DOC_ID = None, None
+        if blob_path is not None:
+            with suppress(OSError):
+                blob_path.unlink()
+
+
+def _load_published_document(handle: SharedDocumentHandle) -> Any:
+    """Materialize the document described by a handle in the current process."""
+    if handle.mode == "json":
+        from pdf2foundry.ingest.doc_cache import load_document_cache
+
+        return load_document_cache(Path(str(handle.location)))
+
+    if handle.mode == "mmap":
+        with (
+            open(str(handle.location), "rb") as f,
+            mmap.mmap(f.fileno(), handle.size, access=mmap.ACCESS_READ) as mapped,
+        ):
+            return pickle.loads(mapped)
+
+    raise RuntimeError(f"Document {handle.doc_id[:8]} was not inherited by this worker process")
+
+
+def resolve_worker_document(handle: SharedDocumentHandle) -> Any:
+    """Return the published document, loading it at most once per process.
+
+    Args:
+        handle: Handle produced by publish_document()
+
+    Returns:
+        The Docling document
+    """
+    global _WORKER_DOC, _WORKER_DOC_ID
+
+    if handle.doc_id == _WORKER_DOC_ID:
+        return _WORKER_DOC
+
+    doc = _load_published_document(handle)
+    _WORKER_DOC, _WORKER_DOC_ID = doc, handle.doc_id
+    logger.debug("Worker %d loaded document %s (mode=%s)", os.getpid(), handle.doc_id[:8], handle.mode)
+    return doc
+
+
+def init_worker_document(handle: SharedDocumentHandle) -> None:
+    """ProcessPoolExecutor initializer that loads the document up front."""
+    resolve_worker_document(handle)
+
+
+__all__ = [
+    "SharedDocumentHandle",
+    "choose_publish_mode",
+    "init_worker_document",
+    "publish_document",
+    "resolve_worker_document",
+]
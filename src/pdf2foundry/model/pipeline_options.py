@@ -28,6 +28,13 @@ class OcrMode(Enum):
     OFF = "off"  # Never run OCR
 
 
+class WorkerPoolLifetime(Enum):
+    """Lifetime of the worker process pool used for page-level transforms."""
+
+    DOCUMENT = "document"  # Create a pool per document and shut it down afterwards
+    PROCESS = "process"  # Keep one warm pool for every document converted by this process
+
+
 @dataclass
 class PdfPipelineOptions:
     """Pipeline configuration options for PDF2Foundry processing."""
@@ -38,12 +45,18 @@ class PdfPipelineOptions:
     # OCR processing mode (default: AUTO for intelligent OCR)
     ocr_mode: OcrMode = OcrMode.AUTO
 
+    # Detect the script of OCR'd pages (extra Tesseract OSD pass on a thumbnail)
+    ocr_detect_script: bool = False
+
     # Enable picture descriptions/captions
     picture_descriptions: bool = False
 
     # VLM repository ID for picture descriptions (required when picture_descriptions=True)
     vlm_repo_id: str | None = None
 
+    # Images per VLM call when generating picture descriptions
+    caption_batch_size: int = 8
+
     # Text coverage threshold for AUTO OCR mode (5% default)
     text_coverage_threshold: float = 0.05
 
@@ -59,30 +72,68 @@ class PdfPipelineOptions:
     # Enable experimental multi-column reflow in layout transform
     reflow_columns: bool = False
 
+    # Pages per parallel task (0 = adapt to measured page processing times)
+    page_batch_size: int = 0
+
+    # Lifetime of the page worker pool
+    worker_pool: WorkerPoolLifetime = WorkerPoolLifetime.DOCUMENT
+
+    # Persist OCR results across runs in the user cache directory
+    disk_cache: bool = True
+
+    # Root directory of persistent caches (None = per-user cache directory)
+    cache_dir: str | None = None
+
+    # Memory budget for cached page and region images in MB (0 = entry counts only)
+    image_cache_mb: int = 512
+
+    # Stream pages through extraction, mapping and writing, flushing each chapter to disk
+    streaming: bool = False
+
+    # Docling JSON cache backing the document, if any (set during pipeline setup).
+    # Page workers load the document from it instead of receiving a pickled copy.
+    docling_json_path: str | None = None
+
     @classmethod
     def from_cli(
         cls,
         *,
         tables: str = "auto",
         ocr: str = "auto",
+        ocr_detect_script: bool = False,
         picture_descriptions: str = "off",
         vlm_repo_id: str | None = None,
+        caption_batch_size: int = 8,
         text_coverage_threshold: float = 0.05,
         pages: list[int] | None = None,
         workers: int = 1,
         reflow_columns: bool = False,
+        page_batch_size: int = 0,
+        worker_pool: str = "document",
+        disk_cache: bool = True,
+        cache_dir: str | None = None,
+        image_cache_mb: int = 512,
+        streaming: bool = False,
     ) -> PdfPipelineOptions:
         """Build PdfPipelineOptions from CLI argument values.
 
         Args:
             tables: Table handling mode ("structured", "auto", "image-only")
             ocr: OCR mode ("auto", "on", "off")
+            ocr_detect_script: Detect the script of OCR'd pages when no language is set
             picture_descriptions: Picture descriptions ("on", "off")
             vlm_repo_id: VLM repository ID for picture descriptions
+            caption_batch_size: Images per VLM call when captioning
             text_coverage_threshold: Text coverage threshold for AUTO OCR
             pages: List of 1-based page indices to process (None for all pages)
             workers: Number of worker processes for CPU-bound page-level steps
             reflow_columns: Enable experimental multi-column reflow
+            page_batch_size: Pages per parallel task (0 = adaptive)
+            worker_pool: Worker pool lifetime ("document", "process")
+            disk_cache: Persist conversions and expensive per-image results across runs
+            cache_dir: Root directory of persistent caches (None = user cache dir)
+            image_cache_mb: Memory budget for cached page and region images (0 = counts only)
+            streaming: Stream pages to disk chapter by chapter with bounded memory
 
         Returns:
             PdfPipelineOptions instance with mapped enum values
@@ -123,19 +174,46 @@ class PdfPipelineOptions:
                 # Fallback if models module not available (shouldn't happen in normal usage)
                 vlm_repo_id = "Salesforce/blip-image-captioning-base"
 
+        # Validate caption batch size
+        if caption_batch_size < 1:
+            raise ValueError(f"Caption batch size must be >= 1, got {caption_batch_size}")
+
         # Validate workers parameter
         if workers < 1:
             raise ValueError(f"Workers must be >= 1, got {workers}")
 
+        # Validate page batch size (0 means adaptive)
+        if page_batch_size < 0:
+            raise ValueError(f"Page batch size must be >= 0, got {page_batch_size}")
+
+        # Validate image cache budget (0 means entry counts only)
+        if image_cache_mb < 0:
+            raise ValueError(f"Image cache budget must be >= 0 MB, got {image_cache_mb}")
+
+        # Map worker pool lifetime string to enum
+        try:
+            worker_pool_lifetime = WorkerPoolLifetime(worker_pool)
+        except ValueError as exc:
+            valid_values = [lifetime.value for lifetime in WorkerPoolLifetime]
+            raise ValueError(f"Invalid worker pool lifetime '{worker_pool}'. Valid values: {valid_values}") from exc
+
         return cls(
             tables_mode=tables_mode,
             ocr_mode=ocr_mode,
+            ocr_detect_script=ocr_detect_script,
             picture_descriptions=picture_descriptions_bool,
             vlm_repo_id=vlm_repo_id,
+            caption_batch_size=caption_batch_size,
             text_coverage_threshold=text_coverage_threshold,
             pages=pages,
             workers=workers,
             reflow_columns=reflow_columns,
+            page_batch_size=page_batch_size,
+            worker_pool=worker_pool_lifetime,
+            disk_cache=disk_cache,
+            cache_dir=cache_dir,
+            image_cache_mb=image_cache_mb,
+            streaming=streaming,
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -143,13 +221,21 @@ class PdfPipelineOptions:
         return {
             "tables_mode": self.tables_mode.value,
             "ocr_mode": self.ocr_mode.value,
+            "ocr_detect_script": self.ocr_detect_script,
             "picture_descriptions": self.picture_descriptions,
             "vlm_repo_id": self.vlm_repo_id,
+            "caption_batch_size": self.caption_batch_size,
             "text_coverage_threshold": self.text_coverage_threshold,
             "pages": self.pages,
             "workers": self.workers,
             "workers_effective": self.workers_effective,
             "reflow_columns": self.reflow_columns,
+            "page_batch_size": self.page_batch_size,
+            "worker_pool": self.worker_pool.value,
+            "disk_cache": self.disk_cache,
+            "cache_dir": self.cache_dir,
+            "image_cache_mb": self.image_cache_mb,
+            "streaming": self.streaming,
         }
 
     def __repr__(self) -> str:
@@ -158,13 +244,21 @@ class PdfPipelineOptions:
             f"PdfPipelineOptions("
             f"tables_mode={self.tables_mode.value}, "
             f"ocr_mode={self.ocr_mode.value}, "
+            f"ocr_detect_script={self.ocr_detect_script}, "
             f"picture_descriptions={self.picture_descriptions}, "
             f"vlm_repo_id={self.vlm_repo_id!r}, "
+            f"caption_batch_size={self.caption_batch_size}, "
             f"text_coverage_threshold={self.text_coverage_threshold}, "
             f"pages={self.pages}, "
             f"workers={self.workers}, "
             f"workers_effective={self.workers_effective}, "
-            f"reflow_columns={self.reflow_columns}"
+            f"reflow_columns={self.reflow_columns}, "
+            f"page_batch_size={self.page_batch_size}, "
+            f"worker_pool={self.worker_pool.value}, "
+            f"disk_cache={self.disk_cache}, "
+            f"cache_dir={self.cache_dir!r}, "
+            f"image_cache_mb={self.image_cache_mb}, "
+            f"streaming={self.streaming}"
             f")"
         )
 
@@ -173,4 +267,5 @@ __all__ = [
     "OcrMode",
     "PdfPipelineOptions",
     "TableMode",
+    "WorkerPoolLifetime",
 ]
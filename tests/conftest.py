@@ -36,3 +36,9 @@ def isolate_logging():
     logging.root.handlers.clear()
     logging.root.handlers.extend(original_handlers)
     logging.root.setLevel(original_level)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep persistent caches out of the user's cache directory during tests."""
+    monkeypatch.setenv("PDF2FOUNDRY_CACHE_DIR", str(tmp_path_factory.mktemp("pdf2foundry-cache")))
@@ -0,0 +1,105 @@
+"""Tests for the content-addressed asset store."""
+
+from __future__ import annotations
+
+import base64
+import io
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+from pdf2foundry.ingest.asset_store import store_bytes, store_file
+from pdf2foundry.ingest.caption_processor import apply_captions_to_images
+from pdf2foundry.ingest.content_extractor import extract_semantic_content
+from pdf2foundry.model.content import ImageAsset
+from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+
+def _png(color: tuple[int, int, int]) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _RepeatedLogoDoc:
+    """Every page shows the same logo, and page 2 also has its own image."""
+
+    def num_pages(self) -> int:
+        return 3
+
+    def export_to_html(self, page_no: int = 1, **_: object) -> str:
+        images = [_png((200, 0, 0))] + ([_png((0, 0, 200))] if page_no == 2 else [])
+        tags = "".join(f'<img src="data:image/png;base64,{base64.b64encode(data).decode()}">' for data in images)
+        return f"<div>{tags}</div>"
+
+
+class TestStore:
+    """Test storing bytes and files under their content hash."""
+
+    def test_identical_bytes_are_written_once(self, tmp_path: Path) -> None:
+        name = store_bytes(tmp_path, b"logo", "png")
+        mtime = (tmp_path / name).stat().st_mtime_ns
+
+        assert store_bytes(tmp_path, b"logo", "png") == name
+        assert (tmp_path / name).stat().st_mtime_ns == mtime
+        assert store_bytes(tmp_path, b"other", "png") != name
+        assert store_bytes(tmp_path, b"logo", "jpg") != name
+        assert sorted(p.suffix for p in tmp_path.iterdir()) == [".jpg", ".png", ".png"]
+
+    def test_file_is_hard_linked(self, tmp_path: Path) -> None:
+        src = tmp_path / "figure.PNG"
+        src.write_bytes(b"pixels")
+
+        name = store_file(tmp_path / "assets", src)
+
+        assert name.endswith(".png")
+        assert name == store_bytes(tmp_path / "other", b"pixels", "png")
+        assert (tmp_path / "assets" / name).stat().st_ino == src.stat().st_ino
+
+    def test_file_is_copied_when_links_fail(self, tmp_path: Path) -> None:
+        src = tmp_path / "figure.png"
+        src.write_bytes(b"pixels")
+
+        with (
+            patch("pdf2foundry.ingest.asset_store.os.link", side_effect=OSError("cross-device link")),
+            patch("pdf2foundry.ingest.asset_store._reflink", return_value=False),
+        ):
+            name = store_file(tmp_path / "assets", src)
+
+        stored = tmp_path / "assets" / name
+        assert stored.read_bytes() == b"pixels"
+        assert stored.stat().st_ino != src.stat().st_ino
+        assert [p.name for p in (tmp_path / "assets").iterdir()] == [name]
+
+
+class TestDeduplication:
+    """Test that repeated images share one asset across pages."""
+
+    def test_repeated_image_is_stored_once(self, tmp_path: Path) -> None:
+        out = extract_semantic_content(_RepeatedLogoDoc(), tmp_path, PdfPipelineOptions())
+
+        logo = out.images[0].name
+        assert [(image.page_no, image.name == logo) for image in out.images] == [
+            (1, True),
+            (2, True),
+            (2, False),
+            (3, True),
+        ]
+        assert len(list(tmp_path.iterdir())) == 2
+        assert all(f'src="assets/{logo}"' in page.html for page in out.pages)
+
+    def test_shared_file_is_captioned_once(self, tmp_path: Path) -> None:
+        (tmp_path / "img-logo.png").write_bytes(_png((200, 0, 0)))
+        assets = [ImageAsset(src="assets/img-logo.png", name="img-logo.png", page_no=n) for n in (1, 2, 3)]
+        engine = Mock()
+        engine.is_available.return_value = True
+        engine.generate_batch.return_value = ["A red logo"]
+        cache = Mock()
+        cache.get.return_value = object()
+
+        options = PdfPipelineOptions(picture_descriptions=True)
+        apply_captions_to_images(assets, tmp_path, options, engine, cache)
+
+        assert [len(call.args[0]) for call in engine.generate_batch.call_args_list] == [1]
+        assert [asset.caption for asset in assets] == ["A red logo"] * 3
@@ -0,0 +1,159 @@
+"""Tests for the batch conversion command and warm resource sharing."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from pdf2foundry.cli import app
+from pdf2foundry.cli.batch import BatchJob, load_batch_jobs, run_batch, summarize_batch
+from pdf2foundry.core.warm_resources import get_or_create, is_warm, warm_resources
+
+
+def _pdf(directory: Path, name: str) -> Path:
+    path = directory / name
+    path.write_bytes(b"%PDF-1.4\n")
+    return path
+
+
+class TestWarmResources:
+    """Test the process-wide registry of warm resources."""
+
+    def test_factory_runs_every_time_outside_a_batch(self) -> None:
+        assert get_or_create("key", object) is not get_or_create("key", object)
+        assert not is_warm()
+
+    def test_resources_are_shared_inside_and_released_after(self) -> None:
+        with warm_resources():
+            first = get_or_create("key", object)
+            with warm_resources():
+                assert get_or_create("key", object) is first
+            assert get_or_create("other", object) is not first
+        assert not is_warm()
+        assert get_or_create("key", object) is not first
+
+    def test_failed_factory_keeps_nothing(self) -> None:
+        calls: list[int] = []
+
+        def factory() -> object:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("model download failed")
+            return object()
+
+        with warm_resources():
+            with pytest.raises(RuntimeError):
+                get_or_create("key", factory)
+            assert get_or_create("key", factory) is get_or_create("key", factory)
+        assert len(calls) == 2
+
+
+class TestLoadBatchJobs:
+    """Test reading batch jobs from directories and manifests."""
+
+    def test_directory_sorted_with_default_ids(self, tmp_path: Path) -> None:
+        _pdf(tmp_path, "Monster Manual.pdf")
+        _pdf(tmp_path, "Adventure 01.pdf")
+
+        jobs = load_batch_jobs(tmp_path)
+
+        assert [(j.mod_id, j.mod_title) for j in jobs] == [
+            ("adventure-01", "Adventure 01"),
+            ("monster-manual", "Monster Manual"),
+        ]
+
+    def test_json_manifest(self, tmp_path: Path) -> None:
+        _pdf(tmp_path, "a.pdf")
+        _pdf(tmp_path, "b.pdf")
+        manifest = tmp_path / "batch.json"
+        manifest.write_text(json.dumps(["a.pdf", {"pdf": "b.pdf", "mod_id": "bee", "pages": "1-3,5"}]))
+
+        jobs = load_batch_jobs(manifest)
+
+        assert jobs[0].pdf == tmp_path / "a.pdf"
+        assert (jobs[1].mod_id, jobs[1].mod_title, jobs[1].pages) == ("bee", "b", [1, 2, 3, 5])
+
+    def test_text_manifest_skips_comments(self, tmp_path: Path) -> None:
+        _pdf(tmp_path, "a.pdf")
+        manifest = tmp_path / "batch.txt"
+        manifest.write_text("# nightly\na.pdf  # core rules\n\n")
+
+        assert [j.pdf for j in load_batch_jobs(manifest)] == [tmp_path / "a.pdf"]
+
+    @pytest.mark.parametrize(
+        "items, message",
+        [
+            (["missing.pdf"], "PDF not found"),
+            (["a.pdf", {"pdf": "a.pdf"}], "Duplicate module ID"),
+            ([{"mod_id": "x"}], "needs a 'pdf' path"),
+        ],
+    )
+    def test_invalid_manifests(self, tmp_path: Path, items: list[Any], message: str) -> None:
+        _pdf(tmp_path, "a.pdf")
+        manifest = tmp_path / "batch.json"
+        manifest.write_text(json.dumps(items))
+
+        with pytest.raises(ValueError, match=message):
+            load_batch_jobs(manifest)
+
+
+class TestRunBatch:
+    """Test batch execution."""
+
+    def test_failure_is_isolated_and_resources_stay_warm(self, tmp_path: Path) -> None:
+        jobs = [BatchJob(_pdf(tmp_path, f"{n}.pdf"), mod_id=f"m{n}", mod_title=str(n)) for n in range(3)]
+        seen: list[tuple[str, bool, str, object]] = []
+
+        def fake_pipeline(**kwargs: Any) -> None:
+            options = kwargs["pipeline_options"]
+            seen.append((kwargs["mod_id"], is_warm(), options.worker_pool.value, get_or_create("model", object)))
+            if kwargs["mod_id"] == "m1":
+                raise typer.Exit(1) from ValueError("broken outline")
+
+        with patch("pdf2foundry.cli.conversion.run_conversion_pipeline", side_effect=fake_pipeline):
+            results = run_batch(jobs, out_dir=tmp_path / "dist", options={"workers": 2}, toc=True)
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].error == "ValueError: broken outline"
+        assert all(warm and pool == "process" for _, warm, pool, _ in seen)
+        assert len({id(model) for *_, model in seen}) == 1
+        assert not is_warm()
+
+    def test_summary(self, tmp_path: Path) -> None:
+        job = BatchJob(tmp_path / "a.pdf", "a", "A")
+        from pdf2foundry.cli.batch import BatchResult
+
+        summary = summarize_batch(
+            [BatchResult(job, True, 10.0), BatchResult(job, True, 2.0), BatchResult(job, False, 4.0, "boom")]
+        )
+
+        assert (summary["succeeded"], summary["failed"]) == (2, 1)
+        assert summary["total_seconds"] == 16.0
+        assert (summary["first_seconds"], summary["warm_mean_seconds"]) == (10.0, 3.0)
+
+
+def test_batch_command_reports_and_fails_on_any_error(tmp_path: Path) -> None:
+    _pdf(tmp_path, "good.pdf")
+    _pdf(tmp_path, "bad.pdf")
+    report = tmp_path / "report.json"
+
+    def fake_pipeline(**kwargs: Any) -> None:
+        if kwargs["mod_id"] == "bad":
+            raise RuntimeError("conversion exploded")
+
+    with patch("pdf2foundry.cli.conversion.run_conversion_pipeline", side_effect=fake_pipeline):
+        result = CliRunner().invoke(
+            app, ["batch", str(tmp_path), "--out-dir", str(tmp_path / "dist"), "--report", str(report), "--ocr", "off"]
+        )
+
+    assert result.exit_code == 1
+    assert "1 succeeded, 1 failed" in result.output
+    data = json.loads(report.read_text())
+    assert [(d["mod_id"], d["ok"]) for d in data["documents"]] == [("bad", False), ("good", True)]
+    assert data["documents"][0]["error"] == "RuntimeError: conversion exploded"
@@ -0,0 +1,106 @@
+"""Tests that the persistent cache flags of `convert` reach the caches they control."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from pdf2foundry.cli import app
+from pdf2foundry.ingest.caption_cache import create_caption_cache
+from pdf2foundry.ingest.ocr_engine import create_ocr_cache
+
+
+class _OnePageDoc:
+    def num_pages(self) -> int:
+        return 1
+
+    def export_to_html(self, **_: object) -> str:
+        return "<p>text</p>"
+
+
+@pytest.fixture
+def pipeline(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Run `convert` past ingestion with a stub document, through real content extraction."""
+    monkeypatch.setenv("PDF2FOUNDRY_SKIP_VALIDATION", "1")
+    with (
+        patch("pdf2foundry.cli.conversion.ingest_docling", return_value=_OnePageDoc()),
+        patch("pdf2foundry.cli.conversion.parse_structure_from_doc", return_value=Mock()),
+        patch("pdf2foundry.cli.conversion.build_document_ir", return_value=Mock(chapters=[])),
+        patch("pdf2foundry.backend.caps.detect_backend_capabilities", return_value=Mock()),
+        patch("pdf2foundry.backend.caps.resolve_effective_workers", return_value=(1, [])),
+        patch("pdf2foundry.backend.caps.log_worker_resolution"),
+    ):
+        yield
+
+
+def _convert(tmp_path: Path, *flags: str) -> None:
+    pdf = tmp_path / "book.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n" + b"%" * 2048 + b"\n%EOF\n")  # Large enough to skip the placeholder path
+    args = ["convert", str(pdf), "--mod-id", "book", "--mod-title", "Book", "--out-dir", str(tmp_path / "out")]
+    result = CliRunner().invoke(app, [*args, "--no-toc", "--ocr", "off", *flags])
+    assert result.exit_code == 0, result.stdout
+
+
+@pytest.mark.usefixtures("pipeline")
+class TestOcrCacheFlags:
+    """Test --disk-cache/--cache-dir against the OCR cache."""
+
+    def _ocr_caches(self, tmp_path: Path, *flags: str) -> list[Any]:
+        caches: list[Any] = []
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            caches.append(create_ocr_cache(*args, **kwargs))
+            return caches[-1]
+
+        with patch("pdf2foundry.ingest.content_extractor.create_ocr_cache", side_effect=record):
+            _convert(tmp_path, *flags)
+        return caches
+
+    def test_cache_dir_reaches_ocr_cache(self, tmp_path: Path) -> None:
+        [cache] = self._ocr_caches(tmp_path, "--cache-dir", str(tmp_path / "cache"))
+
+        assert cache._disk_cache is not None
+        assert cache._disk_cache.path.is_relative_to(tmp_path / "cache")
+
+    def test_no_disk_cache_reaches_ocr_cache(self, tmp_path: Path) -> None:
+        [cache] = self._ocr_caches(tmp_path, "--no-disk-cache", "--cache-dir", str(tmp_path / "cache"))
+
+        assert cache._disk_cache is None
+
+
+@pytest.mark.usefixtures("pipeline")
+class TestCaptionCacheFlags:
+    """Test --disk-cache/--cache-dir against the caption cache."""
+
+    def _caption_caches(self, tmp_path: Path, *flags: str) -> list[Any]:
+        caches: list[Any] = []
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            caches.append(create_caption_cache(*args, **kwargs))
+            return caches[-1]
+
+        engine = Mock()
+        engine.is_available.return_value = False
+        engine.cache_fingerprint.return_value = "model"
+        with (
+            patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine", return_value=engine),
+            patch("pdf2foundry.ingest.caption_processor.create_caption_cache", side_effect=record),
+        ):
+            _convert(tmp_path, "--picture-descriptions", "on", "--vlm-repo-id", "org/model", *flags)
+        return caches
+
+    def test_cache_dir_reaches_caption_cache(self, tmp_path: Path) -> None:
+        [cache] = self._caption_caches(tmp_path, "--cache-dir", str(tmp_path / "cache"))
+
+        assert cache._disk_cache is not None
+        assert cache._disk_cache.path.is_relative_to(tmp_path / "cache")
+
+    def test_no_disk_cache_reaches_caption_cache(self, tmp_path: Path) -> None:
+        [cache] = self._caption_caches(tmp_path, "--no-disk-cache", "--cache-dir", str(tmp_path / "cache"))
+
+        assert cache._disk_cache is None
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
 import sys
 import types
+from pathlib import Path
 
 from typer.testing import CliRunner
 
 from pdf2foundry.cli import app
+from pdf2foundry.docling_env import CAPABILITY_CACHE_FILENAME
 
 
 def _shim_docling_success() -> None:
@@ -78,6 +81,16 @@ def test_cli_doctor_success() -> None:
     assert "Docling Environment Check:" in result.stdout
 
 
+def test_cli_doctor_cache_dir(tmp_path: Path) -> None:
+    _shim_docling_success()
+    runner = CliRunner()
+    result = runner.invoke(app, ["doctor", "--cache-dir", str(tmp_path)])
+    assert result.exit_code == 0
+
+    cached = json.loads((tmp_path / CAPABILITY_CACHE_FILENAME).read_text(encoding="utf-8"))
+    assert len(cached) == 1
+
+
 def test_cli_doctor_failure() -> None:
     # Shim with failing converter
     _shim_docling_success()
@@ -0,0 +1,74 @@
+"""Import-time budget for the CLI entry point.
+
+`pdf2foundry --help`, `version` and `doctor` only need typer and the command
+definitions. The conversion pipeline (builder, ingest, PIL, pytesseract, rich
+progress) must load when a command runs, not when the CLI module is imported.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Cumulative import time of pdf2foundry.cli, best of a few runs. Typer alone
+# accounts for roughly half of it; the conversion pipeline used to add ~200 ms.
+IMPORT_BUDGET_MS = float(os.environ.get("PDF2FOUNDRY_IMPORT_BUDGET_MS", "200"))
+
+HEAVY_MODULES = [
+    "pdf2foundry.cli.conversion",
+    "pdf2foundry.builder.ir_builder",
+    "pdf2foundry.ingest.content_extractor",
+    "pdf2foundry.ingest.ocr_engine",
+    "pdf2foundry.ui.progress",
+    "PIL",
+    "pytesseract",
+    "jinja2",
+    "rich.progress",
+    "importlib.metadata",
+]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$")
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Run ``python -X importtime`` and return cumulative microseconds per module."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")]))}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+@pytest.mark.perf
+class TestCliImportTime:
+    """Guard the cold-start cost of `import pdf2foundry.cli`."""
+
+    def test_heavy_modules_are_not_imported(self) -> None:
+        loaded = _import_times("pdf2foundry.cli")
+
+        assert "pdf2foundry.cli.main" in loaded
+        assert [name for name in HEAVY_MODULES if name in loaded] == []
+
+    def test_import_time_within_budget(self) -> None:
+        best_ms = min(_import_times("pdf2foundry.cli")["pdf2foundry.cli"] for _ in range(3)) / 1000
+
+        assert best_ms <= IMPORT_BUDGET_MS, (
+            f"import pdf2foundry.cli took {best_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms); "
+            "run `python -X importtime -c 'import pdf2foundry.cli'` to find the new heavy import"
+        )
@@ -0,0 +1,187 @@
+"""Tests for the persistent, content-addressed conversion cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from pdf2foundry.cli import app
+from pdf2foundry.ingest import conversion_cache as cc
+from pdf2foundry.ingest import docling_adapter as da
+from pdf2foundry.ingest.conversion_cache import ConversionCache, conversion_key, open_conversion_cache
+from pdf2foundry.ingest.ingestion import JsonOpts, ingest_docling
+
+
+class _Doc:
+    def __init__(self, pages: int = 2) -> None:
+        self._pages = pages
+
+    def num_pages(self) -> int:
+        return self._pages
+
+    def export_to_html(self, page_no: int = 0, **_: object) -> str:
+        return f"<p>page {page_no}</p>"
+
+
+SHA = "ab" * 32
+
+
+def _age(path: Path, seconds: float) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+class TestConversionKey:
+    """Test what the cache key depends on."""
+
+    def test_key_depends_on_content_options_and_versions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        base = conversion_key(SHA, {"ocr": False})
+
+        assert conversion_key(SHA, {"ocr": False}) == base
+        assert conversion_key("1" * 64, {"ocr": False}) != base
+        assert conversion_key(SHA, {"ocr": True}) != base
+
+        monkeypatch.setattr(cc, "docling_versions", lambda: {"docling": "99.0"})
+        assert conversion_key(SHA, {"ocr": False}) != base
+
+    def test_env_switches_are_conversion_options(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PDF2FOUNDRY_NO_ML", raising=False)
+        default = da.conversion_options()
+        monkeypatch.setenv("PDF2FOUNDRY_NO_ML", "1")
+
+        assert da.conversion_options() != default
+
+
+class TestConversionCache:
+    """Test storage, LRU eviction and pruning."""
+
+    def test_round_trip_and_miss(self, tmp_path: Path) -> None:
+        cache = ConversionCache(tmp_path / "conversions")
+        assert cache.get("missing") is None
+
+        cache.put("k1", _Doc(pages=3), source_sha256=SHA)
+        doc = cache.get("k1")
+
+        assert doc is not None
+        assert doc.num_pages() == 3
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.entries()[0].source_sha256 == SHA
+
+    def test_corrupt_entry_is_discarded(self, tmp_path: Path) -> None:
+        cache = ConversionCache(tmp_path / "conversions")
+        path = cache.put("k1", _Doc())
+        path.write_bytes(path.read_bytes()[:-4])
+
+        assert cache.get("k1") is None
+        assert not path.exists()
+
+    def test_put_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ConversionCache(tmp_path / "conversions", max_bytes=0)
+        first = cache.put("first", _Doc())
+        second = cache.put("second", _Doc())
+        _age(first, 200)
+        _age(second, 100)
+        assert cache.get("first") is not None  # A hit makes "first" most recently used
+
+        cache.max_bytes = first.stat().st_size * 2
+        cache.put("third", _Doc())
+
+        assert [entry.key for entry in cache.entries()] == ["first", "third"]
+
+    def test_prune_by_size_and_age(self, tmp_path: Path) -> None:
+        cache = ConversionCache(tmp_path / "conversions", max_bytes=0)
+        old = cache.put("old", _Doc())
+        cache.put("new", _Doc())
+        _age(old, 10 * 86400)
+
+        assert cache.prune(older_than=86400) == 1
+        assert [entry.key for entry in cache.entries()] == ["new"]
+        assert cache.prune(0) == 1
+        assert cache.entries() == []
+
+    def test_open_uses_cache_root(self, tmp_path: Path) -> None:
+        assert open_conversion_cache(tmp_path).directory == tmp_path / "conversions"
+
+
+class TestIngestWithConversionCache:
+    """Test that unchanged PDFs are converted once per machine."""
+
+    def _patch_conversion(self, monkeypatch: pytest.MonkeyPatch, calls: list[Path]) -> None:
+        def mock_convert(pdf_path: Path, **_: Any) -> _Doc:
+            calls.append(pdf_path)
+            return _Doc(pages=5)
+
+        monkeypatch.setattr(da, "_do_docling_convert_impl", mock_convert)
+        da._cached_convert.cache_clear()
+
+    def test_same_content_is_converted_once(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Path] = []
+        self._patch_conversion(monkeypatch, calls)
+        first = tmp_path / "book.pdf"
+        copy = tmp_path / "renamed copy.pdf"
+        first.write_bytes(b"%PDF-1.4 same bytes")
+        copy.write_bytes(b"%PDF-1.4 same bytes")
+        events: list[str] = []
+
+        ingest_docling(first, JsonOpts())
+        da._cached_convert.cache_clear()  # A new process has no in-memory memo
+        doc = ingest_docling(copy, JsonOpts(), on_progress=lambda event, _: events.append(event))
+
+        assert calls == [first]
+        assert doc.num_pages() == 5
+        assert "ingest:loaded_from_cache" in events
+
+    def test_changed_content_or_disabled_cache_converts(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Path] = []
+        self._patch_conversion(monkeypatch, calls)
+        pdf = tmp_path / "book.pdf"
+        pdf.write_bytes(b"%PDF-1.4 first edition")
+        ingest_docling(pdf, JsonOpts())
+
+        pdf.write_bytes(b"%PDF-1.4 second edition")
+        da._cached_convert.cache_clear()
+        ingest_docling(pdf, JsonOpts())
+        da._cached_convert.cache_clear()
+        ingest_docling(pdf, JsonOpts(conversion_cache=False))
+
+        assert len(calls) == 3
+        assert len(open_conversion_cache().entries()) == 2
+
+
+class TestCacheCommand:
+    """Test the ``pdf2foundry cache`` subcommand."""
+
+    def test_info_list_prune_clear(self, tmp_path: Path) -> None:
+        runner = CliRunner()
+        cache = open_conversion_cache(tmp_path)
+        cache.put("a" * 64, _Doc(), source_sha256=SHA)
+        cache.put("b" * 64, _Doc())
+        _age(cache.directory / f"{'a' * 64}.bin", 30 * 86400)
+        cache_dir = ["--cache-dir", str(tmp_path)]
+
+        result = runner.invoke(app, ["cache", "info", *cache_dir])
+        assert result.exit_code == 0
+        assert "Conversions: 2 entries" in result.stdout
+
+        result = runner.invoke(app, ["cache", "list", *cache_dir])
+        assert result.stdout.index("a" * 12) < result.stdout.index("b" * 12)
+
+        result = runner.invoke(app, ["cache", "prune", "--older-than-days", "7", *cache_dir])
+        assert "Removed 1 cached conversions" in result.stdout
+
+        result = runner.invoke(app, ["cache", "clear", "--yes", *cache_dir])
+        assert result.exit_code == 0
+        assert cache.entries() == []
+
+    def test_clear_asks_for_confirmation(self, tmp_path: Path) -> None:
+        open_conversion_cache(tmp_path).put("k" * 64, _Doc())
+
+        result = CliRunner().invoke(app, ["cache", "clear", "--cache-dir", str(tmp_path)], input="n\n")
+
+        assert result.exit_code == 1
+        assert len(open_conversion_cache(tmp_path).entries()) == 1
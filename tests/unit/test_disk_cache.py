@@ -0,0 +1,211 @@
+"""Tests for the persistent disk cache and cache directory resolution."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from pdf2foundry.core.cache_paths import CACHE_DIR_ENV, get_cache_root
+from pdf2foundry.ingest.caption_engine import CaptionCache, HFCaptionEngine, create_caption_cache
+from pdf2foundry.ingest.disk_cache import DiskCache, open_disk_cache
+from pdf2foundry.ingest.ocr_engine import OcrCache, OcrResult, TesseractOcrEngine, create_ocr_cache
+from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+
+class TestCacheRoot:
+    """Test cache root resolution."""
+
+    def test_override_wins(self, tmp_path: Path) -> None:
+        assert get_cache_root(tmp_path / "explicit") == tmp_path / "explicit"
+
+    def test_environment_variable(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "env"))
+        assert get_cache_root() == tmp_path / "env"
+
+    def test_platform_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch("pdf2foundry.core.cache_paths.sys.platform", "linux"):
+            assert get_cache_root() == tmp_path / "pdf2foundry"
+
+
+class TestDiskCache:
+    """Test the SQLite-backed store."""
+
+    def test_round_trip_survives_reopen(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path / "c.sqlite3", max_bytes=1024)
+        assert cache.get("k") is None
+        cache.set("k", b"value")
+        assert cache.get("k") == b"value"
+        cache.close()
+
+        reopened = DiskCache(tmp_path / "c.sqlite3", max_bytes=1024)
+        assert reopened.get("k") == b"value"
+
+    def test_lazy_open_does_not_touch_disk(self, tmp_path: Path) -> None:
+        DiskCache(tmp_path / "sub" / "c.sqlite3", max_bytes=1024)
+        assert not (tmp_path / "sub").exists()
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path / "c.sqlite3", max_bytes=300)
+        with patch("pdf2foundry.ingest.disk_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", b"x" * 100)
+            cache.set("b", b"x" * 100)
+            assert cache.get("a") is not None  # "a" becomes more recent than "b"
+            cache.set("c", b"x" * 150)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        stats = cache.stats()
+        assert stats["bytes"] <= 300
+        assert stats["evictions"] == 1
+
+    def test_stats_and_clear(self, tmp_path: Path) -> None:
+        cache = open_disk_cache("unit", 1024, tmp_path)
+        cache.set("k", b"12345")
+        cache.get("k")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["path"] == str(tmp_path / "unit.sqlite3")
+        assert (stats["entries"], stats["bytes"], stats["hits"], stats["misses"]) == (1, 5, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+
+class TestOcrDiskTier:
+    """Test the OCR cache's persistent tier."""
+
+    def test_results_survive_new_cache_instance(self, tmp_path: Path) -> None:
+        image = Image.new("RGB", (20, 20), "white")
+        results = [OcrResult("Scanned text", confidence=0.9, language="eng", bbox=(1.0, 2.0, 3.0, 4.0))]
+
+        first = OcrCache(disk_cache=DiskCache(tmp_path / "ocr.sqlite3", 1024 * 1024), engine_fingerprint="t:5")
+        first.set(image, None, results)
+
+        second = OcrCache(disk_cache=DiskCache(tmp_path / "ocr.sqlite3", 1024 * 1024), engine_fingerprint="t:5")
+        cached = second.get(image)
+
+        assert cached is not None
+        assert cached[0].text == "Scanned text"
+        assert cached[0].confidence == pytest.approx(0.9)
+        assert cached[0].language == "eng"
+        assert cached[0].bbox == (1.0, 2.0, 3.0, 4.0)
+
+    def test_line_results_round_trip_compactly(self, tmp_path: Path) -> None:
+        from pdf2foundry.ingest.ocr_engine import _decode_results, _encode_results
+
+        results = [
+            OcrResult("One", confidence=0.91234, language="eng", bbox=(1.0, 2.0, 30.0, 10.0), paragraph=0),
+            OcrResult("Two", confidence=0.8, language="eng", bbox=(1.0, 14.0, 28.5, 10.0), paragraph=0),
+            OcrResult("Page", confidence=0.0),
+        ]
+
+        payload = _encode_results(results)
+        decoded = _decode_results(payload)
+
+        assert b'"lang":["eng"]' in payload
+        assert [r.text for r in decoded] == ["One", "Two", "Page"]
+        assert decoded[0].confidence == pytest.approx(0.9123)
+        assert decoded[1].bbox == (1.0, 14.0, 28.5, 10.0)
+        assert [r.paragraph for r in decoded] == [0, 0, None]
+        assert [r.language for r in decoded] == ["eng", "eng", None]
+        assert decoded[2].bbox is None
+
+    def test_engine_fingerprint_scopes_entries(self, tmp_path: Path) -> None:
+        image = Image.new("RGB", (20, 20), "white")
+        OcrCache(disk_cache=DiskCache(tmp_path / "ocr.sqlite3", 1024), engine_fingerprint="t:4").set(
+            image, None, [OcrResult("old")]
+        )
+
+        newer = OcrCache(disk_cache=DiskCache(tmp_path / "ocr.sqlite3", 1024), engine_fingerprint="t:5")
+        assert newer.get(image) is None
+
+    def test_disk_errors_disable_tier(self) -> None:
+        import sqlite3
+
+        disk = Mock()
+        disk.get.side_effect = sqlite3.OperationalError("disk I/O error")
+        cache = OcrCache(disk_cache=disk)
+        image = Image.new("RGB", (5, 5))
+
+        assert cache.get(image) is None
+        cache.set(image, None, [OcrResult("text")])
+        assert disk.set.call_count == 0
+        assert cache.get(image) is not None  # Memory tier still works
+
+    def test_create_ocr_cache_honors_options(self, tmp_path: Path) -> None:
+        engine = Mock(spec=TesseractOcrEngine)
+        engine.cache_fingerprint.return_value = "tesseract:5.3:--psm 6"
+
+        enabled = create_ocr_cache(PdfPipelineOptions(cache_dir=str(tmp_path)), engine)
+        disabled = create_ocr_cache(PdfPipelineOptions(disk_cache=False), engine)
+
+        assert enabled._disk_cache is not None
+        assert enabled._disk_cache.path == tmp_path / "ocr.sqlite3"
+        assert disabled._disk_cache is None
+
+
+class TestCaptionDiskTier:
+    """Test the caption cache's persistent tier."""
+
+    def _cache(self, tmp_path: Path, fingerprint: str) -> CaptionCache:
+        return CaptionCache(disk_cache=DiskCache(tmp_path / "captions.sqlite3", 1024 * 1024), model_fingerprint=fingerprint)
+
+    def test_captions_and_misses_persist(self, tmp_path: Path) -> None:
+        image = Image.new("RGB", (16, 16), "red")
+        blank = Image.new("RGB", (16, 16), "blue")
+        first = self._cache(tmp_path, "blip")
+        first.set(image, "A red square")
+        first.set(blank, None)  # Remember that no caption could be generated
+
+        second = self._cache(tmp_path, "blip")
+        assert second.get(image) == "A red square"
+        assert second.get(blank) is None
+        assert second.hits == 2
+
+    def test_model_fingerprint_scopes_entries(self, tmp_path: Path) -> None:
+        image = Image.new("RGB", (16, 16), "red")
+        self._cache(tmp_path, "blip").set(image, "A red square")
+
+        result = self._cache(tmp_path, "florence").get(image)
+        assert not isinstance(result, str | type(None))  # Sentinel: not cached for this model
+
+    def test_engine_fingerprint_includes_generation_params(self) -> None:
+        florence = HFCaptionEngine("microsoft/Florence-2-base").cache_fingerprint()
+        blip = HFCaptionEngine("Salesforce/blip-image-captioning-base").cache_fingerprint()
+
+        assert "num_beams" in florence
+        assert "Florence-2-base" in florence
+        assert florence != blip
+
+    def test_stats_report(self, tmp_path: Path) -> None:
+        cache = self._cache(tmp_path, "blip")
+        image = Image.new("RGB", (16, 16), "red")
+        cache.get(image)
+        cache.set(image, "A red square")
+        cache.get(image)
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["disk"]["entries"] == 1
+        report = cache.format_stats()
+        assert "1 hits, 1 misses (50.0% hit rate)" in report
+        assert "disk: 1 entries" in report
+
+    def test_create_caption_cache_honors_options(self, tmp_path: Path) -> None:
+        engine = HFCaptionEngine("Salesforce/blip-image-captioning-base")
+
+        enabled = create_caption_cache(PdfPipelineOptions(cache_dir=str(tmp_path)), engine)
+        disabled = create_caption_cache(PdfPipelineOptions(disk_cache=False), engine)
+
+        assert enabled._disk_cache is not None
+        assert enabled._disk_cache.path == tmp_path / "captions.sqlite3"
+        assert disabled._disk_cache is None
+        assert "disk:" not in disabled.format_stats()
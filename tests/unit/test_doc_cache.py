@@ -0,0 +1,249 @@
+"""Tests for the binary Docling document cache format."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pdf2foundry.ingest import docling_adapter as da
+from pdf2foundry.ingest.doc_cache import (
+    FORMAT_VERSION,
+    MAGIC,
+    CacheSourceMismatchError,
+    DocCacheFormat,
+    encode_binary_cache,
+    file_sha256,
+    is_binary_cache,
+    json_source_path,
+    load_document_cache,
+    read_binary_data,
+    read_binary_header,
+    read_json_source,
+    write_binary_cache,
+    write_json_source,
+)
+from pdf2foundry.ingest.ingestion import JsonOpts, JsonValidationError, ingest_docling, try_load_doc_from_json
+from pdf2foundry.ingest.json_io import atomic_write_text, doc_to_json, read_json_file
+
+
+class _HtmlDoc:
+    """Document exported through the per-page HTML fallback shape."""
+
+    def __init__(self, pages: int = 3, paragraphs: int = 1) -> None:
+        self._pages = pages
+        self._paragraphs = paragraphs
+
+    def num_pages(self) -> int:
+        return self._pages
+
+    def export_to_html(self, page_no: int = 0, **_: object) -> str:
+        body = "".join(f"<p class='text'>Page {page_no} paragraph {i} of the rulebook.</p>" for i in range(self._paragraphs))
+        return f"<html><body>{body}</body></html>"
+
+
+SHA_A = "a" * 64
+SHA_B = "b" * 64
+
+
+class TestBinaryCacheFormat:
+    """Test header handling and round trips."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.bin"
+        source = _HtmlDoc(pages=3)
+        write_binary_cache(path, source, source_sha256=SHA_A)
+
+        assert is_binary_cache(path)
+        doc = load_document_cache(path)
+        assert doc.num_pages() == 3
+        assert doc.export_to_html(page_no=2) == source.export_to_html(page_no=2)
+
+    def test_header_records_version_and_source(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.bin"
+        write_binary_cache(path, _HtmlDoc(), source_sha256=SHA_A)
+
+        header = read_binary_header(path)
+        assert header.format_version == FORMAT_VERSION
+        assert header.source_sha256 == SHA_A
+        assert header.codec in {"zlib", "zstd"}
+        assert header.encoding in {"json", "msgpack"}
+
+    def test_unknown_source_is_recorded_as_none(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.bin"
+        write_binary_cache(path, _HtmlDoc())
+
+        assert read_binary_header(path).source_sha256 is None
+        assert read_binary_data(path, expected_source_sha256=SHA_B)["num_pages"] == 3
+
+    def test_source_mismatch_rejected_before_decoding(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.bin"
+        data = encode_binary_cache(_HtmlDoc(), source_sha256=SHA_A)
+        path.write_bytes(data[:-8])  # A corrupt payload is never reached
+
+        with pytest.raises(CacheSourceMismatchError, match="different PDF"):
+            read_binary_data(path, expected_source_sha256=SHA_B)
+
+    def test_unsupported_version_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.bin"
+        data = bytearray(encode_binary_cache(_HtmlDoc()))
+        data[len(MAGIC)] = FORMAT_VERSION + 1
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(ValueError, match="unsupported binary cache version"):
+            read_binary_header(path)
+
+    def test_corrupt_payload_raises_value_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.bin"
+        path.write_bytes(encode_binary_cache(_HtmlDoc())[:-8])
+
+        with pytest.raises(ValueError):
+            read_binary_data(path)
+
+    def test_json_cache_is_not_binary(self, tmp_path: Path) -> None:
+        path = tmp_path / "docling.json"
+        atomic_write_text(path, doc_to_json(_HtmlDoc(pages=2)))
+
+        assert not is_binary_cache(path)
+        assert load_document_cache(path).num_pages() == 2
+
+    def test_default_filenames(self) -> None:
+        assert DocCacheFormat.JSON.default_filename == "docling.json"
+        assert DocCacheFormat.BINARY.default_filename == "docling.bin"
+
+
+class TestBinaryCacheIngestion:
+    """Test the binary format through ingest_docling."""
+
+    def _patch_conversion(self, monkeypatch: pytest.MonkeyPatch, calls: list[Path]) -> None:
+        def mock_convert(pdf_path: Path, **_: Any) -> _HtmlDoc:
+            calls.append(pdf_path)
+            return _HtmlDoc(pages=4)
+
+        monkeypatch.setattr(da, "_do_docling_convert_impl", mock_convert)
+        da._cached_convert.cache_clear()
+
+    def test_writes_binary_and_reloads_without_conversion(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Path] = []
+        self._patch_conversion(monkeypatch, calls)
+        pdf = tmp_path / "book.pdf"
+        pdf.write_bytes(b"%PDF-1.4 book")
+        cache_file = tmp_path / "docling.bin"
+        opts = JsonOpts(path=cache_file, cache_format=DocCacheFormat.BINARY)
+
+        ingest_docling(pdf, opts)
+        doc = ingest_docling(pdf, opts)
+
+        assert len(calls) == 1
+        assert is_binary_cache(cache_file)
+        assert read_binary_header(cache_file).source_sha256 == file_sha256(pdf)
+        assert doc.num_pages() == 4
+
+    def test_changed_pdf_invalidates_binary_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Path] = []
+        self._patch_conversion(monkeypatch, calls)
+        pdf = tmp_path / "book.pdf"
+        pdf.write_bytes(b"%PDF-1.4 first edition")
+        cache_file = tmp_path / "docling.bin"
+        write_binary_cache(cache_file, _HtmlDoc(pages=2), source_sha256=SHA_A)
+
+        doc = ingest_docling(pdf, JsonOpts(path=cache_file, cache_format=DocCacheFormat.BINARY))
+
+        assert len(calls) == 1  # Stale cache was rejected and the PDF converted
+        assert doc.num_pages() == 4
+        assert read_binary_header(cache_file).source_sha256 == file_sha256(pdf)
+
+    def test_changed_pdf_invalidates_json_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Path] = []
+        self._patch_conversion(monkeypatch, calls)
+        pdf = tmp_path / "book.pdf"
+        pdf.write_bytes(b"%PDF-1.4 first edition")
+        cache_file = tmp_path / "docling.json"
+        opts = JsonOpts(path=cache_file)
+
+        ingest_docling(pdf, opts)
+        ingest_docling(pdf, opts)
+        assert len(calls) == 1
+        assert read_json_source(cache_file) == file_sha256(pdf)
+
+        pdf.write_bytes(b"%PDF-1.4 second edition")
+        da._cached_convert.cache_clear()  # Same path; only the content changed
+        doc = ingest_docling(pdf, opts)
+
+        assert len(calls) == 2  # Stale cache was rejected and the PDF converted
+        assert doc.num_pages() == 4
+        assert read_json_source(cache_file) == file_sha256(pdf)
+
+    def test_json_without_recorded_source_is_accepted(self, tmp_path: Path) -> None:
+        cache_file = tmp_path / "docling.json"
+        atomic_write_text(cache_file, doc_to_json(_HtmlDoc(pages=2)))
+        json_source_path(cache_file).write_text("not a digest\n")
+
+        doc, warnings = try_load_doc_from_json(cache_file, fallback_on_failure=False, source_sha256=SHA_B)
+
+        assert doc is not None and warnings == []
+        write_json_source(cache_file, None)
+        assert not json_source_path(cache_file).exists()
+
+    def test_mismatch_is_a_validation_error(self, tmp_path: Path) -> None:
+        cache_file = tmp_path / "docling.bin"
+        write_binary_cache(cache_file, _HtmlDoc(), source_sha256=SHA_A)
+
+        with pytest.raises(JsonValidationError, match="different PDF"):
+            try_load_doc_from_json(cache_file, fallback_on_failure=False, source_sha256=SHA_B)
+
+        json_file = tmp_path / "docling.json"
+        atomic_write_text(json_file, doc_to_json(_HtmlDoc()))
+        write_json_source(json_file, SHA_A)
+        with pytest.raises(JsonValidationError, match="different PDF"):
+            try_load_doc_from_json(json_file, fallback_on_failure=False, source_sha256=SHA_B)
+
+
+def test_binary_cache_benchmark_against_json(tmp_path: Path) -> None:
+    """Benchmark cache writes and reads: pretty JSON text versus the binary format."""
+    texts = [
+        {
+            "self_ref": f"#/texts/{i}",
+            "label": "text",
+            "prov": [
+                {"page_no": i // 50 + 1, "bbox": {"l": 72.0, "t": 10.0 * (i % 50), "r": 540.0, "b": 10.0 * (i % 50) + 9}}
+            ],
+            "text": f"Paragraph {i} of the rulebook describing a rule.",
+        }
+        for i in range(5000)
+    ]
+
+    class _NativeDoc:
+        def to_json(self) -> Any:
+            return {"schema_name": "Benchmark", "texts": texts}
+
+    doc = _NativeDoc()
+    json_path = tmp_path / "docling.json"
+    bin_path = tmp_path / "docling.bin"
+
+    def best_of(fn: Any, runs: int = 3) -> float:
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    json_write = best_of(lambda: atomic_write_text(json_path, doc_to_json(doc, pretty=True)))
+    bin_write = best_of(lambda: write_binary_cache(bin_path, doc, source_sha256=SHA_A))
+    json_read = best_of(lambda: read_json_file(json_path))
+    bin_read = best_of(lambda: read_binary_data(bin_path, expected_source_sha256=SHA_A))
+    json_size, bin_size = json_path.stat().st_size, bin_path.stat().st_size
+
+    print(
+        f"\nDocling cache benchmark ({json_size / 1e6:.1f} MB JSON): "
+        f"write json={json_write * 1000:.1f}ms binary={bin_write * 1000:.1f}ms; "
+        f"read json={json_read * 1000:.1f}ms binary={bin_read * 1000:.1f}ms; "
+        f"size binary={bin_size / json_size:.1%} of JSON"
+    )
+
+    assert read_binary_data(bin_path) == read_json_file(json_path)
+    assert bin_size < json_size / 4
+    assert bin_write < json_write
@@ -4,7 +4,14 @@ import sys
 import types
 from typing import Any
 
-from pdf2foundry.docling_env import format_report_lines, probe_docling, report_is_ok
+from pdf2foundry.docling_env import (
+    DoclingProbeReport,
+    format_report_lines,
+    probe_cache_key,
+    probe_docling,
+    probe_docling_cached,
+    report_is_ok,
+)
 
 
 def _shim_docling(success: bool = True) -> None:
@@ -97,3 +104,56 @@ def test_probe_docling_partial_failure(monkeypatch: Any) -> None:
     assert report.has_docling
     assert not report.can_construct_converter
     assert not report_is_ok(report)
+
+
+def _counting_probe(ok: bool = True) -> tuple[list[int], Any]:
+    calls: list[int] = []
+
+    def probe() -> DoclingProbeReport:
+        calls.append(1)
+        return DoclingProbeReport(
+            has_docling=True,
+            has_docling_core=True,
+            docling_version="2.0.0",
+            docling_core_version="2.0.0",
+            can_construct_converter=ok,
+            has_core_types=True,
+        )
+
+    return calls, probe
+
+
+def test_probe_docling_cached_probes_once(tmp_path: Any) -> None:
+    calls, probe = _counting_probe()
+
+    first = probe_docling_cached(cache_dir=tmp_path, probe=probe)
+    second = probe_docling_cached(cache_dir=tmp_path, probe=probe)
+
+    assert len(calls) == 1
+    assert second == first
+    assert (tmp_path / "capabilities.json").is_file()
+
+
+def test_probe_docling_cached_refresh_and_key(tmp_path: Any, monkeypatch: Any) -> None:
+    calls, probe = _counting_probe()
+    probe_docling_cached(cache_dir=tmp_path, probe=probe)
+
+    probe_docling_cached(cache_dir=tmp_path, probe=probe, refresh=True)
+    assert len(calls) == 2
+
+    # A different interpreter or Docling version misses the cache
+    key = probe_cache_key()
+    monkeypatch.setattr(sys, "executable", "/other/python")
+    assert probe_cache_key() != key
+    probe_docling_cached(cache_dir=tmp_path, probe=probe)
+    assert len(calls) == 3
+
+
+def test_probe_docling_cached_does_not_keep_failures(tmp_path: Any) -> None:
+    calls, probe = _counting_probe(ok=False)
+
+    probe_docling_cached(cache_dir=tmp_path, probe=probe)
+    probe_docling_cached(cache_dir=tmp_path, probe=probe)
+
+    assert len(calls) == 2
+    assert not (tmp_path / "capabilities.json").exists()
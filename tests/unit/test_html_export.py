@@ -0,0 +1,149 @@
+"""Tests for single-pass per-page HTML export."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pdf2foundry.ingest.content_extractor import _extract_images_from_html
+from pdf2foundry.ingest.html_export import PICTURE_REF_PREFIX, export_page_html, iter_page_html
+
+
+class _PerPageDoc:
+    """Document without a Docling tree: only per-page export is available."""
+
+    def __init__(self, failing: set[int] | None = None) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.failing = failing or set()
+
+    def num_pages(self) -> int:
+        return 5
+
+    def export_to_html(self, **kwargs: Any) -> str:
+        self.calls.append(kwargs)
+        if kwargs["page_no"] in self.failing:
+            raise RuntimeError("export failed")
+        return f"<p>{kwargs['page_no']}</p>"
+
+
+def _docling_document(pages: int, skip: int | None = None, pictures: bool = False) -> Any:
+    pytest.importorskip("docling_core.transforms.serializer.html")
+    try:
+        from docling_core.types.doc import BoundingBox, DocItemLabel, ImageRef, ProvenanceItem, document
+        from PIL import Image
+    except ImportError as exc:  # Other tests may leave stub docling modules behind
+        pytest.skip(f"docling-core unavailable: {exc}")
+
+    doc = document.DoclingDocument(name="book")
+    for page_no in range(1, pages + 1):
+        image = ImageRef.from_pil(Image.new("RGB", (100, 100), (page_no * 40, 90, 160)), dpi=72) if pictures else None
+        doc.add_page(page_no=page_no, size={"width": 100, "height": 100}, image=image)
+    for page_no in range(1, pages + 1):
+        if page_no == skip:
+            continue
+        prov = ProvenanceItem(page_no=page_no, bbox=BoundingBox(l=0, t=0, r=10, b=10), charspan=(0, 1))
+        doc.add_heading(text=f"Heading {page_no}", level=1, prov=prov)
+        doc.add_text(label=DocItemLabel.TEXT, text=f"Text & more {page_no}", prov=prov)
+        group = doc.add_group(label="list", name="list")
+        for n in range(2):
+            doc.add_list_item(text=f"Item {page_no}.{n}", parent=group, prov=prov)
+        doc.add_text(
+            label=DocItemLabel.PAGE_FOOTER,
+            text=f"Footer {page_no}",
+            prov=prov,
+            content_layer=document.ContentLayer.FURNITURE,
+        )
+        if pictures:
+            caption = doc.add_text(label=DocItemLabel.CAPTION, text=f"Figure {page_no}", prov=prov)
+            doc.add_picture(caption=caption, prov=prov)
+    return doc
+
+
+class TestPerPageFallback:
+    """Test documents that can only be exported page by page."""
+
+    def test_pages_in_order_with_export_options(self) -> None:
+        doc = _PerPageDoc()
+
+        assert list(iter_page_html(doc, [3, 1, 3], include_layers={"body"})) == [(1, "<p>1</p>"), (3, "<p>3</p>")]
+        assert doc.calls[0] == {"page_no": 1, "split_page_view": False, "included_content_layers": {"body"}}
+
+    def test_failed_page_is_empty(self) -> None:
+        doc = _PerPageDoc(failing={2})
+
+        assert export_page_html(doc, 2) == ""
+        assert dict(iter_page_html(doc, [1, 2, 3]))[2] == ""
+
+
+class TestSinglePassExport:
+    """Test that one traversal reproduces Docling's per-page export."""
+
+    @pytest.mark.parametrize("selected", [[1, 2, 3, 4, 5], [2, 4], [5]])
+    def test_matches_per_page_export(self, selected: list[int]) -> None:
+        doc = _docling_document(5, skip=3)
+        from docling_core.types.doc import ImageRefMode
+        from docling_core.types.doc.document import ContentLayer
+
+        layers = {ContentLayer.BODY, ContentLayer.FURNITURE}
+        exported = list(iter_page_html(doc, selected, layers, ImageRefMode.EMBEDDED))
+
+        assert [page_no for page_no, _ in exported] == selected
+        for page_no, html in exported:
+            expected = doc.export_to_html(
+                page_no=page_no,
+                split_page_view=False,
+                included_content_layers=layers,
+                image_mode=ImageRefMode.EMBEDDED,
+            )
+            assert html == expected
+
+    def test_traversals_do_not_grow_with_page_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        traversals: list[int] = []
+
+        def count_full_traversals(pages: int) -> int:
+            doc = _docling_document(pages)
+            iterate_items = type(doc).iterate_items
+
+            def counting_iterate_items(self: Any, *args: Any, **kwargs: Any) -> Any:
+                if kwargs.get("root") is None:
+                    traversals.append(pages)
+                return iterate_items(self, *args, **kwargs)
+
+            monkeypatch.setattr(type(doc), "iterate_items", counting_iterate_items)
+            assert len(list(iter_page_html(doc, range(1, pages + 1)))) == pages
+            monkeypatch.undo()
+            return traversals.count(pages)
+
+        assert count_full_traversals(40) == count_full_traversals(4)
+
+
+class TestPictureRefs:
+    """Test writing pictures straight from the document instead of via base64."""
+
+    def test_unresolvable_reference_is_dropped(self, tmp_path: Path) -> None:
+        html = f'<figure><img src="{PICTURE_REF_PREFIX}#/pictures/0"></figure>'
+
+        with patch("pdf2foundry.ingest.content_extractor.picture_png", return_value=None):
+            updated, images = _extract_images_from_html(html, 1, tmp_path, doc=object())
+        assert (updated, images) == ('<figure><img src=""></figure>', [])
+
+        assert _extract_images_from_html(html, 1, tmp_path)[1] == []
+
+    def test_matches_base64_extraction(self, tmp_path: Path) -> None:
+        doc = _docling_document(3, pictures=True)
+        from docling_core.types.doc import ImageRefMode
+
+        for page_no, html in iter_page_html(doc, [1, 2, 3], image_mode=ImageRefMode.EMBEDDED, picture_refs=True):
+            assert "base64" not in html
+            direct = _extract_images_from_html(html, page_no, tmp_path / "direct", doc)
+            embedded = doc.export_to_html(page_no=page_no, split_page_view=False, image_mode=ImageRefMode.EMBEDDED)
+            decoded = _extract_images_from_html(embedded, page_no, tmp_path / "decoded")
+
+            assert direct == decoded
+            assert len(direct[1]) == 1
+
+        for path in (tmp_path / "decoded").iterdir():
+            assert (tmp_path / "direct" / path.name).read_bytes() == path.read_bytes()
@@ -0,0 +1,70 @@
+"""Tests for the byte-budgeted SharedImageCache."""
+
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from pdf2foundry.ingest.image_cache import BBox, CacheLimits, SharedImageCache, image_nbytes
+
+
+@pytest.fixture
+def mock_doc() -> Mock:
+    """Create a mock document rendering distinct 600x800 RGB pages."""
+    doc = Mock()
+
+    def render_page(page_index: int, dpi: int = 150) -> Image.Image:
+        img = Image.linear_gradient("L").resize((600, 800)).convert("RGB")
+        img.paste((page_index * 40 % 256, 0, 0), (0, 0, 10, 10))
+        return img
+
+    doc.render_page = render_page
+    return doc
+
+
+class TestImageCacheMemoryBudget:
+    """Test pixel-memory accounting and eviction across the page and region tiers."""
+
+    def test_memory_budget_bounds_page_bytes(self, mock_doc: Mock) -> None:
+        """Test that pages are evicted once their pixel bytes exceed the budget."""
+        cache = SharedImageCache(CacheLimits(memory_budget_mb=3))
+
+        # Each 600x800 RGB page holds 1.44 MB of pixels
+        for i in range(3):
+            cache.get_cached_page_image(mock_doc, i, 150)
+
+        metrics = cache.get_metrics()
+        assert metrics["page_cache_size"] == 2
+        assert metrics["page_evictions"] == 1
+        assert metrics["memory_bytes"] == 2 * 600 * 800 * 3
+
+    def test_regions_are_evicted_before_pages(self, mock_doc: Mock) -> None:
+        """Test that evicted regions are re-cropped from the cached page without rasterizing."""
+        cache = SharedImageCache(CacheLimits(memory_budget_mb=2))
+
+        first = cache.get_cached_region_image(mock_doc, 0, BBox(0, 0, 500, 500))
+        cache.get_cached_region_image(mock_doc, 0, BBox(500, 500, 1000, 1000))
+        again = cache.get_cached_region_image(mock_doc, 0, BBox(0, 0, 500, 500))
+
+        metrics = cache.get_metrics()
+        assert metrics["region_evictions"] >= 1
+        assert metrics["page_evictions"] == 0
+        assert metrics["rasterize_calls"] == 1
+        assert first is not None and again is not None
+        assert again.image.tobytes() == first.image.tobytes()
+
+    def test_zero_budget_limits_by_count_only(self, mock_doc: Mock) -> None:
+        """Test that a zero memory budget disables byte-based eviction."""
+        cache = SharedImageCache(CacheLimits(page_raster_cache=4, memory_budget_mb=0))
+
+        for i in range(4):
+            cache.get_cached_page_image(mock_doc, i, 150)
+
+        assert cache.get_metrics()["page_cache_size"] == 4
+
+    def test_image_nbytes(self) -> None:
+        """Test pixel memory estimates for common modes."""
+        assert image_nbytes(Image.new("RGB", (10, 20))) == 600
+        assert image_nbytes(Image.new("L", (10, 20))) == 200
+        assert image_nbytes(Image.new("I;16", (10, 20))) == 400
+        assert image_nbytes(Image.new("1", (10, 20))) == 40
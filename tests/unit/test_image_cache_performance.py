@@ -1,6 +1,8 @@
 """Performance tests for the shared image cache system."""
 
+import hashlib
 import time
+from collections.abc import Callable
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +10,7 @@ from PIL import Image
 
 from pdf2foundry.ingest.image_cache import (
     BBox,
+    CachedImage,
     CacheLimits,
     SharedImageCache,
     get_image_hash,
@@ -306,6 +309,49 @@ class TestImageHashPerformance:
         # Should be reasonably fast (less than 100ms per hash for 1MP image)
         assert avg_time < 0.1, f"Average hash time {avg_time:.6f}s is too slow"
 
+    @pytest.mark.perf
+    def test_raw_hash_benchmark_against_png_encoding(self) -> None:
+        """Micro-benchmark: hashing raw pixels beats PNG-encoding a page raster before hashing."""
+        from io import BytesIO
+
+        # A noisy page-sized raster (compresses poorly, like a scanned page)
+        img = Image.effect_noise((1275, 1650), 64).convert("RGB")
+
+        def png_hash() -> str:
+            buf = BytesIO()
+            img.save(buf, format="PNG")
+            return hashlib.sha256(buf.getvalue()).hexdigest()[:16]
+
+        def best_of(fn: Callable[[], object], runs: int = 3) -> float:
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        png_time = best_of(png_hash)
+        raw_time = best_of(lambda: get_image_hash(img))
+
+        # Raw hashing is several times faster; only require it to win so loaded machines do not flake
+        assert raw_time < png_time, f"raw hash {raw_time * 1000:.1f}ms vs png+sha256 {png_time * 1000:.1f}ms"
+
+    def test_hash_depends_on_mode(self) -> None:
+        """Test that the pixel layout (mode) is part of the hash."""
+        gray = Image.new("L", (10, 10), 0)
+        assert get_image_hash(gray) != get_image_hash(gray.convert("RGB"))
+
+    def test_cached_image_memoizes_hash(self) -> None:
+        """Test that a CachedImage hashes its pixels only once."""
+        cached = CachedImage(image=Image.new("RGB", (50, 50), (1, 2, 3)), page_index=0)
+
+        with patch("pdf2foundry.ingest.image_cache.hashlib.blake2b", wraps=hashlib.blake2b) as mock_hasher:
+            first = get_image_hash(cached)
+            second = cached.hash
+
+        assert first == second == get_image_hash(cached.image)
+        assert mock_hasher.call_count == 1
+
 
 class TestCacheFeatureGates:
     """Test cache feature gate functionality."""
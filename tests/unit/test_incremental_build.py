@@ -0,0 +1,132 @@
+"""Tests for incremental rebuilds driven by the build manifest."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pdf2foundry.builder.build_manifest import (
+    BUILD_MANIFEST_FILENAME,
+    BuildManifest,
+    build_fingerprint,
+    chapter_input_hash,
+    load_build_manifest,
+    save_build_manifest,
+)
+from pdf2foundry.builder.sources import JournalSourceWriter
+from pdf2foundry.cli.conversion import write_chapter_sources
+from pdf2foundry.model.ir import ChapterIR, SectionIR
+
+
+def _chapters(count: int = 3, changed: dict[int, str] | None = None) -> list[ChapterIR]:
+    changed = changed or {}
+    chapters = []
+    for n in range(1, count + 1):
+        html = changed.get(n, f"<p>Chapter {n} text</p>")
+        section = SectionIR(id_path=[f"chapter-{n}", "intro"], level=2, title="Intro", page_start=n, page_end=n, html=html)
+        chapters.append(ChapterIR(id_path=[f"chapter-{n}"], title=f"Chapter {n}", sections=[section]))
+    return chapters
+
+
+def _build(
+    journals: Path, chapters: list[ChapterIR], previous: BuildManifest | None, toc: bool = True
+) -> JournalSourceWriter:
+    writer = JournalSourceWriter(journals, fingerprint="fp", previous=previous)
+    write_chapter_sources(chapters, writer, mod_id="m", mod_title="Book", toc=toc)
+    writer.remove_stale()
+    return writer
+
+
+def _read_tree(directory: Path) -> dict[str, str]:
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(directory.iterdir())}
+
+
+@pytest.fixture
+def journals(tmp_path: Path) -> Path:
+    path = tmp_path / "journals"
+    path.mkdir()
+    return path
+
+
+class TestBuildManifest:
+    """Test fingerprints and manifest persistence."""
+
+    def test_fingerprint_ignores_runtime_options(self) -> None:
+        base = build_fingerprint("m", "Book", {"tables_mode": "auto", "workers": 1, "streaming": False})
+
+        assert build_fingerprint("m", "Book", {"tables_mode": "auto", "workers": 8, "streaming": True}) == base
+        assert build_fingerprint("m", "Book", {"tables_mode": "image-only", "workers": 1}) != base
+        assert build_fingerprint("m", "Other Title", {"tables_mode": "auto"}) != base
+
+    def test_chapter_hash_covers_html_and_position(self) -> None:
+        chapter = _chapters(1)[0]
+        base = chapter_input_hash(chapter, 1, "fp")
+
+        assert chapter_input_hash(chapter, 2, "fp") != base
+        assert chapter_input_hash(chapter, 1, "other") != base
+        assert chapter_input_hash(_chapters(1, {1: "<p>Edited</p>"})[0], 1, "fp") != base
+
+    def test_round_trip(self, journals: Path, tmp_path: Path) -> None:
+        manifest = _build(journals, _chapters(), None).manifest(packed=True)
+        path = tmp_path / BUILD_MANIFEST_FILENAME
+        save_build_manifest(path, manifest)
+
+        assert load_build_manifest(path, "fp") == manifest
+
+    def test_load_rejects_other_fingerprint_and_garbage(self, tmp_path: Path) -> None:
+        path = tmp_path / BUILD_MANIFEST_FILENAME
+        assert load_build_manifest(path, "fp") is None
+
+        save_build_manifest(path, BuildManifest(fingerprint="old"))
+        assert load_build_manifest(path, "fp") is None
+
+        path.write_text("{not json", encoding="utf-8")
+        assert load_build_manifest(path, "fp") is None
+
+
+class TestIncrementalSources:
+    """Test that unchanged chapters keep their files across builds."""
+
+    def test_unchanged_build_writes_nothing(self, journals: Path) -> None:
+        first = _build(journals, _chapters(), None)
+        before = _read_tree(journals)
+
+        second = _build(journals, _chapters(), first.manifest())
+
+        assert (second.written, second.reused, second.removed) == (0, 4, 0)
+        assert not second.changed
+        assert _read_tree(journals) == before
+
+    def test_only_changed_chapter_is_rewritten(self, journals: Path, tmp_path: Path) -> None:
+        first = _build(journals, _chapters(), None)
+        second = _build(journals, _chapters(changed={2: "<p>Edited</p>"}), first.manifest())
+
+        fresh = tmp_path / "fresh"
+        fresh.mkdir()
+        _build(fresh, _chapters(changed={2: "<p>Edited</p>"}), None)
+
+        assert (second.written, second.reused) == (1, 3)  # The TOC only links page IDs, which did not change
+        assert second.changed
+        assert _read_tree(journals) == _read_tree(fresh)
+
+    def test_removed_chapter_deletes_stale_file(self, journals: Path, tmp_path: Path) -> None:
+        first = _build(journals, _chapters(3), None)
+        second = _build(journals, _chapters(2), first.manifest())
+
+        fresh = tmp_path / "fresh"
+        fresh.mkdir()
+        _build(fresh, _chapters(2), None)
+
+        assert second.removed == 1
+        assert _read_tree(journals) == _read_tree(fresh)
+
+    def test_deleted_file_is_regenerated(self, journals: Path) -> None:
+        first = _build(journals, _chapters(), None)
+        victim = first.records[1].file
+        (journals / victim).unlink()
+
+        second = _build(journals, _chapters(), first.manifest())
+
+        assert second.written == 1
+        assert (journals / victim).is_file()
@@ -0,0 +1,141 @@
+"""Tests for batched caption generation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from pdf2foundry.ingest.caption_engine import HFCaptionEngine
+from pdf2foundry.ingest.caption_processor import apply_captions_to_images
+from pdf2foundry.model.content import ImageAsset
+from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+
+def _images(count: int) -> list[Image.Image]:
+    return [Image.new("RGB", (32, 32), color=(i * 40 % 256, 0, 0)) for i in range(count)]
+
+
+class TestGenerateBatch:
+    """Test HFCaptionEngine.generate_batch."""
+
+    @pytest.fixture(autouse=True)
+    def _available(self) -> object:
+        with (
+            patch.object(HFCaptionEngine, "is_available", return_value=True),
+            patch.object(HFCaptionEngine, "_load_pipeline"),
+        ):
+            yield
+
+    def test_pipeline_receives_whole_batch(self) -> None:
+        engine = HFCaptionEngine("Salesforce/blip-image-captioning-base")
+        engine._pipeline = Mock(
+            return_value=[[{"generated_text": "a photo of a cat"}], [{"generated_text": "a dog"}], [{"text": "a bird"}]]
+        )
+
+        captions = engine.generate_batch(_images(3))
+
+        assert captions == ["A cat", "A dog", "A bird"]
+        engine._pipeline.assert_called_once()
+        args, kwargs = engine._pipeline.call_args
+        assert len(args[0]) == 3
+        assert kwargs == {"batch_size": 3}
+
+    def test_florence_stacks_prompts_into_one_generate_call(self) -> None:
+        model = Mock()
+        processor = Mock()
+        processor.return_value = {"input_ids": Mock(), "pixel_values": Mock()}
+        processor.batch_decode.return_value = ["A castle on a hill", "A dragon"]
+        engine = HFCaptionEngine("microsoft/Florence-2-base")
+        engine._pipeline = {"model": model, "processor": processor, "type": "florence2"}
+
+        captions = engine.generate_batch(_images(2))
+
+        assert captions == ["A castle on a hill", "A dragon"]
+        model.generate.assert_called_once()
+        assert processor.call_args.kwargs["text"] == ["<MORE_DETAILED_CAPTION>"] * 2
+        assert processor.batch_decode.call_args.kwargs == {"skip_special_tokens": False}
+
+    def test_florence_batch_matches_single_image_captions(self) -> None:
+        """Batch grouping (and the padding it brings) does not change a caption."""
+        raw = {(0, 0, 0): "<s><MORE_DETAILED_CAPTION>A castle on a hill</s>", (40, 0, 0): "<s>A dragon</s>"}
+
+        def generate(input_ids: list[Image.Image], **_: object) -> list[str]:
+            texts = [raw[image.getpixel((0, 0))] for image in input_ids]
+            longest = max(map(len, texts))
+            return [text + "<pad>" * (longest - len(text)) for text in texts] if len(texts) > 1 else texts
+
+        def processor(text: object, images: object, return_tensors: str) -> dict[str, object]:
+            return {"input_ids": images if isinstance(images, list) else [images], "pixel_values": None}
+
+        florence = Mock(side_effect=processor)
+        florence.tokenizer.pad_token = "<pad>"
+        florence.batch_decode.side_effect = lambda ids, skip_special_tokens: list(ids)
+        engine = HFCaptionEngine("microsoft/Florence-2-base")
+        engine._pipeline = {"model": Mock(generate=generate), "processor": florence, "type": "florence2"}
+        images = _images(2)
+
+        singles = [engine.generate(image) for image in images]
+
+        assert engine.generate_batch(images) == singles
+        assert engine.generate_batch(images[:1]) == [engine.generate(images[0])]
+        assert "<pad>" not in "".join(str(caption) for caption in singles)
+
+    def test_batch_failure_falls_back_to_single_images(self) -> None:
+        engine = HFCaptionEngine("test/model")
+        engine._pipeline = Mock(side_effect=[RuntimeError("out of memory"), "First", "Second"])
+
+        assert engine.generate_batch(_images(2)) == ["First", "Second"]
+        assert engine._pipeline.call_count == 3
+
+    def test_single_image_uses_generate(self) -> None:
+        engine = HFCaptionEngine("test/model")
+        engine._pipeline = Mock(return_value=[{"generated_text": "solo"}])
+
+        assert engine.generate_batch(_images(1)) == ["Solo"]
+        assert engine.generate_batch([]) == []
+
+
+class TestApplyCaptionsBatching:
+    """Test that apply_captions_to_images batches cache misses."""
+
+    def _assets(self, tmp_path: Path, count: int) -> list[ImageAsset]:
+        assets = []
+        for i, image in enumerate(_images(count)):
+            name = f"img{i}.png"
+            image.save(tmp_path / name)
+            assets.append(ImageAsset(src=f"assets/{name}", name=name, page_no=1))
+        return assets
+
+    def test_misses_are_grouped_by_caption_batch_size(self, tmp_path: Path) -> None:
+        assets = self._assets(tmp_path, 5)
+        engine = Mock()
+        engine.is_available.return_value = True
+        engine.generate_batch.side_effect = lambda images: [f"Caption {len(images)}"] * len(images)
+        cache = Mock()
+        # Second image is a cache hit; the others are misses
+        cache.get.side_effect = [object(), "Cached", object(), object(), object()]
+
+        options = PdfPipelineOptions(picture_descriptions=True, caption_batch_size=2)
+        apply_captions_to_images(assets, tmp_path, options, engine, cache)
+
+        assert [len(call.args[0]) for call in engine.generate_batch.call_args_list] == [2, 2]
+        assert [a.caption for a in assets] == ["Caption 2", "Cached", "Caption 2", "Caption 2", "Caption 2"]
+        assert cache.set.call_count == 4
+
+    def test_failed_batch_does_not_abort_captioning(self, tmp_path: Path) -> None:
+        assets = self._assets(tmp_path, 3)
+        engine = Mock()
+        engine.is_available.return_value = True
+        engine.generate_batch.side_effect = [RuntimeError("boom"), ["Last"]]
+        cache = Mock()
+        cache.get.return_value = object()
+        events: list[tuple[str, dict]] = []
+
+        options = PdfPipelineOptions(picture_descriptions=True, caption_batch_size=2)
+        apply_captions_to_images(assets, tmp_path, options, engine, cache, lambda e, p: events.append((e, p)))
+
+        assert [a.caption for a in assets] == [None, None, "Last"]
+        assert events[-1] == ("caption:batch_completed", {"total_images": 3, "captioned_count": 1})
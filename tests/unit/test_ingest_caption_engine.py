@@ -140,7 +140,6 @@ class TestCaptionCache:
         cache = CaptionCache(max_size=10)
         assert cache._max_size == 10
         assert len(cache._cache) == 0
-        assert len(cache._access_order) == 0
 
     def test_get_miss(self) -> None:
         """Test cache miss."""
@@ -237,7 +236,6 @@ class TestCaptionCache:
         cache.clear()
 
         assert len(cache._cache) == 0
-        assert len(cache._access_order) == 0
 
         # Both should return sentinel objects (not found)
         result1 = cache.get(image1)
@@ -22,6 +22,7 @@ class MockCaptionEngine:
         self._available = available
         self._caption = caption
         self.generate_calls: list[Image.Image] = []
+        self.batch_sizes: list[int] = []
 
     def is_available(self) -> bool:
         """Mock availability check."""
@@ -34,6 +35,11 @@ class MockCaptionEngine:
             return None
         return self._caption
 
+    def generate_batch(self, pil_images: list[Image.Image]) -> list[str | None]:
+        """Mock batched caption generation."""
+        self.batch_sizes.append(len(pil_images))
+        return [self.generate(pil_image) for pil_image in pil_images]
+
 
 class MockCaptionCache:
     """Mock caption cache for testing."""
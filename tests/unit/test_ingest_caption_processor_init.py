@@ -49,7 +49,7 @@ class TestInitializeCaptionComponents:
         assert events[0]["reason"] == "no_vlm_repo_id"
 
     @patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine")
-    @patch("pdf2foundry.ingest.caption_processor.CaptionCache")
+    @patch("pdf2foundry.ingest.caption_processor.create_caption_cache")
     def test_initialize_success(self, mock_cache_class: Mock, mock_engine_class: Mock) -> None:
         """Test successful initialization."""
         options = PdfPipelineOptions(picture_descriptions=True, vlm_repo_id="microsoft/Florence-2-base")
@@ -75,7 +75,7 @@ class TestInitializeCaptionComponents:
 
         # Should create engine with correct model ID
         mock_engine_class.assert_called_once_with("microsoft/Florence-2-base")
-        mock_cache_class.assert_called_once_with(max_size=2000)
+        mock_cache_class.assert_called_once_with(options, mock_engine, 2000)
 
         # Should emit initialized event
         assert len(events) == 1
@@ -83,7 +83,7 @@ class TestInitializeCaptionComponents:
         assert events[0]["model_id"] == "microsoft/Florence-2-base"
 
     @patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine")
-    @patch("pdf2foundry.ingest.caption_processor.CaptionCache")
+    @patch("pdf2foundry.ingest.caption_processor.create_caption_cache")
     def test_initialize_engine_unavailable(self, mock_cache_class: Mock, mock_engine_class: Mock) -> None:
         """Test initialization when engine is unavailable."""
         options = PdfPipelineOptions(picture_descriptions=True, vlm_repo_id="microsoft/Florence-2-base")
@@ -138,7 +138,7 @@ class TestInitializeCaptionComponents:
         assert events[0]["error"] == "Model not found"
 
     @patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine")
-    @patch("pdf2foundry.ingest.caption_processor.CaptionCache")
+    @patch("pdf2foundry.ingest.caption_processor.create_caption_cache")
     def test_initialize_with_shared_cache_limits(self, mock_cache_class: Mock, mock_engine_class: Mock) -> None:
         """Test initialization with shared image cache limits."""
         options = PdfPipelineOptions(picture_descriptions=True, vlm_repo_id="microsoft/Florence-2-base")
@@ -162,4 +162,4 @@ class TestInitializeCaptionComponents:
         assert cache is mock_cache
 
         # Should use cache size from shared cache
-        mock_cache_class.assert_called_once_with(max_size=5000)
+        mock_cache_class.assert_called_once_with(options, mock_engine, 5000)
@@ -177,7 +177,7 @@ class TestCaptionIntegration:
         assert "Model not found" in caption_events[0]["error"]
 
     @patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine")
-    @patch("pdf2foundry.ingest.caption_processor.CaptionCache")
+    @patch("pdf2foundry.ingest.caption_processor.create_caption_cache")
     def test_extract_content_with_captions_success(
         self, mock_cache_class: Mock, mock_engine_class: Mock, tmp_path: Path
     ) -> None:
@@ -185,7 +185,7 @@ class TestCaptionIntegration:
         # Mock successful caption engine
         mock_engine = Mock()
         mock_engine.is_available.return_value = True
-        mock_engine.generate.return_value = "A test image caption"
+        mock_engine.generate_batch.side_effect = lambda images: ["A test image caption"] * len(images)
         mock_engine_class.return_value = mock_engine
 
         # Mock cache
@@ -225,7 +225,7 @@ class TestCaptionIntegration:
         assert completion_events[0]["captioned_count"] == len(out.images)
 
     @patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine")
-    @patch("pdf2foundry.ingest.caption_processor.CaptionCache")
+    @patch("pdf2foundry.ingest.caption_processor.create_caption_cache")
     def test_extract_content_with_captions_cache_hit(
         self, mock_cache_class: Mock, mock_engine_class: Mock, tmp_path: Path
     ) -> None:
@@ -252,10 +252,10 @@ class TestCaptionIntegration:
             assert image.alt_text == "Cached caption"
 
         # Engine generate should not be called due to cache hit
-        mock_engine.generate.assert_not_called()
+        mock_engine.generate_batch.assert_not_called()
 
     @patch("pdf2foundry.ingest.caption_processor.HFCaptionEngine")
-    @patch("pdf2foundry.ingest.caption_processor.CaptionCache")
+    @patch("pdf2foundry.ingest.caption_processor.create_caption_cache")
     def test_extract_content_with_captions_no_caption_generated(
         self, mock_cache_class: Mock, mock_engine_class: Mock, tmp_path: Path
     ) -> None:
@@ -263,7 +263,7 @@ class TestCaptionIntegration:
         # Mock caption engine that returns None
         mock_engine = Mock()
         mock_engine.is_available.return_value = True
-        mock_engine.generate.return_value = None
+        mock_engine.generate_batch.side_effect = lambda images: [None] * len(images)
         mock_engine_class.return_value = mock_engine
 
         # Mock cache miss
@@ -46,9 +46,10 @@ def test_copy_referenced_local_image(tmp_path: Path) -> None:
     src_img = tmp_path / "orig.png"
     src_img.write_bytes(b"\x89PNG\r\n\x1a\n")
     out = extract_semantic_content(_FakeDocReferenced(src_img), tmp_path, PdfPipelineOptions())
-    # Should have at least one referenced image copied
-    assert any(img.name == src_img.name for img in out.images)
-    # Copied file exists under assets/
-    assert (tmp_path / src_img.name).exists() or (tmp_path / "assets" / src_img.name).exists()
+    # Should have at least one referenced image stored under its content hash
+    stored = [img for img in out.images if img.name.endswith(".png")]
+    assert stored
+    # Stored file exists under assets/ with the same content
+    assert (tmp_path / stored[0].name).read_bytes() == src_img.read_bytes()
     # HTML rewritten
     assert "assets/" in out.pages[0].html
@@ -11,7 +11,7 @@ from pdf2foundry.ingest.ingestion import (
     JsonOpts,
     JsonValidationError,
     ingest_docling,
-    load_json_file,
+    load_json_data,
     try_load_doc_from_json,
     validate_doc,
 )
@@ -46,7 +46,7 @@ def test_ingest_docling_converts_and_emits(monkeypatch: pytest.MonkeyPatch) -> N
 
     dummy = _DummyDoc(pages=4)
 
-    def fake_convert(_: Path) -> _DummyDoc:
+    def fake_convert(_: Path, **__: object) -> _DummyDoc:
         return dummy
 
     # Patch the symbol resolved inside ingest_docling by its fully qualified import
@@ -65,7 +65,7 @@ def test_ingest_docling_writes_json_when_path(
 ) -> None:
     dummy = _DummyDoc(pages=1)
 
-    def fake_convert(_: Path) -> _DummyDoc:
+    def fake_convert(_: Path, **__: object) -> _DummyDoc:
         return dummy
 
     monkeypatch.setattr("pdf2foundry.ingest.docling_adapter.run_docling_conversion", fake_convert)
@@ -179,56 +179,92 @@ def test_validate_doc_missing_export_method() -> None:
 def test_validate_doc_export_method_fails() -> None:
     """Test that export_to_html method failure is caught."""
     doc = _InvalidDoc(pages=3, export_fails=True)
+    validate_doc(doc)  # Structural checks do not render the document
     with pytest.raises(JsonValidationError, match="export_to_html\\(\\) method failed"):
-        validate_doc(doc)
+        validate_doc(doc, deep=True)
 
 
 def test_validate_doc_export_returns_non_string() -> None:
     """Test that export_to_html returning non-string fails validation."""
     doc = _InvalidDoc(pages=3, export_returns_non_string=True)
     with pytest.raises(JsonValidationError, match="export_to_html\\(\\) must return a string"):
-        validate_doc(doc)
+        validate_doc(doc, deep=True)
+
+
+class _SchemaDoc(_DummyDoc):
+    """Document exposing DoclingDocument schema metadata."""
+
+    def __init__(self, schema_name: str = "DoclingDocument", version: str = "1.0.0", body: object = ()) -> None:
+        super().__init__(pages=2)
+        self.schema_name = schema_name
+        self.version = version
+        self.body = body
+        self.pages: dict[int, object] | None = {1: object(), 2: object()}
+
+    def export_to_html(self, **_: object) -> str:
+        raise AssertionError("Structural validation must not render the document")
+
 
+def test_validate_doc_checks_docling_schema(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test schema name, version and required field checks on native documents."""
+    monkeypatch.setattr("pdf2foundry.ingest.ingestion._supported_docling_schema_major", lambda: "1")
 
-def test_load_json_file_success(tmp_path: Path) -> None:
+    validate_doc(_SchemaDoc())  # type: ignore[arg-type]
+
+    with pytest.raises(JsonValidationError, match="Unexpected schema 'Other'"):
+        validate_doc(_SchemaDoc(schema_name="Other"))  # type: ignore[arg-type]
+    with pytest.raises(JsonValidationError, match=r"Unsupported schema version 2\.0\.0"):
+        validate_doc(_SchemaDoc(version="2.0.0"))  # type: ignore[arg-type]
+    with pytest.raises(JsonValidationError, match="Missing required fields: body"):
+        validate_doc(_SchemaDoc(body=None))  # type: ignore[arg-type]
+
+
+def test_validate_doc_accepts_real_docling_document() -> None:
+    """Test that a current DoclingDocument passes structural validation."""
+    docling_document = pytest.importorskip("docling_core.types.doc.document")
+    doc = docling_document.DoclingDocument(name="book")
+    doc.add_page(page_no=1, size=docling_document.Size(width=100, height=100))
+
+    validate_doc(doc)
+
+
+def test_load_json_data_success(tmp_path: Path) -> None:
     """Test successful JSON file loading."""
     json_file = tmp_path / "test.json"
-    json_content = '{"test": "value"}'
-    json_file.write_text(json_content, encoding="utf-8")
+    json_file.write_text('{"test": "value"}', encoding="utf-8")
 
-    result = load_json_file(json_file)
-    assert result == json_content
+    assert load_json_data(json_file) == {"test": "value"}
 
 
-def test_load_json_file_missing_file(tmp_path: Path) -> None:
+def test_load_json_data_missing_file(tmp_path: Path) -> None:
     """Test that missing file raises JsonLoadError."""
     missing_file = tmp_path / "missing.json"
     with pytest.raises(JsonLoadError, match="Failed to load JSON from.*missing.json"):
-        load_json_file(missing_file)
+        load_json_data(missing_file)
 
 
-def test_load_json_file_invalid_json(tmp_path: Path) -> None:
+def test_load_json_data_invalid_json(tmp_path: Path) -> None:
     """Test that invalid JSON raises JsonLoadError."""
     json_file = tmp_path / "invalid.json"
     json_file.write_text("{ invalid json", encoding="utf-8")
 
     with pytest.raises(JsonLoadError, match="Failed to load JSON from.*invalid.json"):
-        load_json_file(json_file)
+        load_json_data(json_file)
 
 
-def test_load_json_file_permission_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_load_json_data_permission_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that permission errors are handled properly."""
     json_file = tmp_path / "test.json"
     json_file.write_text('{"test": "value"}', encoding="utf-8")
 
-    # Mock read_text to raise PermissionError
-    def mock_read_text(*args: Any, **kwargs: Any) -> str:
+    # Mock the reader to raise PermissionError
+    def mock_read_json_file(*args: Any, **kwargs: Any) -> Any:
         raise PermissionError("Permission denied")
 
-    monkeypatch.setattr(Path, "read_text", mock_read_text)
+    monkeypatch.setattr("pdf2foundry.ingest.json_io.read_json_file", mock_read_json_file)
 
     with pytest.raises(JsonLoadError, match="Failed to load JSON from.*test.json.*Permission denied"):
-        load_json_file(json_file)
+        load_json_data(json_file)
 
 
 def test_try_load_doc_from_json_success(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -236,11 +272,11 @@ def test_try_load_doc_from_json_success(tmp_path: Path, monkeypatch: pytest.Monk
     json_file = tmp_path / "doc.json"
     json_file.write_text('{"num_pages": 3}', encoding="utf-8")
 
-    # Mock doc_from_json to return a valid document
-    def mock_doc_from_json(text: str) -> _DummyDoc:
+    # Mock doc_from_data to return a valid document
+    def mock_doc_from_data(data: object) -> _DummyDoc:
         return _DummyDoc(pages=3)
 
-    monkeypatch.setattr("pdf2foundry.ingest.json_io.doc_from_json", mock_doc_from_json)
+    monkeypatch.setattr("pdf2foundry.ingest.json_io.doc_from_data", mock_doc_from_data)
 
     doc, warnings = try_load_doc_from_json(json_file, fallback_on_failure=False)
     assert doc is not None
@@ -272,11 +308,11 @@ def test_try_load_doc_from_json_validation_error_fallback_enabled(tmp_path: Path
     json_file = tmp_path / "invalid_doc.json"
     json_file.write_text('{"num_pages": 3}', encoding="utf-8")
 
-    # Mock doc_from_json to return an invalid document
-    def mock_doc_from_json(text: str) -> _InvalidDoc:
+    # Mock doc_from_data to return an invalid document
+    def mock_doc_from_data(data: object) -> _InvalidDoc:
         return _InvalidDoc(pages=0)  # Invalid: zero pages
 
-    monkeypatch.setattr("pdf2foundry.ingest.json_io.doc_from_json", mock_doc_from_json)
+    monkeypatch.setattr("pdf2foundry.ingest.json_io.doc_from_data", mock_doc_from_data)
 
     doc, warnings = try_load_doc_from_json(json_file, fallback_on_failure=True)
     assert doc is None
@@ -289,11 +325,11 @@ def test_try_load_doc_from_json_validation_error_fallback_disabled(tmp_path: Pat
     json_file = tmp_path / "invalid_doc.json"
     json_file.write_text('{"num_pages": 3}', encoding="utf-8")
 
-    # Mock doc_from_json to return an invalid document
-    def mock_doc_from_json(text: str) -> _InvalidDoc:
+    # Mock doc_from_data to return an invalid document
+    def mock_doc_from_data(data: object) -> _InvalidDoc:
         return _InvalidDoc(pages=0)  # Invalid: zero pages
 
-    monkeypatch.setattr("pdf2foundry.ingest.json_io.doc_from_json", mock_doc_from_json)
+    monkeypatch.setattr("pdf2foundry.ingest.json_io.doc_from_data", mock_doc_from_data)
 
     with pytest.raises(
         JsonValidationError,
@@ -112,44 +112,74 @@ class TestTesseractOcrEngine:
             assert engine._available is False
 
     def test_run_pil_image(self) -> None:
-        """Test OCR with PIL Image input."""
+        """Test OCR with PIL Image input uses a single Tesseract pass."""
         engine = TesseractOcrEngine()
 
         # Create a mock PIL image
         mock_image = Mock(spec=Image.Image)
 
-        # Mock pytesseract
-        mock_pytesseract = Mock()
-        mock_pytesseract.image_to_string.return_value = "Hello world"
-        mock_pytesseract.image_to_data.return_value = {"conf": ["95", "90", "85"]}
-        mock_pytesseract.image_to_osd.return_value = {"script": "Latin"}
-        mock_pytesseract.Output.DICT = "dict"
+        data = {
+            "text": ["", "Hello", "world", "Again"],
+            "conf": ["-1", "95", "90", "85"],
+            "block_num": [1, 1, 1, 2],
+            "par_num": [1, 1, 1, 1],
+            "line_num": [0, 1, 1, 1],
+            "left": [0, 10, 60, 10],
+            "top": [0, 20, 22, 50],
+            "width": [200, 40, 45, 50],
+            "height": [100, 10, 10, 12],
+        }
 
         with (
             patch(
                 "pdf2foundry.ingest.ocr_engine.pytesseract.get_tesseract_version",
                 return_value="5.0.0",
             ),
-            patch(
-                "pdf2foundry.ingest.ocr_engine.pytesseract.image_to_string",
-                return_value="Hello world",
-            ),
-            patch(
-                "pdf2foundry.ingest.ocr_engine.pytesseract.image_to_data",
-                return_value={"conf": ["95", "90", "85"]},
-            ),
-            patch(
-                "pdf2foundry.ingest.ocr_engine.pytesseract.image_to_osd",
-                return_value={"script": "Latin"},
-            ),
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_string") as mock_to_string,
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_data", return_value=data) as mock_to_data,
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_osd") as mock_osd,
             patch("pdf2foundry.ingest.ocr_engine.pytesseract.Output.DICT", "dict"),
         ):
             results = engine.run(mock_image)
 
-            assert len(results) == 1
-            assert results[0].text == "Hello world"
-            assert results[0].confidence == 0.9  # (95+90+85)/3/100
-            assert results[0].language == "Latin"
+            assert [r.text for r in results] == ["Hello world", "Again"]
+            assert results[0].confidence == pytest.approx(0.925)  # (95+90)/2/100
+            assert results[0].bbox == (10.0, 20.0, 95.0, 12.0)
+            assert [r.paragraph for r in results] == [0, 1]
+            assert results[0].language is None  # Script detection is opt-in
+            mock_to_data.assert_called_once()
+            mock_to_string.assert_not_called()
+            mock_osd.assert_not_called()
+
+    def test_run_detects_script_on_thumbnail(self) -> None:
+        """Test that requested script detection runs OSD on a downscaled image."""
+        engine = TesseractOcrEngine(detect_script=True)
+        image = Image.new("L", (3000, 1500), color=255)
+        data = {"text": ["Hello"], "conf": ["95"], "block_num": [1], "par_num": [1], "line_num": [1]}
+
+        with (
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.get_tesseract_version", return_value="5.0.0"),
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_data", return_value=data),
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_osd", return_value={"script": "Latin"}) as mock_osd,
+        ):
+            results = engine.run(image)
+
+        assert results[0].language == "Latin"
+        osd_image = mock_osd.call_args.args[0]
+        assert max(osd_image.size) == 1024
+        # An explicit language skips detection entirely
+        with (
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.get_tesseract_version", return_value="5.0.0"),
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_data", return_value=data),
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_osd") as mock_osd,
+        ):
+            assert engine.run(image, language="fra")[0].language == "fra"
+            mock_osd.assert_not_called()
+
+    def test_cache_fingerprint_includes_script_detection(self) -> None:
+        """Test that results with and without script detection are cached separately."""
+        with patch("pdf2foundry.ingest.ocr_engine.pytesseract.get_tesseract_version", return_value="5.0.0"):
+            assert TesseractOcrEngine().cache_fingerprint() != TesseractOcrEngine(detect_script=True).cache_fingerprint()
 
     def test_run_empty_text(self) -> None:
         """Test OCR when no text is found."""
@@ -169,7 +199,7 @@ class TestTesseractOcrEngine:
                 return_value="5.0.0",
             ),
             patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_string", return_value=""),
-            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_data", return_value={"conf": []}),
+            patch("pdf2foundry.ingest.ocr_engine.pytesseract.image_to_data", return_value={"text": [], "conf": []}),
             patch("pdf2foundry.ingest.ocr_engine.pytesseract.Output.DICT", "dict"),
         ):
             results = engine.run(mock_image)
@@ -219,7 +249,7 @@ class TestOcrCache:
     def test_init(self) -> None:
         """Test cache initialization."""
         cache = OcrCache()
-        assert cache._cache == {}
+        assert len(cache._cache) == 0
 
     def test_get_set_basic(self) -> None:
         """Test basic cache get/set functionality."""
@@ -371,3 +401,39 @@ class TestNeedsOcr:
     def test_needs_ocr_invalid_mode(self) -> None:
         """Test with invalid OCR mode."""
         assert needs_ocr("test", "invalid") is False
+
+
+class TestOcrLayout:
+    """Test interpretation of image_to_data output."""
+
+    def test_data_to_text_handles_missing_layout_columns(self) -> None:
+        from pdf2foundry.ingest.ocr_layout import data_to_text, mean_confidence
+
+        data = {"text": ["one", " ", "two"], "conf": ["90", "-1", "bad"]}
+
+        assert data_to_text(data) == "one two"
+        assert mean_confidence(data) == 0.9
+        assert mean_confidence({}) == 0.0
+
+    def test_data_to_lines_groups_words_per_line(self) -> None:
+        from pdf2foundry.ingest.ocr_layout import data_to_lines
+
+        data = {
+            "text": ["First", "line", "Second", "Next"],
+            "conf": ["80", "90", "70", "60"],
+            "block_num": [1, 1, 1, 1],
+            "par_num": [1, 1, 1, 2],
+            "line_num": [1, 1, 2, 1],
+            "left": [5, 50, 5, 5],
+            "top": [10, 8, 30, 60],
+            "width": [40, 30, 60, 30],
+            "height": [10, 12, 10, 10],
+        }
+
+        lines = data_to_lines(data)
+
+        assert [line.text for line in lines] == ["First line", "Second", "Next"]
+        assert lines[0].bbox == (5.0, 8.0, 75.0, 12.0)
+        assert lines[0].confidence == pytest.approx(0.85)
+        assert [line.paragraph for line in lines] == [0, 0, 1]
+        assert data_to_lines({"text": ["", " "]}) == []
@@ -354,6 +354,25 @@ class TestMergeOcrResults:
         assert 'data-ocr-language="eng"' in result
         assert 'data-bbox="10.0,20.0,100.0,50.0"' in result
 
+    def test_merge_lines_into_paragraphs_in_reading_order(self) -> None:
+        """Test that line results are grouped per paragraph and sorted top to bottom."""
+        html = "<p>Original</p>"
+        ocr_results = [
+            OcrResult("second line", confidence=0.8, bbox=(10.0, 40.0, 80.0, 10.0), paragraph=0),
+            OcrResult("first line", confidence=0.6, bbox=(10.0, 20.0, 90.0, 10.0), paragraph=0),
+            OcrResult("next paragraph", confidence=0.9, bbox=(10.0, 80.0, 70.0, 10.0), paragraph=1),
+        ]
+
+        result = _merge_ocr_results(ocr_results, html)
+
+        assert result.index("first line") < result.index("second line") < result.index("next paragraph")
+        assert result.count("<p ") == 2
+        assert 'data-bbox="10.0,20.0,90.0,30.0"' in result  # Union of the paragraph's lines
+        assert 'data-ocr-confidence="0.700"' in result
+        assert (
+            '<span data-ocr="true" data-ocr-confidence="0.600" data-bbox="10.0,20.0,90.0,10.0">first line</span>' in result
+        )
+
 
 class TestExtractSemanticContentOcrIntegration:
     """Test OCR integration in extract_semantic_content function."""
@@ -368,7 +387,7 @@ class TestExtractSemanticContentOcrIntegration:
 
         with (
             patch("pdf2foundry.ingest.content_extractor.TesseractOcrEngine") as mock_engine_class,
-            patch("pdf2foundry.ingest.content_extractor.OcrCache") as mock_cache_class,
+            patch("pdf2foundry.ingest.content_extractor.create_ocr_cache") as mock_cache_class,
         ):
             mock_engine = Mock()
             mock_engine.is_available.return_value = True
@@ -396,7 +415,7 @@ class TestExtractSemanticContentOcrIntegration:
 
         with (
             patch("pdf2foundry.ingest.content_extractor.TesseractOcrEngine", return_value=mock_engine),
-            patch("pdf2foundry.ingest.content_extractor.OcrCache", return_value=mock_cache),
+            patch("pdf2foundry.ingest.content_extractor.create_ocr_cache", return_value=mock_cache),
             patch("pdf2foundry.ingest.content_extractor.apply_ocr_to_page") as mock_apply_ocr,
         ):
             mock_apply_ocr.return_value = "<p>Test content</p>"
@@ -446,7 +465,7 @@ class TestExtractSemanticContentOcrIntegration:
 
         with (
             patch("pdf2foundry.ingest.content_extractor.TesseractOcrEngine", return_value=mock_engine),
-            patch("pdf2foundry.ingest.content_extractor.OcrCache", return_value=mock_cache),
+            patch("pdf2foundry.ingest.content_extractor.create_ocr_cache", return_value=mock_cache),
             patch("pdf2foundry.ingest.content_extractor.apply_ocr_to_page") as mock_apply_ocr,
         ):
             mock_apply_ocr.return_value = "<p>Test content</p>"
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import Any
 
-from pdf2foundry.ingest.json_io import atomic_write_text, doc_from_json, doc_to_json
+import pytest
+
+from pdf2foundry.ingest import json_io
+from pdf2foundry.ingest.json_io import (
+    atomic_write_text,
+    doc_from_data,
+    doc_from_json,
+    doc_from_json_file,
+    doc_to_json,
+    read_json_file,
+)
 
 
 class _NativeDoc:
@@ -80,3 +92,62 @@ def test_atomic_write_text(tmp_path: Path) -> None:
     atomic_write_text(path, data)
     assert path.exists()
     assert path.read_text(encoding="utf-8") == data
+
+
+def _write_cache(path: Path, pages: int) -> None:
+    data = {"schema_version": 1, "num_pages": pages, "pages_html": [f"<p>{i}</p>" for i in range(pages)]}
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_doc_from_json_file_parses_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loading a cache file parses the JSON exactly once and never builds a str copy."""
+    path = tmp_path / "doc.json"
+    _write_cache(path, 3)
+    calls: list[type] = []
+    original = json_io._loads
+
+    def counting_loads(data: Any) -> Any:
+        calls.append(type(data))
+        return original(data)
+
+    def no_read_text(*args: Any, **kwargs: Any) -> str:
+        raise AssertionError("read_text should not be used")
+
+    monkeypatch.setattr(json_io, "_loads", counting_loads)
+    monkeypatch.setattr(Path, "read_text", no_read_text)
+
+    doc = doc_from_json_file(path)
+
+    assert calls == [memoryview]
+    assert doc.num_pages() == 3
+    assert doc.export_to_html(page_no=2) == "<p>2</p>"
+
+
+def test_read_json_file_stdlib_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without orjson the standard library parser is used."""
+    path = tmp_path / "doc.json"
+    _write_cache(path, 2)
+    monkeypatch.setattr(json_io, "_orjson", None)
+
+    assert read_json_file(path)["num_pages"] == 2
+
+
+@pytest.mark.parametrize("content", ["", "{ invalid json"])
+def test_read_json_file_invalid_raises_value_error(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "doc.json"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        read_json_file(path)
+
+
+def test_doc_from_data_native_docling_document() -> None:
+    """Native DoclingDocument payloads are validated into a DoclingDocument."""
+    document = pytest.importorskip("docling_core.types.doc.document")
+    source = document.DoclingDocument(name="book")
+    source.add_page(page_no=1, size=document.Size(width=100, height=100))
+
+    doc = doc_from_data(source.export_to_dict())
+
+    assert isinstance(doc, document.DoclingDocument)
+    assert doc.num_pages() == 1
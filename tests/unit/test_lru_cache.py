@@ -0,0 +1,85 @@
+"""Tests for the shared LRU mapping."""
+
+import time
+
+import pytest
+
+from pdf2foundry.ingest.lru_cache import LruCache
+
+
+class TestLruCache:
+    """Test entry-count and byte budgets."""
+
+    def test_get_touches_and_peek_does_not(self) -> None:
+        cache: LruCache[str, int] = LruCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.get("a") == 1
+        assert cache.peek("b") == 2
+        cache.put("c", 3)  # Evicts "b", the least recently used
+
+        assert list(cache) == ["a", "c"]
+        assert cache.evictions == 1
+
+    def test_get_default_and_stored_none(self) -> None:
+        cache: LruCache[str, str | None] = LruCache()
+        cache.put("none", None)
+
+        assert "none" in cache
+        assert cache.get("missing", "default") == "default"
+        assert cache.get("none", "default") is None
+
+    def test_byte_budget_evicts_oldest(self) -> None:
+        evicted: list[str] = []
+        cache: LruCache[str, bytes] = LruCache(max_bytes=10, sizeof=len, on_evict=lambda key, _: evicted.append(key))
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.put("a", b"12")  # Replacing an entry updates the byte total
+        assert cache.total_bytes == 6
+
+        cache.put("c", b"123456")
+
+        assert evicted == ["b"]
+        assert cache.total_bytes == 8
+        assert cache.pop("a") == b"12"
+        assert cache.total_bytes == 6
+
+    def test_oversized_entry_is_kept_alone(self) -> None:
+        cache: LruCache[str, bytes] = LruCache(max_bytes=4, sizeof=len)
+        cache.put("small", b"12")
+        cache.put("big", b"123456")
+
+        assert list(cache) == ["big"]
+
+    def test_evict_oldest(self) -> None:
+        cache: LruCache[str, bytes] = LruCache(sizeof=len)
+        assert cache.evict_oldest() is None
+        cache.put("a", b"12")
+        cache.put("b", b"3")
+
+        assert cache.evict_oldest() == ("a", b"12")
+        assert cache.total_bytes == 1
+        assert cache.evictions == 1
+
+    def test_byte_budget_requires_sizeof(self) -> None:
+        with pytest.raises(ValueError, match="sizeof"):
+            LruCache(max_bytes=10)
+
+    def test_touch_and_evict_are_constant_time(self) -> None:
+        """Hits on a large cache cost about the same as on a small one."""
+
+        def time_hits(size: int) -> float:
+            cache: LruCache[int, int] = LruCache(max_entries=size)
+            for i in range(size):
+                cache.put(i, i)
+            start = time.perf_counter()
+            for i in range(20000):
+                cache.get(i % 16)
+                cache.put(size + i, i)
+            return time.perf_counter() - start
+
+        small = min(time_hits(100) for _ in range(3))
+        large = min(time_hits(50000) for _ in range(3))
+
+        assert large < small * 5
@@ -2,7 +2,7 @@
 
 import pytest
 
-from pdf2foundry.model.pipeline_options import OcrMode, PdfPipelineOptions, TableMode
+from pdf2foundry.model.pipeline_options import OcrMode, PdfPipelineOptions, TableMode, WorkerPoolLifetime
 
 
 class TestTableMode:
@@ -137,6 +137,30 @@ class TestPdfPipelineOptions:
         with pytest.raises(ValueError, match="Workers must be >= 1"):
             PdfPipelineOptions.from_cli(workers=-1)
 
+    def test_from_cli_image_cache_budget(self) -> None:
+        """Test from_cli maps and validates the image cache memory budget."""
+        assert PdfPipelineOptions.from_cli(image_cache_mb=0).image_cache_mb == 0
+        with pytest.raises(ValueError, match="Image cache budget must be >= 0 MB"):
+            PdfPipelineOptions.from_cli(image_cache_mb=-1)
+
+    def test_from_cli_batching_and_pool_lifetime(self) -> None:
+        """Test from_cli maps page batch size and worker pool lifetime."""
+        options = PdfPipelineOptions.from_cli(page_batch_size=8, worker_pool="process")
+        assert options.page_batch_size == 8
+        assert options.worker_pool == WorkerPoolLifetime.PROCESS
+
+        with pytest.raises(ValueError, match="Page batch size must be >= 0"):
+            PdfPipelineOptions.from_cli(page_batch_size=-1)
+        with pytest.raises(ValueError, match="Invalid worker pool lifetime 'forever'"):
+            PdfPipelineOptions.from_cli(worker_pool="forever")
+
+    def test_from_cli_caption_batch_size(self) -> None:
+        """Test from_cli validates the caption batch size."""
+        assert PdfPipelineOptions.from_cli(caption_batch_size=4).caption_batch_size == 4
+
+        with pytest.raises(ValueError, match="Caption batch size must be >= 1"):
+            PdfPipelineOptions.from_cli(caption_batch_size=0)
+
     def test_to_dict(self) -> None:
         """Test to_dict serialization."""
         options = PdfPipelineOptions(
@@ -153,13 +177,21 @@ class TestPdfPipelineOptions:
         expected = {
             "tables_mode": "structured",
             "ocr_mode": "on",
+            "ocr_detect_script": False,
             "picture_descriptions": True,
             "vlm_repo_id": "test-model",
+            "caption_batch_size": 8,
             "text_coverage_threshold": 0.1,
             "pages": [1, 3, 5],
             "workers": 4,
             "workers_effective": 1,
             "reflow_columns": True,
+            "page_batch_size": 0,
+            "worker_pool": "document",
+            "disk_cache": True,
+            "cache_dir": None,
+            "image_cache_mb": 512,
+            "streaming": False,
         }
 
         assert options.to_dict() == expected
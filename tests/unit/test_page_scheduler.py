@@ -0,0 +1,182 @@
+"""Tests for adaptive page batching and persistent worker pools."""
+
+import logging
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from pdf2foundry.ingest import page_scheduler
+from pdf2foundry.ingest.page_scheduler import (
+    AdaptiveBatchPlanner,
+    discard_page_pool,
+    get_page_pool,
+    iter_page_batches,
+    shutdown_page_pools,
+)
+from pdf2foundry.ingest.parallel_processor import PageProcessingContext, PageProcessingResult
+from pdf2foundry.model.content import HtmlPage
+from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+
+def _result(page_no: int, seconds: float = 0.01) -> PageProcessingResult:
+    return PageProcessingResult(
+        page_no=page_no,
+        html_page=HtmlPage(html=f"<p>{page_no}</p>", page_no=page_no),
+        images=[],
+        tables=[],
+        links=[],
+        processing_time=seconds,
+    )
+
+
+def _contexts(count: int, tmp_path: Path) -> list[PageProcessingContext]:
+    options = PdfPipelineOptions()
+    return [
+        PageProcessingContext(page_no=i, out_assets_path=str(tmp_path), name_prefix="test", pipeline_options=options)
+        for i in range(1, count + 1)
+    ]
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs each batch synchronously on submit."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def submit(self, fn: Any, batch: list[PageProcessingContext], *args: Any) -> Future:
+        self.batch_sizes.append(len(batch))
+        future: Future = Future()
+        try:
+            future.set_result(fn(batch, *args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _fake_batch(batch: list[PageProcessingContext], seconds: float) -> list[PageProcessingResult]:
+    return [_result(context.page_no, seconds) for context in batch]
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+class TestAdaptiveBatchPlanner:
+    """Test batch size planning."""
+
+    def test_probes_with_single_pages_before_measuring(self) -> None:
+        planner = AdaptiveBatchPlanner(workers=4)
+        assert planner.seconds_per_page is None
+        assert planner.next_size(100) == 1
+
+    def test_fixed_size_overrides_adaptation(self) -> None:
+        planner = AdaptiveBatchPlanner(workers=4, fixed_size=8)
+        assert planner.next_size(100) == 8
+        assert planner.next_size(3) == 3
+
+    def test_fast_pages_grow_batches_up_to_fair_share(self) -> None:
+        planner = AdaptiveBatchPlanner(workers=2, target_batch_seconds=0.5, max_batch_size=32)
+        planner.record([_result(1, 0.01)])
+        # 50 pages fit the time budget, but 40 remaining pages allow only 10 per batch
+        assert planner.next_size(40) == 10
+        assert planner.next_size(1000) == 32
+
+    def test_slow_pages_keep_single_page_batches(self) -> None:
+        planner = AdaptiveBatchPlanner(workers=2)
+        planner.record([_result(1, 2.0)])
+        assert planner.next_size(100) == 1
+
+    def test_record_smooths_measurements(self) -> None:
+        planner = AdaptiveBatchPlanner(workers=2)
+        planner.record([_result(1, 1.0)])
+        planner.record([_result(2, 0.0)])
+        assert planner.seconds_per_page == pytest.approx(0.7)
+
+    def test_no_pages_left(self) -> None:
+        assert AdaptiveBatchPlanner(workers=2).next_size(0) == 0
+
+
+class TestIterPageBatches:
+    """Test batch submission and result collection."""
+
+    def test_collects_every_page_in_growing_batches(self, tmp_path: Path) -> None:
+        executor = _InlineExecutor()
+        planner = AdaptiveBatchPlanner(workers=1, target_batch_seconds=0.5)
+
+        results = iter_page_batches(
+            executor, _fake_batch, _contexts(20, tmp_path), planner, 0.1, max_in_flight=2  # type: ignore[arg-type]
+        )
+
+        assert [result.page_no for result in results] == list(range(1, 21))
+        assert executor.batch_sizes[0] == 1
+        assert max(executor.batch_sizes) > 1
+        assert sum(executor.batch_sizes) == 20
+
+    def test_failed_batch_raises_and_logs(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        def failing_batch(batch: list[PageProcessingContext]) -> list[PageProcessingResult]:
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.ERROR), pytest.raises(RuntimeError, match="Page 1 processing failed"):
+            list(
+                iter_page_batches(
+                    _InlineExecutor(),  # type: ignore[arg-type]
+                    failing_batch,
+                    _contexts(3, tmp_path),
+                    AdaptiveBatchPlanner(workers=2),
+                    max_in_flight=1,
+                )
+            )
+        assert "Page 1 failed: boom" in caplog.text
+
+    def test_batch_ranges_are_named_in_errors(self, tmp_path: Path) -> None:
+        def failing_batch(batch: list[PageProcessingContext]) -> list[PageProcessingResult]:
+            raise ValueError("boom")
+
+        with pytest.raises(RuntimeError, match="Pages 1-3 processing failed"):
+            list(
+                iter_page_batches(
+                    _InlineExecutor(),  # type: ignore[arg-type]
+                    failing_batch,
+                    _contexts(3, tmp_path),
+                    AdaptiveBatchPlanner(workers=2, fixed_size=3),
+                    max_in_flight=1,
+                )
+            )
+
+
+class TestPersistentPools:
+    """Test the process-lifetime pool registry."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_pools(self) -> Any:
+        yield
+        shutdown_page_pools()
+
+    def test_same_configuration_reuses_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        created = []
+
+        def fake_pool(**kwargs: Any) -> Mock:
+            pool = Mock()
+            created.append(pool)
+            return pool
+
+        monkeypatch.setattr(page_scheduler, "ProcessPoolExecutor", fake_pool)
+
+        first = get_page_pool(2, "spawn")
+        assert get_page_pool(2, "spawn") is first
+        assert get_page_pool(3, "spawn") is not first
+        assert len(created) == 2
+
+        discard_page_pool(2, "spawn")
+        first.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert get_page_pool(2, "spawn") is not first
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="fork start method is only reliable on Linux")
+    def test_real_pool_survives_between_calls(self) -> None:
+        pool = get_page_pool(1, "fork")
+        assert pool.submit(_square, 3).result() == 9
+        assert get_page_pool(1, "fork").submit(_square, 4).result() == 16
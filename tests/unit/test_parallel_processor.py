@@ -3,6 +3,7 @@
 # ruff: noqa: SIM117
 
 import logging
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
@@ -16,7 +17,29 @@ from pdf2foundry.ingest.parallel_processor import (
     process_pages_parallel,
 )
 from pdf2foundry.model.content import HtmlPage
-from pdf2foundry.model.pipeline_options import PdfPipelineOptions, TableMode
+from pdf2foundry.model.pipeline_options import OcrMode, PdfPipelineOptions, TableMode
+
+
+def _completed_future(results: list[PageProcessingResult] | None = None, exc: Exception | None = None) -> Future:
+    """Build an already-resolved future as returned by a synchronous executor."""
+    future: Future = Future()
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(results or [])
+    return future
+
+
+def _submit_from(results: dict[int, PageProcessingResult], failing: dict[int, Exception] | None = None) -> Any:
+    """Create a submit() side effect that resolves each batch from precomputed results."""
+
+    def submit(_fn: Any, batch: list[PageProcessingContext], *_args: Any) -> Future:
+        for context in batch:
+            if failing and context.page_no in failing:
+                return _completed_future(exc=failing[context.page_no])
+        return _completed_future([results[context.page_no] for context in batch])
+
+    return submit
 
 
 class TestPageProcessingContext:
@@ -243,54 +266,44 @@ class TestProcessPagesParallel:
         options = PdfPipelineOptions()
         options.workers_effective = 2
 
-        # Mock executor and futures
+        # Mock executor
         mock_executor = Mock()
         mock_executor_class.return_value.__enter__.return_value = mock_executor
 
-        # Create mock futures and results
-        future1 = Mock()
-        future2 = Mock()
-
-        result1 = PageProcessingResult(
-            page_no=1,
-            html_page=HtmlPage(html="<p>Page 1</p>", page_no=1),
-            images=[],
-            tables=[],
-            links=[],
-            processing_time=0.1,
-        )
-        result2 = PageProcessingResult(
-            page_no=2,
-            html_page=HtmlPage(html="<p>Page 2</p>", page_no=2),
-            images=[],
-            tables=[],
-            links=[],
-            processing_time=0.2,
-        )
-
-        future1.result.return_value = result1
-        future2.result.return_value = result2
-
-        mock_executor.submit.side_effect = [future1, future2]
-
-        # Mock as_completed to return futures in order
-        with patch("pdf2foundry.ingest.parallel_processor.as_completed") as mock_as_completed:
-            mock_as_completed.return_value = [future1, future2]
-
-            # Process pages
-            pages, images, tables, links, total_time = process_pages_parallel(doc, selected_pages, tmp_path, options)
-
-            # Verify results
-            assert len(pages) == 2
-            assert pages[0].html == "<p>Page 1</p>"
-            assert pages[1].html == "<p>Page 2</p>"
-            assert images == []
-            assert tables == []
-            assert links == []
-            assert total_time > 0
-
-            # Verify executor was used correctly
-            assert mock_executor.submit.call_count == 2
+        results = {
+            1: PageProcessingResult(
+                page_no=1,
+                html_page=HtmlPage(html="<p>Page 1</p>", page_no=1),
+                images=[],
+                tables=[],
+                links=[],
+                processing_time=0.1,
+            ),
+            2: PageProcessingResult(
+                page_no=2,
+                html_page=HtmlPage(html="<p>Page 2</p>", page_no=2),
+                images=[],
+                tables=[],
+                links=[],
+                processing_time=0.2,
+            ),
+        }
+        mock_executor.submit.side_effect = _submit_from(results)
+
+        # Process pages
+        pages, images, tables, links, total_time = process_pages_parallel(doc, selected_pages, tmp_path, options)
+
+        # Verify results
+        assert len(pages) == 2
+        assert pages[0].html == "<p>Page 1</p>"
+        assert pages[1].html == "<p>Page 2</p>"
+        assert images == []
+        assert tables == []
+        assert links == []
+        assert total_time > 0
+
+        # Without timing data yet, the first batches hold a single page each
+        assert mock_executor.submit.call_count == 2
 
     @patch("pdf2foundry.ingest.parallel_processor.ProcessPoolExecutor")
     def test_parallel_processing_failure_fallback(self, mock_executor_class: Mock, tmp_path: Path) -> None:
@@ -332,10 +345,7 @@ class TestProcessPagesParallel:
         mock_executor = Mock()
         mock_executor_class.return_value.__enter__.return_value = mock_executor
 
-        # Create mock futures - one succeeds, one fails
-        future1 = Mock()
-        future2 = Mock()
-
+        # One page succeeds, one fails
         result1 = PageProcessingResult(
             page_no=1,
             html_page=HtmlPage(html="<p>Page 1</p>", page_no=1),
@@ -344,27 +354,19 @@ class TestProcessPagesParallel:
             links=[],
             processing_time=0.1,
         )
+        mock_executor.submit.side_effect = _submit_from({1: result1}, failing={2: Exception("Worker failed")})
 
-        future1.result.return_value = result1
-        future2.result.side_effect = Exception("Worker failed")
-
-        mock_executor.submit.side_effect = [future1, future2]
-
-        # Mock as_completed to return failing future first
-        with patch("pdf2foundry.ingest.parallel_processor.as_completed") as mock_as_completed:
-            mock_as_completed.return_value = [future2, future1]
-
-            with patch("pdf2foundry.ingest.parallel_processor._process_pages_sequential") as mock_sequential:
-                mock_sequential.return_value = ([], [], [], [], 1.0)
+        with patch("pdf2foundry.ingest.parallel_processor._process_pages_sequential") as mock_sequential:
+            mock_sequential.return_value = ([], [], [], [], 1.0)
 
-                # Process pages - should fallback due to worker exception
-                with caplog.at_level(logging.ERROR):  # Capture both ERROR and WARNING
-                    process_pages_parallel(doc, selected_pages, tmp_path, options)
+            # Process pages - should fallback due to worker exception
+            with caplog.at_level(logging.ERROR):  # Capture both ERROR and WARNING
+                process_pages_parallel(doc, selected_pages, tmp_path, options)
 
-                # Verify fallback was used
-                mock_sequential.assert_called_once()
-                # The test should check for the actual error message that gets logged
-                assert "Page 2 failed: Worker failed" in caplog.text
+            # Verify fallback was used
+            mock_sequential.assert_called_once()
+            # The test should check for the actual error message that gets logged
+            assert "Page 2 failed: Worker failed" in caplog.text
 
     def test_deterministic_ordering(self, tmp_path: Path) -> None:
         """Test that results are returned in deterministic page order."""
@@ -408,46 +410,58 @@ class TestProcessPagesParallel:
                 ),
             }
 
-            # Mock futures
-            futures = [Mock() for _ in range(3)]
-            for i, future in enumerate(futures):
-                page_no = selected_pages[i]
-                future.result.return_value = results[page_no]
-
-            mock_executor.submit.side_effect = futures
-
-            with patch("pdf2foundry.ingest.parallel_processor.as_completed") as mock_as_completed:
-                # Return futures in different order than submitted
-                mock_as_completed.return_value = [futures[2], futures[0], futures[1]]
+            # Resolve batches from the precomputed results
+            mock_executor.submit.side_effect = _submit_from(results)
 
-                # Process pages
-                pages, _, _, _, _ = process_pages_parallel(doc, selected_pages, tmp_path, options)
+            # Process pages
+            pages, _, _, _, _ = process_pages_parallel(doc, selected_pages, tmp_path, options)
 
-                # Verify results are in the same order as selected_pages
-                assert len(pages) == 3
-                assert pages[0].page_no == 1  # First in selected_pages
-                assert pages[1].page_no == 3  # Second in selected_pages
-                assert pages[2].page_no == 2  # Third in selected_pages
-                assert pages[0].html == "<p>Page 1</p>"
-                assert pages[1].html == "<p>Page 3</p>"
-                assert pages[2].html == "<p>Page 2</p>"
+            # Verify results are in the same order as selected_pages
+            assert len(pages) == 3
+            assert pages[0].page_no == 1  # First in selected_pages
+            assert pages[1].page_no == 3  # Second in selected_pages
+            assert pages[2].page_no == 2  # Third in selected_pages
+            assert pages[0].html == "<p>Page 1</p>"
+            assert pages[1].html == "<p>Page 3</p>"
+            assert pages[2].html == "<p>Page 2</p>"
 
 
 class TestIntegrationWithContentExtractor:
     """Test integration with the main content extractor."""
 
-    def test_parallel_condition_logic(self) -> None:
-        """Test the logic for determining when to use parallel processing."""
-        # Test the condition logic directly without importing content_extractor
-        # to avoid optional dependency issues in tests
-
-        # Simulate the condition from content_extractor.py
-        def should_use_parallel(workers_effective: int, ocr_engine: Any, caption_engine: Any) -> bool:
-            return workers_effective > 1 and ocr_engine is None and caption_engine is None
-
-        # Test cases
-        assert should_use_parallel(2, None, None) is True  # Should use parallel
-        assert should_use_parallel(1, None, None) is False  # Single worker
-        assert should_use_parallel(2, Mock(), None) is False  # OCR enabled
-        assert should_use_parallel(2, None, Mock()) is False  # Captions enabled
-        assert should_use_parallel(2, Mock(), Mock()) is False  # Both enabled
+    @pytest.mark.parametrize("ocr_mode", [OcrMode.AUTO, OcrMode.ON])
+    def test_multiple_workers_use_parallel_path_with_ocr(self, ocr_mode: OcrMode, tmp_path: Path) -> None:
+        """OCR no longer forces sequential processing when workers are available."""
+        from pdf2foundry.ingest.content_extractor import extract_semantic_content
+
+        doc = Mock()
+        doc.num_pages.return_value = 2
+        options = PdfPipelineOptions(ocr_mode=ocr_mode, workers=2)
+        options.workers_effective = 2
+
+        with patch("pdf2foundry.ingest.parallel_processor.process_pages_parallel") as mock_parallel:
+            mock_parallel.return_value = (
+                [HtmlPage(html="<p>1</p>", page_no=1), HtmlPage(html="<p>2</p>", page_no=2)],
+                [],
+                [],
+                [],
+                0.1,
+            )
+            content = extract_semantic_content(doc, tmp_path, options)
+
+        mock_parallel.assert_called_once()
+        assert [page.page_no for page in content.pages] == [1, 2]
+
+    def test_single_worker_stays_sequential(self, tmp_path: Path) -> None:
+        """A single worker keeps the in-process sequential path."""
+        from pdf2foundry.ingest.content_extractor import extract_semantic_content
+
+        doc = Mock()
+        doc.num_pages.return_value = 1
+        doc.export_to_html.return_value = "<p>" + "text " * 1000 + "</p>"
+        options = PdfPipelineOptions()
+
+        with patch("pdf2foundry.ingest.parallel_processor.process_pages_parallel") as mock_parallel:
+            extract_semantic_content(doc, tmp_path, options)
+
+        mock_parallel.assert_not_called()
@@ -0,0 +1,103 @@
+"""Tests for OCR components built inside page worker processes."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pdf2foundry.ingest import parallel_processor
+from pdf2foundry.ingest.parallel_processor import PageProcessingContext, process_page_content
+from pdf2foundry.model.pipeline_options import OcrMode, PdfPipelineOptions
+
+
+class TestWorkerOcr:
+    """Test OCR inside page workers."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_worker_ocr(self) -> Any:
+        parallel_processor._WORKER_OCR = None
+        parallel_processor._WORKER_OCR_KEY = None
+        yield
+        parallel_processor._WORKER_OCR = None
+        parallel_processor._WORKER_OCR_KEY = None
+
+    def test_process_page_content_applies_ocr_with_worker_components(self, tmp_path: Path) -> None:
+        """OCR output is merged into the page HTML returned by the worker."""
+        doc = Mock()
+        doc.export_to_html.return_value = "<img src='scan.png'>"
+        options = PdfPipelineOptions(ocr_mode=OcrMode.ON)
+        context = PageProcessingContext(
+            page_no=1, out_assets_path=str(tmp_path), name_prefix="page-0001", pipeline_options=options
+        )
+
+        with patch("pdf2foundry.ingest.ocr_processor.apply_ocr_to_page", return_value="<p>ocr text</p>") as mock_ocr:
+            result = process_page_content(doc, context)
+
+        assert result.html_page.html == "<p>ocr text</p>"
+        engine, cache, _ = parallel_processor._WORKER_OCR  # type: ignore[misc]
+        args = mock_ocr.call_args.args
+        assert args[4] is engine
+        assert args[5] is cache
+
+    def test_worker_components_are_reused(self) -> None:
+        """Each process builds its OCR engine and cache once."""
+        options = PdfPipelineOptions(ocr_mode=OcrMode.AUTO)
+
+        first = parallel_processor._get_worker_ocr_components(options)
+        second = parallel_processor._get_worker_ocr_components(options)
+
+        assert first is second
+        assert first[2] is not None  # OCR enabled -> page images are cached
+
+    def test_ocr_off_skips_worker_components(self, tmp_path: Path) -> None:
+        """With OCR off, workers never build OCR components."""
+        doc = Mock()
+        doc.export_to_html.return_value = ""
+        options = PdfPipelineOptions(ocr_mode=OcrMode.OFF)
+        context = PageProcessingContext(
+            page_no=1, out_assets_path=str(tmp_path), name_prefix="page-0001", pipeline_options=options
+        )
+
+        process_page_content(doc, context)
+
+        assert parallel_processor._WORKER_OCR is None
+
+    def test_workers_split_the_image_cache_budget(self) -> None:
+        """Each worker holds its own image cache, so it gets a share of the memory budget."""
+        options = PdfPipelineOptions(ocr_mode=OcrMode.ON, image_cache_mb=600, workers_effective=4)
+
+        _, _, image_cache = parallel_processor._get_worker_ocr_components(options)
+
+        assert image_cache is not None
+        assert image_cache._limits.memory_budget_mb == 150
+
+    def test_components_follow_options_of_each_document(self, tmp_path: Path) -> None:
+        """A reused worker rebuilds its components when the next document has other options."""
+        first_doc = PdfPipelineOptions(ocr_mode=OcrMode.ON, image_cache_mb=600, workers_effective=2, disk_cache=False)
+        second_doc = PdfPipelineOptions(
+            ocr_mode=OcrMode.ON,
+            ocr_detect_script=True,
+            image_cache_mb=600,
+            workers_effective=4,
+            cache_dir=str(tmp_path / "cache"),
+        )
+        doc = Mock()
+        doc.export_to_html.return_value = "<img src='scan.png'>"
+
+        components = []
+        with patch("pdf2foundry.ingest.ocr_processor.apply_ocr_to_page", return_value="") as mock_ocr:
+            for options in (first_doc, first_doc, second_doc):
+                context = PageProcessingContext(
+                    page_no=1, out_assets_path=str(tmp_path), name_prefix="page-0001", pipeline_options=options
+                )
+                process_page_content(doc, context)
+                call = mock_ocr.call_args
+                components.append((call.args[4], call.args[5], call.kwargs["shared_image_cache"]))
+
+        assert components[0] == components[1]
+        (engine, cache, image_cache), (next_engine, next_cache, next_image_cache) = components[0], components[2]
+        assert (engine._detect_script, next_engine._detect_script) == (False, True)
+        assert cache._disk_cache is None
+        assert next_cache._disk_cache is not None
+        assert (image_cache._limits.memory_budget_mb, next_image_cache._limits.memory_budget_mb) == (300, 150)
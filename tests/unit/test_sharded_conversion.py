@@ -0,0 +1,180 @@
+"""Tests for page-range sharded Docling conversion."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pdf2foundry.ingest import docling_adapter as da
+from pdf2foundry.ingest import sharded_conversion as sc
+from pdf2foundry.ingest.ingestion import JsonOpts, ingest_docling
+from pdf2foundry.ingest.json_io import atomic_write_text, doc_to_json
+from pdf2foundry.ingest.sharded_conversion import (
+    merge_documents,
+    page_runs,
+    plan_conversion_shards,
+    plan_selection_shards,
+    plan_shards,
+)
+
+
+def _shard_doc(document: Any, first_page: int, last_page: int) -> Any:
+    """Build a document as Docling returns it for a page range."""
+    doc = document.DoclingDocument(name="book")
+    for page_no in range(first_page, last_page + 1):
+        doc.add_page(page_no=page_no, size=document.Size(width=100, height=100))
+        prov = document.ProvenanceItem(page_no=page_no, bbox=document.BoundingBox(l=0, t=0, r=10, b=10), charspan=(0, 6))
+        doc.add_text(label=document.DocItemLabel.TEXT, text=f"page {page_no}", prov=prov)
+    return doc
+
+
+class TestPlanShards:
+    """Test splitting a document into page ranges."""
+
+    def test_even_split(self) -> None:
+        assert plan_shards(100, 4) == [(1, 25), (26, 50), (51, 75), (76, 100)]
+
+    def test_shards_cover_every_page_once(self) -> None:
+        shards = plan_shards(45, 4)
+
+        assert shards == [(1, 23), (24, 45)]  # At most 45 // 20 shards
+
+    def test_short_or_empty_documents(self) -> None:
+        assert plan_shards(30, 4) == [(1, 30)]
+        assert plan_shards(0, 4) == []
+
+    def test_no_sharding_without_page_count_or_workers(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setattr(sc, "pdf_page_count", lambda _: None)
+        assert plan_conversion_shards(tmp_path / "book.pdf", 4) == []
+
+        monkeypatch.setattr(sc, "pdf_page_count", lambda _: 200)
+        assert plan_conversion_shards(tmp_path / "book.pdf", 1) == []
+
+
+class TestPageSelection:
+    """Test planning the conversion of a --pages selection."""
+
+    def test_page_runs(self) -> None:
+        assert page_runs([12, 1, 2, 3, 10, 11, 3]) == [(1, 3), (10, 12)]
+        assert page_runs([]) == []
+
+    def test_selection_shards_cover_only_selected_pages(self) -> None:
+        assert plan_selection_shards([40, 41, 42, 43, 44, 45], 4) == [(40, 45)]
+        assert plan_selection_shards([*range(1, 41), 50], 2) == [(1, 20), (21, 40), (50, 50)]
+
+
+class TestMergeDocuments:
+    """Test merging shard documents with real docling-core documents."""
+
+    def test_pages_are_numbered_in_order(self) -> None:
+        document = pytest.importorskip("docling_core.types.doc.document")
+
+        merged = merge_documents([_shard_doc(document, 1, 2), _shard_doc(document, 3, 5)])
+
+        assert sorted(merged.pages) == [1, 2, 3, 4, 5]  # type: ignore[attr-defined]
+        assert [item.prov[0].page_no for item in merged.texts] == [1, 2, 3, 4, 5]  # type: ignore[attr-defined]
+        assert merged.texts[3].text == "page 4"  # type: ignore[attr-defined]
+
+    def test_selection_keeps_page_numbers(self) -> None:
+        document = pytest.importorskip("docling_core.types.doc.document")
+
+        merged = merge_documents([_shard_doc(document, 2, 3), _shard_doc(document, 10, 11)], keep_page_numbers=True)
+
+        assert sorted(merged.pages) == [2, 3, 10, 11]  # type: ignore[attr-defined]
+        assert all(page_no == page.page_no for page_no, page in merged.pages.items())  # type: ignore[attr-defined]
+        assert [item.prov[0].page_no for item in merged.texts] == [2, 3, 10, 11]  # type: ignore[attr-defined]
+        assert da.document_page_count(merged) == 11
+
+    def test_single_shard_is_returned_unchanged(self) -> None:
+        doc = object()
+
+        assert merge_documents([doc]) is doc
+
+
+class TestShardedConversion:
+    """Test sharding through run_docling_conversion."""
+
+    def _patch(self, monkeypatch: pytest.MonkeyPatch, page_count: int | None, calls: list[Any]) -> None:
+        document = pytest.importorskip("docling_core.types.doc.document")
+
+        def mock_convert(pdf_path: Path, *, page_range: tuple[int, int] | None = None, **_: Any) -> Any:
+            calls.append(page_range)
+            first, last = page_range or (1, page_count or 3)
+            return _shard_doc(document, first, last)
+
+        monkeypatch.setattr(da, "_do_docling_convert_impl", mock_convert)
+        monkeypatch.setattr(sc, "pdf_page_count", lambda _: page_count)
+        monkeypatch.setattr(sc, "_shard_executor", lambda workers: ThreadPoolExecutor(max_workers=workers))
+        da._cached_convert.cache_clear()
+
+    def test_long_document_is_converted_in_shards(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Any] = []
+        self._patch(monkeypatch, 60, calls)
+
+        doc = da.run_docling_conversion(tmp_path / "book.pdf", workers=2)
+
+        assert sorted(calls) == [(1, 30), (31, 60)]
+        assert doc.num_pages() == 60
+        da._cached_convert.cache_clear()
+
+    def test_unknown_page_count_converts_in_one_pass(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Any] = []
+        self._patch(monkeypatch, None, calls)
+
+        doc = da.run_docling_conversion(tmp_path / "book.pdf", workers=4)
+
+        assert calls == [None]
+        assert doc.num_pages() == 3
+        da._cached_convert.cache_clear()
+
+    def test_shard_failure_propagates(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Any] = []
+        self._patch(monkeypatch, 60, calls)
+
+        def failing_convert(pdf_path: Path, **_: Any) -> Any:
+            raise RuntimeError("shard failed")
+
+        monkeypatch.setattr(da, "_do_docling_convert_impl", failing_convert)
+
+        with pytest.raises(RuntimeError, match="shard failed"):
+            da.run_docling_conversion(tmp_path / "book.pdf", workers=2)
+        da._cached_convert.cache_clear()
+
+    def test_selected_pages_are_the_only_pages_converted(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Any] = []
+        self._patch(monkeypatch, 60, calls)
+
+        doc = da.run_docling_conversion(tmp_path / "book.pdf", pages=[40, 41, 42, 43, 44, 45, 50])
+
+        assert calls == [(40, 45), (50, 50)]
+        assert da.document_page_numbers(doc) == {40, 41, 42, 43, 44, 45, 50}
+        da._cached_convert.cache_clear()
+
+    def test_selection_beyond_the_end_is_rejected(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        calls: list[Any] = []
+        self._patch(monkeypatch, 60, calls)
+
+        with pytest.raises(ValueError, match="exceeds document length 60"):
+            da.run_docling_conversion(tmp_path / "book.pdf", pages=[59, 60, 61])
+        assert calls == []
+        da._cached_convert.cache_clear()
+
+    def test_ingest_converts_selection_and_skips_incomplete_cache(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        document = pytest.importorskip("docling_core.types.doc.document")
+        calls: list[Any] = []
+        self._patch(monkeypatch, 60, calls)
+        pdf = tmp_path / "book.pdf"
+        pdf.write_bytes(b"%PDF-1.4 book")
+        cache_file = tmp_path / "docling.json"
+        atomic_write_text(cache_file, doc_to_json(_shard_doc(document, 1, 3)))
+
+        doc = ingest_docling(pdf, JsonOpts(path=cache_file, conversion_cache=False), pages=[5, 6])
+
+        assert calls == [(5, 6)]
+        assert da.document_page_numbers(doc) == {5, 6}
+        da._cached_convert.cache_clear()
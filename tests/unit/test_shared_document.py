@@ -0,0 +1,153 @@
+"""Tests for publishing a Docling document to page workers once."""
+
+import json
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pdf2foundry.ingest import shared_document
+from pdf2foundry.ingest.parallel_processor import process_pages_parallel
+from pdf2foundry.ingest.shared_document import (
+    SharedDocumentHandle,
+    choose_publish_mode,
+    init_worker_document,
+    publish_document,
+    resolve_worker_document,
+)
+from pdf2foundry.model.pipeline_options import PdfPipelineOptions
+
+
+class _PicklableDoc:
+    """Minimal picklable document used to exercise the mmap path."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages_count = pages
+
+    def num_pages(self) -> int:
+        return self.pages_count
+
+    def export_to_html(self, page_no: int = 0, **_: object) -> str:
+        return f"<p>Page {page_no}</p>"
+
+
+def _worker_page_count(handle: SharedDocumentHandle) -> int:
+    return int(resolve_worker_document(handle).num_pages())
+
+
+@pytest.fixture(autouse=True)
+def _reset_worker_state() -> None:
+    shared_document._WORKER_DOC = None
+    shared_document._WORKER_DOC_ID = None
+
+
+class TestChoosePublishMode:
+    """Test publication mode selection."""
+
+    def test_fork_inherits(self, tmp_path: Path) -> None:
+        json_path = tmp_path / "doc.json"
+        json_path.write_text("{}")
+        assert choose_publish_mode("fork", str(json_path)) == "inherit"
+
+    def test_spawn_prefers_existing_json_cache(self, tmp_path: Path) -> None:
+        json_path = tmp_path / "doc.json"
+        json_path.write_text("{}")
+        assert choose_publish_mode("spawn", str(json_path)) == "json"
+
+    def test_spawn_without_cache_uses_mmap(self, tmp_path: Path) -> None:
+        assert choose_publish_mode("spawn", None) == "mmap"
+        assert choose_publish_mode("forkserver", str(tmp_path / "missing.json")) == "mmap"
+
+
+class TestPublishDocument:
+    """Test the publish/resolve round trip in a single process."""
+
+    def test_inherit_mode_sets_and_clears_global(self) -> None:
+        doc = Mock()
+        with publish_document(doc, start_method="fork") as handle:
+            assert handle.mode == "inherit"
+            assert resolve_worker_document(handle) is doc
+        assert shared_document._WORKER_DOC is None
+
+    def test_mmap_mode_round_trip_and_cleanup(self) -> None:
+        doc = _PicklableDoc(7)
+        with publish_document(doc, start_method="spawn") as handle:
+            assert handle.mode == "mmap"
+            assert handle.size > 0
+            blob = Path(str(handle.location))
+            assert blob.exists()
+            loaded = resolve_worker_document(handle)
+            assert loaded is not doc
+            assert loaded.num_pages() == 7
+            # Second resolution reuses the already loaded document
+            assert resolve_worker_document(handle) is loaded
+        assert not blob.exists()
+
+    def test_json_mode_loads_cache_file(self, tmp_path: Path) -> None:
+        json_path = tmp_path / "doc.json"
+        json_path.write_text(json.dumps({"num_pages": 3, "pages_html": ["a", "b", "c"]}))
+
+        with publish_document(Mock(), start_method="spawn", json_path=str(json_path)) as handle:
+            assert handle.mode == "json"
+            assert handle.size == 0
+            init_worker_document(handle)
+            assert resolve_worker_document(handle).num_pages() == 3
+
+    def test_unpicklable_document_raises(self) -> None:
+        with (
+            pytest.raises((pickle.PicklingError, TypeError, AttributeError)),
+            publish_document(Mock(), start_method="spawn"),
+        ):
+            pass
+
+    def test_inherit_handle_outside_worker_fails(self) -> None:
+        handle = SharedDocumentHandle(doc_id="missing", mode="inherit")
+        with pytest.raises(RuntimeError, match="not inherited"):
+            resolve_worker_document(handle)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="fork start method is only reliable on Linux")
+def test_forked_workers_inherit_document_without_pickling() -> None:
+    """Workers forked after publication see the document without it being pickled."""
+    doc = Mock()  # Mocks cannot be pickled, so success proves inheritance
+    doc.num_pages.return_value = 11
+
+    with (
+        publish_document(doc, start_method="fork") as handle,
+        ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=init_worker_document,
+            initargs=(handle,),
+        ) as executor,
+    ):
+        assert list(executor.map(_worker_page_count, [handle, handle])) == [11, 11]
+
+
+@patch("pdf2foundry.ingest.parallel_processor.ProcessPoolExecutor")
+def test_process_pages_parallel_submits_handle_not_document(mock_executor_class: Mock, tmp_path: Path) -> None:
+    """Each submitted task carries the small handle instead of the document."""
+    doc = Mock()
+    options = PdfPipelineOptions()
+    options.workers_effective = 2
+
+    mock_executor = Mock()
+    mock_executor_class.return_value.__enter__.return_value = mock_executor
+    mock_executor.submit.side_effect = RuntimeError("stop after inspecting submit")
+
+    with (
+        patch("pdf2foundry.ingest.parallel_processor.multiprocessing.get_start_method", return_value="fork"),
+        patch("pdf2foundry.ingest.parallel_processor._process_pages_sequential") as mock_sequential,
+    ):
+        mock_sequential.return_value = ([], [], [], [], 0.0)
+        process_pages_parallel(doc, [1, 2], tmp_path, options)
+
+    _, kwargs = mock_executor_class.call_args
+    assert kwargs["initializer"] is init_worker_document
+    submitted_args = mock_executor.submit.call_args.args
+    assert isinstance(submitted_args[2], SharedDocumentHandle)
+    assert doc not in submitted_args
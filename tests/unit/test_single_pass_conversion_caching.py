@@ -247,6 +247,23 @@ class TestJSONCaching:
         loaded_doc = doc_from_json(default_path.read_text(encoding="utf-8"))
         assert loaded_doc.num_pages() == 8
 
+    def test_page_selection_is_not_saved_as_full_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """A --pages run does not leave a partial cache that a later full run would load."""
+
+        def mock_convert(pdf_path: Path, *, pages: list[int] | None = None, **_: Any) -> _TestDoc:
+            return _TestDoc(pages=len(pages) if pages is not None else 5)
+
+        monkeypatch.setattr(da, "_do_docling_convert_impl", mock_convert)
+        da._cached_convert.cache_clear()
+        default_path = tmp_path / "sources" / "docling.json"
+        opts = JsonOpts(write=True, default_path=default_path)
+
+        assert ingest_docling(Path("/tmp/test.pdf"), opts, pages=[1, 2]).num_pages() == 2
+        assert not default_path.exists()
+
+        assert ingest_docling(Path("/tmp/test.pdf"), opts).num_pages() == 5
+        assert doc_from_json(default_path.read_text(encoding="utf-8")).num_pages() == 5
+
 
 class TestErrorHandling:
     """Test error handling for invalid JSON and fallback behavior."""
@@ -0,0 +1,156 @@
+"""Tests for the streaming page pipeline (extract -> clean -> map -> write)."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pdf2foundry.builder.ir_builder import build_document_ir, iter_chapter_ir, map_ir_to_foundry_entries
+from pdf2foundry.builder.sources import JournalSourceWriter
+from pdf2foundry.builder.toc import build_toc_entry_from_entries
+from pdf2foundry.cli.conversion import write_sources_streaming
+from pdf2foundry.ingest.content_extractor import extract_semantic_content
+from pdf2foundry.ingest.page_stream import STREAM_WINDOW_PAGES, iter_semantic_pages
+from pdf2foundry.model.content import HtmlPage, ParsedContent
+from pdf2foundry.model.document import OutlineNode, ParsedDocument
+from pdf2foundry.model.pipeline_options import OcrMode, PdfPipelineOptions
+
+
+class _BookDoc:
+    """Document whose pages each carry ``page_bytes`` of paragraph HTML."""
+
+    def __init__(self, pages: int, page_bytes: int = 2000) -> None:
+        self._pages = pages
+        self._paragraphs = max(1, page_bytes // 60)
+
+    def num_pages(self) -> int:
+        return self._pages
+
+    def export_to_html(self, page_no: int = 0, **_: object) -> str:
+        body = "".join(f"<p>Page {page_no:04d} paragraph {i:04d} of the long rulebook.</p>" for i in range(self._paragraphs))
+        return f"<html><body><h2>Page {page_no}</h2>{body}</body></html>"
+
+
+def _outline(pages: int, chapter_pages: int = 10, with_sections: bool = True) -> ParsedDocument:
+    chapters = []
+    for number, start in enumerate(range(1, pages + 1, chapter_pages), start=1):
+        end = min(pages, start + chapter_pages - 1)
+        children = (
+            [
+                OutlineNode(f"Part {number}a", 2, start, start + 1, path=[f"chapter-{number}", "a"]),
+                OutlineNode(f"Part {number}b", 2, start + 2, end, path=[f"chapter-{number}", "b"]),
+            ]
+            if with_sections
+            else []
+        )
+        chapters.append(OutlineNode(f"Chapter {number}", 1, start, end, children, path=[f"chapter-{number}"]))
+    return ParsedDocument(page_count=pages, outline=chapters)
+
+
+def _options() -> PdfPipelineOptions:
+    return PdfPipelineOptions(ocr_mode=OcrMode.OFF)
+
+
+def _read_tree(directory: Path) -> dict[str, str]:
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(directory.iterdir())}
+
+
+class TestIterChapterIr:
+    """Test chapter assembly from a page stream."""
+
+    def test_matches_build_document_ir(self) -> None:
+        parsed_doc = _outline(25)
+        parsed_doc.outline[-1].children = []  # Synthetic per-page sections
+        parsed_doc.outline[-1].page_end = None
+        pages = [HtmlPage(html=f"<p>p{n}</p>", page_no=n) for n in range(1, 26)]
+
+        expected = build_document_ir(parsed_doc, ParsedContent(pages=pages), mod_id="m", doc_title="Book").chapters
+        streamed = list(iter_chapter_ir(parsed_doc, iter(pages), "Book"))
+
+        assert streamed == expected
+
+    def test_chapter_is_yielded_before_later_pages_are_read(self) -> None:
+        consumed: list[int] = []
+
+        def pages() -> Iterator[HtmlPage]:
+            for n in range(1, 31):
+                consumed.append(n)
+                yield HtmlPage(html=f"<p>p{n}</p>", page_no=n)
+
+        chapters = iter_chapter_ir(_outline(30), pages(), "Book")
+        first = next(chapters)
+
+        assert first.title == "Chapter 1"
+        assert consumed[-1] == 11  # The first page of chapter 2 closed chapter 1
+
+
+class TestStreamingExtraction:
+    """Test streaming page extraction and source writing."""
+
+    def test_pages_match_batch_extraction(self, tmp_path: Path) -> None:
+        doc = _BookDoc(STREAM_WINDOW_PAGES * 2 + 3)
+
+        batch = extract_semantic_content(doc, tmp_path / "batch", _options())
+        streamed = list(iter_semantic_pages(doc, tmp_path / "stream", _options()))
+
+        assert streamed == batch.pages
+
+    def test_sources_match_batch_pipeline(self, tmp_path: Path) -> None:
+        doc = _BookDoc(35)
+        parsed_doc = _outline(35)
+        batch_dir, stream_dir = tmp_path / "batch", tmp_path / "stream"
+        batch_dir.mkdir()
+        stream_dir.mkdir()
+
+        content = extract_semantic_content(doc, tmp_path / "assets", _options())
+        entries = map_ir_to_foundry_entries(build_document_ir(parsed_doc, content, mod_id="m", doc_title="Book"))
+        writer = JournalSourceWriter(batch_dir)
+        for entry in [build_toc_entry_from_entries("m", entries), *entries]:
+            writer.write(entry)
+        written = write_sources_streaming(
+            doc,
+            parsed_doc,
+            assets_dir=tmp_path / "assets",
+            journals_src_dir=stream_dir,
+            options=_options(),
+            mod_id="m",
+            mod_title="Book",
+            toc=True,
+        )
+
+        assert written == 5
+        assert _read_tree(stream_dir) == _read_tree(batch_dir)
+
+
+@pytest.mark.slow
+def test_streaming_peak_memory_is_flat(tmp_path: Path) -> None:
+    """Peak traced memory of a streaming run does not grow with the number of pages."""
+
+    def peak(pages: int) -> int:
+        out = tmp_path / f"run-{pages}"
+        out.mkdir()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            write_sources_streaming(
+                _BookDoc(pages, page_bytes=20_000),
+                _outline(pages),
+                assets_dir=out / "assets",
+                journals_src_dir=out,
+                options=_options(),
+                mod_id="m",
+                mod_title="Book",
+                toc=False,
+            )
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    short, long = peak(30), peak(300)
+    print(f"\nStreaming peak memory: 30 pages={short / 1e6:.1f} MB, 300 pages={long / 1e6:.1f} MB")
+
+    assert long < short * 1.5